@@ -0,0 +1,419 @@
+"""DynamoDeluxe backend supervisor.
+
+Owns the backend subprocess for the lifetime of the host app:
+
+- stdout/stderr are always drained by reader threads into a bounded `RingLog`, so a full
+  pipe can never stall the backend, whether or not the log dialog is open;
+- a probe thread decides readiness from the backend's HTTP config endpoint (which also
+  reports the socket.io port), a TCP connect to the configured socket port, or a log line
+  matching `config.DYNAMO_READY_LOG_PATTERN`;
+- the resolved `BackendEndpoint` is handed to tools (FluxLite's HardwareService) so they
+  connect directly instead of re-probing;
+- a backend that exits on its own is restarted with exponential backoff, up to
+  `config.DYNAMO_RESTART_MAX` times per session, and probed for readiness again.
+
+Callbacks (`subscribe`, `on_ready`, `on_exit`) run on supervisor threads; Qt consumers
+must marshal to the UI thread (e.g. via a Signal).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from . import config
+
+_logger = logging.getLogger(__name__)
+
+# Config endpoints the backend may expose (same set FluxLite's HardwareService probes).
+CONFIG_PATHS: Tuple[str, ...] = ("config", "dynamo/config", "api/config", "flux/config", "v1/config", "backend/config")
+
+_MAX_LINE_CHARS = 4000
+
+
+@dataclass(frozen=True)
+class BackendEndpoint:
+    host: str  # scheme://hostname, no port
+    http_port: int
+    socket_port: int
+    source: str  # "http" | "tcp" | "log"
+
+
+class RingLog:
+    """Thread-safe bounded log of (seq, stream, text) lines with live subscribers."""
+
+    def __init__(self, max_lines: int) -> None:
+        self._lines: Deque[Tuple[int, str, str]] = deque(maxlen=max(1, int(max_lines)))
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[str, str], None]] = []
+
+    def append(self, stream: str, text: str) -> None:
+        text = text.rstrip("\r\n")
+        if len(text) > _MAX_LINE_CHARS:
+            text = text[:_MAX_LINE_CHARS] + " …"
+        with self._lock:
+            self._seq += 1
+            self._lines.append((self._seq, stream, text))
+            subscribers = list(self._subscribers)
+        for cb in subscribers:
+            try:
+                cb(stream, text)
+            except Exception:
+                pass
+
+    def snapshot(self, last: Optional[int] = None) -> List[Tuple[int, str, str]]:
+        with self._lock:
+            lines = list(self._lines)
+        return lines[-int(last):] if last else lines
+
+    def subscribe(self, callback: Callable[[str, str], None], *, replay: bool = True) -> None:
+        """Add `callback(stream, text)`; with `replay`, first call it for the buffered lines."""
+        with self._lock:
+            backlog = list(self._lines) if replay else []
+            # Registered under the lock so no line falls between the replay and live delivery.
+            self._subscribers.append(callback)
+        for _, stream, text in backlog:
+            try:
+                callback(stream, text)
+            except Exception:
+                pass
+
+    def unsubscribe(self, callback: Callable[[str, str], None]) -> None:
+        with self._lock:
+            try:
+                self._subscribers.remove(callback)
+            except ValueError:
+                pass
+
+    @property
+    def dropped(self) -> int:
+        """Lines that have fallen out of the ring."""
+        with self._lock:
+            return self._seq - len(self._lines)
+
+
+def _normalize_host(host: str) -> str:
+    raw = (host or "").strip() or "http://localhost"
+    if not raw.startswith("http://") and not raw.startswith("https://"):
+        raw = f"http://{raw}"
+    parsed = urlparse(raw)
+    return f"{parsed.scheme or 'http'}://{parsed.hostname or 'localhost'}"
+
+
+def find_socket_port(obj: Any) -> Optional[int]:
+    """First plausible socket.io port in a backend config document (key contains socket + port)."""
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            key = str(k).lower()
+            if "socketport" in key or ("socket" in key and "port" in key):
+                try:
+                    port = int(v)
+                    if 1000 <= port <= 65535:
+                        return port
+                except Exception:
+                    pass
+            found = find_socket_port(v)
+            if found is not None:
+                return found
+    elif isinstance(obj, list):
+        for item in obj:
+            found = find_socket_port(item)
+            if found is not None:
+                return found
+    return None
+
+
+def _tcp_open(hostname: str, port: int, timeout_s: float) -> bool:
+    try:
+        with socket.create_connection((hostname, int(port)), timeout=timeout_s):
+            return True
+    except OSError:
+        return False
+
+
+class BackendSupervisor:
+    """Start, watch and stop the DynamoDeluxe subprocess; see the module docstring."""
+
+    def __init__(
+        self,
+        argv: Sequence[str],
+        *,
+        cwd: Path,
+        env: Dict[str, str],
+        host: str = config.DYNAMO_HOST,
+        http_port: int = config.DYNAMO_HTTP_PORT,
+        socket_port: int = config.DYNAMO_SOCKET_PORT,
+        log_lines: int = config.DYNAMO_LOG_LINES,
+        ready_timeout_s: float = config.DYNAMO_READY_TIMEOUT_S,
+        ready_log_pattern: str = config.DYNAMO_READY_LOG_PATTERN,
+        restart_max: int = config.DYNAMO_RESTART_MAX,
+        restart_backoff_s: float = config.DYNAMO_RESTART_BACKOFF_S,
+        restart_backoff_max_s: float = config.DYNAMO_RESTART_BACKOFF_MAX_S,
+        popen: Callable[..., Any] = subprocess.Popen,
+    ) -> None:
+        self.argv = list(argv)
+        self.cwd = cwd
+        self.env = env
+        self.host = _normalize_host(host)
+        self.http_port = int(http_port)
+        self.socket_port = int(socket_port)
+        self.ready_timeout_s = float(ready_timeout_s)
+        self.restart_max = max(0, int(restart_max))
+        self.restart_backoff_s = max(0.0, float(restart_backoff_s))
+        self.restart_backoff_max_s = max(self.restart_backoff_s, float(restart_backoff_max_s))
+        self.restarts = 0
+        self._popen = popen
+        self.log = RingLog(log_lines)
+        self.process: "subprocess.Popen[bytes] | None" = None
+        self._ready_re = re.compile(ready_log_pattern) if ready_log_pattern else None
+        self._endpoint: Optional[BackendEndpoint] = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._ready_callbacks: List[Callable[[BackendEndpoint], None]] = []
+        self._exit_callbacks: List[Callable[[int], None]] = []
+        self._threads: List[threading.Thread] = []
+        self._started_at = 0.0
+        self._final_rc: Optional[int] = None
+
+    # --- lifecycle ---
+
+    def start(self) -> None:
+        """Spawn the backend and return immediately; readiness is reported asynchronously."""
+        self._launch()
+        self._spawn(self._supervise_loop, name="dynamo-probe")
+
+    def _launch(self) -> None:
+        self._started_at = time.perf_counter()
+        self.process = self._popen(
+            self.argv,
+            cwd=self.cwd,
+            env=self.env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        _logger.info("DynamoDeluxe backend started (PID: %d)", self.process.pid)
+        for stream, name in ((self.process.stdout, "stdout"), (self.process.stderr, "stderr")):
+            if stream is not None:
+                self._spawn(self._drain, stream, name, name=f"dynamo-{name}")
+
+    def stop(self, timeout_s: float = 10.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        proc = self.process
+        if proc is None:
+            return
+        try:
+            if proc.poll() is None:
+                _logger.info("Stopping DynamoDeluxe backend (PID: %d)...", proc.pid)
+                proc.terminate()
+                try:
+                    proc.wait(timeout=timeout_s)
+                    _logger.info("DynamoDeluxe backend stopped.")
+                except subprocess.TimeoutExpired:
+                    _logger.warning("DynamoDeluxe backend did not stop gracefully, killing...")
+                    proc.kill()
+                    proc.wait()
+        except Exception as exc:
+            _logger.error("Error stopping DynamoDeluxe backend: %s", exc)
+        for t in self._threads:
+            t.join(timeout=1.0)
+
+    def _spawn(self, target, *args, name: str) -> None:
+        t = threading.Thread(target=target, args=args, name=name, daemon=True)
+        t.start()
+        self._threads.append(t)
+
+    # --- state ---
+
+    def is_running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def endpoint(self) -> Optional[BackendEndpoint]:
+        return self._endpoint
+
+    def wait_ready(self, timeout_s: Optional[float] = None) -> Optional[BackendEndpoint]:
+        self._ready.wait(timeout_s)
+        return self._endpoint
+
+    def on_ready(self, callback: Callable[[BackendEndpoint], None]) -> None:
+        """
+        Call `callback(endpoint)` each time the backend becomes ready: now if it already is,
+        and again after every restart.
+        """
+        with self._lock:
+            endpoint = self._endpoint
+            self._ready_callbacks.append(callback)
+        if endpoint is not None:
+            callback(endpoint)
+
+    def on_exit(self, callback: Callable[[int], None]) -> None:
+        """
+        Call `callback(returncode)` when the backend exits for good, i.e. with no restart left
+        (immediately if it already has). Not called for `stop()`.
+        """
+        with self._lock:
+            rc = self._final_rc
+            if rc is None:
+                self._exit_callbacks.append(callback)
+                return
+        callback(int(rc))
+
+    # --- pipes ---
+
+    def _drain(self, stream, name: str) -> None:
+        try:
+            for raw in iter(stream.readline, b""):
+                text = raw.decode("utf-8", errors="replace")
+                self.log.append(name, text)
+                if self._ready_re is not None and not self._ready.is_set():
+                    self._check_ready_line(text)
+        except Exception:
+            pass
+        finally:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def _check_ready_line(self, text: str) -> None:
+        m = self._ready_re.search(text) if self._ready_re is not None else None
+        if m is None:
+            return
+        port = (m.groupdict() or {}).get("socket_port")
+        if port:
+            self._set_ready(BackendEndpoint(self.host, self.http_port, int(port), "log"))
+        else:
+            self._wake.set()  # the backend says it is up: probe now rather than at the next tick
+
+    # --- readiness ---
+
+    def _probe_once(self) -> Optional[BackendEndpoint]:
+        hostname = urlparse(self.host).hostname or "localhost"
+        if _tcp_open(hostname, self.http_port, 0.25):
+            for path in CONFIG_PATHS:
+                try:
+                    req = urllib.request.Request(f"{self.host}:{self.http_port}/{path}", headers={"Accept": "application/json"})
+                    with urllib.request.urlopen(req, timeout=0.7) as resp:
+                        if resp.status != 200:
+                            continue
+                        port = find_socket_port(json.loads(resp.read().decode("utf-8", errors="replace")))
+                    if port is not None:
+                        return BackendEndpoint(self.host, self.http_port, int(port), "http")
+                except Exception:
+                    continue
+        if _tcp_open(hostname, self.socket_port, 0.25):
+            return BackendEndpoint(self.host, self.http_port, self.socket_port, "tcp")
+        return None
+
+    def _supervise_loop(self) -> None:
+        """Probe and watch the current process; restart it with backoff when it exits on its own."""
+        while True:
+            rc = self._watch_process()
+            if rc is None:
+                return  # stopping
+            if self._stop.is_set():
+                return
+            if self.restarts >= self.restart_max:
+                self._handle_exit(rc)
+                return
+            delay = min(self.restart_backoff_max_s, self.restart_backoff_s * (2 ** self.restarts))
+            self.restarts += 1
+            self._log_exit(rc, f"; restarting in {delay:.1f} s (attempt {self.restarts}/{self.restart_max})")
+            with self._lock:
+                self._endpoint = None
+                self._ready.clear()
+            if self._stop.wait(delay):
+                return
+            try:
+                self._launch()
+            except Exception as exc:
+                _logger.error("Failed to restart DynamoDeluxe backend: %s", exc)
+                self._handle_exit(rc)
+                return
+
+    def _watch_process(self) -> Optional[int]:
+        """Probe until ready, then wait for the process to exit. Its return code, or None when stopping."""
+        interval = 0.1
+        warned = False
+        while not self._stop.is_set() and not self._ready.is_set():
+            proc = self.process
+            rc = proc.poll() if proc is not None else None
+            if rc is not None:
+                return int(rc)
+            endpoint = self._probe_once()
+            if endpoint is not None:
+                self._set_ready(endpoint)
+                break
+            if not warned and time.perf_counter() - self._started_at > self.ready_timeout_s:
+                warned = True
+                _logger.warning("DynamoDeluxe backend not ready after %.0f s; still waiting.", self.ready_timeout_s)
+            self._wake.wait(interval)
+            self._wake.clear()
+            interval = min(1.0, interval * 1.5)
+        # Ready (or stopping): keep watching for the process exiting.
+        proc = self.process
+        while proc is not None and not self._stop.is_set():
+            try:
+                return int(proc.wait(timeout=0.5))
+            except subprocess.TimeoutExpired:
+                continue
+        return None
+
+    def _set_ready(self, endpoint: BackendEndpoint) -> None:
+        with self._lock:
+            if self._endpoint is not None:
+                return
+            self._endpoint = endpoint
+            self._ready.set()
+            callbacks = list(self._ready_callbacks)
+        self._wake.set()
+        _logger.info(
+            "DynamoDeluxe backend ready in %.0f ms (%s:%d, socket port %d via %s)",
+            (time.perf_counter() - self._started_at) * 1000.0,
+            endpoint.host,
+            endpoint.http_port,
+            endpoint.socket_port,
+            endpoint.source,
+        )
+        for cb in callbacks:
+            try:
+                cb(endpoint)
+            except Exception:
+                _logger.exception("Backend ready callback failed")
+
+    def _log_exit(self, rc: int, note: str = "") -> None:
+        # Let the readers catch the last lines before quoting them.
+        for t in self._threads:
+            if t is not threading.current_thread() and t.name != "dynamo-probe":
+                t.join(timeout=1.0)
+        tail = "\n".join(f"[{stream}] {text}" for _, stream, text in self.log.snapshot(last=20))
+        _logger.error("DynamoDeluxe backend exited with code %d%s%s", rc, note, f"; last output:\n{tail}" if tail else "")
+
+    def _handle_exit(self, rc: int) -> None:
+        with self._lock:
+            self._final_rc = int(rc)
+            callbacks, self._exit_callbacks = self._exit_callbacks, []
+        if not self._stop.is_set():
+            self._log_exit(rc)
+        for cb in callbacks:
+            try:
+                cb(rc)
+            except Exception:
+                _logger.exception("Backend exit callback failed")
@@ -5,9 +5,41 @@ Keep this small and host-focused; tools should own their own configuration.
 
 from __future__ import annotations
 
+import os
+
 
 # Metrics editor (optional tool page)
 METRICS_EDITOR_STREAMLIT_HOST: str = "127.0.0.1"
 METRICS_EDITOR_STREAMLIT_PORT: int = 8503
 METRICS_EDITOR_STREAMLIT_ENTRYPOINT: str = ""
 
+# DynamoDeluxe submodule update: "background" fetches after the window is interactive and
+# fast-forwards on the next launch; "blocking" pulls before the backend starts; "off" skips it.
+DYNAMO_UPDATE_MODE: str = os.environ.get("FLUXDELUXE_DYNAMO_UPDATE", "background").strip().lower()
+# Launch the DynamoDeluxe backend subprocess at startup.
+DYNAMO_AUTOSTART: bool = bool(int(os.environ.get("FLUXDELUXE_DYNAMO_AUTOSTART", "1")))
+
+# Startup profiling: one JSON line per launch (empty = <repo>/.fluxdeluxe/startup_history.jsonl);
+# VERBOSE logs the full phase timeline; EXIT_AFTER_STARTUP quits once interactive (measurement runs).
+STARTUP_HISTORY_PATH: str = os.environ.get("FLUXDELUXE_STARTUP_HISTORY", "").strip()
+STARTUP_PROFILE_VERBOSE: bool = bool(int(os.environ.get("FLUXDELUXE_STARTUP_PROFILE", "0")))
+STARTUP_EXIT_AFTER_INTERACTIVE: bool = bool(int(os.environ.get("FLUXDELUXE_EXIT_AFTER_STARTUP", "0")))
+
+# DynamoDeluxe backend endpoint (same env names FluxLite reads) and supervisor settings:
+# LOG_LINES bounds the in-memory backend log; READY_TIMEOUT_S only controls when a slow start is
+# logged; READY_LOG_PATTERN is a regex on backend output that triggers an immediate readiness
+# probe, or marks the backend ready outright when it has a `socket_port` named group.
+DYNAMO_HOST: str = os.environ.get("SOCKET_HOST", "http://localhost")
+DYNAMO_HTTP_PORT: int = int(os.environ.get("HTTP_PORT", "3001"))
+DYNAMO_SOCKET_PORT: int = int(os.environ.get("SOCKET_PORT", "3000"))
+DYNAMO_LOG_LINES: int = int(os.environ.get("FLUXDELUXE_DYNAMO_LOG_LINES", "5000"))
+DYNAMO_READY_TIMEOUT_S: float = float(os.environ.get("FLUXDELUXE_DYNAMO_READY_TIMEOUT_S", "30"))
+DYNAMO_READY_LOG_PATTERN: str = os.environ.get(
+    "FLUXDELUXE_DYNAMO_READY_PATTERN",
+    r"(?i)(running on|listening on|server started|application startup complete)",
+)
+# A backend that exits on its own is restarted up to RESTART_MAX times per session, waiting
+# RESTART_BACKOFF_S before the first restart and doubling each time (capped at RESTART_BACKOFF_MAX_S).
+DYNAMO_RESTART_MAX: int = int(os.environ.get("FLUXDELUXE_DYNAMO_RESTART_MAX", "3"))
+DYNAMO_RESTART_BACKOFF_S: float = float(os.environ.get("FLUXDELUXE_DYNAMO_RESTART_BACKOFF_S", "1.0"))
+DYNAMO_RESTART_BACKOFF_MAX_S: float = float(os.environ.get("FLUXDELUXE_DYNAMO_RESTART_BACKOFF_MAX_S", "30"))
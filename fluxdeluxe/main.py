@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import configparser
+import json
 import logging
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 if __name__ == "__main__" and __package__ is None:
@@ -18,6 +20,12 @@ if __name__ == "__main__" and __package__ is None:
 # create a second module instance with a different `_dynamo_process`. Alias the running
 # module so imports see the same state.
 if __name__ == "__main__":
+    # The embedded FluxLite page runs batch rollups in spawned worker processes; in a frozen
+    # build each worker re-launches this executable, and freeze_support() must claim it before
+    # any app start-up (backend spawn, Qt) happens.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     sys.modules.setdefault("FluxDeluxe.main", sys.modules[__name__])
 
 
@@ -29,13 +37,24 @@ logging.basicConfig(
 
 _logger = logging.getLogger(__name__)
 
+from . import config  # noqa: E402
+from . import startup_profile  # noqa: E402
+from .backend_supervisor import BackendSupervisor  # noqa: E402
+
+startup_profile.mark("main")
+
+
+_dynamo_supervisor: "BackendSupervisor | None" = None
+
 
-_dynamo_process: "subprocess.Popen[bytes] | None" = None
+def get_backend_supervisor() -> "BackendSupervisor | None":
+    """Get the DynamoDeluxe backend supervisor (logs, readiness, endpoint); None if not started."""
+    return _dynamo_supervisor
 
 
 def get_dynamo_process() -> "subprocess.Popen[bytes] | None":
-    """Get the DynamoDeluxe backend subprocess (for log viewing, etc.)."""
-    return _dynamo_process
+    """Get the DynamoDeluxe backend subprocess."""
+    return _dynamo_supervisor.process if _dynamo_supervisor is not None else None
 
 
 def _get_dynamo_path() -> Path:
@@ -131,9 +150,92 @@ def _update_dynamo_deluxe() -> None:
         _logger.warning("Unexpected error updating DynamoDeluxe: %s", exc)
 
 
+def _pending_update_marker() -> Path:
+    return startup_profile.history_path().parent / "dynamo_update_pending.json"
+
+
+def _fetch_dynamo_updates() -> None:
+    """
+    Background half of the update: fetch the tracking branch and, if the submodule is
+    behind, leave a marker so the next launch fast-forwards before starting the backend
+    (the running backend's files are never changed underneath it).
+    """
+    submodule_path = _get_dynamo_path()
+    if not submodule_path.exists():
+        return
+    try:
+        branch = _get_dynamo_tracking_branch()
+        status = _git_run(["status", "--porcelain"], cwd=submodule_path)
+        if status.stdout.strip():
+            _logger.warning("DynamoDeluxe has local changes; skipping auto-update (branch=%s).", branch)
+            return
+        _git_run(["fetch", "origin", branch], cwd=submodule_path)
+        result = _git_run(["rev-list", "--count", f"HEAD..origin/{branch}"], cwd=submodule_path)
+        commits_behind = int(result.stdout.strip() or "0")
+        marker = _pending_update_marker()
+        if commits_behind > 0:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.write_text(json.dumps({"branch": branch, "behind": commits_behind}), encoding="utf-8")
+            _logger.info("DynamoDeluxe is %d commit(s) behind; the update will be applied on next launch.", commits_behind)
+        else:
+            try:
+                marker.unlink()
+            except FileNotFoundError:
+                pass
+            _logger.info("DynamoDeluxe is up to date.")
+    except subprocess.CalledProcessError as exc:
+        _logger.warning("Failed to check DynamoDeluxe for updates: %s", exc)
+    except Exception as exc:
+        _logger.warning("Unexpected error checking DynamoDeluxe for updates: %s", exc)
+    finally:
+        startup_profile.mark("update_checked")
+
+
+def _apply_pending_dynamo_update() -> None:
+    """Fast-forward to the commits fetched by a previous launch (local git only, no network)."""
+    marker = _pending_update_marker()
+    if not marker.exists():
+        return
+    submodule_path = _get_dynamo_path()
+    try:
+        branch = _get_dynamo_tracking_branch()
+        status = _git_run(["status", "--porcelain"], cwd=submodule_path)
+        if status.stdout.strip():
+            _logger.warning("DynamoDeluxe has local changes; skipping pending update (branch=%s).", branch)
+            return
+        current_branch = _git_run(["rev-parse", "--abbrev-ref", "HEAD"], cwd=submodule_path).stdout.strip()
+        if current_branch != branch:
+            try:
+                _git_run(["checkout", branch], cwd=submodule_path)
+            except subprocess.CalledProcessError:
+                _git_run(["checkout", "-B", branch, f"origin/{branch}"], cwd=submodule_path)
+        _git_run(["merge", "--ff-only", f"origin/{branch}"], cwd=submodule_path)
+        _logger.info("DynamoDeluxe updated to origin/%s.", branch)
+    except subprocess.CalledProcessError as exc:
+        _logger.warning("Failed to apply pending DynamoDeluxe update: %s", exc)
+    except Exception as exc:
+        _logger.warning("Unexpected error applying DynamoDeluxe update: %s", exc)
+    finally:
+        try:
+            marker.unlink()
+        except Exception:
+            pass
+
+
+def start_background_update_check() -> None:
+    """Run the fetch half of the DynamoDeluxe update off the UI thread (background mode only)."""
+    if config.DYNAMO_UPDATE_MODE != "background":
+        return
+    threading.Thread(target=_fetch_dynamo_updates, name="dynamo-update", daemon=True).start()
+
+
 def _start_dynamo_backend() -> None:
     """Start the DynamoDeluxe backend as a subprocess."""
-    global _dynamo_process
+    global _dynamo_supervisor
+
+    if not config.DYNAMO_AUTOSTART:
+        _logger.info("DynamoDeluxe autostart disabled")
+        return
 
     dynamo_path = _get_dynamo_path()
     if not dynamo_path.exists():
@@ -166,30 +268,10 @@ def _start_dynamo_backend() -> None:
         _logger.info("  Script: %s", main_script)
         _logger.info("  Working directory: %s", working_dir)
         _logger.info("  PYTHONPATH: %s", env["PYTHONPATH"])
-        _dynamo_process = subprocess.Popen(
-            [sys.executable, str(main_script)],
-            cwd=working_dir,
-            env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        _logger.info("DynamoDeluxe backend started (PID: %d)", _dynamo_process.pid)
-
-        # Check if process died immediately
-        import time
-        time.sleep(0.5)
-        poll_result = _dynamo_process.poll()
-        if poll_result is not None:
-            _logger.error("DynamoDeluxe backend exited immediately with code: %d", poll_result)
-            # Try to read any error output
-            stdout_data, stderr_data = _dynamo_process.communicate(timeout=2)
-            if stdout_data:
-                _logger.error("stdout: %s", stdout_data.decode("utf-8", errors="replace")[:2000])
-            if stderr_data:
-                _logger.error("stderr: %s", stderr_data.decode("utf-8", errors="replace")[:2000])
-            _dynamo_process = None
-        else:
-            _logger.info("DynamoDeluxe backend is running")
+        supervisor = BackendSupervisor([sys.executable, str(main_script)], cwd=working_dir, env=env)
+        supervisor.on_ready(lambda _endpoint: startup_profile.mark("backend_ready"))
+        supervisor.start()
+        _dynamo_supervisor = supervisor
     except Exception as exc:
         _logger.error("Failed to start DynamoDeluxe backend: %s", exc)
         import traceback
@@ -198,24 +280,14 @@ def _start_dynamo_backend() -> None:
 
 def _stop_dynamo_backend() -> None:
     """Stop the DynamoDeluxe backend subprocess."""
-    global _dynamo_process
+    global _dynamo_supervisor
 
-    if _dynamo_process is None:
+    if _dynamo_supervisor is None:
         return
-
     try:
-        _logger.info("Stopping DynamoDeluxe backend (PID: %d)...", _dynamo_process.pid)
-        _dynamo_process.terminate()
-        _dynamo_process.wait(timeout=10)
-        _logger.info("DynamoDeluxe backend stopped.")
-    except subprocess.TimeoutExpired:
-        _logger.warning("DynamoDeluxe backend did not stop gracefully, killing...")
-        _dynamo_process.kill()
-        _dynamo_process.wait()
-    except Exception as exc:
-        _logger.error("Error stopping DynamoDeluxe backend: %s", exc)
+        _dynamo_supervisor.stop()
     finally:
-        _dynamo_process = None
+        _dynamo_supervisor = None
 
 
 def run_qt() -> int:
@@ -232,9 +304,8 @@ def run_qt() -> int:
     from PySide6 import QtCore  # type: ignore
     from PySide6.QtCore import Qt  # type: ignore
 
-    from .ui.main_window import MainWindow
-
     app = QtWidgets.QApplication(sys.argv)
+    startup_profile.mark("qt_app")
 
     # App/window icon
     try:
@@ -245,9 +316,12 @@ def run_qt() -> int:
     except Exception:
         pass
 
-    # Splash screen while app + backend come up.
+    # Splash screen while app + backend come up. Skipped headless: QSplashScreen.show() waits
+    # (up to 1 s) for an expose event the offscreen platform never delivers.
     splash = None
     try:
+        if app.platformName() == "offscreen":
+            raise RuntimeError("no display")
         icon_path = Path(__file__).resolve().parent / "ui" / "assets" / "icons" / "fluxliteicon.svg"
         pix = QtGui.QIcon(str(icon_path)).pixmap(256, 256)
         if not pix.isNull():
@@ -256,6 +330,7 @@ def run_qt() -> int:
             splash.setEnabled(False)
             splash.show()
             app.processEvents()
+            startup_profile.mark("splash_shown")
     except Exception:
         splash = None
 
@@ -281,31 +356,56 @@ def run_qt() -> int:
     except Exception as exc:
         logging.getLogger(__name__).warning("Failed to load Qt theme.qss: %s", exc)
 
+    # Import the window (and its tool pages) behind the splash rather than before QApplication.
+    from .ui.main_window import MainWindow
+
+    startup_profile.mark("window_imported")
     win = MainWindow()
+    startup_profile.mark("window_built")
+
+    class _FirstPaintFilter(QtCore.QObject):
+        """Marks the first paint of the main window, then the first idle turn after it."""
+
+        def eventFilter(self, obj, event):  # noqa: N802
+            try:
+                if event.type() == QtCore.QEvent.Type.Paint and isinstance(obj, QtWidgets.QWidget) and obj.window() is win:
+                    app.removeEventFilter(self)
+                    startup_profile.mark("first_paint")
+                    QtCore.QTimer.singleShot(0, _on_interactive)
+            except Exception:
+                pass
+            return False
+
+    def _on_interactive() -> None:
+        startup_profile.mark("interactive")
+        startup_profile.finish()
+        start_background_update_check()
+        if config.STARTUP_EXIT_AFTER_INTERACTIVE:
+            app.quit()
+
+    first_paint_filter = _FirstPaintFilter(app)
+    app.installEventFilter(first_paint_filter)
+
     win.showMaximized()
 
-    # Close splash once backend is detected (or after a short timeout).
+    # Close splash once the backend reports ready (or after a short timeout).
     if splash is not None:
         try:
-            max_ms = 6000
-            interval_ms = 100
-            elapsed_ms = 0
-
-            def _tick() -> None:
-                nonlocal elapsed_ms
-                elapsed_ms += interval_ms
-                try:
-                    if win.is_backend_ready() or elapsed_ms >= max_ms:
-                        splash.finish(win)
-                        splash.deleteLater()
-                        return
-                except Exception:
-                    splash.finish(win)
-                    splash.deleteLater()
+            closed = False
+
+            def _close_splash(*_args) -> None:
+                nonlocal closed
+                if closed:
                     return
-                QtCore.QTimer.singleShot(interval_ms, _tick)
+                closed = True
+                splash.finish(win)
+                splash.deleteLater()
 
-            QtCore.QTimer.singleShot(interval_ms, _tick)
+            if win.is_backend_ready():
+                _close_splash()
+            else:
+                win.backend_state_changed.connect(lambda _ready, _text: _ready and _close_splash())
+                QtCore.QTimer.singleShot(6000, _close_splash)
         except Exception:
             try:
                 splash.finish(win)
@@ -318,11 +418,18 @@ def run_qt() -> int:
 
 
 def main() -> int:
-    # Check for DynamoDeluxe updates before starting the app
-    _update_dynamo_deluxe()
+    # DynamoDeluxe updates: "blocking" pulls now; "background" applies what the previous
+    # launch fetched (fast-forward only) and fetches again once the window is interactive.
+    mode = config.DYNAMO_UPDATE_MODE
+    if mode == "blocking":
+        _update_dynamo_deluxe()
+    elif mode != "off":
+        _apply_pending_dynamo_update()
+    startup_profile.mark("update_applied")
 
     # Start the DynamoDeluxe backend
     _start_dynamo_backend()
+    startup_profile.mark("backend_spawned")
 
     # Qt is required; raise a clear error if unavailable
     try:
@@ -0,0 +1,241 @@
+"""Startup timeline, launch history and import-time report for FluxDeluxe.
+
+`main()` marks phases on a process-wide timeline (t=0 when `fluxdeluxe.main` starts
+executing). `run_qt` marks the first paint of the main window and the first idle turn of
+the event loop after it ("interactive"). `finish()` logs the result and appends one line
+per launch to the history file, so time-to-interactive can be tracked across versions.
+
+Report from the repo root:
+    python -m fluxdeluxe.startup_profile imports                  # -X importtime of the startup imports
+    python -m fluxdeluxe.startup_profile imports --module tools.FluxLite.src.ui.fluxlite_page
+    python -m fluxdeluxe.startup_profile measure --runs 3         # launch headless, record TTI
+    python -m fluxdeluxe.startup_profile history --last 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import config
+
+_logger = logging.getLogger(__name__)
+
+_t0 = time.perf_counter()
+_marks: List[Tuple[str, float]] = []
+_finished = False
+
+HISTORY_KEEP = 500
+
+
+def mark(label: str) -> float:
+    """Record `label` at the current time; returns ms since startup."""
+    ms = (time.perf_counter() - _t0) * 1000.0
+    _marks.append((str(label), ms))
+    return ms
+
+
+def marks() -> Dict[str, float]:
+    """First time (ms) each label was marked."""
+    out: Dict[str, float] = {}
+    for label, ms in _marks:
+        out.setdefault(label, ms)
+    return out
+
+
+def format_timeline() -> str:
+    lines = []
+    prev = 0.0
+    for label, ms in _marks:
+        lines.append(f"  {ms:8.1f} ms  (+{ms - prev:7.1f})  {label}")
+        prev = ms
+    return "\n".join(lines)
+
+
+def history_path() -> Path:
+    configured = str(getattr(config, "STARTUP_HISTORY_PATH", "") or "").strip()
+    if configured:
+        return Path(configured)
+    return Path(__file__).resolve().parent.parent / ".fluxdeluxe" / "startup_history.jsonl"
+
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return out.stdout.strip()
+    except Exception:
+        return ""
+
+
+def finish() -> None:
+    """Log the startup timeline and append it to the launch history (once per process)."""
+    global _finished
+    if _finished:
+        return
+    _finished = True
+    m = marks()
+    tti = m.get("interactive")
+    first_paint = m.get("first_paint")
+    _logger.info(
+        "Startup: first paint %s, interactive %s",
+        f"{first_paint:.0f} ms" if first_paint is not None else "n/a",
+        f"{tti:.0f} ms" if tti is not None else "n/a",
+    )
+    if bool(getattr(config, "STARTUP_PROFILE_VERBOSE", False)):
+        _logger.info("Startup timeline:\n%s", format_timeline())
+    record = {
+        "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "tti_ms": round(tti, 1) if tti is not None else None,
+        "first_paint_ms": round(first_paint, 1) if first_paint is not None else None,
+        "marks": {k: round(v, 1) for k, v in m.items()},
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "qt_platform": os.environ.get("QT_QPA_PLATFORM", ""),
+        "git_rev": _git_rev(),
+    }
+    try:
+        path = history_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        _trim_history(path)
+    except Exception as exc:
+        _logger.debug("Could not record startup history: %s", exc)
+
+
+def _trim_history(path: Path) -> None:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        if len(lines) > 2 * HISTORY_KEEP:
+            path.write_text("\n".join(lines[-HISTORY_KEEP:]) + "\n", encoding="utf-8")
+    except Exception:
+        pass
+
+
+def load_history(path: Optional[Path] = None) -> List[dict]:
+    out: List[dict] = []
+    try:
+        with (path or history_path()).open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    out.append(json.loads(line))
+                except Exception:
+                    continue
+    except FileNotFoundError:
+        pass
+    return out
+
+
+# --- -X importtime report ---
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parse `-X importtime` output into (module, self_us, cumulative_us, depth)."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, cum_us, name = rest.split("|", 2)
+            depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+            rows.append((name.strip(), int(self_us), int(cum_us), max(0, depth)))
+        except ValueError:
+            continue
+    return rows
+
+
+def run_importtime(module: str) -> List[Tuple[str, int, int, int]]:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).resolve().parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"import {module} failed")
+    return parse_importtime(proc.stderr)
+
+
+def _cmd_imports(args) -> int:
+    for module in args.module:
+        rows = run_importtime(module)
+        top_level = [r for r in rows if r[3] == 0]
+        total_ms = sum(r[2] for r in top_level) / 1000.0
+        print(f"{module}: {len(rows)} modules, {total_ms:.1f} ms total (top-level cumulative)")
+        print(f"  {'cumulative':>11} {'self':>9}  module")
+        for name, self_us, cum_us, depth in sorted(rows, key=lambda r: -r[2])[: args.top]:
+            print(f"  {cum_us / 1000.0:9.1f}ms {self_us / 1000.0:7.1f}ms  {'  ' * min(depth, 6)}{name}")
+        print()
+    return 0
+
+
+def _cmd_measure(args) -> int:
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["FLUXDELUXE_EXIT_AFTER_STARTUP"] = "1"
+    if not args.with_backend:
+        env["FLUXDELUXE_DYNAMO_AUTOSTART"] = "0"
+        env["FLUXDELUXE_DYNAMO_UPDATE"] = "off"
+    before = len(load_history())
+    for _ in range(max(1, args.runs)):
+        subprocess.run([sys.executable, "-m", "fluxdeluxe.main"], cwd=Path(__file__).resolve().parent.parent, env=env, check=False)
+    new = load_history()[before:]
+    for rec in new:
+        print(f"{rec.get('ts')}  first paint {rec.get('first_paint_ms')} ms  interactive {rec.get('tti_ms')} ms")
+    ttis = sorted(r["tti_ms"] for r in new if r.get("tti_ms") is not None)
+    if ttis:
+        print(f"interactive: min {ttis[0]:.0f} ms, median {ttis[len(ttis) // 2]:.0f} ms over {len(ttis)} run(s)")
+    return 0 if ttis else 1
+
+
+def _cmd_history(args) -> int:
+    rows = load_history()[-args.last :]
+    if not rows:
+        print(f"no startup history at {history_path()}")
+        return 0
+    print(f"{'when':<20} {'paint':>8} {'interactive':>12} {'backend':>9}  rev")
+    for r in rows:
+        m = r.get("marks") or {}
+        backend = m.get("backend_ready")
+        print(
+            f"{r.get('ts', ''):<20} {r.get('first_paint_ms') or '-':>8} {r.get('tti_ms') or '-':>12} "
+            f"{backend if backend is not None else '-':>9}  {r.get('git_rev', '')}"
+        )
+    return 0
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m fluxdeluxe.startup_profile", description="FluxDeluxe startup profiling")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    imp = sub.add_parser("imports", help="-X importtime report for startup imports")
+    imp.add_argument("--module", nargs="+", default=["fluxdeluxe.ui.main_window"])
+    imp.add_argument("--top", type=int, default=25)
+    mea = sub.add_parser("measure", help="launch headless, exit once interactive, report time-to-interactive")
+    mea.add_argument("--runs", type=int, default=3)
+    mea.add_argument("--with-backend", action="store_true", help="also start DynamoDeluxe / run the update check")
+    his = sub.add_parser("history", help="recent launches")
+    his.add_argument("--last", type=int, default=20)
+    args = ap.parse_args(argv)
+    return {"imports": _cmd_imports, "measure": _cmd_measure, "history": _cmd_history}[args.cmd](args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
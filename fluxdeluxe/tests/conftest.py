@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Tests import the host app as `fluxdeluxe.*`, the same way `python -m fluxdeluxe.main` runs it from the repo root.
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
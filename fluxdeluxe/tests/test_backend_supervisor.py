@@ -0,0 +1,192 @@
+import io
+import subprocess
+import threading
+
+from fluxdeluxe.backend_supervisor import BackendSupervisor
+
+READY_PATTERN = r"socket\.io listening on (?P<socket_port>\d+)"
+
+
+class _StubProcess:
+    """Just enough of `subprocess.Popen` for the supervisor, driven by the test instead of an OS process."""
+
+    _next_pid = 4000
+
+    def __init__(self, *, ready_port=None, crash_rc=None, stubborn=False):
+        _StubProcess._next_pid += 1
+        self.pid = _StubProcess._next_pid
+        out = f"booting\nsocket.io listening on {ready_port}\n" if ready_port else "booting\n"
+        self.stdout = io.BytesIO(out.encode("utf-8"))
+        self.stderr = io.BytesIO(b"")
+        self.stubborn = stubborn
+        self.calls = []
+        self.returncode = None
+        self._exited = threading.Event()
+        if crash_rc is not None:
+            self.exit(crash_rc)
+
+    def exit(self, rc):
+        self.returncode = rc
+        self._exited.set()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if not self._exited.wait(timeout):
+            raise subprocess.TimeoutExpired("dynamo", timeout)
+        return self.returncode
+
+    def terminate(self):
+        self.calls.append("terminate")
+        if not self.stubborn:
+            self.exit(-15)
+
+    def kill(self):
+        self.calls.append("kill")
+        self.exit(-9)
+
+
+class _Popen:
+    def __init__(self, *procs):
+        self.procs = list(procs)
+        self.launched = []
+
+    def __call__(self, argv, **kwargs):
+        proc = self.procs.pop(0)
+        self.launched.append(proc)
+        return proc
+
+
+class _Delays(threading.Event):
+    """The supervisor's stop event, recording each backoff wait."""
+
+    def __init__(self):
+        super().__init__()
+        self.waits = []
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        return super().wait(timeout)
+
+
+def _supervisor(popen, **kwargs):
+    kwargs.setdefault("restart_backoff_s", 0.01)
+    sup = BackendSupervisor(
+        ["dynamo"], cwd=".", env={}, host="localhost", http_port=1, socket_port=2,
+        ready_log_pattern=READY_PATTERN, popen=popen, **kwargs,
+    )
+    sup._probe_once = lambda: None  # readiness only from the log line; no sockets
+    sup._stop = _Delays()
+    return sup
+
+
+def test_ready_from_the_log_line_resolves_the_endpoint():
+    popen = _Popen(_StubProcess(ready_port=3100))
+    sup = _supervisor(popen)
+    seen = []
+    sup.on_ready(seen.append)
+    sup.start()
+    try:
+        endpoint = sup.wait_ready(2.0)
+        assert endpoint is not None and (endpoint.socket_port, endpoint.source) == (3100, "log")
+        assert seen == [endpoint]
+        # A late subscriber hears about the current endpoint straight away.
+        late = []
+        sup.on_ready(late.append)
+        assert late == [endpoint]
+    finally:
+        sup.stop(timeout_s=1.0)
+
+
+def test_crash_after_ready_restarts_with_backoff_and_reports_ready_again():
+    first = _StubProcess(ready_port=3100)
+    popen = _Popen(first, _StubProcess(crash_rc=1), _StubProcess(ready_port=3200))
+    sup = _supervisor(popen, restart_max=3, restart_backoff_s=0.01)
+    ready, exits = [], []
+    again = threading.Event()
+    sup.on_ready(lambda e: (ready.append(e.socket_port), len(ready) == 2 and again.set()))
+    sup.on_exit(exits.append)
+    sup.start()
+    try:
+        assert sup.wait_ready(2.0) is not None
+        first.exit(1)
+        assert again.wait(2.0)
+        assert ready == [3100, 3200]
+        assert sup.endpoint().socket_port == 3200 and sup.is_ready()
+        assert len(popen.launched) == 3 and sup.restarts == 2
+        # Doubling backoff between attempts; nothing reported as a final exit.
+        assert sup._stop.waits == [0.01, 0.02]
+        assert exits == []
+    finally:
+        sup.stop(timeout_s=1.0)
+
+
+def test_gives_up_after_the_restart_budget_and_reports_the_exit_once():
+    popen = _Popen(*(_StubProcess(crash_rc=3) for _ in range(4)))
+    sup = _supervisor(popen, restart_max=3, restart_backoff_s=0.01, restart_backoff_max_s=0.03)
+    exits = []
+    done = threading.Event()
+    sup.on_exit(lambda rc: (exits.append(rc), done.set()))
+    sup.start()
+    try:
+        assert done.wait(2.0)
+        assert exits == [3] and len(popen.launched) == 4
+        assert sup._stop.waits == [0.01, 0.02, 0.03]  # capped at restart_backoff_max_s
+        assert not sup.is_ready() and sup.endpoint() is None
+        late = []
+        sup.on_exit(late.append)
+        assert late == [3]
+    finally:
+        sup.stop(timeout_s=1.0)
+
+
+def test_restart_max_zero_reports_the_first_exit():
+    popen = _Popen(_StubProcess(crash_rc=2))
+    sup = _supervisor(popen, restart_max=0)
+    done = threading.Event()
+    sup.on_exit(lambda rc: done.set())
+    sup.start()
+    try:
+        assert done.wait(2.0)
+        assert len(popen.launched) == 1 and sup._stop.waits == []
+    finally:
+        sup.stop(timeout_s=1.0)
+
+
+def test_stop_terminates_without_restarting_or_reporting_an_exit():
+    proc = _StubProcess(ready_port=3100)
+    popen = _Popen(proc, _StubProcess(ready_port=3200))
+    sup = _supervisor(popen)
+    exits = []
+    sup.on_exit(exits.append)
+    sup.start()
+    assert sup.wait_ready(2.0) is not None
+    sup.stop(timeout_s=1.0)
+    assert proc.calls == ["terminate"] and not sup.is_running()
+    assert len(popen.launched) == 1 and exits == []
+
+
+def test_stop_kills_a_backend_that_ignores_terminate():
+    proc = _StubProcess(ready_port=3100, stubborn=True)
+    sup = _supervisor(_Popen(proc))
+    sup.start()
+    assert sup.wait_ready(2.0) is not None
+    sup.stop(timeout_s=0.05)
+    assert proc.calls == ["terminate", "kill"] and proc.returncode == -9
+
+
+def test_stop_during_backoff_cancels_the_restart():
+    popen = _Popen(_StubProcess(crash_rc=1), _StubProcess(ready_port=3200))
+    sup = _supervisor(popen, restart_max=3, restart_backoff_s=30.0)
+    exits = []
+    sup.on_exit(exits.append)
+    sup.start()
+    for _ in range(200):
+        if sup._stop.waits:
+            break
+        threading.Event().wait(0.01)
+    assert sup._stop.waits == [30.0]
+    sup.stop(timeout_s=1.0)
+    assert all(not t.is_alive() for t in sup._threads)
+    assert len(popen.launched) == 1 and exits == []
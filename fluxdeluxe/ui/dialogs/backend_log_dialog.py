@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import threading
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, Signal, QObject
@@ -15,7 +14,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QFont, QTextCursor
 
 if TYPE_CHECKING:
-    import subprocess
+    from ...backend_supervisor import RingLog
 
 
 class LogSignals(QObject):
@@ -40,8 +39,7 @@ class BackendLogDialog(QDialog):
         self._setup_ui()
         self._signals = LogSignals()
         self._signals.log_received.connect(self._append_log)
-        self._reader_threads: list[threading.Thread] = []
-        self._stop_event = threading.Event()
+        self._log: "RingLog | None" = None
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -50,6 +48,7 @@ class BackendLogDialog(QDialog):
         self._log_view = QPlainTextEdit()
         self._log_view.setReadOnly(True)
         self._log_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._log_view.setMaximumBlockCount(20000)
         self._log_view.setFont(QFont("Consolas", 9))
         self._log_view.setStyleSheet(
             "QPlainTextEdit { background-color: #1e1e1e; color: #d4d4d4; }"
@@ -81,46 +80,21 @@ class BackendLogDialog(QDialog):
         if self._auto_scroll_cb.isChecked():
             self._log_view.moveCursor(QTextCursor.MoveOperation.End)
 
-    def start_reading(self, process: "subprocess.Popen"):
-        """Start background threads to read stdout/stderr from the process."""
-        self._stop_event.clear()
-
-        if process.stdout:
-            t = threading.Thread(
-                target=self._read_stream,
-                args=(process.stdout, "[stdout]"),
-                daemon=True,
-            )
-            t.start()
-            self._reader_threads.append(t)
-
-        if process.stderr:
-            t = threading.Thread(
-                target=self._read_stream,
-                args=(process.stderr, "[stderr]"),
-                daemon=True,
-            )
-            t.start()
-            self._reader_threads.append(t)
-
-    def _read_stream(self, stream, prefix: str):
-        """Read lines from a stream and emit signals."""
-        try:
-            for line in iter(stream.readline, b""):
-                if self._stop_event.is_set():
-                    break
-                try:
-                    text = line.decode("utf-8", errors="replace")
-                    self._signals.log_received.emit(text)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-    def stop_reading(self):
-        """Stop the reader threads."""
-        self._stop_event.set()
-        self._reader_threads.clear()
+    def attach(self, log: "RingLog"):
+        """Show `log`'s buffered lines, then follow it live (its supervisor owns the pipes)."""
+        self.detach()
+        self._log = log
+        log.subscribe(self._on_line)
+
+    def _on_line(self, stream: str, text: str):
+        # Called on supervisor reader threads; the signal hops to the UI thread.
+        self._signals.log_received.emit(text)
+
+    def detach(self):
+        """Stop following the attached log."""
+        if self._log is not None:
+            self._log.unsubscribe(self._on_line)
+            self._log = None
 
     def closeEvent(self, event):
         """Hide instead of close so we can reopen."""
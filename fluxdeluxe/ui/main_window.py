@@ -3,23 +3,30 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from PySide6 import QtWidgets, QtGui, QtCore
 
 from .dialogs.backend_log_dialog import BackendLogDialog
 from .tools.launcher_page import ToolLauncherPage
 from .tools.tool_registry import ToolSpec, default_tools
-from .tools.metrics_editor_page import MetricsEditorPage
-from .tools.web_tool_page import WebToolPage
+
+if TYPE_CHECKING:
+    # Imported on first use: the metrics editor pulls in `requests`, which dominates startup imports.
+    from .tools.metrics_editor_page import MetricsEditorPage
+    from .tools.web_tool_page import WebToolPage
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # (ready, status text); emitted from backend supervisor threads, delivered on the UI thread.
+    backend_state_changed = QtCore.Signal(bool, str)
+
     def __init__(self) -> None:
         super().__init__()
         self._logger = logging.getLogger(__name__)
         self._backend_ready = False
-        self._backend_probe_attempts = 0
+        self._backend_supervisor = None
+        self.backend_state_changed.connect(self._on_backend_state)
         self.setWindowTitle("FluxDeluxe")
 
         # Window icon (matches app icon set in fluxdeluxe/main.py)
@@ -54,10 +61,8 @@ class MainWindow(QtWidgets.QMainWindow):
         # --- Metrics Editor tool page (lazy loaded; does NOT require backend) ---
         self._metrics_editor_page: Optional[MetricsEditorPage] = None
 
-        # --- Web tool host page (hosted Streamlit, etc) ---
-        self.web_tool_page = WebToolPage()
-        self.web_tool_page.btn_home.clicked.connect(self.show_home)
-        self.tool_stack.addWidget(self.web_tool_page)
+        # --- Web tool host page (hosted Streamlit, etc; lazy loaded) ---
+        self.web_tool_page: Optional[WebToolPage] = None
 
         self.setCentralWidget(central)
 
@@ -78,8 +83,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_backend_logs.clicked.connect(self._show_backend_logs)
         self.statusBar().addPermanentWidget(self.btn_backend_logs)
 
-        # Start reading backend logs (and mark backend ready when detected)
-        self._setup_backend_log_reader()
+        # Attach backend logs and readiness (the supervisor probes; we just listen)
+        self._attach_backend_supervisor()
 
         # Always start at Home (tool grid)
         self.show_home()
@@ -102,7 +107,16 @@ class MainWindow(QtWidgets.QMainWindow):
         try:
             from tools.FluxLite.src.ui.fluxlite_page import FluxLitePage  # type: ignore
 
-            page = FluxLitePage()
+            # Hand over the endpoint the supervisor already resolved so FluxLite skips its own discovery.
+            endpoint = self._backend_endpoint()
+            if endpoint is not None:
+                page = FluxLitePage(
+                    backend_host=endpoint.host,
+                    http_port=endpoint.http_port,
+                    socket_port=endpoint.socket_port,
+                )
+            else:
+                page = FluxLitePage()
             self._fluxlite_page = page
             self.tool_stack.addWidget(page)
 
@@ -140,6 +154,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if self._metrics_editor_page is not None:
             return self._metrics_editor_page
 
+        from .tools.metrics_editor_page import MetricsEditorPage
+
         page = MetricsEditorPage()
         self._metrics_editor_page = page
         self.tool_stack.addWidget(page)
@@ -152,6 +168,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
         return page
 
+    def _ensure_web_tool_page(self) -> WebToolPage:
+        if self.web_tool_page is not None:
+            return self.web_tool_page
+
+        from .tools.web_tool_page import WebToolPage
+
+        page = WebToolPage()
+        page.btn_home.clicked.connect(self.show_home)
+        self.web_tool_page = page
+        self.tool_stack.addWidget(page)
+        return page
+
     def open_tool(self, tool_id: str) -> None:
         # Avoid UI-triggered races: do not open tools until backend is detected.
         if not self._backend_ready and str(tool_id or "").strip() != "metrics_editor":
@@ -183,52 +211,48 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         if spec.kind == "web":
-            self.tool_stack.setCurrentWidget(self.web_tool_page)
+            page = self._ensure_web_tool_page()
+            self.tool_stack.setCurrentWidget(page)
             self.tool_title.setText(spec.name)
             try:
-                self.web_tool_page.set_tool(title=spec.name, url=str(spec.url or ""))
+                page.set_tool(title=spec.name, url=str(spec.url or ""))
             except Exception:
                 pass
             return
 
-    def _setup_backend_log_reader(self) -> None:
-        """Set up the backend log dialog to read from the DynamoDeluxe process."""
+    def _attach_backend_supervisor(self) -> None:
+        """Mirror the DynamoDeluxe supervisor's log and readiness into the UI."""
         try:
             main_module = self._resolve_main_module()
-            process = getattr(main_module, "get_dynamo_process", lambda: None)()
-
-            if process is not None:
-                dialog = BackendLogDialog.get_instance(self)
-                dialog.start_reading(process)
-                self._backend_ready = True
-                try:
-                    self.status_label.setText("Backend ready")
-                except Exception:
-                    pass
+            supervisor = getattr(main_module, "get_backend_supervisor", lambda: None)()
+            if supervisor is None:
+                # Not launched by us (autostart off / submodule missing): tools find the backend themselves.
+                self._on_backend_state(True, "")
                 return
+            self._backend_supervisor = supervisor
+            BackendLogDialog.get_instance(self).attach(supervisor.log)
+            self._on_backend_state(False, "Starting backend…")
+            supervisor.on_ready(lambda _endpoint: self.backend_state_changed.emit(True, "Backend ready"))
+            supervisor.on_exit(lambda rc: self.backend_state_changed.emit(False, f"Backend exited (code {rc}); see Backend Logs"))
+        except Exception:
+            self._logger.exception("Error attaching backend supervisor")
 
-            # Backend handle not available yet: retry a few times.
-            self._backend_probe_attempts += 1
-            if self._backend_probe_attempts <= 25:
-                try:
-                    self.status_label.setText("Starting backend…")
-                except Exception:
-                    pass
-                QtCore.QTimer.singleShot(200, self._setup_backend_log_reader)
-            else:
-                self._logger.warning("Backend process handle not found after retries.")
-                try:
-                    self.status_label.setText("Backend not detected")
-                except Exception:
-                    pass
+    def _on_backend_state(self, ready: bool, text: str) -> None:
+        self._backend_ready = bool(ready)
+        try:
+            self.status_label.setText(text)
         except Exception:
-            self._logger.exception("Error setting up backend log reader")
+            pass
+
+    def _backend_endpoint(self):
+        supervisor = self._backend_supervisor
+        return supervisor.endpoint() if supervisor is not None else None
 
     def _resolve_main_module(self):
         """Resolve the running main module (works with `-m` and with normal imports)."""
         # If launched via `python -m FluxDeluxe.main`, the process is stored on __main__.
         mod = sys.modules.get("__main__")
-        if mod is not None and hasattr(mod, "get_dynamo_process"):
+        if mod is not None and hasattr(mod, "get_backend_supervisor"):
             return mod
 
         # Otherwise (or after our aliasing), this should work.
@@ -250,7 +274,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Stop backend log reader
         try:
             dialog = BackendLogDialog.get_instance(self)
-            dialog.stop_reading()
+            dialog.detach()
         except Exception:
             pass
 
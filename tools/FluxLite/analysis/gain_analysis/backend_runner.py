@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import os
 from dataclasses import dataclass
@@ -43,19 +44,42 @@ def _hash_key(*parts: str) -> str:
     return h.hexdigest()[:12]
 
 
+def _shared_cache():
+    """The app-wide processed-output cache, when the app package is importable."""
+    try:
+        from src.infra.processed_cache import shared_cache  # type: ignore
+
+        return shared_cache()
+    except Exception:
+        return None
+
+
+def _post(url: str, body: Dict[str, object], *, timeout_s: float) -> requests.Response:
+    """POST through the app's pooled keep-alive client (retries, metrics) when the app package is importable."""
+    headers = {"Content-Type": "application/json"}
+    try:
+        from src.infra.http_client import shared_client  # type: ignore
+    except Exception:
+        return requests.post(url, data=json.dumps(body), headers=headers, timeout=timeout_s)
+    return shared_client().request("POST", url, timeout_s=float(timeout_s), headers=headers, data=json.dumps(body))
+
+
 def _sanitize_csv_headers(input_csv_path: str, cache_dir: str) -> str:
     """
     Backend `process-csv` expects exact header names (e.g. `device_id`) and does not
-    always trim whitespace. Some discrete CSVs contain padded headers like `device_id   `.
-    This helper writes a sanitized copy with stripped headers and returns its path.
+    always trim whitespace. Some discrete CSVs contain padded headers like `device_id   `
+    (or a UTF-8 BOM). This helper writes a sanitized copy with stripped headers and returns
+    its path, or the input itself when it is already clean.
+
+    The check and the rewrite match the app's `process_csv_via_backend(sanitize_header=True)`
+    byte for byte, so both send the same bytes and share processed-cache entries.
     """
     abs_in = os.path.abspath(input_csv_path)
     st = os.stat(abs_in)
     # Bump the version if sanitize behavior changes so cached inputs are regenerated.
-    cache_id = _hash_key(abs_in, str(st.st_mtime_ns), str(st.st_size), "sanitized_v2")
+    cache_id = _hash_key(abs_in, str(st.st_mtime_ns), str(st.st_size), "sanitized_v3")
     in_base = os.path.splitext(os.path.basename(abs_in))[0]
     out_dir = os.path.join(cache_dir, "_inputs")
-    _safe_mkdir(out_dir)
     out_path = os.path.join(out_dir, f"{in_base}__{cache_id}.csv")
     if os.path.isfile(out_path) and os.path.getsize(out_path) > 0:
         return out_path
@@ -67,17 +91,25 @@ def _sanitize_csv_headers(input_csv_path: str, cache_dir: str) -> str:
         header = next(reader, None)
         if not header:
             raise ValueError(f"empty csv: {abs_in}")
-        header_clean = [str(h or "").strip() for h in header]
+        header_clean = [str(h or "").lstrip("\ufeff").strip() for h in header]
         # Identify columns where trimming values is helpful for backend filtering.
         device_id_idx = -1
         try:
             device_id_idx = header_clean.index("device_id")
         except Exception:
             device_id_idx = -1
+        first_row = next(reader, None)
+        needs_rewrite = header != header_clean
+        if not needs_rewrite and first_row is not None and 0 <= device_id_idx < len(first_row):
+            needs_rewrite = first_row[device_id_idx] != str(first_row[device_id_idx] or "").strip()
+        if not needs_rewrite:
+            return abs_in
+        _safe_mkdir(out_dir)
         with open(out_path, "w", encoding="utf-8", newline="") as dst:
-            writer = csv.writer(dst)
+            writer = csv.writer(dst, lineterminator="\n")
             writer.writerow(header_clean)
-            for row in reader:
+            rows = reader if first_row is None else itertools.chain([first_row], reader)
+            for row in rows:
                 if device_id_idx >= 0 and device_id_idx < len(row):
                     try:
                         row[device_id_idx] = str(row[device_id_idx] or "").strip()
@@ -125,6 +157,26 @@ def process_csv_with_cache(
     if os.path.isfile(cached_path) and os.path.getsize(cached_path) > 0:
         return cached_path
 
+    # Same request already answered for another flow (or another cache_dir)?
+    # Correction-off runs use the mode the app's temperature-off baselines send.
+    mode = "scalar" if coef_z is not None else "legacy"
+    shared = _shared_cache()
+    shared_key = None
+    if shared is not None:
+        try:
+            shared_key = shared.key(
+                input_csv_path=abs_in_sanitized,
+                device_id=device_id,
+                use_temperature_correction=coef_z is not None,
+                mode=mode,
+                coefficients=None if coef_z is None else {"x": 0.0, "y": 0.0, "z": float(coef_z)},
+                room_temp_f=cfg.room_temperature_f,
+            )
+            if shared.materialize(shared_key, cached_path):
+                return cached_path
+        except Exception:
+            shared_key = None
+
     url = cfg.process_csv_url()
     body: Dict[str, object] = {
         "csvPath": abs_in_sanitized,
@@ -132,13 +184,12 @@ def process_csv_with_cache(
         "outputDir": os.path.abspath(cache_dir),
         "use_temperature_correction": bool(coef_z is not None),
         "room_temperature_f": float(cfg.room_temperature_f),
-        "mode": "scalar",
+        "mode": mode,
     }
     if coef_z is not None:
         body["temperature_correction_coefficients"] = {"x": 0.0, "y": 0.0, "z": float(coef_z)}
 
-    headers = {"Content-Type": "application/json"}
-    resp = requests.post(url, data=json.dumps(body), headers=headers, timeout=timeout_s)
+    resp = _post(url, body, timeout_s=timeout_s)
     if resp.status_code >= 400:
         # Include response body to make schema/validation errors debuggable.
         raise RuntimeError(
@@ -170,6 +221,8 @@ def process_csv_with_cache(
                     os.remove(out_csv_path_abs)
                 except Exception:
                     pass
+        if shared is not None and shared_key:
+            shared.put(shared_key, cached_path)
         return cached_path
 
     # If backend wrote remotely and only returned a path, fail loudly (we need local files to parse).
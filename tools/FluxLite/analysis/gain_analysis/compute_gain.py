@@ -7,6 +7,8 @@ import statistics
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
 from .io_discrete import DiscreteRow, SENSOR_PREFIXES
 
 
@@ -54,6 +56,48 @@ def parse_processed_sumz(processed_csv_path: str) -> List[Tuple[int, str, float]
     """
     Parse processed CSV and return [(time_ms, phase, sum_z)] in file order.
     """
+    try:
+        from src.infra.columnar_csv import load_csv_columns  # type: ignore
+    except Exception:
+        load_csv_columns = None  # type: ignore
+    if load_csv_columns is None:
+        return _parse_processed_sumz_rows(processed_csv_path)
+
+    table = load_csv_columns(processed_csv_path)
+    if table is None:
+        return []
+    n = table.n_rows
+    t_ms = _first_number(table, ("time", "time_ms"))
+    t_ms = np.where(np.isfinite(t_ms), np.trunc(t_ms), 0.0).astype(np.int64)
+    sz = _first_number(table, ("sum-z", "sum_z"))
+    sz = np.where(np.isnan(sz), 0.0, sz)
+
+    phases = np.full(n, _norm_phase(""), dtype=object)
+    pending = np.ones(n, dtype=bool)
+    for name in ("phase_name", "phase"):
+        if not table.has(name):
+            continue
+        txt = table.text(name)
+        present = pending & (txt != "")
+        phases[present] = table.text(name, _norm_phase)[present]
+        pending &= ~present
+    return list(zip(t_ms.tolist(), phases.tolist(), sz.tolist()))
+
+
+def _first_number(table, names: Tuple[str, ...]) -> "np.ndarray":
+    """`float(a or b or 0)` per row: first non-blank cell among `names`; NaN where that cell is not a number."""
+    out = np.zeros(table.n_rows, dtype=np.float64)
+    pending = np.ones(table.n_rows, dtype=bool)
+    for name in names:
+        if not table.has(name):
+            continue
+        present = pending & ~table.blank(name)
+        out[present] = table.column(name)[present]
+        pending &= ~present
+    return out
+
+
+def _parse_processed_sumz_rows(processed_csv_path: str) -> List[Tuple[int, str, float]]:
     out: List[Tuple[int, str, float]] = []
     with open(processed_csv_path, "r", encoding="utf-8", newline="") as handle:
         reader = csv.DictReader(handle, skipinitialspace=True)
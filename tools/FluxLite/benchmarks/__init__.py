@@ -0,0 +1,7 @@
+"""
+Headless benchmark suite for FluxLite analysis and live paths.
+
+Synthetic plate streams and temperature-test files (benchmarks.synth) drive the hot paths
+(benchmarks.cases); benchmarks.runner times them and writes / compares JSON results.
+Runs offline: no backend, no hardware and no Qt display.
+"""
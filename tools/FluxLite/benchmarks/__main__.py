@@ -0,0 +1,93 @@
+"""
+Benchmark suite entry point.
+
+Run from tools/FluxLite:
+    python -m benchmarks list
+    python -m benchmarks run --out bench-main.json
+    python -m benchmarks run --quick --only analyzer live.
+    python -m benchmarks compare bench-main.json bench-branch.json --threshold 0.15
+    python -m benchmarks run --out bench-branch.json --compare bench-main.json
+
+`compare` (and `run --compare`) exits with status 1 when any case regressed by more than
+the threshold, so it can gate a CI job.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+# No display is ever needed; keep any incidental Qt import headless.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from .cases import CASES, configure_isolated_caches, select  # noqa: E402
+from .runner import compare_results, format_comparison, load_results, run_suite, save_results  # noqa: E402
+
+
+def _compare(baseline_path: str, current: dict, threshold: float, stat: str) -> int:
+    rows = compare_results(load_results(baseline_path), current, threshold=threshold, stat=stat)
+    print(format_comparison(rows, stat=stat))
+    regressed = [r.name for r in rows if r.status == "regression"]
+    if regressed:
+        print(f"{len(regressed)} regression(s) beyond {threshold * 100:.0f}%: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    sub.add_parser("list", help="list benchmark cases")
+
+    run = sub.add_parser("run", help="run the suite and optionally save / compare results")
+    run.add_argument("--only", nargs="*", default=[], help="run cases whose name contains any of these")
+    run.add_argument("--quick", action="store_true", help="small inputs (smoke run)")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--out", default="", help="write results JSON here")
+    run.add_argument("--compare", default="", help="baseline results JSON to compare against")
+    run.add_argument("--threshold", type=float, default=0.10, help="relative slowdown flagged as a regression")
+    run.add_argument("--stat", choices=("min_s", "median_s", "mean_s"), default="min_s")
+    run.add_argument("--workdir", default="", help="keep synthetic inputs here (default: temporary, removed afterwards)")
+
+    cmp_ = sub.add_parser("compare", help="compare two results files")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("current")
+    cmp_.add_argument("--threshold", type=float, default=0.10)
+    cmp_.add_argument("--stat", choices=("min_s", "median_s", "mean_s"), default="min_s")
+
+    args = ap.parse_args(argv)
+
+    if args.cmd == "list":
+        for c in CASES:
+            print(f"{c.name:<44} {c.description}")
+        return 0
+
+    if args.cmd == "compare":
+        return _compare(args.baseline, load_results(args.current), args.threshold, args.stat)
+
+    cases = select(list(args.only or []))
+    if not cases:
+        print(f"no cases match {args.only}")
+        return 2
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix="fluxlite_bench_")
+    configure_isolated_caches(workdir)
+    try:
+        doc = run_suite(cases, quick=bool(args.quick), repeats=int(args.repeats), workdir=workdir)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    if args.out:
+        print(f"results: {save_results(doc, args.out)}")
+    failed = [name for name, r in doc["results"].items() if r.get("error")]
+    status = 1 if failed else 0
+    if args.compare:
+        status = max(status, _compare(args.compare, doc, args.threshold, args.stat))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
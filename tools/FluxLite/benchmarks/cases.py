@@ -0,0 +1,204 @@
+"""
+Benchmark cases: analysis and live hot paths on synthetic inputs.
+
+Each setup writes or generates its inputs under the run's work directory and returns the
+call to time. Cases that read CSVs through the columnar loader drop its memo (and, for
+the cold variants, the NPZ cache) before every repeat so each timing includes the parse.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from typing import List
+
+from src import config
+from src.infra import columnar_csv
+
+from . import synth
+from .runner import Case, Context, Prepared
+
+DEVICE_ID = "07.00000051"
+
+
+def _drop_csv_caches(*, npz: bool = True) -> None:
+    columnar_csv.clear_memo()
+    if npz:
+        shutil.rmtree(columnar_csv.cache_dir(), ignore_errors=True)
+
+
+# --- analysis ---
+
+
+def _analyze_setup(ctx: Context, *, npz: bool) -> Prepared:
+    from src.app_services.analysis.temperature_analyzer import TemperatureAnalyzer
+
+    samples = synth.temperature_test_samples(device_type="07", hz=ctx.size(100, 50))
+    path = synth.write_processed_temperature_csv(ctx.path("temp", "temp-processed-bench.csv"), samples)
+    meta = {"device_id": DEVICE_ID, "body_weight_n": synth.BODY_WEIGHT_N}
+    ta = TemperatureAnalyzer()
+
+    def run() -> object:
+        out = ta.analyze_single_processed_csv(path, meta)
+        cells = sum(len(st["cells"]) for st in out["data"]["stages"].values())
+        if not cells:
+            raise RuntimeError("analyzer found no cells in the synthetic run")
+        return out
+
+    return Prepared(run, items=len(samples), item="row", before_each=lambda: _drop_csv_caches(npz=not npz))
+
+
+def analyze_single_processed_csv(ctx: Context) -> Prepared:
+    return _analyze_setup(ctx, npz=False)
+
+
+def analyze_single_processed_csv_npz(ctx: Context) -> Prepared:
+    return _analyze_setup(ctx, npz=True)
+
+
+def select_best_window_optimized(ctx: Context) -> Prepared:
+    from src.app_services.analysis.temperature_analyzer import TemperatureAnalyzer
+
+    segs = synth.window_segments(ctx.size(400, 60))
+    window_ms = int(getattr(config, "TEMP_ANALYSIS_WINDOW_MS", 1000))
+    tol_ms = int(getattr(config, "TEMP_ANALYSIS_WINDOW_TOL_MS", 200))
+    ta = TemperatureAnalyzer()
+
+    def run() -> object:
+        return [ta._select_best_window_optimized(s, window_ms, tol_ms) for s in segs]
+
+    return Prepared(run, items=len(segs), item="segment")
+
+
+def _downsample_setup(ctx: Context, strategy: str) -> Prepared:
+    from src.app_services.repositories.csv_transform_repository import CsvTransformRepository
+
+    samples = synth.plate_session(ctx.size(60, 10), hz=1000.0, seed=2)
+    src_csv = synth.write_raw_capture_csv(ctx.path("raw", "temp-raw-bench.csv"), samples, device_id=DEVICE_ID)
+    dest = ctx.path("raw", f"temp-trimmed-bench-{strategy}.csv")
+    repo = CsvTransformRepository()
+    return Prepared(lambda: repo.downsample_csv(src_csv, dest, rate_hz=50.0, strategy=strategy), items=len(samples), item="row")
+
+
+def downsample_csv_to_50hz(ctx: Context) -> Prepared:
+    return _downsample_setup(ctx, "decimate")
+
+
+def downsample_csv_fir(ctx: Context) -> Prepared:
+    return _downsample_setup(ctx, "fir")
+
+
+def estimate_coefs(ctx: Context) -> Prepared:
+    from src.ui.discrete_temp.coef_math import compute_baseline_anchor, estimate_coefs as _estimate
+
+    sets = synth.coef_point_sets(ctx.size(2000, 300))
+
+    def run() -> object:
+        out = []
+        for pts in sets:
+            anchor = compute_baseline_anchor(pts)
+            out.append((_estimate(pts, anchor), _estimate(pts, anchor, normalization="rms_baseline")))
+        return out
+
+    return Prepared(run, items=len(sets), item="series")
+
+
+def gain_pipeline(ctx: Context) -> Prepared:
+    """analysis/gain_analysis offline: parse, align and compute gain rows for a coef sweep (backend outputs synthesized)."""
+    from analysis.gain_analysis.compute_gain import align_sumz_by_time, compute_gain_rows, parse_processed_sumz, summarize_gain
+    from analysis.gain_analysis.io_discrete import load_discrete_rows
+
+    session = synth.write_discrete_session_csv(
+        ctx.path("discrete_temp_testing", DEVICE_ID, "2026-01-01", "bench", "discrete_temp_session.csv"),
+        device_id=DEVICE_ID,
+        rows=ctx.size(2000, 300),
+    )
+    rows = load_discrete_rows(session)
+    coefs = [round(0.001 * k, 6) for k in range(1, ctx.size(11, 4))]
+    off = synth.write_processed_sumz_csv(ctx.path("gain", "off.csv"), rows, coef_z=None)
+    on = {c: synth.write_processed_sumz_csv(ctx.path("gain", f"c{c:.6f}.csv"), rows, coef_z=c) for c in coefs}
+
+    def run() -> object:
+        raw_rows = load_discrete_rows(session)
+        f0 = align_sumz_by_time(raw_rows, parse_processed_sumz(off))
+        gain_rows = []
+        for c in coefs:
+            f1 = align_sumz_by_time(raw_rows, parse_processed_sumz(on[c]))
+            gain_rows.extend(compute_gain_rows(raw_rows=raw_rows, f0_list=f0, f1_list=f1, coef_z=c))
+        return summarize_gain(gain_rows)
+
+    return Prepared(run, items=len(rows) * len(coefs), item="gain-row", before_each=_drop_csv_caches)
+
+
+# --- live path ---
+
+
+def measurement_engine_process_sample(ctx: Context) -> Prepared:
+    from src.app_services.live_measurement_engine import LiveMeasurementEngine
+
+    samples = synth.plate_session(ctx.size(60, 10), hz=1000.0, device_type="07", seed=4)
+    trace = [(s.t_ms, s.visible, s.cop_x_m * 1000.0, s.cop_y_m * 1000.0, s.fz) for s in samples]
+
+    def run() -> object:
+        engine = LiveMeasurementEngine()
+        done: set = set()
+        captures = 0
+        for t_ms, visible, x, y, fz in trace:
+            ev = engine.process_sample(
+                t_ms=t_ms,
+                cop_x_mm=x,
+                cop_y_mm=y,
+                fz_n=fz,
+                is_visible=visible,
+                device_type="07",
+                rows=5,
+                cols=3,
+                rotation_quadrants=0,
+                is_cell_already_done=lambda r, c: (r, c) in done,
+            )
+            if ev is not None:
+                captures += 1
+                done.add((ev.row, ev.col))
+        return captures
+
+    return Prepared(run, items=len(trace), item="sample")
+
+
+def extract_device_frames(ctx: Context) -> Prepared:
+    from src.ui.live_data_frames import extract_device_frames as _extract
+
+    samples = synth.plate_session(ctx.size(20, 4), hz=1000.0, seed=6)
+    payloads = synth.live_payloads(samples, device_ids=(DEVICE_ID, "07.00000052", "08.00000003"))
+
+    def run() -> object:
+        n = 0
+        for p in payloads:
+            n += len(_extract(p))
+        return n
+
+    return Prepared(run, items=len(payloads), item="payload")
+
+
+CASES: List[Case] = [
+    Case("analyzer.analyze_single_processed_csv", analyze_single_processed_csv, "parse + segment + best windows, cold CSV cache"),
+    Case("analyzer.analyze_single_processed_csv[npz]", analyze_single_processed_csv_npz, "same, columns loaded from the NPZ cache"),
+    Case("analyzer.select_best_window_optimized", select_best_window_optimized, "best-window search per stage segment"),
+    Case("live.measurement_engine.process_sample", measurement_engine_process_sample, "1 kHz plate session through LiveMeasurementEngine"),
+    Case("live.extract_device_frames", extract_device_frames, "raw + processed multi-device payloads"),
+    Case("csv.downsample_csv_to_50hz", downsample_csv_to_50hz, "1 kHz raw capture CSV to 50 Hz"),
+    Case("csv.downsample_csv[fir]", downsample_csv_fir, "same, anti-aliased FIR strategy"),
+    Case("discrete.estimate_coefs", estimate_coefs, "baseline anchor + y0 and rms_baseline coefs per series"),
+    Case("gain.pipeline", gain_pipeline, "discrete rows, processed sum-z alignment, gain rows and summary"),
+]
+
+
+def select(names: List[str]) -> List[Case]:
+    """Cases whose name contains any of `names` (all cases when empty)."""
+    if not names:
+        return list(CASES)
+    return [c for c in CASES if any(n in c.name for n in names)]
+
+
+def configure_isolated_caches(workdir: str) -> None:
+    """Point the on-disk CSV cache at the run's work directory so benchmarks never touch the project's caches."""
+    config.CSV_CACHE_DIR = os.path.join(workdir, "csv_cache")
@@ -0,0 +1,253 @@
+"""
+Timing loop, result files and regression comparison for the benchmark suite.
+
+A case is a named `setup(ctx) -> Prepared` function. Setup builds the synthetic inputs
+(outside the timed region) and returns the callable to time plus how many items one
+call processes, so results can be read per sample / per row as well as per call.
+
+Result file (JSON):
+    {"schema": 1, "created_at": ..., "scale": "full", "env": {...},
+     "results": {"<case>": {"item": "sample", "items": 20000, "repeats": 5,
+                            "min_s": ..., "median_s": ..., "mean_s": ..., "stdev_s": ...,
+                            "per_item_us": ...}}}
+
+`compare` matches cases by name and flags a regression when the current run's statistic
+(min by default: the least noisy on a shared machine) is slower than the baseline's by
+more than the threshold.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class Prepared:
+    fn: Callable[[], object]
+    items: int
+    item: str = "call"  # singular unit of `items` (sample, row, payload, ...)
+    before_each: Optional[Callable[[], None]] = None  # untimed reset between repeats (e.g. drop caches)
+
+
+@dataclass
+class Context:
+    workdir: str
+    quick: bool = False
+
+    def size(self, full: int, quick: int) -> int:
+        return quick if self.quick else full
+
+    def path(self, *parts: str) -> str:
+        p = os.path.join(self.workdir, *parts)
+        os.makedirs(os.path.dirname(p), exist_ok=True)
+        return p
+
+
+@dataclass
+class Case:
+    name: str
+    setup: Callable[[Context], Prepared]
+    description: str = ""
+
+
+@dataclass
+class CaseResult:
+    name: str
+    item: str
+    items: int
+    repeats: int
+    times_s: List[float] = field(default_factory=list)
+    error: str = ""
+
+    def to_dict(self) -> Dict[str, object]:
+        if self.error:
+            return {"item": self.item, "items": self.items, "error": self.error}
+        med = statistics.median(self.times_s)
+        return {
+            "item": self.item,
+            "items": self.items,
+            "repeats": self.repeats,
+            "min_s": min(self.times_s),
+            "median_s": med,
+            "mean_s": statistics.fmean(self.times_s),
+            "stdev_s": statistics.pstdev(self.times_s),
+            "per_item_us": (med / self.items * 1e6) if self.items else None,
+        }
+
+
+def time_case(case: Case, ctx: Context, *, repeats: int, warmup: int = 1) -> CaseResult:
+    try:
+        prep = case.setup(ctx)
+    except Exception as exc:
+        return CaseResult(case.name, "call", 0, 0, error=f"setup failed: {exc!r}")
+    res = CaseResult(case.name, prep.item, int(prep.items), int(repeats))
+    try:
+        for _ in range(max(0, warmup)):
+            if prep.before_each is not None:
+                prep.before_each()
+            prep.fn()
+        for _ in range(max(1, repeats)):
+            if prep.before_each is not None:
+                prep.before_each()
+            gc.collect()
+            t0 = time.perf_counter()
+            prep.fn()
+            res.times_s.append(time.perf_counter() - t0)
+    except Exception as exc:
+        res.error = f"run failed: {exc!r}"
+    return res
+
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return out.stdout.strip()
+    except Exception:
+        return ""
+
+
+def environment() -> Dict[str, object]:
+    env: Dict[str, object] = {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_rev": _git_rev(),
+    }
+    try:
+        import numpy
+
+        env["numpy"] = numpy.__version__
+    except Exception:
+        pass
+    return env
+
+
+def run_suite(
+    cases: Sequence[Case],
+    *,
+    quick: bool = False,
+    repeats: int = 5,
+    workdir: str = "",
+    log: Callable[[str], None] = print,
+) -> Dict[str, object]:
+    """Run `cases` in order and return the result document."""
+    workdir = workdir or tempfile.mkdtemp(prefix="fluxlite_bench_")
+    ctx = Context(workdir=workdir, quick=quick)
+    results: Dict[str, object] = {}
+    for case in cases:
+        r = time_case(case, ctx, repeats=repeats)
+        results[case.name] = r.to_dict()
+        if r.error:
+            log(f"{case.name:<44} ERROR {r.error}")
+        else:
+            d = r.to_dict()
+            log(f"{case.name:<44} {float(d['median_s']) * 1e3:10.2f} ms  {float(d['per_item_us'] or 0.0):10.3f} µs/{r.item}  (n={r.items}, min {float(d['min_s']) * 1e3:.2f} ms)")
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "scale": "quick" if quick else "full",
+        "repeats": int(repeats),
+        "env": environment(),
+        "results": results,
+    }
+
+
+def save_results(doc: Dict[str, object], path: str) -> str:
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(doc, fh, indent=2, sort_keys=True)
+    return path
+
+
+def load_results(path: str) -> Dict[str, object]:
+    with open(path, "r", encoding="utf-8") as fh:
+        doc = json.load(fh)
+    if not isinstance(doc, dict) or int(doc.get("schema") or 0) != SCHEMA_VERSION:
+        raise ValueError(f"{path}: not a benchmark result file (schema {SCHEMA_VERSION})")
+    return doc
+
+
+@dataclass
+class Comparison:
+    name: str
+    status: str  # "regression" | "improvement" | "same" | "new" | "missing" | "error" | "incomparable"
+    baseline_s: Optional[float] = None
+    current_s: Optional[float] = None
+    ratio: Optional[float] = None
+    note: str = ""
+
+
+def compare_results(
+    baseline: Dict[str, object],
+    current: Dict[str, object],
+    *,
+    threshold: float = 0.10,
+    stat: str = "min_s",
+) -> List[Comparison]:
+    """Per-case comparison; `ratio` is current/baseline of `stat`, normalized per item."""
+    base_res = dict(baseline.get("results") or {})
+    cur_res = dict(current.get("results") or {})
+    out: List[Comparison] = []
+    for name in list(base_res) + [n for n in cur_res if n not in base_res]:
+        b = base_res.get(name)
+        c = cur_res.get(name)
+        if b is None:
+            out.append(Comparison(name, "new"))
+            continue
+        if c is None:
+            out.append(Comparison(name, "missing"))
+            continue
+        if b.get("error") or c.get("error"):
+            out.append(Comparison(name, "error", note=str(c.get("error") or b.get("error"))))
+            continue
+        if not b.get("items") or not c.get("items"):
+            out.append(Comparison(name, "incomparable", note="no item count"))
+            continue
+        # Per-item so a quick run can still be compared against a full one (roughly).
+        bs = float(b[stat]) / float(b["items"])
+        cs = float(c[stat]) / float(c["items"])
+        note = "" if int(b["items"]) == int(c["items"]) else f"items {b['items']} -> {c['items']}"
+        ratio = cs / bs if bs > 0 else None
+        if ratio is None:
+            status = "incomparable"
+        elif ratio > 1.0 + threshold:
+            status = "regression"
+        elif ratio < 1.0 - threshold:
+            status = "improvement"
+        else:
+            status = "same"
+        out.append(Comparison(name, status, float(b[stat]), float(c[stat]), ratio, note))
+    return out
+
+
+def format_comparison(rows: Sequence[Comparison], *, stat: str = "min_s") -> str:
+    lines = [f"{'case':<44} {'baseline':>12} {'current':>12} {'ratio':>8}  status"]
+    for r in rows:
+        b = f"{r.baseline_s * 1e3:.2f} ms" if r.baseline_s is not None else "—"
+        c = f"{r.current_s * 1e3:.2f} ms" if r.current_s is not None else "—"
+        ratio = f"x{r.ratio:.3f}" if r.ratio is not None else "—"
+        flag = r.status.upper() if r.status == "regression" else r.status
+        lines.append(f"{r.name:<44} {b:>12} {c:>12} {ratio:>8}  {flag}{('  (' + r.note + ')') if r.note else ''}")
+    lines.append(f"(statistic: {stat}, per item)")
+    return "\n".join(lines)
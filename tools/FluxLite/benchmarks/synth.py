@@ -0,0 +1,319 @@
+"""
+Synthetic data for the benchmark suite: plate streams and temperature-test files.
+
+Everything is generated from a seeded `random.Random`, so a given (size, seed) always
+produces the same data and timings stay comparable between runs.
+
+A plate session is a list of `PlateSample`s at a fixed rate: the plate starts empty, then
+a load steps onto a grid cell, settles with an exponential overshoot, holds with sensor
+noise, slow drift and occasional impulse spikes, and steps off before the next cell.
+The same session backs the live payloads, the measurement-engine trace and the processed
+temperature CSVs.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+import os
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.app_services.geometry import GeometryService
+
+SENSOR_PREFIXES: Tuple[str, ...] = (
+    "rear-right-outer",
+    "rear-right-inner",
+    "rear-left-outer",
+    "rear-left-inner",
+    "front-left-outer",
+    "front-left-inner",
+    "front-right-outer",
+    "front-right-inner",
+)
+SENSOR_NAMES: Tuple[str, ...] = tuple(p.replace("-", " ").title() for p in SENSOR_PREFIXES)
+
+DB_TARGET_N = 206.3
+BODY_WEIGHT_N = 800.0
+
+
+@dataclass(frozen=True)
+class PlateSample:
+    t_ms: int
+    fx: float
+    fy: float
+    fz: float
+    cop_x_m: float
+    cop_y_m: float
+    temp_f: float
+
+    @property
+    def visible(self) -> bool:
+        return abs(self.fz) > 5.0
+
+
+_centers: Dict[str, List[Tuple[int, int, float, float]]] = {}
+
+
+def cell_centers(device_type: str) -> List[Tuple[int, int, float, float]]:
+    """(row, col, x_mm, y_mm) per grid cell, found by sampling COP over the plate and averaging per cell."""
+    hit = _centers.get(device_type)
+    if hit is not None:
+        return hit
+    rows, cols = GeometryService.get_grid_dimensions(device_type)
+    acc: Dict[Tuple[int, int], List[float]] = {}
+    for xi in range(-400, 401, 8):
+        for yi in range(-400, 401, 8):
+            cell = GeometryService.map_cop_to_cell(device_type, rows, cols, float(xi), float(yi))
+            if cell is None:
+                continue
+            a = acc.setdefault(cell, [0.0, 0.0, 0.0])
+            a[0] += xi
+            a[1] += yi
+            a[2] += 1.0
+    out = sorted((r, c, a[0] / a[2], a[1] / a[2]) for (r, c), a in acc.items())
+    _centers[device_type] = out
+    return out
+
+
+def plate_session(
+    seconds: float,
+    *,
+    hz: float = 1000.0,
+    device_type: str = "07",
+    loads_n: Sequence[float] = (DB_TARGET_N, BODY_WEIGHT_N),
+    hold_s: float = 4.0,
+    idle_s: float = 1.0,
+    lead_in_s: float = 0.0,
+    temp_f: float = 76.0,
+    seed: int = 1,
+) -> List[PlateSample]:
+    """Step-on / hold / step-off cycles over every grid cell and load, repeated to fill `seconds`."""
+    rng = random.Random(seed)
+    centers = cell_centers(device_type)
+    dt_ms = 1000.0 / hz
+    n_total = int(seconds * hz)
+    out: List[PlateSample] = []
+    t = 0.0
+
+    def emit(fz: float, x_mm: float, y_mm: float) -> None:
+        nonlocal t
+        out.append(
+            PlateSample(
+                t_ms=int(t),
+                fx=rng.gauss(0.0, 0.8) + 0.01 * fz,
+                fy=rng.gauss(0.0, 0.8) - 0.01 * fz,
+                fz=fz,
+                cop_x_m=x_mm / 1000.0,
+                cop_y_m=y_mm / 1000.0,
+                temp_f=temp_f + 0.002 * (t / 1000.0) + rng.gauss(0.0, 0.05),
+            )
+        )
+        t += dt_ms * rng.uniform(0.95, 1.05)
+
+    for _ in range(int(lead_in_s * hz)):
+        emit(rng.gauss(0.0, 0.5), 0.0, 0.0)
+    while len(out) < n_total:
+        for load in loads_n:
+            for _r, _c, cx, cy in centers:
+                for _ in range(int(idle_s * hz)):
+                    emit(rng.gauss(0.0, 0.5), 0.0, 0.0)
+                drift = rng.uniform(-2.0, 2.0)
+                noise = load * rng.uniform(0.002, 0.008)
+                x0 = cx + rng.gauss(0.0, 8.0)
+                y0 = cy + rng.gauss(0.0, 8.0)
+                n_hold = int(hold_s * hz)
+                for k in range(n_hold):
+                    settle = 0.12 * load * math.exp(-k / (0.25 * hz))
+                    fz = load + settle + drift * (k / hz) + rng.gauss(0.0, noise)
+                    if rng.random() < 0.003:
+                        fz += rng.choice((-1.0, 1.0)) * 0.2 * load
+                    emit(fz, x0 + rng.gauss(0.0, 1.5), y0 + rng.gauss(0.0, 1.5))
+                if len(out) >= n_total:
+                    break
+            if len(out) >= n_total:
+                break
+    return out[:n_total]
+
+
+# --- live stream payloads ---
+
+
+def raw_stream_payload(s: PlateSample, device_id: str) -> dict:
+    """Raw-stream payload ({deviceId, time, sensors:[...], cop, moments, avgTemperatureF})."""
+    per = s.fz / 8.0
+    sensors = [{"name": n, "x": s.fx / 8.0, "y": s.fy / 8.0, "z": per} for n in SENSOR_NAMES]
+    sensors.append({"name": "Sum", "x": s.fx, "y": s.fy, "z": s.fz})
+    return {
+        "deviceId": device_id,
+        "time": s.t_ms,
+        "sensors": sensors,
+        "cop": {"x": s.cop_x_m, "y": s.cop_y_m},
+        "moments": {"x": s.fz * s.cop_y_m, "y": -s.fz * s.cop_x_m, "z": 0.1},
+        "avgTemperatureF": s.temp_f,
+    }
+
+
+def processed_stream_payload(samples: Sequence[Tuple[str, PlateSample]]) -> dict:
+    """Processed-stream payload ({devices:[...]}) with one frame per (device_id, sample)."""
+    return {
+        "devices": [
+            {
+                "id": did,
+                "fx": s.fx,
+                "fy": s.fy,
+                "fz": s.fz,
+                "time": s.t_ms,
+                "cop": {"x": s.cop_x_m, "y": s.cop_y_m},
+                "moments": {"x": s.fz * s.cop_y_m, "y": -s.fz * s.cop_x_m, "z": 0.1},
+                "avgTemperatureF": s.temp_f,
+            }
+            for did, s in samples
+        ]
+    }
+
+
+def live_payloads(samples: Sequence[PlateSample], *, device_ids: Sequence[str] = ("07.00000051",)) -> List[dict]:
+    """Mixed traffic: raw payloads for the first device, processed multi-device payloads every other sample."""
+    out: List[dict] = []
+    for i, s in enumerate(samples):
+        out.append(raw_stream_payload(s, device_ids[0]))
+        if i % 2 == 0:
+            out.append(processed_stream_payload([(did, s) for did in device_ids]))
+    return out
+
+
+# --- CSV files ---
+
+
+def write_raw_capture_csv(path: str, samples: Sequence[PlateSample], *, device_id: str = "07.00000051") -> str:
+    """Raw capture CSV: time, device_id, per-sensor x/y/z/t, sum-*, moments-*, COPx/COPy."""
+    header = ["time", "device_id"]
+    for p in SENSOR_PREFIXES:
+        header += [f"{p}-x", f"{p}-y", f"{p}-z", f"{p}-t"]
+    header += ["sum-x", "sum-y", "sum-z", "sum-t", "moments-x", "moments-y", "moments-z", "COPx", "COPy"]
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        w = csv.writer(handle)
+        w.writerow(header)
+        for s in samples:
+            per = [f"{s.fx / 8.0:.4f}", f"{s.fy / 8.0:.4f}", f"{s.fz / 8.0:.4f}", f"{s.temp_f:.2f}"]
+            row = [s.t_ms, device_id] + per * len(SENSOR_PREFIXES)
+            row += [f"{s.fx:.4f}", f"{s.fy:.4f}", f"{s.fz:.4f}", f"{s.temp_f:.2f}"]
+            row += [f"{s.fz * s.cop_y_m:.4f}", f"{-s.fz * s.cop_x_m:.4f}", "0.1", f"{s.cop_x_m:.6f}", f"{s.cop_y_m:.6f}"]
+            w.writerow(row)
+    return path
+
+
+def write_processed_temperature_csv(path: str, samples: Sequence[PlateSample]) -> str:
+    """Processed temperature-test output (what the backend's process-csv returns for a run)."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        w = csv.writer(handle)
+        w.writerow(["time", "sum-x", "sum-y", "sum-z", "sum-t", "moments-x", "moments-y", "moments-z", "COPx", "COPy"])
+        for s in samples:
+            w.writerow(
+                [
+                    s.t_ms,
+                    f"{s.fx:.4f}",
+                    f"{s.fy:.4f}",
+                    f"{s.fz:.4f}",
+                    f"{s.temp_f:.2f}",
+                    f"{s.fz * s.cop_y_m:.4f}",
+                    f"{-s.fz * s.cop_x_m:.4f}",
+                    "0.1",
+                    f"{s.cop_x_m:.6f}",
+                    f"{s.cop_y_m:.6f}",
+                ]
+            )
+    return path
+
+
+def temperature_test_samples(*, device_type: str = "07", hz: float = 100.0, seed: int = 1) -> List[PlateSample]:
+    """One pass of DB then body-weight holds over every cell, after the analyzer's warm-up skip."""
+    rows, cols = GeometryService.get_grid_dimensions(device_type)
+    hold_s, idle_s = 4.0, 1.0
+    seconds = 21.0 + 2 * rows * cols * (hold_s + idle_s)
+    return plate_session(seconds, hz=hz, device_type=device_type, hold_s=hold_s, idle_s=idle_s, lead_in_s=21.0, seed=seed)
+
+
+def window_segments(n: int, *, hz: float = 100.0, seed: int = 3) -> List[List[Tuple[int, float, float, float]]]:
+    """Stage segments as the analyzer collects them: (t_ms, fz, cop_x_mm, cop_y_mm), 2.5-12 s each."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        m = int(rng.uniform(2.5, 12.0) * hz)
+        target = rng.choice((DB_TARGET_N, 700.0, 900.0))
+        drift = rng.uniform(-3.0, 3.0)
+        noise = rng.uniform(0.05, 2.0)
+        t = rng.randint(20_000, 600_000)
+        x0, y0 = rng.uniform(-150, 150), rng.uniform(-200, 200)
+        seg = []
+        for i in range(m):
+            fz = target + 25.0 * (0.5 ** (i / (0.3 * hz))) + drift * (i / hz) + rng.gauss(0.0, noise)
+            seg.append((t, fz, x0 + rng.gauss(0.0, 2.0), y0 + rng.gauss(0.0, 2.0)))
+            t += int(round(1000.0 / hz * rng.uniform(0.9, 1.1)))
+        out.append(seg)
+    return out
+
+
+def coef_point_sets(n: int, *, points: int = 40, seed: int = 5) -> List[List[Tuple[float, float]]]:
+    """(temperature_f, value) series around room temperature with a linear temperature response."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        y0 = rng.choice((DB_TARGET_N, BODY_WEIGHT_N, 12.0))
+        coef = rng.uniform(-0.004, 0.004)
+        pts = []
+        for _ in range(points):
+            t = rng.uniform(40.0, 110.0) if rng.random() < 0.8 else rng.uniform(74.0, 78.0)
+            pts.append((t, y0 * (1.0 - (76.0 - t) * coef) + rng.gauss(0.0, 0.004 * abs(y0))))
+        out.append(pts)
+    return out
+
+
+# --- discrete temp / gain analysis ---
+
+
+def write_discrete_session_csv(path: str, *, device_id: str = "07.00000051", rows: int = 400, seed: int = 7) -> str:
+    """discrete_temp_session.csv: alternating 45lb / bodyweight rows across a temperature sweep."""
+    rng = random.Random(seed)
+    header = ["device_id", "phase_name", "time", "sum-t", "sum-z"] + [f"{p}-z" for p in SENSOR_PREFIXES] + [f"{p}-t" for p in SENSOR_PREFIXES]
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        w = csv.writer(handle)
+        w.writerow(header)
+        t_ms = 0
+        for i in range(rows):
+            phase = "45lb" if i % 2 == 0 else "bodyweight"
+            load = DB_TARGET_N if phase == "45lb" else BODY_WEIGHT_N
+            temp = 50.0 + 50.0 * (i / max(1, rows - 1)) + rng.gauss(0.0, 0.3)
+            per = [load / 8.0 * rng.uniform(0.9, 1.1) for _ in SENSOR_PREFIXES]
+            temps = [temp + rng.gauss(0.0, 0.5) for _ in SENSOR_PREFIXES]
+            w.writerow([device_id, phase, t_ms, f"{temp:.2f}", f"{sum(per):.4f}"] + [f"{v:.4f}" for v in per] + [f"{v:.2f}" for v in temps])
+            t_ms += rng.randint(4000, 9000)
+    return path
+
+
+def write_processed_sumz_csv(
+    path: str,
+    discrete_rows: Iterable,
+    *,
+    coef_z: Optional[float],
+    gain: float = 0.97,
+    room_temp_f: float = 76.0,
+    seed: int = 11,
+) -> str:
+    """Stand-in for a backend process-csv output of a discrete session (time, phase_name, sum-z)."""
+    rng = random.Random(seed)
+    os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        w = csv.writer(handle)
+        w.writerow(["time", "phase_name", "sum-z"])
+        for r in discrete_rows:
+            f0 = float(r.sum_z) * (1.0 + rng.gauss(0.0, 0.0005))
+            if coef_z is not None:
+                f0 *= 1.0 + gain * float(coef_z) * (float(r.sum_t_f) - room_temp_f)
+            w.writerow([r.time_ms, r.phase, f"{f0:.4f}"])
+    return path
@@ -0,0 +1,174 @@
+"""
+Bias-map computation in TemperatureBaselineBiasService for a device with many baselines.
+
+Feeds the service synthetic baseline analyses (random per-cell means, some cells missing,
+occasional duplicate or out-of-grid cells) through stub repo/processing/analyzer objects,
+with an optional per-baseline delay standing in for backend processing + window analysis.
+Times the service serially and with TEMP_BIAS_WORKERS threads, times the NumPy reduction
+on its own, and checks the bias maps against the per-cell nested-list reference.
+
+Run from tools/FluxLite:
+    python -m examples.bench_baseline_bias --baselines 200 --rows 5 --cols 5 --delay-ms 20 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src import config
+from src.app_services.temperature_baseline_bias_service import TemperatureBaselineBiasService
+
+
+class _Repo:
+    def __init__(self, entries: list, out_dir: str) -> None:
+        self.entries = entries
+        self.out_dir = out_dir
+        self.saved: dict = {}
+
+    def list_temperature_room_baseline_tests(self, device_id: str, *, min_temp_f: float, max_temp_f: float) -> list:
+        return list(self.entries)
+
+    def save_temperature_bias_cache(self, device_id: str, payload: dict) -> str:
+        self.saved = payload
+        return os.path.join(self.out_dir, "temp-baseline-bias.json")
+
+
+class _Processing:
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+
+    def ensure_temp_off_processed(self, *, csv_path: str, **_kw) -> str:
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        return csv_path
+
+
+class _Analyzer:
+    def __init__(self, analyses: dict) -> None:
+        self.analyses = analyses
+
+    def analyze_single_processed_csv(self, path: str, meta: dict) -> dict:
+        return self.analyses[path]
+
+
+def synth(rng: random.Random, n: int, rows: int, cols: int, out_dir: str):
+    entries, analyses = [], {}
+    for i in range(n):
+        path = os.path.join(out_dir, f"temp-raw-bench-{i:04d}.csv")
+        with open(path, "w", encoding="utf-8") as h:
+            h.write("time\n")
+        stages = {}
+        for key, target in (("db", 206.3), ("bw", 800.0)):
+            cells = []
+            for r in range(rows):
+                for c in range(cols):
+                    if rng.random() < 0.1:
+                        continue  # no window for this cell
+                    cells.append({"row": r, "col": c, "mean_n": target * (1.0 + rng.gauss(0.0, 0.04))})
+            if rng.random() < 0.05:
+                cells.append(dict(cells[0], mean_n=target * 1.2))  # duplicate cell (later wins)
+            if rng.random() < 0.05:
+                cells.append({"row": rows, "col": 0, "mean_n": target * 0.9})  # outside the grid
+            stages[key] = {"cells": cells, "target_n": target}
+        analyses[path] = {"grid": {"rows": rows, "cols": cols, "device_type": "06"}, "data": {"stages": stages}}
+        entries.append({"csv_path": path, "temp_f": 72.0 + rng.random() * 4.0, "meta": {}})
+    return entries, analyses
+
+
+def reference_bias(analyses: dict, entries: list, rows: int, cols: int) -> dict:
+    """Per-cell nested-list computation (the pre-NumPy implementation)."""
+    per = {"db": [], "bw": [], "all": []}
+    for e in entries:
+        stages = analyses[e["csv_path"]]["data"]["stages"]
+        pcts = {}
+        for key in ("db", "bw"):
+            target = float(stages[key]["target_n"])
+            m = {}
+            for cell in stages[key]["cells"]:
+                m[(int(cell["row"]), int(cell["col"]))] = (float(cell["mean_n"]) - target) / target
+            pcts[key] = m
+        avg = {k: sum(v.values()) / float(len(v)) if v else 0.0 for k, v in pcts.items()}
+        mats = {"db": [], "bw": [], "all": []}
+        for r in range(rows):
+            row = {"db": [], "bw": [], "all": []}
+            for c in range(cols):
+                a = float(pcts["db"].get((r, c), avg["db"]))
+                b = float(pcts["bw"].get((r, c), avg["bw"]))
+                row["db"].append(a)
+                row["bw"].append(b)
+                row["all"].append(0.5 * a + 0.5 * b)
+            for k in mats:
+                mats[k].append(row[k])
+        for k in per:
+            per[k].append(mats[k])
+    n = float(len(entries))
+    return {
+        f"bias_{k}": [[sum(b[r][c] for b in per[k]) / n for c in range(cols)] for r in range(rows)] for k in per
+    }
+
+
+def run(entries, analyses, out_dir: str, delay_s: float, workers: int):
+    config.TEMP_BIAS_WORKERS = workers
+    repo = _Repo(entries, out_dir)
+    svc = TemperatureBaselineBiasService(repo=repo, analyzer=_Analyzer(analyses), processing=_Processing(delay_s))
+    t0 = time.perf_counter()
+    res = svc.compute_and_store_bias_for_device(device_id="06.00000000")
+    return time.perf_counter() - t0, res
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--baselines", type=int, default=200)
+    ap.add_argument("--rows", type=int, default=5)
+    ap.add_argument("--cols", type=int, default=5)
+    ap.add_argument("--delay-ms", type=float, default=20.0)
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--seed", type=int, default=11)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    out_dir = tempfile.mkdtemp(prefix="bench_bias_")
+    entries, analyses = synth(rng, args.baselines, args.rows, args.cols, out_dir)
+    delay_s = args.delay_ms / 1000.0
+
+    t_serial, res_serial = run(entries, analyses, out_dir, delay_s, 1)
+    t_par, res_par = run(entries, analyses, out_dir, delay_s, args.workers)
+    if not (res_serial.get("ok") and res_par.get("ok")):
+        print("bias computation failed:", res_serial.get("errors") or res_par.get("errors"))
+        return 1
+
+    # Reduction alone (no simulated I/O), against the nested-list reference.
+    t0 = time.perf_counter()
+    _t, res_fast = run(entries, analyses, out_dir, 0.0, 1)
+    t_vec = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ref = reference_bias(analyses, entries, args.rows, args.cols)
+    t_ref = time.perf_counter() - t0
+
+    mismatched = []
+    for key, want in ref.items():
+        for res in (res_serial, res_par, res_fast):
+            if res["payload"][key] != want:
+                mismatched.append(key)
+    strip = lambda p: {k: v for k, v in p.items() if k != "computed_at_ms"}
+    same_payload = strip(res_serial["payload"]) == strip(res_par["payload"])
+
+    cells = args.rows * args.cols
+    print(f"baselines={args.baselines} grid={args.rows}x{args.cols} ({cells} cells) delay={args.delay_ms:g}ms/baseline")
+    print(f"serial service          {t_serial * 1e3:9.1f} ms")
+    print(f"{args.workers:2d} workers service      {t_par * 1e3:9.1f} ms  x{t_serial / max(t_par, 1e-9):.1f}")
+    print(f"no-delay service        {t_vec * 1e3:9.1f} ms  (cell parsing + means + spread)")
+    print(f"nested-list reference   {t_ref * 1e3:9.1f} ms  (bias maps only)")
+    spread = res_par["bias_spread"]["all"]
+    width = max(spread["p90"][r][c] - spread["p10"][r][c] for r in range(args.rows) for c in range(args.cols))
+    print(f"widest p10–p90 cell spread (all): {width * 100:.2f}%")
+    print(f"serial == parallel payload: {same_payload}   bias maps != reference: {sorted(set(mismatched)) or 'none'}")
+    return 0 if same_payload and not mismatched else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+"""
+Per-sample cost of LiveMeasurementEngine at 1 kHz input: incremental stability tracker vs
+the full re-filter reference, plus a sample-by-sample check that both produce the same
+phase / status text / progress / capture events.
+
+Run from tools/FluxLite:
+    python -m examples.bench_live_stability --seconds 60 --window-ms 1000
+    python -m examples.bench_live_stability --window-ms 3000 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from dataclasses import replace
+
+from src.app_services.live_measurement_engine import LiveMeasurementConfig, LiveMeasurementEngine
+
+
+DEVICE_TYPE = "07"
+ROWS, COLS = 5, 3
+
+# (duration_ms, visible, cop_x_mm, cop_y_mm, fz_n, fz_noise_n, cop_noise_mm, drift_n_per_s)
+_SEGMENTS = (
+    (800, False, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    (2500, True, 0.0, 0.0, 600.0, 3.0, 1.5, 0.0),  # arm + stable capture
+    (1500, True, 0.0, 0.0, 600.0, 4.0, 2.0, 60.0),  # drifting load
+    (2500, True, 0.0, 120.0, 450.0, 2.0, 1.0, 0.0),  # next cell
+    (1200, True, 0.0, 120.0, 450.0, 25.0, 30.0, 0.0),  # wobbly
+    (600, False, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    (3000, True, 0.0, -120.0, 40.0, 1.0, 1.0, 0.0),  # below arming force
+)
+
+
+def synth_trace(seconds: float, seed: int) -> list[tuple[int, bool, float, float, float]]:
+    """1 kHz (t_ms, visible, cop_x, cop_y, fz) samples cycling through `_SEGMENTS`, with impulse spikes."""
+    rng = random.Random(seed)
+    out: list[tuple[int, bool, float, float, float]] = []
+    t = 0
+    total = int(seconds * 1000)
+    while t < total:
+        for dur, visible, cx, cy, fz, fz_sd, cop_sd, drift in _SEGMENTS:
+            for k in range(dur):
+                if t >= total:
+                    break
+                f = fz + drift * (k / 1000.0) + rng.gauss(0.0, fz_sd)
+                if visible and rng.random() < 0.004:
+                    f += rng.choice((-1.0, 1.0)) * 150.0  # impulse noise the median filter should reject
+                out.append((t, visible, cx + rng.gauss(0.0, cop_sd), cy + rng.gauss(0.0, cop_sd), f))
+                t += 1
+    return out
+
+
+def run(engine: LiveMeasurementEngine, trace) -> tuple[float, list]:
+    done: set[tuple[int, int]] = set()
+    log: list = []
+    t0 = time.perf_counter()
+    for t_ms, visible, x, y, fz in trace:
+        ev = engine.process_sample(
+            t_ms=t_ms,
+            cop_x_mm=x,
+            cop_y_mm=y,
+            fz_n=fz,
+            is_visible=visible,
+            device_type=DEVICE_TYPE,
+            rows=ROWS,
+            cols=COLS,
+            rotation_quadrants=0,
+            is_cell_already_done=lambda r, c: (r, c) in done,
+        )
+        if ev is not None:
+            done.add((ev.row, ev.col))
+            if len(done) > 3:
+                done.clear()
+        log.append((engine.phase, engine.status(), engine.progress_01, ev))
+    return time.perf_counter() - t0, log
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--seconds", type=float, default=60.0, help="length of the synthetic 1 kHz trace")
+    ap.add_argument("--window-ms", type=int, default=1000, help="stability_duration_ms")
+    ap.add_argument("--kernel", type=int, default=7, help="median_filter_size")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    trace = synth_trace(args.seconds, args.seed)
+    base = replace(LiveMeasurementConfig(), stability_duration_ms=int(args.window_ms), median_filter_size=int(args.kernel))
+
+    t_ref, log_ref = run(LiveMeasurementEngine(replace(base, incremental_stability=False)), trace)
+    t_inc, log_inc = run(LiveMeasurementEngine(replace(base, incremental_stability=True)), trace)
+
+    mismatches = [i for i, (a, b) in enumerate(zip(log_ref, log_inc)) if a != b]
+    captures = sum(1 for entry in log_ref if entry[3] is not None)
+    n = len(trace)
+    print(f"samples={n} window={args.window_ms}ms kernel={args.kernel} captures={captures}")
+    print(f"reference   {t_ref / n * 1e6:8.2f} us/sample  ({t_ref * 1e3:.0f} ms total)")
+    print(f"incremental {t_inc / n * 1e6:8.2f} us/sample  ({t_inc * 1e3:.0f} ms total)  x{t_ref / max(t_inc, 1e-9):.1f}")
+    if mismatches:
+        i = mismatches[0]
+        print(f"MISMATCH at {len(mismatches)} sample(s); first t={trace[i][0]}ms:\n  ref={log_ref[i]}\n  inc={log_inc[i]}")
+        return 1
+    print("verdicts, status text, progress and capture events identical")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""
+Compare live-stream decode cost per 1000 samples: msgpack dict frames vs packed binary blocks.
+
+Run from tools/FluxLite:
+    python -m examples.bench_wire_decode --samples 1000 --block 10 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import msgpack  # type: ignore
+
+from src.app_services.live_frame_store import LiveFrameStore
+from src.infra import binary_frames
+from src.ui.live_data_frames import extract_device_frames
+from examples.binary_stream_server import synth_samples
+
+
+def _dict_payloads(t, ch) -> list[bytes]:
+    out = []
+    for k in range(t.shape[0]):
+        c = ch[k].astype(float)
+        out.append(
+            msgpack.packb(
+                {
+                    "deviceId": "07.00000001",
+                    "time": int(t[k]),
+                    "sensors": [{"name": "Sum", "x": c[0], "y": c[1], "z": c[2]}],
+                    "cop": {"x": c[3], "y": c[4]},
+                    "moments": {"x": c[5], "y": c[6], "z": c[7]},
+                    "avgTemperatureF": c[8],
+                }
+            )
+        )
+    return out
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--samples", type=int, default=1000)
+    ap.add_argument("--block", type=int, default=10, help="samples per binary frame")
+    ap.add_argument("--repeat", type=int, default=50)
+    args = ap.parse_args()
+
+    t, ch = synth_samples(int(time.time() * 1000), args.samples, 500.0)
+    dict_msgs = _dict_payloads(t, ch)
+    bin_msgs = [
+        binary_frames.encode_frame({"07.00000001": (t[i : i + args.block], ch[i : i + args.block])})
+        for i in range(0, args.samples, args.block)
+    ]
+
+    def _dict_path() -> None:
+        for m in dict_msgs:
+            extract_device_frames(msgpack.unpackb(m, raw=False))
+
+    def _binary_path() -> None:
+        for m in bin_msgs:
+            for b in binary_frames.decode_frame(m):
+                b.channels[:, 2].mean()
+
+    def _binary_to_dicts() -> None:
+        for m in bin_msgs:
+            for b in binary_frames.decode_frame(m):
+                b.to_frames()
+
+    store = LiveFrameStore()
+
+    def _binary_to_store() -> None:
+        for m in bin_msgs:
+            store.ingest_blocks(binary_frames.decode_frame(m))
+        store.take_dirty()
+
+    per_k = 1000.0 / float(args.samples)
+    for name, fn in (("msgpack dict + extract", _dict_path), ("binary blocks", _binary_path), ("binary -> dict frames", _binary_to_dicts), ("binary -> frame store", _binary_to_store)):
+        best = float("inf")
+        for _ in range(int(args.repeat)):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        print(f"{name:<26} {best * 1e3 * per_k:8.3f} ms / 1000 samples")
+    print(f"wire bytes / sample: dict={sum(map(len, dict_msgs)) / args.samples:.1f}  binary={sum(map(len, bin_msgs)) / args.samples:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
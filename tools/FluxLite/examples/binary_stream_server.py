@@ -0,0 +1,141 @@
+"""
+Local stand-in for the backend live stream.
+
+Speaks just enough of the DynamoDeluxe socket protocol to exercise IoClient/HardwareService
+without hardware: answers `negotiateStreamFormat`, then pushes synthetic plate samples either as
+packed `axf-f32-v1` blocks on `binaryFrameData` or as legacy msgpack dicts on `simpleJsonData`.
+
+Run from tools/FluxLite:
+    python -m examples.binary_stream_server --port 3000 --rate 500 --devices 2
+    python -m examples.binary_stream_server --dict-only      # emulate an old backend
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import socketserver
+import threading
+import time
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import msgpack  # type: ignore
+import numpy as np
+import socketio  # type: ignore
+
+from src.infra import binary_frames
+
+
+class _ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args) -> None:  # noqa: D401 - keep console clean
+        pass
+
+
+def synth_samples(t0_ms: int, n: int, rate_hz: float, phase: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+    """Return (time_ms, channels) for `n` samples of a slowly swaying ~700 N load."""
+    t = t0_ms + (np.arange(n) * (1000.0 / rate_hz)).astype(np.int64)
+    s = (t / 1000.0) + phase
+    ch = np.zeros((n, len(binary_frames.CHANNELS)), dtype=np.float32)
+    ch[:, 0] = 5.0 * np.sin(2 * math.pi * 0.7 * s)
+    ch[:, 1] = 3.0 * np.cos(2 * math.pi * 0.4 * s)
+    ch[:, 2] = 700.0 + 25.0 * np.sin(2 * math.pi * 1.3 * s)
+    ch[:, 3] = 0.05 * np.sin(2 * math.pi * 0.2 * s)
+    ch[:, 4] = 0.08 * np.cos(2 * math.pi * 0.2 * s)
+    ch[:, 5:8] = ch[:, 0:3] * 0.01
+    ch[:, 8] = 74.0
+    return t, ch
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=3000)
+    ap.add_argument("--rate", type=float, default=500.0, help="samples/s per device")
+    ap.add_argument("--devices", type=int, default=1)
+    ap.add_argument("--push-hz", type=float, default=100.0, help="frames/s pushed to each client")
+    ap.add_argument("--dict-only", action="store_true", help="ignore negotiation; always send msgpack dicts")
+    args = ap.parse_args()
+
+    sio = socketio.Server(async_mode="threading", cors_allowed_origins="*")
+    app = socketio.WSGIApp(sio)
+    formats: dict[str, str] = {}
+    streaming: dict[str, threading.Event] = {}
+    device_ids = [f"07.{i:08d}" for i in range(1, int(args.devices) + 1)]
+
+    def _stream(sid: str, stop: threading.Event) -> None:
+        per_push = max(1, int(round(args.rate / args.push_hz)))
+        t_ms = int(time.time() * 1000)
+        while not stop.is_set():
+            fmt = formats.get(sid, binary_frames.FORMAT_DICT)
+            blocks = {did: synth_samples(t_ms, per_push, args.rate, phase=i) for i, did in enumerate(device_ids)}
+            if fmt == binary_frames.FORMAT_NAME:
+                sio.emit("binaryFrameData", binary_frames.encode_frame(blocks), to=sid)
+            else:
+                for did, (t, ch) in blocks.items():
+                    for k in range(t.shape[0]):
+                        c = ch[k].astype(float)
+                        sio.emit(
+                            "simpleJsonData",
+                            msgpack.packb(
+                                {
+                                    "id": did,
+                                    "time": int(t[k]),
+                                    "fx": c[0],
+                                    "fy": c[1],
+                                    "fz": c[2],
+                                    "cop": {"x": c[3], "y": c[4]},
+                                    "moments": {"x": c[5], "y": c[6], "z": c[7]},
+                                    "avgTemperatureF": c[8],
+                                }
+                            ),
+                            to=sid,
+                        )
+            t_ms += int(per_push * 1000.0 / args.rate)
+            stop.wait(1.0 / args.push_hz)
+
+    @sio.event
+    def connect(sid, environ, auth=None):  # noqa: ANN001
+        formats[sid] = binary_frames.FORMAT_DICT
+        print(f"[stand-in] client connected {sid}")
+
+    @sio.event
+    def disconnect(sid):  # noqa: ANN001
+        ev = streaming.pop(sid, None)
+        if ev is not None:
+            ev.set()
+        formats.pop(sid, None)
+        print(f"[stand-in] client disconnected {sid}")
+
+    @sio.on("negotiateStreamFormat")
+    def negotiate(sid, data):  # noqa: ANN001
+        wanted = list((data or {}).get("formats") or [])
+        fmt = binary_frames.FORMAT_DICT
+        if not args.dict_only and binary_frames.FORMAT_NAME in wanted:
+            fmt = binary_frames.FORMAT_NAME
+        formats[sid] = fmt
+        sio.emit("negotiateStreamFormatStatus", {"format": fmt, "channels": list(binary_frames.CHANNELS)}, to=sid)
+
+    @sio.on("startDataReception")
+    def start_reception(sid, data=None):  # noqa: ANN001
+        if sid in streaming:
+            return
+        stop = threading.Event()
+        streaming[sid] = stop
+        threading.Thread(target=_stream, args=(sid, stop), daemon=True).start()
+        sio.emit("startDataReceptionStatus", {"status": "success"}, to=sid)
+
+    server = make_server(args.host, int(args.port), app, server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+    print(f"[stand-in] serving on http://{args.host}:{args.port} ({len(device_ids)} device(s) @ {args.rate:g} Hz)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+"""
+Check the scalar-mode linear-response shortcut against real backend outputs.
+
+Processes the input once with temperature correction off, then for each sampled
+(cx, cy, cz) runs the backend in scalar mode and compares its sum-x/y/z with the
+shortcut's prediction from the OFF output. Prints per-sample relative RMS error and
+the gain that best explains the backend's response; the median fitted gain is the value
+to use for TEMP_LINEAR_RESPONSE_GAIN.
+
+Needs a running backend (address from config / BACKEND_* env). Run from tools/FluxLite:
+    python -m examples.validate_linear_response --input-csv path/to/session.csv --device-id 06.00000042 --samples 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+
+from src.app_services.temperature_linear_response import LinearResponse
+from src.ui.discrete_temp.tuning_core import fmt_coef_tag, run_backend_candidate, run_backend_off_baseline
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--input-csv", required=True)
+    ap.add_argument("--device-id", required=True)
+    ap.add_argument("--room-temp-f", type=float, default=76.0)
+    ap.add_argument("--samples", type=int, default=6)
+    ap.add_argument("--x-max", type=float, default=0.005)
+    ap.add_argument("--y-max", type=float, default=0.005)
+    ap.add_argument("--z-max", type=float, default=0.008)
+    ap.add_argument("--gain", type=float, default=1.0)
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--out-dir", default="")
+    ap.add_argument("--timeout-s", type=int, default=300)
+    args = ap.parse_args()
+
+    out_dir = os.path.abspath(args.out_dir or tempfile.mkdtemp(prefix="linear_response_"))
+    off_path = run_backend_off_baseline(
+        input_csv_path=args.input_csv,
+        device_id=args.device_id,
+        output_folder=out_dir,
+        room_temp_f=args.room_temp_f,
+        timeout_s=args.timeout_s,
+    )
+    model = LinearResponse(off_path, room_temp_f=args.room_temp_f, gain=args.gain)
+
+    rng = random.Random(args.seed)
+    fitted: dict[str, list[float]] = {"x": [], "y": [], "z": []}
+    worst = 0.0
+    print(f"OFF output: {off_path}  rows={model.n_rows}  gain={model.gain:g}")
+    print(f"{'cx':>9} {'cy':>9} {'cz':>9}  " + "  ".join(f"{a}:rel_rms  {a}:gain" for a in ("x", "y", "z")))
+    for _ in range(max(1, args.samples)):
+        coeffs = {
+            "x": round(rng.uniform(0.0, args.x_max), 4),
+            "y": round(rng.uniform(0.0, args.y_max), 4),
+            "z": round(rng.uniform(0.0, args.z_max), 4),
+        }
+        tag = "_".join(fmt_coef_tag(coeffs[a]) for a in ("x", "y", "z"))
+        backend_path = run_backend_candidate(
+            input_csv_path=args.input_csv,
+            device_id=args.device_id,
+            output_folder=out_dir,
+            output_filename=f"check__nn_scalar_{tag}.csv",
+            coeffs=coeffs,
+            room_temp_f=args.room_temp_f,
+            timeout_s=args.timeout_s,
+        )
+        check = model.compare_with_backend(coeffs, backend_path)
+        cells = []
+        for a in ("x", "y", "z"):
+            r = check.get(a) or {}
+            rel = r.get("rel_rms_error")
+            g = r.get("fitted_gain")
+            if rel is not None:
+                worst = max(worst, float(rel))
+            if g is not None:
+                fitted[a].append(float(g))
+            cells.append(f"{'—' if rel is None else f'{rel:.2e}':>9}  {'—' if g is None else f'{g:.3f}':>6}")
+        print(f"{coeffs['x']:9.4f} {coeffs['y']:9.4f} {coeffs['z']:9.4f}  " + "  ".join(cells))
+        if check.get("row_mismatch"):
+            print(f"  warning: OFF and backend outputs differ by {check['row_mismatch']} rows")
+
+    print(f"worst relative RMS error: {worst:.2e}")
+    for a in ("x", "y", "z"):
+        if fitted[a]:
+            print(f"median fitted gain {a}: {statistics.median(fitted[a]):.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
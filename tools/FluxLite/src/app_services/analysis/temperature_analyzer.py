@@ -1,16 +1,118 @@
 from __future__ import annotations
 import os
-import csv
 import math
 import statistics
 import logging
+from itertools import chain
 from typing import Dict, List, Optional, Tuple, Any
 
+import numpy as np
+
 from ... import config
+from ...infra.columnar_csv import CsvColumns, load_csv_columns
 from ..geometry import GeometryService
 
 logger = logging.getLogger(__name__)
 
+# Accepted header spellings (matched case-insensitively) in processed CSVs
+_TIME_COLUMNS = ("time", "time_ms", "elapsed_time")
+_FZ_COLUMNS = ("sum-z", "sum_z", "fz")
+_COPX_COLUMNS = ("copx", "cop_x")
+_COPY_COLUMNS = ("copy", "cop_y")
+
+def _best_windows_vectorized(
+    t_ms: np.ndarray,
+    fz: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    bounds: List[Tuple[int, int]],
+    min_duration: int,
+    max_duration: int,
+) -> List[Optional[Dict[str, float]]]:
+    """
+    Best stable window for every segment `[lo, hi)` of the concatenated sample arrays.
+
+    Equivalent to `TemperatureAnalyzer._select_best_window_scan` (same window bounds and
+    the same first-wins tie rule) but every candidate window, i.e. each right edge paired
+    with the earliest left edge within `max_duration`, is evaluated at once from prefix
+    sums of t, fz, fz^2, t^2 and t*fz. Timestamps must be non-decreasing per segment.
+    """
+    out: List[Optional[Dict[str, float]]] = [None] * len(bounds)
+    n = int(t_ms.shape[0])
+    if n == 0:
+        return out
+
+    t = t_ms.astype(np.float64)
+    t_rel = np.zeros(n, dtype=np.float64)
+    left = np.zeros(n, dtype=np.int64)
+    # Centre Fz per segment: the std/slope formulas are shift-invariant and the prefix
+    # sums of fz^2 lose far less precision around zero.
+    centre = np.zeros(n, dtype=np.float64)
+    for lo, hi in bounds:
+        if hi <= lo:
+            continue
+        ts = t[lo:hi]
+        t_rel[lo:hi] = (ts - ts[0]) / 1000.0
+        left[lo:hi] = np.searchsorted(ts, ts - float(max_duration), side="left") + lo
+        centre[lo:hi] = float(fz[lo:hi].mean())
+    fzc = fz - centre
+
+    def prefix(a: np.ndarray) -> np.ndarray:
+        c = np.empty(n + 1, dtype=np.float64)
+        c[0] = 0.0
+        np.cumsum(a, out=c[1:])
+        return c
+
+    right = np.arange(n)
+    c_t, c_fz, c_x, c_y = prefix(t_rel), prefix(fzc), prefix(x), prefix(y)
+    c_fz2, c_t2, c_tfz = prefix(fzc * fzc), prefix(t_rel * t_rel), prefix(t_rel * fzc)
+    count = (right - left + 1).astype(np.float64)
+    duration = t - t[left]
+    valid = (count >= 2) & (duration >= float(min_duration))
+
+    def wsum(c: np.ndarray) -> np.ndarray:
+        return c[right + 1] - c[left]
+
+    s_t, s_fz, s_fz2 = wsum(c_t), wsum(c_fz), wsum(c_fz2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_num = np.maximum(s_fz2 - s_fz * s_fz / count, 0.0)
+        std = np.sqrt(var_num / np.maximum(count - 1.0, 1.0))
+        slope_num = count * wsum(c_tfz) - s_t * s_fz
+        slope_den = count * wsum(c_t2) - s_t * s_t
+        slope = np.where(np.abs(slope_den) < 1e-9, 0.0, slope_num / np.where(slope_den == 0.0, 1.0, slope_den))
+    slope_abs = np.abs(slope)
+
+    for si, (lo, hi) in enumerate(bounds):
+        cand = np.flatnonzero(valid[lo:hi]) + lo
+        if cand.shape[0] == 0:
+            continue
+        # The "std < best - 1e-6, or within 1e-6 with a smaller |slope|" rule is order
+        # dependent (ties can chain), so replay it over the precomputed floats.
+        best = 0
+        best_std = float("inf")
+        best_slope = float("inf")
+        k = 0
+        for sd, sl in zip(std[cand].tolist(), slope_abs[cand].tolist()):
+            d = sd - best_std
+            if d < -1e-6 or (d <= 1e-6 and sl < best_slope):
+                best, best_std, best_slope = k, sd, sl
+            k += 1
+
+        r = int(cand[best])
+        l = int(left[r])
+        cnt = float(count[r])
+        out[si] = {
+            "std": best_std,
+            "slope": best_slope,
+            "mean_fz": float(centre[r] + (c_fz[r + 1] - c_fz[l]) / cnt),
+            "mean_x": float((c_x[r + 1] - c_x[l]) / cnt),
+            "mean_y": float((c_y[r + 1] - c_y[l]) / cnt),
+            "t_start": float(t_ms[l]),
+            "t_end": float(t_ms[r]),
+        }
+    return out
+
+
 class TemperatureAnalyzer:
     """
     Analyzes processed temperature test CSVs to find stable windows and evaluate accuracy.
@@ -204,12 +306,7 @@ class TemperatureAnalyzer:
         segments = self._collect_stage_segments(csv_path, stage_configs, rows, cols, device_type)
         best_per_stage: Dict[str, Dict[Tuple[int, int], Dict[str, float]]] = {cfg["key"]: {} for cfg in stage_configs}
 
-        cfg_by_key = {cfg["key"]: cfg for cfg in stage_configs}
-        for segment in segments:
-            cfg = cfg_by_key.get(segment["stage_key"])
-            if not cfg:
-                continue
-            metrics = self._evaluate_segment(segment, cfg)
+        for segment, metrics in zip(segments, self._evaluate_segments(segments, stage_configs)):
             if not metrics:
                 continue
             cell_key = (int(metrics["row"]), int(metrics["col"]))
@@ -282,100 +379,71 @@ class TemperatureAnalyzer:
             current = None
 
         try:
-            with open(csv_path, "r", newline="", encoding="utf-8") as handle:
-                reader = csv.reader(handle)
-                header = next(reader, [])
-                if not header:
-                    return segments
-                
-                headers_map = {h.strip().lower(): i for i, h in enumerate(header)}
-                time_idx = -1
-                for k in ("time", "time_ms", "elapsed_time"):
-                     if k in headers_map:
-                         time_idx = headers_map[k]
-                         break
-                
-                fz_idx = -1
-                for k in ("sum-z", "sum_z", "fz"):
-                    if k in headers_map:
-                        fz_idx = headers_map[k]
-                        break
-                
-                copx_idx = -1
-                for k in ("copx", "cop_x"):
-                    if k in headers_map:
-                        copx_idx = headers_map[k]
-                        break
+            table = load_csv_columns(csv_path)
+            if table is None:
+                return segments
+            time_col = table.find(*_TIME_COLUMNS)
+            fz_col = table.find(*_FZ_COLUMNS)
+            copx_col = table.find(*_COPX_COLUMNS)
+            copy_col = table.find(*_COPY_COLUMNS)
+            if time_col is None or fz_col is None or copx_col is None or copy_col is None:
+                return segments
+
+            t_all = table.values[time_col]
+            ok = table.valid(time_col, fz_col, copx_col, copy_col) & np.isfinite(t_all)
+            if not ok.any():
+                return segments
+            t_ms_arr = np.trunc(t_all[ok]).astype(np.int64)
+            warmup_skip_ms = int(getattr(config, "TEMP_WARMUP_SKIP_MS", 20000))
+            keep = (t_ms_arr - t_ms_arr[0]) >= warmup_skip_ms
+            rows_iter = zip(
+                t_ms_arr[keep].tolist(),
+                table.values[fz_col][ok][keep].tolist(),
+                (table.values[copx_col][ok][keep] * 1000.0).tolist(),
+                (table.values[copy_col][ok][keep] * 1000.0).tolist(),
+            )
+
+            for t_ms, fz, copx, copy in rows_iter:
+                cell = GeometryService.map_cop_to_cell(device_type, rows, cols, copx, copy)
+                stage_cfg = self._match_stage(fz, stage_configs)
+                if cell is None or stage_cfg is None:
+                    close_current()
+                    continue
+
+                stage_key = stage_cfg["key"]
+                if current:
+                    should_close = False
+                    if current["stage_key"] != stage_key:
+                        should_close = True
+                    elif current["cell"] != cell:
+                        should_close = True
+                    else:
+                        last_sample = current["samples"][-1]
+                        last_x, last_y = last_sample[2], last_sample[3]
+                        dist_jump = math.sqrt((copx - last_x)**2 + (copy - last_y)**2)
                         
-                copy_idx = -1
-                for k in ("copy", "cop_y"):
-                    if k in headers_map:
-                        copy_idx = headers_map[k]
-                        break
+                        start_sample = current["samples"][0]
+                        start_x, start_y = start_sample[2], start_sample[3]
+                        dist_drift = math.sqrt((copx - start_x)**2 + (copy - start_y)**2)
                         
-                if time_idx < 0 or fz_idx < 0 or copx_idx < 0 or copy_idx < 0:
-                    return segments
-
-                warmup_skip_ms = int(getattr(config, "TEMP_WARMUP_SKIP_MS", 20000))
-                first_t_ms: Optional[int] = None
-                
-                for row in reader:
-                    if len(row) <= max(time_idx, fz_idx, copx_idx, copy_idx):
-                        continue
-                    try:
-                        t_ms = int(float(row[time_idx]))
-                        fz = float(row[fz_idx])
-                        copx = float(row[copx_idx]) * 1000.0
-                        copy = float(row[copy_idx]) * 1000.0
-                    except (ValueError, IndexError):
-                        continue
-                    
-                    if first_t_ms is None:
-                        first_t_ms = t_ms
+                        max_drift = float(getattr(config, "TEMP_COP_MAX_DISPLACEMENT_MM", 100.0))
+                        
+                        if dist_jump > 20.0: 
+                            should_close = True
+                        elif dist_drift > max_drift:
+                            should_close = True
                     
-                    if (t_ms - first_t_ms) < warmup_skip_ms:
-                        continue
-
-                    cell = GeometryService.map_cop_to_cell(device_type, rows, cols, copx, copy)
-                    stage_cfg = self._match_stage(fz, stage_configs)
-                    if cell is None or stage_cfg is None:
+                    if should_close:
                         close_current()
-                        continue
 
-                    stage_key = stage_cfg["key"]
-                    if current:
-                        should_close = False
-                        if current["stage_key"] != stage_key:
-                            should_close = True
-                        elif current["cell"] != cell:
-                            should_close = True
-                        else:
-                            last_sample = current["samples"][-1]
-                            last_x, last_y = last_sample[2], last_sample[3]
-                            dist_jump = math.sqrt((copx - last_x)**2 + (copy - last_y)**2)
-                            
-                            start_sample = current["samples"][0]
-                            start_x, start_y = start_sample[2], start_sample[3]
-                            dist_drift = math.sqrt((copx - start_x)**2 + (copy - start_y)**2)
-                            
-                            max_drift = float(getattr(config, "TEMP_COP_MAX_DISPLACEMENT_MM", 100.0))
-                            
-                            if dist_jump > 20.0: 
-                                should_close = True
-                            elif dist_drift > max_drift:
-                                should_close = True
-                        
-                        if should_close:
-                            close_current()
-
-                    if current is None:
-                        current = {
-                            "stage_key": stage_key,
-                            "cell": cell,
-                            "samples": [],
-                        }
-                    current["samples"].append((t_ms, fz, copx, copy))
-            
+                if current is None:
+                    current = {
+                        "stage_key": stage_key,
+                        "cell": cell,
+                        "samples": [],
+                    }
+                current["samples"].append((t_ms, fz, copx, copy))
+
             logger.info(
                 "temperature.analyze.csv segments path=%s count=%s",
                 os.path.basename(csv_path),
@@ -401,22 +469,72 @@ class TemperatureAnalyzer:
                 return cfg
         return None
 
-    def _evaluate_segment(self, segment: Dict[str, object], stage_cfg: Dict[str, object]) -> Optional[Dict[str, object]]:
-        samples: List[Tuple[int, float, float, float]] = segment.get("samples") or []
-        if not samples:
-            return None
-        
-        desired_ms = int(stage_cfg.get("window_ms", 1000))
-        tolerance_ms = int(stage_cfg.get("window_tol_ms", 200))
-        
-        best = self._select_best_window_optimized(
-            samples,
-            desired_ms,
-            tolerance_ms,
-        )
-        if not best:
-            return None
+    def evaluate_csv_segments(
+        self,
+        csv_path: str,
+        meta: Optional[Dict[str, object]] = None,
+    ) -> List[Dict[str, object]]:
+        """
+        Batch entry point: find every stage segment in a processed CSV and its best window.
 
+        Returns one entry per segment (in file order) with `stage_key`, `cell`,
+        `t_first`/`t_last` of the segment and `metrics` (None when no window qualifies).
+        All segments are scored in a single vectorized pass.
+        """
+        meta = dict(meta or {})
+        device_type = GeometryService.infer_device_type(meta)
+        rows, cols = GeometryService.get_grid_dimensions(device_type)
+        stage_configs = self._stage_configs_for_meta(meta)
+        if not csv_path or not os.path.isfile(csv_path) or not stage_configs:
+            return []
+        segments = self._collect_stage_segments(csv_path, stage_configs, rows, cols, device_type)
+        out: List[Dict[str, object]] = []
+        for seg, metrics in zip(segments, self._evaluate_segments(segments, stage_configs)):
+            samples = seg.get("samples") or []
+            out.append(
+                {
+                    "stage_key": seg.get("stage_key"),
+                    "cell": seg.get("cell"),
+                    "t_first": samples[0][0] if samples else None,
+                    "t_last": samples[-1][0] if samples else None,
+                    "metrics": metrics,
+                }
+            )
+        return out
+
+    def _evaluate_segments(
+        self,
+        segments: List[Dict[str, object]],
+        stage_configs: List[Dict[str, object]],
+    ) -> List[Optional[Dict[str, object]]]:
+        """Evaluate all segments, batching those that share a window size into one NumPy pass."""
+        cfg_by_key = {cfg["key"]: cfg for cfg in stage_configs}
+        results: List[Optional[Dict[str, object]]] = [None] * len(segments)
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for i, seg in enumerate(segments):
+            cfg = cfg_by_key.get(seg.get("stage_key"))
+            if not cfg or not seg.get("samples"):
+                continue
+            wkey = (int(cfg.get("window_ms", 1000)), int(cfg.get("window_tol_ms", 200)))
+            groups.setdefault(wkey, []).append(i)
+
+        for (desired_ms, tolerance_ms), idxs in groups.items():
+            bests = self._select_best_windows_batch(
+                [segments[i]["samples"] for i in idxs],  # type: ignore[misc]
+                desired_ms,
+                tolerance_ms,
+            )
+            for i, best in zip(idxs, bests):
+                if best:
+                    results[i] = self._segment_metrics(segments[i], cfg_by_key[segments[i]["stage_key"]], best)
+        return results
+
+    def _segment_metrics(
+        self,
+        segment: Dict[str, object],
+        stage_cfg: Dict[str, object],
+        best: Dict[str, float],
+    ) -> Dict[str, object]:
         target = float(stage_cfg.get("target_n") or 0.0)
         tolerance = float(stage_cfg.get("tolerance_n") or 0.0)
         mean_fz = best["mean_fz"]
@@ -442,6 +560,61 @@ class TemperatureAnalyzer:
         desired_ms: int,
         tolerance_ms: int,
     ) -> Optional[Dict[str, float]]:
+        if not samples:
+            return None
+        return self._select_best_windows_batch([samples], desired_ms, tolerance_ms)[0]
+
+    def _select_best_windows_batch(
+        self,
+        segments_samples: List[List[Tuple[int, float, float, float]]],
+        desired_ms: int,
+        tolerance_ms: int,
+    ) -> List[Optional[Dict[str, float]]]:
+        """Best window per sample list; one vectorized pass over all of them."""
+        min_duration = max(200, desired_ms - tolerance_ms)
+        max_duration = desired_ms + tolerance_ms
+        results: List[Optional[Dict[str, float]]] = [None] * len(segments_samples)
+        bounds: List[Tuple[int, int]] = []
+        batch_idx: List[int] = []
+        total = 0
+        for i, samples in enumerate(segments_samples):
+            if samples:
+                bounds.append((total, total + len(samples)))
+                batch_idx.append(i)
+                total += len(samples)
+        if not total:
+            return results
+
+        arr = np.fromiter(
+            chain.from_iterable(chain.from_iterable(segments_samples[i] for i in batch_idx)),
+            dtype=np.float64,
+            count=4 * total,
+        ).reshape(total, 4)
+        t_ms = arr[:, 0].astype(np.int64)
+        back = np.flatnonzero(np.diff(t_ms) < 0) + 1
+        unsorted = set()
+        for pos in back.tolist():
+            for j, (lo, hi) in enumerate(bounds):
+                if lo < pos < hi:
+                    unsorted.add(j)
+                    break
+        sorted_bounds = [b for j, b in enumerate(bounds) if j not in unsorted]
+        bests = iter(_best_windows_vectorized(t_ms, arr[:, 1], arr[:, 2], arr[:, 3], sorted_bounds, min_duration, max_duration))
+        for j, i in enumerate(batch_idx):
+            if j in unsorted:
+                # Out-of-order timestamps: the two-pointer scan defines the semantics.
+                results[i] = self._select_best_window_scan(segments_samples[i], desired_ms, tolerance_ms)
+            else:
+                results[i] = next(bests)
+        return results
+
+    def _select_best_window_scan(
+        self,
+        samples: List[Tuple[int, float, float, float]],
+        desired_ms: int,
+        tolerance_ms: int,
+    ) -> Optional[Dict[str, float]]:
+        """Reference two-pointer scan (running sums); used for unsorted timestamps."""
         if not samples:
             return None
         
@@ -554,7 +727,7 @@ class TemperatureAnalyzer:
             return {"stages": stage_map}
         
         times, fz_vals, copx_vals, copy_vals = self._load_csv_for_analysis(csv_path)
-        if not times:
+        if times.shape[0] == 0:
             return {"stages": stage_map}
         
         cfg_by_key = {cfg["key"]: cfg for cfg in stage_configs}
@@ -571,23 +744,14 @@ class TemperatureAnalyzer:
                 t_start = win_info.get("t_start", 0)
                 t_end = win_info.get("t_end", 0)
                 
-                window_fz = []
-                window_x = []
-                window_y = []
-                for i, t in enumerate(times):
-                    if t_start <= t <= t_end:
-                        window_fz.append(fz_vals[i])
-                        if i < len(copx_vals):
-                            window_x.append(copx_vals[i])
-                        if i < len(copy_vals):
-                            window_y.append(copy_vals[i])
-                
-                if not window_fz:
+                in_window = (times >= t_start) & (times <= t_end)
+                count = int(np.count_nonzero(in_window))
+                if count == 0:
                     continue
-                
-                mean_fz = sum(window_fz) / len(window_fz)
-                mean_x = sum(window_x) / len(window_x) if window_x else 0.0
-                mean_y = sum(window_y) / len(window_y) if window_y else 0.0
+
+                mean_fz = float(fz_vals[in_window].sum()) / count
+                mean_x = float(copx_vals[in_window].sum()) / count
+                mean_y = float(copy_vals[in_window].sum()) / count
                 
                 signed_pct = ((mean_fz - target_n) / target_n * 100.0) if target_n else 0.0
                 abs_ratio = abs(mean_fz - target_n) / tolerance_n if tolerance_n else 0.0
@@ -603,64 +767,24 @@ class TemperatureAnalyzer:
         
         return {"stages": stage_map, "_windows": forced_windows, "_segments": []}
 
-    def _load_csv_for_analysis(self, csv_path: str) -> Tuple[List[float], List[float], List[float], List[float]]:
-        times: List[float] = []
-        fz_vals: List[float] = []
-        copx_vals: List[float] = []
-        copy_vals: List[float] = []
-        
-        try:
-            with open(csv_path, "r", newline="", encoding="utf-8") as handle:
-                reader = csv.reader(handle)
-                header = next(reader, [])
-                if not header:
-                    return times, fz_vals, copx_vals, copy_vals
-                
-                headers_map = {h.strip().lower(): i for i, h in enumerate(header)}
-                
-                time_idx = -1
-                for k in ("time", "time_ms", "elapsed_time"):
-                    if k in headers_map:
-                        time_idx = headers_map[k]
-                        break
-                
-                fz_idx = -1
-                for k in ("sum-z", "sum_z", "fz"):
-                    if k in headers_map:
-                        fz_idx = headers_map[k]
-                        break
-                
-                copx_idx = -1
-                for k in ("copx", "cop_x"):
-                    if k in headers_map:
-                        copx_idx = headers_map[k]
-                        break
-                
-                copy_idx = -1
-                for k in ("copy", "cop_y"):
-                    if k in headers_map:
-                        copy_idx = headers_map[k]
-                        break
-                
-                if time_idx < 0 or fz_idx < 0:
-                    return times, fz_vals, copx_vals, copy_vals
-                
-                for row in reader:
-                    if len(row) <= max(time_idx, fz_idx):
-                        continue
-                    try:
-                        t = float(row[time_idx])
-                        fz = float(row[fz_idx])
-                        copx = float(row[copx_idx]) * 1000.0 if copx_idx >= 0 and copx_idx < len(row) else 0.0
-                        copy = float(row[copy_idx]) * 1000.0 if copy_idx >= 0 and copy_idx < len(row) else 0.0
-                    except (ValueError, IndexError):
-                        continue
-                    times.append(t)
-                    fz_vals.append(fz)
-                    copx_vals.append(copx)
-                    copy_vals.append(copy)
-        except Exception:
-            pass
-        
-        return times, fz_vals, copx_vals, copy_vals
-
+    def _load_csv_for_analysis(self, csv_path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(time, fz, copx_mm, copy_mm) arrays for rows with a parseable time and Fz; missing COP columns read as 0."""
+        empty = np.zeros(0, dtype=np.float64)
+        table: Optional[CsvColumns] = load_csv_columns(csv_path)
+        if table is None:
+            return empty, empty, empty, empty
+        time_col = table.find(*_TIME_COLUMNS)
+        fz_col = table.find(*_FZ_COLUMNS)
+        if time_col is None or fz_col is None:
+            return empty, empty, empty, empty
+
+        ok = table.valid(time_col, fz_col)
+        cop: List[np.ndarray] = []
+        for names in (_COPX_COLUMNS, _COPY_COLUMNS):
+            col = table.find(*names)
+            if col is None:
+                cop.append(np.zeros(table.n_rows, dtype=np.float64))
+            else:
+                ok &= table.valid(col)
+                cop.append(table.values[col] * 1000.0)
+        return table.values[time_col][ok], table.values[fz_col][ok], cop[0][ok], cop[1][ok]
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import logging
 import os
-from typing import Optional
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 
 from ..infra.backend_address import BackendAddress, backend_address_from_config
 from ..infra.http_client import post_json
+from ..infra.processed_cache import shared_cache
 
 logger = logging.getLogger(__name__)
 
+# Bump if the sanitize rewrite changes so existing copies are rebuilt.
+_SANITIZE_VERSION = "sanitized_v1"
+
+_sanitize_lock = threading.Lock()
+# sanitized path -> [lock, holders]; an entry lives only while someone holds or waits on it.
+_sanitize_locks: Dict[str, List] = {}
+
+
 def _resolve_backend_address(hardware: object | None = None) -> BackendAddress:
     # HardwareService is authoritative when available.
     if hardware is not None:
@@ -24,6 +37,110 @@ def _resolve_backend_address(hardware: object | None = None) -> BackendAddress:
     return backend_address_from_config()
 
 
+@contextmanager
+def _sanitize_path_lock(path: str) -> Iterator[None]:
+    with _sanitize_lock:
+        entry = _sanitize_locks.get(path)
+        if entry is None:
+            entry = _sanitize_locks[path] = [threading.Lock(), 0]
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _sanitize_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _sanitize_locks[path]
+
+
+def sanitized_csv_for_backend(input_csv_path: str, output_folder: str) -> str:
+    """
+    Path of a copy of `input_csv_path` with BOM/padding stripped from the header and the
+    device_id values, or the input itself when it is already clean.
+
+    The copy is named by the input's (path, mtime_ns, size) and built once per input version:
+    concurrent callers (tuning candidates, rollup coef sets) wait for the first, and the file
+    only appears, via `os.replace`, once complete, so a backend request reading it never sees
+    a partial rewrite. Copies of older versions of the input are removed.
+    """
+    abs_in = os.path.abspath(input_csv_path)
+    st = os.stat(abs_in)
+    path_id = hashlib.sha1(abs_in.encode("utf-8")).hexdigest()[:8]
+    version = hashlib.sha1(f"{st.st_mtime_ns}\n{st.st_size}\n{_SANITIZE_VERSION}".encode("utf-8")).hexdigest()[:8]
+    stem = os.path.splitext(os.path.basename(abs_in))[0]
+    prefix = f"__sanitized__{stem}__{path_id}"
+    out_path = os.path.join(os.path.abspath(output_folder), f"{prefix}-{version}.csv")
+    if os.path.isfile(out_path):
+        return out_path
+    with _sanitize_path_lock(out_path):
+        if os.path.isfile(out_path):
+            return out_path
+        tmp = f"{out_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        try:
+            with open(abs_in, "r", encoding="utf-8", newline="") as src:
+                reader = csv.reader(src)
+                raw_headers = next(reader, [])
+                norm_headers = [(h or "").lstrip("\ufeff").strip() for h in raw_headers]
+
+                try:
+                    device_id_idx = norm_headers.index("device_id")
+                except Exception:
+                    device_id_idx = -1
+
+                first_row = next(reader, None)
+
+                needs_rewrite = raw_headers != norm_headers
+                if (not needs_rewrite) and first_row is not None and device_id_idx >= 0 and device_id_idx < len(first_row):
+                    if first_row[device_id_idx] != (first_row[device_id_idx] or "").strip():
+                        needs_rewrite = True
+                if not needs_rewrite:
+                    return abs_in
+
+                with open(tmp, "w", encoding="utf-8", newline="") as dst:
+                    writer = csv.writer(dst, lineterminator="\n")
+                    writer.writerow(norm_headers)
+
+                    def _write_row(r: list[str]) -> None:
+                        if device_id_idx >= 0 and device_id_idx < len(r):
+                            r[device_id_idx] = (r[device_id_idx] or "").strip()
+                        writer.writerow(r)
+
+                    if first_row is not None:
+                        _write_row(list(first_row))
+                    for row in reader:
+                        if row is None:
+                            continue
+                        _write_row(list(row))
+            os.replace(tmp, out_path)
+        finally:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except OSError:
+                pass
+    _remove_stale_sanitized(out_path, prefix, stem)
+    return out_path
+
+
+def _remove_stale_sanitized(current_path: str, prefix: str, stem: str) -> None:
+    # Older versions of the same input (same path id), plus the unversioned copy earlier releases
+    # rewrote in place. Copies of other inputs with the same file name are left alone.
+    folder = os.path.dirname(current_path)
+    pattern = re.compile(re.escape(prefix) + r"-[0-9a-f]{8}\.csv|" + re.escape(f"__sanitized__{stem}.csv"))
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(folder, name)
+        if path != current_path and pattern.fullmatch(name):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
 def process_csv_via_backend(
     *,
     input_csv_path: str,
@@ -37,12 +154,15 @@ def process_csv_via_backend(
     sanitize_header: bool = False,
     hardware: object | None = None,
     timeout_s: int = 300,
+    use_cache: bool = True,
 ) -> str:
     """
     Process a CSV through the backend NN via HTTP.
 
     This is a shared utility used by both the Temperature Testing flow and
-    discrete temp plotting features.
+    discrete temp plotting features. Outputs go through the shared processed-output
+    cache (see `infra.processed_cache`): an identical input/device/mode/coefs/room-temp
+    request is copied from the cache instead of being sent to the backend again.
     """
     if not os.path.isfile(input_csv_path):
         raise FileNotFoundError(f"Input CSV not found: {input_csv_path}")
@@ -52,53 +172,72 @@ def process_csv_via_backend(
 
     # Some exported CSVs include padded header names like "device_id   " (or a UTF-8 BOM),
     # but the backend expects exact column names (e.g. "device_id") and may also do exact
-    # value matching on device_id. Optionally sanitize into a temporary sibling file so we
-    # never mutate the original CSV.
+    # value matching on device_id. Optionally sanitize into a sibling file so we never
+    # mutate the original CSV.
     csv_path_for_backend = input_csv_path
     if sanitize_header:
         try:
-            base = os.path.basename(input_csv_path)
-            sanitized_path = os.path.join(output_folder, f"__sanitized__{base}")
-
-            with open(input_csv_path, "r", encoding="utf-8", newline="") as src:
-                reader = csv.reader(src)
-                raw_headers = next(reader, [])
-                norm_headers = [(h or "").lstrip("\ufeff").strip() for h in raw_headers]
-
-                try:
-                    device_id_idx = norm_headers.index("device_id")
-                except Exception:
-                    device_id_idx = -1
-
-                first_row = next(reader, None)
-
-                needs_rewrite = raw_headers != norm_headers
-                if (not needs_rewrite) and first_row is not None and device_id_idx >= 0 and device_id_idx < len(first_row):
-                    if first_row[device_id_idx] != (first_row[device_id_idx] or "").strip():
-                        needs_rewrite = True
+            csv_path_for_backend = sanitized_csv_for_backend(input_csv_path, output_folder)
+        except Exception:
+            # If sanitization fails for any reason, fall back to original path.
+            csv_path_for_backend = input_csv_path
 
-                if needs_rewrite:
-                    with open(sanitized_path, "w", encoding="utf-8", newline="") as dst:
-                        writer = csv.writer(dst, lineterminator="\n")
-                        writer.writerow(norm_headers)
+    expected_path = os.path.join(output_folder, output_filename)
+    cache = shared_cache() if use_cache else None
+    key = None
+    if cache is not None:
+        try:
+            key = cache.key(
+                input_csv_path=csv_path_for_backend,
+                device_id=device_id,
+                use_temperature_correction=use_temperature_correction,
+                mode=mode,
+                coefficients=temperature_coefficients,
+                room_temp_f=room_temp_f,
+            )
+        except Exception as exc:
+            logger.warning(f"processed cache unavailable for {input_csv_path}: {exc}")
+            key = None
 
-                        def _write_row(r: list[str]) -> None:
-                            if device_id_idx >= 0 and device_id_idx < len(r):
-                                r[device_id_idx] = (r[device_id_idx] or "").strip()
-                            writer.writerow(r)
+    def run() -> str:
+        return _post_process_csv(
+            csv_path_for_backend=csv_path_for_backend,
+            device_id=device_id,
+            output_folder=output_folder,
+            expected_path=expected_path,
+            use_temperature_correction=use_temperature_correction,
+            room_temp_f=room_temp_f,
+            mode=mode,
+            temperature_coefficients=temperature_coefficients,
+            hardware=hardware,
+            timeout_s=timeout_s,
+        )
 
-                        if first_row is not None:
-                            _write_row(list(first_row))
-                        for row in reader:
-                            if row is None:
-                                continue
-                            _write_row(list(row))
+    if cache is None or key is None:
+        return run()
+    # Identical concurrent requests (e.g. parallel rollup jobs) wait here and then hit the cache.
+    with cache.key_lock(key):
+        if cache.materialize(key, expected_path):
+            logger.info(f"process-csv cache hit {os.path.basename(input_csv_path)} -> {output_filename}")
+            return expected_path
+        out_path = run()
+        cache.put(key, out_path)
+        return out_path
 
-                    csv_path_for_backend = sanitized_path
-        except Exception:
-            # If sanitization fails for any reason, fall back to original path.
-            csv_path_for_backend = input_csv_path
 
+def _post_process_csv(
+    *,
+    csv_path_for_backend: str,
+    device_id: str,
+    output_folder: str,
+    expected_path: str,
+    use_temperature_correction: bool,
+    room_temp_f: float,
+    mode: str,
+    temperature_coefficients: Optional[dict],
+    hardware: object | None,
+    timeout_s: int,
+) -> str:
     addr = _resolve_backend_address(hardware)
     url = addr.process_csv_url()
 
@@ -124,8 +263,6 @@ def process_csv_via_backend(
     data = post_json(url, body, timeout_s=float(timeout_s))
     out_csv_path = data.get("outputPath") or data.get("path") or data.get("processed_csv")
 
-    expected_path = os.path.join(output_folder, output_filename)
-
     if out_csv_path and os.path.isfile(str(out_csv_path)):
         if os.path.abspath(str(out_csv_path)) != os.path.abspath(expected_path):
             try:
@@ -22,7 +22,11 @@ class DataSyncService(QtCore.QObject):
     def sync_all(self, onedrive_root: str) -> None:
         self.sync_started.emit()
         try:
-            data_sync.sync_all_data(onedrive_root)
-            self.sync_finished.emit(True, "Data synchronized successfully.")
+            stats = data_sync.sync_all_data(onedrive_root) or {}
+            done = ", ".join(f"{stats[k]} {k}" for k in ("copied", "appended", "merged", "unchanged") if stats.get(k))
+            msg = f"Data synchronized successfully ({done})." if done else "Data synchronized successfully."
+            if stats.get("failed"):
+                msg += f" {stats['failed']} file(s) could not be synced."
+            self.sync_finished.emit(True, msg)
         except Exception as e:
             self.sync_finished.emit(False, str(e))
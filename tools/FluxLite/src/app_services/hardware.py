@@ -5,10 +5,15 @@ from typing import Callable, Optional, Dict, Any, List
 from PySide6 import QtCore
 
 from .. import config
+from ..diagnostics import live_profiler
+from ..infra import binary_frames
 from ..io_client import IoClient
+from .live_frame_store import LiveFrameStore
 from ..domain.models import DeviceState, Device, LAUNCH_NAME, LANDING_NAME
-import requests
 from ..infra.backend_address import BackendAddress, backend_address_from_config
+from ..infra.http_client import shared_client
+
+_PROF_ON_JSON = live_profiler.histogram("on_json")
 
 class HardwareService(QtCore.QObject):
     """
@@ -17,7 +22,8 @@ class HardwareService(QtCore.QObject):
     """
     # Signals
     connection_status_changed = QtCore.Signal(str)  # "Connected", "Disconnected", "Connecting..."
-    data_received = QtCore.Signal(dict)  # Raw JSON payload
+    data_received = QtCore.Signal(dict)  # Raw JSON payload; only emitted while something is connected to it
+    frames_available = QtCore.Signal()  # Coalesced: new samples in `frame_store` since last `take_dirty()`
     device_list_updated = QtCore.Signal(list)  # List of available devices
     active_devices_updated = QtCore.Signal(set)  # Set of device IDs actively streaming data
     config_status_received = QtCore.Signal(dict) # Dynamo config status
@@ -52,6 +58,23 @@ class HardwareService(QtCore.QObject):
         # Track last-seen timestamps for each device to implement decay
         self._device_last_seen: Dict[str, float] = {}
         self._active_device_decay_s: float = 1.0  # Device considered inactive after 1 second of no data
+        # Columnar per-device ring buffers, filled on the socket thread (see `_on_json`).
+        self.frame_store = LiveFrameStore()
+        # Owners that need the per-sample dict stream (binary blocks carry no named sensor channels).
+        self._dict_stream_holds: set[str] = set()
+        # Optional socket log for offline replay (see live_replay.SocketLogRecorder).
+        self._recorder = None
+        try:
+            import os
+
+            rec_path = str(os.environ.get("FLUXLITE_RECORD_SOCKET", "") or "").strip()
+            if rec_path:
+                from .live_replay import SocketLogRecorder
+
+                self._recorder = SocketLogRecorder(rec_path)
+                print(f"[hardware] recording live payloads to {rec_path}")
+        except Exception:
+            self._recorder = None
         # Cross-thread Qt scheduling:
         # Socket callbacks may run on non-Qt threads; never start Qt timers from there.
         self._qt_call_lock = threading.Lock()
@@ -106,8 +129,15 @@ class HardwareService(QtCore.QObject):
         
     def connect(self, host: str, port: int) -> None:
         self.disconnect()
+        if self._recorder is not None:
+            try:
+                self._recorder.open()
+            except Exception:
+                pass
         self.client = IoClient(host, port)
         self.client.set_json_callback(self._on_json)
+        self.client.set_json_batch_callback(self._on_json_batch)
+        self.client.set_binary_blocks_callback(self._on_binary_blocks)
         try:
             print(f"[hardware] connect: host={host} port={port}")
         except Exception:
@@ -173,7 +203,17 @@ class HardwareService(QtCore.QObject):
         if self.client:
             self.client.stop()
             self.client = None
+        # Close the socket log so everything recorded so far is on disk (reopened on connect).
+        if self._recorder is not None:
+            try:
+                self._recorder.close()
+            except Exception:
+                pass
         # Clear connection-derived state so UI can revert to empty state.
+        try:
+            self.frame_store.clear()
+        except Exception:
+            pass
         try:
             self._connected_devices = set()
             self._active_devices = set()
@@ -206,6 +246,8 @@ class HardwareService(QtCore.QObject):
                     self.client.emit("startDataReception", {})
                 except Exception:
                     pass
+                # Prefer the packed binary stream when the backend supports it (falls back to dicts).
+                self._request_stream_format()
                 self.client.emit("getDynamoConfig")
                 # One-time wakeup
                 self._wakeup_backend()
@@ -213,6 +255,33 @@ class HardwareService(QtCore.QObject):
             except Exception:
                 pass
 
+    def hold_dict_stream(self, owner: str, hold: bool) -> None:
+        """
+        Keep the live stream on per-sample dicts while `owner` needs the raw-stream fields
+        (`deviceId`, named `sensors`) that binary blocks do not carry. Renegotiates on change.
+        """
+        key = str(owner or "").strip()
+        before = bool(self._dict_stream_holds)
+        if hold:
+            self._dict_stream_holds.add(key)
+        else:
+            self._dict_stream_holds.discard(key)
+        if bool(self._dict_stream_holds) != before and self.client is not None and self.client.status.connected:
+            self._request_stream_format()
+
+    def _request_stream_format(self) -> None:
+        """Ask for the binary stream, or for dicts while a `hold_dict_stream` owner is active."""
+        client = self.client
+        if client is None or not bool(getattr(config, "LIVE_STREAM_BINARY", True)):
+            return
+        try:
+            if self._dict_stream_holds:
+                client.request_stream_format([binary_frames.FORMAT_DICT])
+            else:
+                client.request_stream_format()
+        except Exception:
+            pass
+
     def _on_disconnect(self, *args) -> None:
         self.connection_status_changed.emit("Disconnected")
         if self.client:
@@ -244,37 +313,106 @@ class HardwareService(QtCore.QObject):
         pass
 
     def _on_json(self, data: dict) -> None:
-        self.data_received.emit(data)
+        self._on_json_batch([data])
+
+    def _on_json_batch(self, frames: list) -> None:
+        """
+        Handle one or more decoded payloads from IoClient (socket thread).
+
+        IoClient coalesces simpleJsonData frames when SOCKET_BATCH_WINDOW_MS > 0; active-device
+        bookkeeping then runs once per batch instead of once per packet.
+        """
+        prof = live_profiler.enabled
+        if prof:
+            t0 = live_profiler.now()
+        # Fill the frame store once here (socket thread); GUI consumers drain it as NumPy batches
+        # on `frames_available`, which fires about once per consumer tick instead of per packet.
+        try:
+            notify = False
+            for data in frames:
+                notify = self.frame_store.ingest(data) or notify
+            if notify:
+                self._notify_frames_available()
+        except Exception:
+            pass
+
+        if self._recorder is not None:
+            try:
+                for data in frames:
+                    self._recorder.record(data)
+            except Exception:
+                pass
 
+        if self._has_payload_listeners():
+            for data in frames:
+                self.data_received.emit(data)
+
+        self._track_active_devices(frames)
+        if prof:
+            _PROF_ON_JSON.record_since(t0)
+
+    def _on_binary_blocks(self, blocks: list) -> None:
+        """
+        Handle decoded `axf-f32-v1` blocks (socket thread).
+
+        Blocks go straight into the frame store as whole arrays; per-sample dict frames are only
+        built when a legacy `data_received` listener is connected.
+        """
+        prof = live_profiler.enabled
+        if prof:
+            t0 = live_profiler.now()
+        try:
+            # Whole blocks (extra channels included), one slice copy per ring.
+            notify = self.frame_store.ingest_blocks(blocks)
+            if notify:
+                self._notify_frames_available()
+        except Exception:
+            pass
+
+        recorder = self._recorder
+        legacy = self._has_payload_listeners()
+        if recorder is not None or legacy:
+            for block in blocks:
+                try:
+                    frames = block.to_frames()
+                except Exception:
+                    continue
+                if recorder is not None:
+                    try:
+                        # One log line per block; a list payload replays through `_on_json` as-is.
+                        recorder.record(frames)
+                    except Exception:
+                        pass
+                if legacy:
+                    for frame in frames:
+                        self.data_received.emit(frame)
+
+        self._track_active_devices([{"devices": [{"id": b.device_id} for b in blocks]}])
+        if prof:
+            _PROF_ON_JSON.record_since(t0)
+
+    def _notify_frames_available(self) -> None:
+        if live_profiler.enabled:
+            live_profiler.mark_emitted(live_profiler.now())
+        self.frames_available.emit()
+
+    def _has_payload_listeners(self) -> bool:
+        """True when something still consumes per-packet `data_received` (checked once per batch)."""
+        try:
+            return self.receivers(QtCore.SIGNAL("data_received(QVariantMap)")) > 0
+        except Exception:
+            return True
+
+    def _track_active_devices(self, frames: list) -> None:
         # Track active devices from streaming data with decay-based accumulation
         try:
             now = time.time()
             current_ids: set[str] = set()
 
-            # Extract device IDs from various payload formats
-            if isinstance(data, list):
-                for item in data:
-                    did = item.get("deviceId") or item.get("device_id") or item.get("id")
-                    if did:
-                        current_ids.add(str(did))
-            elif isinstance(data, dict):
-                # Single-frame payload (common): jsonData emits { deviceId: "...", ... }
-                if "deviceId" in data or "device_id" in data or "id" in data:
-                    did = data.get("deviceId") or data.get("device_id") or data.get("id")
-                    if did:
-                        current_ids.add(str(did))
-                else:
-                    devs = data.get("devices")
-                    if isinstance(devs, list):
-                        for d in devs:
-                            did = d.get("deviceId") or d.get("device_id") or d.get("id")
-                            if did:
-                                current_ids.add(str(did))
-                    elif isinstance(devs, dict):
-                        for k in devs.keys():
-                            current_ids.add(str(k))
-
-            # Update last-seen timestamps for devices in this packet
+            for data in frames:
+                self._collect_payload_device_ids(data, current_ids)
+
+            # Update last-seen timestamps for devices in this batch
             for did in current_ids:
                 self._device_last_seen[did] = now
 
@@ -303,6 +441,32 @@ class HardwareService(QtCore.QObject):
         except Exception:
             pass
 
+    @staticmethod
+    def _collect_payload_device_ids(data: object, current_ids: set[str]) -> None:
+        """Add device IDs found in one payload (list / single frame / {devices}) to `current_ids`."""
+        # Extract device IDs from various payload formats
+        if isinstance(data, list):
+            for item in data:
+                did = item.get("deviceId") or item.get("device_id") or item.get("id")
+                if did:
+                    current_ids.add(str(did))
+        elif isinstance(data, dict):
+            # Single-frame payload (common): jsonData emits { deviceId: "...", ... }
+            if "deviceId" in data or "device_id" in data or "id" in data:
+                did = data.get("deviceId") or data.get("device_id") or data.get("id")
+                if did:
+                    current_ids.add(str(did))
+            else:
+                devs = data.get("devices")
+                if isinstance(devs, list):
+                    for d in devs:
+                        did = d.get("deviceId") or d.get("device_id") or d.get("id")
+                        if did:
+                            current_ids.add(str(did))
+                elif isinstance(devs, dict):
+                    for k in devs.keys():
+                        current_ids.add(str(k))
+
     def _wakeup_backend(self) -> None:
         # Implementation of _wakeup_backend logic from original controller
         # This might need to be adapted if it depends on specific internal state
@@ -974,16 +1138,35 @@ class HardwareService(QtCore.QObject):
         print(f"[hardware] device_list_updated: {len(devices)} devices -> {devices}")
         self.device_list_updated.emit(devices)
 
-    def auto_connect(self, host: str = config.SOCKET_HOST, http_port: int = config.HTTP_PORT) -> None:
+    def auto_connect(
+        self,
+        host: str = config.SOCKET_HOST,
+        http_port: int = config.HTTP_PORT,
+        socket_port: Optional[int] = None,
+    ) -> None:
         """
         Attempt to automatically connect to the backend.
         Runs in a background thread.
         Stops once connected.
+
+        `socket_port` is a port the caller already resolved (e.g. the FluxDeluxe backend
+        supervisor); it is tried first, without HTTP discovery.
         """
         def _run():
             # Fallback ports to try if discovery fails
             fallback_ports = [3000]
-            
+
+            if socket_port and not self._stop_flag.is_set():
+                self.connection_status_changed.emit(f"Connecting to port {socket_port}...")
+                self.connect(host, int(socket_port))
+                self._http_port = int(http_port)
+                for _ in range(25): # 5s
+                    if self.client and self.client.status.connected:
+                        self.connection_status_changed.emit("Connected")
+                        return
+                    time.sleep(0.2)
+                self.disconnect()
+
             while not self._stop_flag.is_set():
                 # If already connected, we are done.
                 if self.client and self.client.status.connected:
@@ -1082,7 +1265,8 @@ class HardwareService(QtCore.QObject):
             for path in candidates:
                 try:
                     url = f"{base}:{http_port}/{path}"
-                    resp = requests.get(url, headers=headers, timeout=timeout_s)
+                    # Probes fail fast: no retries (the auto-connect loop already retries).
+                    resp = shared_client().request("GET", url, headers=headers, timeout_s=timeout_s, connect_timeout_s=timeout_s, retries=0)
                     if resp.status_code != 200:
                         continue
                     data = None
@@ -0,0 +1,536 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .. import config
+from ..infra.binary_frames import CHANNELS as BLOCK_CHANNELS
+
+
+# Column layout of the per-device frame matrix. Keep in sync with `_row_from_frame`. "seq" is the
+# store's ingest sequence: samples the backend sent together (one payload, or the same sample
+# index across the blocks of one binary frame) share it, whatever their timestamps.
+FRAME_COLUMNS: tuple[str, ...] = (
+    "time_ms",
+    "fx",
+    "fy",
+    "fz",
+    "cop_x",
+    "cop_y",
+    "mx",
+    "my",
+    "mz",
+    "temp_f",
+    "record_id",
+    "seq",
+)
+COL: Dict[str, int] = {name: i for i, name in enumerate(FRAME_COLUMNS)}
+
+# Raw streams carry up to 8 cells + "Sum"; leave headroom for future plate types.
+MAX_SENSOR_CHANNELS: int = 16
+
+# A pending `frames_available` notification older than this is re-sent, so a consumer that
+# missed one (or connected late) is not left waiting on a store that never re-notifies.
+_RENOTIFY_AFTER_S: float = 0.25
+
+
+def _f(v: object) -> float:
+    try:
+        return float(v or 0.0)
+    except Exception:
+        return 0.0
+
+
+class DeviceFrameRing:
+    """
+    Preallocated NumPy ring buffer holding the most recent samples for one device.
+
+    Rows are `FRAME_COLUMNS` (float64). Raw streams additionally fill a per-sensor
+    (x, y, z) block keyed by sensor name; binary blocks with more channels than
+    `binary_frames.CHANNELS` keep the extras in a parallel block. Both are float64 so raw
+    values reach the discrete-temp buffer exactly as received. Reads return views into
+    the backing arrays whenever the requested range does not wrap; `LiveFrameStore` copies
+    them under its lock before handing them out.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = int(max(16, capacity))
+        self._frames = np.zeros((self.capacity, len(FRAME_COLUMNS)), dtype=np.float64)
+        self._sensors: Optional[np.ndarray] = None  # (capacity, MAX_SENSOR_CHANNELS, 3) float64
+        self._sensor_index: Dict[str, int] = {}
+        self._extra: Optional[np.ndarray] = None  # (capacity, n_extra) float64, binary streams only
+        self._written = 0  # total samples ever written (monotonic)
+        self._taken = 0  # `_written` at the last `take_new()`
+        self.group_id = ""
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    @property
+    def total_written(self) -> int:
+        return int(self._written)
+
+    @property
+    def sensor_names(self) -> list[str]:
+        return sorted(self._sensor_index, key=self._sensor_index.get)  # type: ignore[arg-type]
+
+    def append(self, row: Iterable[float], sensors: Optional[list] = None) -> None:
+        pos = self._written % self.capacity
+        self._frames[pos, :] = row
+        if sensors:
+            block = self._ensure_sensor_block()
+            block[pos, :, :] = 0.0
+            for s in sensors:
+                if not isinstance(s, dict):
+                    continue
+                idx = self._sensor_slot(str(s.get("name") or ""))
+                if idx is None:
+                    continue
+                block[pos, idx, 0] = _f(s.get("x"))
+                block[pos, idx, 1] = _f(s.get("y"))
+                block[pos, idx, 2] = _f(s.get("z"))
+        self._written += 1
+
+    def append_block(self, rows: np.ndarray, extra: Optional[np.ndarray] = None) -> None:
+        """Append an (n, len(FRAME_COLUMNS)) block (plus optional (n, k) extras) in one or two slice copies."""
+        n = int(rows.shape[0])
+        if n <= 0:
+            return
+        if n > self.capacity:
+            rows = rows[n - self.capacity :]
+            if extra is not None:
+                extra = extra[n - self.capacity :]
+            self._written += n - self.capacity
+            n = self.capacity
+        pos = self._written % self.capacity
+        first = min(n, self.capacity - pos)
+        self._frames[pos : pos + first] = rows[:first]
+        if first < n:
+            self._frames[: n - first] = rows[first:]
+        if extra is not None and extra.shape[1] > 0:
+            block = self._ensure_extra_block(int(extra.shape[1]))
+            block[pos : pos + first] = extra[:first]
+            if first < n:
+                block[: n - first] = extra[first:]
+        self._written += n
+
+    def _ensure_extra_block(self, width: int) -> np.ndarray:
+        if self._extra is None or self._extra.shape[1] != width:
+            # Channel layout changed (new negotiation): older extras no longer line up.
+            self._extra = np.zeros((self.capacity, width), dtype=np.float64)
+        return self._extra
+
+    def _ensure_sensor_block(self) -> np.ndarray:
+        if self._sensors is None:
+            self._sensors = np.zeros((self.capacity, MAX_SENSOR_CHANNELS, 3), dtype=np.float64)
+        return self._sensors
+
+    def _sensor_slot(self, name: str) -> Optional[int]:
+        if not name:
+            return None
+        idx = self._sensor_index.get(name)
+        if idx is None:
+            if len(self._sensor_index) >= MAX_SENSOR_CHANNELS:
+                return None
+            idx = len(self._sensor_index)
+            self._sensor_index[name] = idx
+        return idx
+
+    def _ordered(self, arr: np.ndarray, n: int) -> np.ndarray:
+        """Return the last `n` rows of `arr` in write order (view when contiguous)."""
+        n = int(max(0, min(n, len(self))))
+        if n == 0:
+            return arr[:0]
+        end = (self._written % self.capacity) or self.capacity
+        start = end - n
+        if start >= 0:
+            return arr[start:end]
+        return np.concatenate((arr[start:], arr[:end]))
+
+    def last(self, n: int) -> np.ndarray:
+        """Last `n` frames as an (n, len(FRAME_COLUMNS)) array, oldest first."""
+        return self._ordered(self._frames, n)
+
+    def last_sensors(self, n: int) -> Optional[np.ndarray]:
+        """Last `n` per-sensor (x, y, z) blocks, or None for processed-only streams."""
+        if self._sensors is None:
+            return None
+        return self._ordered(self._sensors, n)
+
+    def take_new(self) -> tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray], int]:
+        """
+        Copies of (rows, sensors, extras) written since the previous call, plus how many
+        samples were overwritten before they could be taken.
+        """
+        pending = self._written - self._taken
+        n = min(pending, len(self))
+        self._taken = self._written
+        rows = self._ordered(self._frames, n).copy()
+        sensors = self._ordered(self._sensors, n).copy() if self._sensors is not None else None
+        extra = self._ordered(self._extra, n).copy() if self._extra is not None else None
+        return rows, sensors, extra, int(pending - n)
+
+    def latest(self) -> Optional[np.ndarray]:
+        if self._written == 0:
+            return None
+        return self._frames[(self._written - 1) % self.capacity]
+
+    def window_bounds(self, t0_ms: float, t1_ms: float) -> tuple[int, int]:
+        """Index range [lo, hi) within `last(len(self))` covering t0_ms <= time <= t1_ms."""
+        t = self.last(len(self))[:, COL["time_ms"]]
+        lo = int(np.searchsorted(t, float(t0_ms), side="left"))
+        hi = int(np.searchsorted(t, float(t1_ms), side="right"))
+        return lo, max(lo, hi)
+
+    def window(self, t0_ms: float, t1_ms: float) -> np.ndarray:
+        """Frames whose timestamp falls within [t0_ms, t1_ms], oldest first."""
+        lo, hi = self.window_bounds(t0_ms, t1_ms)
+        return self.last(len(self))[lo:hi]
+
+
+@dataclass(frozen=True)
+class FrameBatch:
+    """
+    Samples one device received since the previous `LiveFrameStore.take_dirty()`.
+
+    Arrays are private copies (safe to keep and to use off the store lock); `dropped`
+    counts samples that were overwritten in the ring before the consumer got to them.
+    """
+
+    device_id: str
+    rows: np.ndarray  # (n, len(FRAME_COLUMNS)) float64, oldest first
+    sensors: Optional[np.ndarray] = None  # (n, MAX_SENSOR_CHANNELS, 3) float64, raw streams only
+    sensor_names: tuple[str, ...] = ()
+    extra: Optional[np.ndarray] = None  # (n, k) float64 extra binary channels
+    group_id: str = ""
+    dropped: int = 0
+
+    def __len__(self) -> int:
+        return int(self.rows.shape[0])
+
+    def column(self, name: str) -> np.ndarray:
+        return self.rows[:, COL[name]]
+
+    def frames(self) -> list[dict]:
+        """
+        Expand into per-sample frame dicts: the `extract_device_frames` shape, plus the raw-stream
+        keys (`deviceId`, `sensors`, `recordId`) when present so raw-payload consumers can use them.
+        """
+        out: list[dict] = []
+        rows = self.rows.tolist()
+        sensors = self.sensors
+        names = self.sensor_names
+        extra = self.extra.tolist() if self.extra is not None else None
+        for i, (t, fx, fy, fz, cx, cy, mx, my, mz, temp, rec, _seq) in enumerate(rows):
+            fr: dict = {
+                "id": self.device_id,
+                "deviceId": self.device_id,
+                "time": int(t),
+                "fx": fx,
+                "fy": fy,
+                "fz": fz,
+                "cop": {"x": cx, "y": cy},
+                "moments": {"x": mx, "y": my, "z": mz},
+                "avgTemperatureF": temp,
+                "recordId": int(rec),
+                "groupId": self.group_id,
+            }
+            if sensors is not None and names:
+                s = sensors[i]
+                fr["sensors"] = [
+                    {"name": nm, "x": float(s[k, 0]), "y": float(s[k, 1]), "z": float(s[k, 2])} for k, nm in enumerate(names)
+                ]
+            if extra is not None:
+                fr["extra"] = extra[i]
+            out.append(fr)
+        return out
+
+
+@dataclass(frozen=True)
+class LiveSamples:
+    """
+    Every device's drained samples in one matrix, in ingest order (see `merge_batches`).
+
+    `device[i]` indexes `device_ids`/`group_ids` for row i. Rows sharing a "seq" value arrived
+    in one backend packet; `packets()` gives their row ranges.
+    """
+
+    rows: np.ndarray  # (n, len(FRAME_COLUMNS)) float64
+    device: np.ndarray  # (n,) intp
+    device_ids: tuple[str, ...]
+    group_ids: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return int(self.rows.shape[0])
+
+    def column(self, name: str) -> np.ndarray:
+        return self.rows[:, COL[name]]
+
+    def packets(self) -> List[Tuple[int, int]]:
+        """[start, end) row ranges, one per backend packet, oldest first."""
+        n = len(self)
+        if n == 0:
+            return []
+        cuts = (np.flatnonzero(np.diff(self.rows[:, COL["seq"]])) + 1).tolist()
+        bounds = [0] + cuts + [n]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+
+def merge_batches(batches: Dict[str, FrameBatch]) -> LiveSamples:
+    """Merge `take_dirty()` batches into ingest order (device order breaks ties within a packet)."""
+    parts = [b for b in batches.values() if len(b)]
+    if not parts:
+        return LiveSamples(np.zeros((0, len(FRAME_COLUMNS)), dtype=np.float64), np.zeros(0, dtype=np.intp), (), ())
+    rows = np.concatenate([b.rows for b in parts]) if len(parts) > 1 else parts[0].rows
+    device = np.repeat(np.arange(len(parts), dtype=np.intp), [len(b) for b in parts])
+    order = np.lexsort((device, rows[:, COL["seq"]]))
+    return LiveSamples(
+        rows=rows[order],
+        device=device[order],
+        device_ids=tuple(b.device_id for b in parts),
+        group_ids=tuple(b.group_id for b in parts),
+    )
+
+
+@dataclass(frozen=True)
+class _Block:
+    device_id: str
+    time_ms: np.ndarray
+    channels: np.ndarray
+
+
+class LiveFrameStore:
+    """
+    Columnar store of live samples, one `DeviceFrameRing` per device id.
+
+    Filled once on the socket thread by `HardwareService`; the GUI drains new samples as
+    `FrameBatch`es via `take_dirty()` (one pull per `frames_available` notification) or reads
+    slices by sample count or time window. Writers and readers share one lock; everything
+    handed out is copied while it is held, so readers never see a ring being overwritten.
+    """
+
+    def __init__(self, capacity: Optional[int] = None) -> None:
+        if capacity is None:
+            capacity = int(getattr(config, "LIVE_FRAME_STORE_CAPACITY", 8192))
+        self.capacity = int(capacity)
+        self._rings: Dict[str, DeviceFrameRing] = {}
+        self._lock = threading.Lock()
+        self._dirty: set[str] = set()
+        self._notified_at: Optional[float] = None
+        self._ingested = 0  # `ingest`/`ingest_blocks` calls (monotonic)
+        self._taken = 0  # `_ingested` as of the last `take_dirty()`
+        self._next_seq = 0  # next "seq" column value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rings.clear()
+            self._dirty.clear()
+            self._notified_at = None
+
+    def device_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._rings.keys())
+
+    @property
+    def packets_taken(self) -> int:
+        """Number of ingested payloads/blocks whose samples have been drained by `take_dirty()`."""
+        with self._lock:
+            return int(self._taken)
+
+    def _ring_for(self, did: str) -> DeviceFrameRing:
+        ring = self._rings.get(did)
+        if ring is None:
+            ring = DeviceFrameRing(self.capacity)
+            self._rings[did] = ring
+        return ring
+
+    def _should_notify(self) -> bool:
+        """Caller holds the lock and has just marked something dirty."""
+        now = time.monotonic()
+        if self._notified_at is None or (now - self._notified_at) >= _RENOTIFY_AFTER_S:
+            self._notified_at = now
+            return True
+        return False
+
+    def ingest(self, payload: Any) -> bool:
+        """
+        Append every device frame found in `payload`.
+
+        Returns True when the caller should notify consumers: the first write after a
+        `take_dirty()`, or a notification that has gone unanswered for `_RENOTIFY_AFTER_S`.
+        Other packets return False so notifications coalesce to about one per consumer tick.
+        """
+        wrote = False
+        with self._lock:
+            seq = (float(self._next_seq),)
+            for did, row, sensors, group_id in _iter_frames(payload):
+                ring = self._ring_for(did)
+                ring.append(row + seq, sensors)
+                if group_id:
+                    ring.group_id = group_id
+                self._dirty.add(did)
+                wrote = True
+            self._ingested += 1
+            if not wrote:
+                return False
+            self._next_seq += 1
+            return self._should_notify()
+
+    def ingest_blocks(self, blocks: Iterable[Any]) -> bool:
+        """
+        Append the decoded blocks of one binary frame (see `infra.binary_frames`): the first
+        channels follow `binary_frames.CHANNELS` (= FRAME_COLUMNS[1:10]); further channels are
+        kept as extras. Sample i of every block gets the same "seq", like the devices of one
+        dict payload. Same notification semantics as `ingest`.
+        """
+        n_std = len(BLOCK_CHANNELS)
+        prepared = []
+        for block in blocks:
+            time_ms, channels = block.time_ms, block.channels
+            n = int(time_ms.shape[0])
+            if n <= 0:
+                continue
+            rows = np.zeros((n, len(FRAME_COLUMNS)), dtype=np.float64)
+            rows[:, 0] = time_ms
+            k = min(int(channels.shape[1]), n_std)
+            rows[:, 1 : 1 + k] = channels[:, :k]
+            extra = channels[:, n_std:] if int(channels.shape[1]) > n_std else None
+            prepared.append((str(block.device_id), rows, extra))
+        with self._lock:
+            self._ingested += 1
+            if not prepared:
+                return False
+            seq0 = self._next_seq
+            width = 0
+            for did, rows, extra in prepared:
+                rows[:, COL["seq"]] = np.arange(seq0, seq0 + rows.shape[0], dtype=np.float64)
+                width = max(width, int(rows.shape[0]))
+                self._ring_for(did).append_block(rows, extra)
+                self._dirty.add(did)
+            self._next_seq = seq0 + width
+            return self._should_notify()
+
+    def ingest_block(self, device_id: str, time_ms: np.ndarray, channels: np.ndarray) -> bool:
+        """Append a single decoded binary block; see `ingest_blocks`."""
+        return self.ingest_blocks([_Block(str(device_id), time_ms, channels)])
+
+    def take_dirty(self) -> Dict[str, FrameBatch]:
+        """Drain every device that received samples since the last call, as copied `FrameBatch`es."""
+        out: Dict[str, FrameBatch] = {}
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            self._notified_at = None
+            self._taken = self._ingested
+            for did in dirty:
+                ring = self._rings.get(did)
+                if ring is None:
+                    continue
+                rows, sensors, extra, dropped = ring.take_new()
+                if rows.shape[0] == 0:
+                    continue
+                out[did] = FrameBatch(
+                    device_id=did,
+                    rows=rows,
+                    sensors=sensors,
+                    sensor_names=tuple(ring.sensor_names) if sensors is not None else (),
+                    extra=extra,
+                    group_id=ring.group_id,
+                    dropped=dropped,
+                )
+        return out
+
+    def last(self, device_id: str, n: int) -> np.ndarray:
+        with self._lock:
+            ring = self._rings.get(str(device_id))
+            if ring is None:
+                return np.zeros((0, len(FRAME_COLUMNS)), dtype=np.float64)
+            return ring.last(n).copy()
+
+    def window(self, device_id: str, t0_ms: float, t1_ms: float) -> np.ndarray:
+        with self._lock:
+            ring = self._rings.get(str(device_id))
+            if ring is None:
+                return np.zeros((0, len(FRAME_COLUMNS)), dtype=np.float64)
+            return ring.window(t0_ms, t1_ms).copy()
+
+    def latest_frame(self, device_id: str) -> Optional[dict]:
+        """Most recent sample as a frame dict (same shape as `extract_device_frames`)."""
+        with self._lock:
+            ring = self._rings.get(str(device_id))
+            row = ring.latest() if ring is not None else None
+            if row is None:
+                return None
+            row = row.copy()
+        return {
+            "id": str(device_id),
+            "time": int(row[COL["time_ms"]]),
+            "fx": float(row[COL["fx"]]),
+            "fy": float(row[COL["fy"]]),
+            "fz": float(row[COL["fz"]]),
+            "cop": {"x": float(row[COL["cop_x"]]), "y": float(row[COL["cop_y"]])},
+            "moments": {"x": float(row[COL["mx"]]), "y": float(row[COL["my"]]), "z": float(row[COL["mz"]])},
+            "avgTemperatureF": float(row[COL["temp_f"]]),
+        }
+
+
+def _row_from_frame(frame: dict, fx: float, fy: float, fz: float) -> tuple:
+    cop = frame.get("cop") or {}
+    mom = frame.get("moments") or {}
+    if not isinstance(cop, dict):
+        cop = {}
+    if not isinstance(mom, dict):
+        mom = {}
+    return (
+        _f(frame.get("time") or frame.get("t")),
+        fx,
+        fy,
+        fz,
+        _f(cop.get("x")),
+        _f(cop.get("y")),
+        _f(mom.get("x")),
+        _f(mom.get("y")),
+        _f(mom.get("z")),
+        _f(frame.get("avgTemperatureF")),
+        _f(frame.get("recordId") or frame.get("record_id")),
+    )
+
+
+def _group_id(frame: dict) -> str:
+    return str(frame.get("groupId") or frame.get("group_id") or "").strip()
+
+
+def _iter_frames(payload: Any):
+    """Yield (device_id, row, sensors|None, group_id) for each device frame in a backend payload."""
+    if isinstance(payload, list):
+        frames = payload
+    elif isinstance(payload, dict):
+        sensors = payload.get("sensors")
+        if isinstance(sensors, list):
+            # Raw stream: { deviceId, sensors:[{name,x,y,z}], cop, moments, time }
+            did = str(payload.get("deviceId") or payload.get("device_id") or "").strip()
+            if not did:
+                return
+            sum_sensor = next((s for s in sensors if isinstance(s, dict) and s.get("name") == "Sum"), None) or {}
+            row = _row_from_frame(payload, _f(sum_sensor.get("x")), _f(sum_sensor.get("y")), _f(sum_sensor.get("z")))
+            yield did, row, sensors, _group_id(payload)
+            return
+        if isinstance(payload.get("devices"), list):
+            frames = payload["devices"]
+        elif "id" in payload or "deviceId" in payload:
+            frames = [payload]
+        else:
+            return
+    else:
+        return
+
+    for fr in frames:
+        if not isinstance(fr, dict):
+            continue
+        did = str(fr.get("id") or fr.get("deviceId") or fr.get("device_id") or "").strip()
+        if not did:
+            continue
+        yield did, _row_from_frame(fr, _f(fr.get("fx")), _f(fr.get("fy")), _f(fr.get("fz"))), None, _group_id(fr)
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 from collections import deque
+from itertools import islice
 from typing import Deque, List, Optional, Tuple
 
+import numpy as np
+
 from .geometry import GeometryService
 
 
@@ -25,6 +30,11 @@ class LiveMeasurementConfig:
     # Median filter kernel size for noise reduction (must be odd)
     median_filter_size: int = 7
 
+    # Evaluate stability incrementally (O(k) per sample) instead of re-filtering the
+    # whole window each sample. Verdicts match the full re-scan; False keeps the
+    # reference implementation (used by examples/bench_live_stability.py to verify).
+    incremental_stability: bool = True
+
 
 @dataclass(frozen=True)
 class CaptureEvent:
@@ -76,6 +86,228 @@ def _apply_median_filter(values: List[float], kernel_size: int = 5) -> List[floa
     return result
 
 
+# Relative distance from a stability threshold inside which the incremental check defers to the
+# reference. Left-to-right summation of n window samples is off by at most ~n ulps
+# (n * 1.1e-16), far below this for any realistic window.
+_VERDICT_MARGIN = 1e-9
+
+
+def _near(value: float, limit: float) -> bool:
+    return abs(value - limit) <= _VERDICT_MARGIN * max(1.0, abs(limit))
+
+
+class _ExactSum:
+    """Running float sum with exact add/remove (Shewchuk partials, as in `math.fsum`)."""
+
+    __slots__ = ("_partials",)
+
+    def __init__(self) -> None:
+        self._partials: List[float] = []
+
+    def add(self, x: float) -> None:
+        partials = self._partials
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+
+    def total(self, extra: List[float] | None = None) -> float:
+        if extra:
+            return math.fsum(self._partials + extra)
+        return math.fsum(self._partials)
+
+
+class _MonotonicExtreme:
+    """Sliding-window min (or max) over (index, value) pairs; amortised O(1) per sample."""
+
+    __slots__ = ("_q", "_is_max")
+
+    def __init__(self, is_max: bool) -> None:
+        self._q: Deque[Tuple[int, float]] = deque()
+        self._is_max = bool(is_max)
+
+    def push(self, idx: int, v: float) -> None:
+        q = self._q
+        if self._is_max:
+            while q and q[-1][1] <= v:
+                q.pop()
+        else:
+            while q and q[-1][1] >= v:
+                q.pop()
+        q.append((idx, v))
+
+    def expire(self, min_idx: int) -> None:
+        q = self._q
+        while q and q[0][0] < min_idx:
+            q.popleft()
+
+    def value(self) -> Optional[float]:
+        return self._q[0][1] if self._q else None
+
+    def clear(self) -> None:
+        self._q.clear()
+
+
+class _StabilityTracker:
+    """
+    Incremental state behind `LiveMeasurementEngine._check_stability`.
+
+    Mirrors the sliding window sample-for-sample (samples carry a monotonic index):
+
+    - Median-filtered Fz: every position whose full kernel lies inside the window has a
+      fixed median, computed once from a sorted kernel buffer (bisect insert/remove) when
+      its last neighbour arrives. Those feed monotonic min/max deques and an exact
+      running sum. Only the <= 2*half edge positions (truncated kernels) are re-derived
+      per check, exactly as `_apply_median_filter` does.
+    - COP: exact running sums give the centroid; monotonic min/max of x/y bound the
+      max distance from it, so the O(n) distance scan only runs when the bound does not
+      already clear the limit.
+    """
+
+    def __init__(self, kernel_size: int) -> None:
+        k = int(kernel_size)
+        if k < 1:
+            k = 1  # `_apply_median_filter` leaves values untouched
+        elif k % 2 == 0:
+            k += 1
+        self.kernel = k
+        self.half = k // 2
+        self.clear()
+
+    def clear(self) -> None:
+        self._left = 0  # index of the oldest sample in the window
+        self._right = 0  # index one past the newest sample
+        self._fz: Deque[float] = deque()
+        self._x: Deque[float] = deque()
+        self._y: Deque[float] = deque()
+        self._kernel_sorted: List[float] = []  # sorted fz of the newest min(n, k) samples
+        self._med: Deque[Tuple[int, float]] = deque()  # (position, full-kernel median)
+        self._med_sum = _ExactSum()
+        self._med_min = _MonotonicExtreme(is_max=False)
+        self._med_max = _MonotonicExtreme(is_max=True)
+        self._sum_x = _ExactSum()
+        self._sum_y = _ExactSum()
+        self._x_min = _MonotonicExtreme(is_max=False)
+        self._x_max = _MonotonicExtreme(is_max=True)
+        self._y_min = _MonotonicExtreme(is_max=False)
+        self._y_max = _MonotonicExtreme(is_max=True)
+
+    def __len__(self) -> int:
+        return self._right - self._left
+
+    def append(self, x: float, y: float, fz: float) -> None:
+        idx = self._right
+        self._right += 1
+        self._fz.append(fz)
+        self._x.append(x)
+        self._y.append(y)
+
+        ks = self._kernel_sorted
+        insort(ks, fz)
+        if len(ks) > self.kernel:
+            old = self._fz[-1 - self.kernel]
+            del ks[bisect_left(ks, old)]
+
+        if len(ks) == self.kernel:
+            # Position idx-half now has its full kernel inside the window.
+            pos = idx - self.half
+            med = ks[self.half]
+            self._med.append((pos, med))
+            self._med_sum.add(med)
+            self._med_min.push(pos, med)
+            self._med_max.push(pos, med)
+
+        self._sum_x.add(x)
+        self._sum_y.add(y)
+        self._x_min.push(idx, x)
+        self._x_max.push(idx, x)
+        self._y_min.push(idx, y)
+        self._y_max.push(idx, y)
+
+    def pop_oldest(self) -> None:
+        if self._right <= self._left:
+            return
+        n_before = self._right - self._left
+        fz = self._fz.popleft()
+        x = self._x.popleft()
+        y = self._y.popleft()
+        self._left += 1
+        if n_before <= self.kernel:
+            # Oldest sample is still part of the newest kernel buffer.
+            ks = self._kernel_sorted
+            del ks[bisect_left(ks, fz)]
+
+        first_interior = self._left + self.half
+        med = self._med
+        while med and med[0][0] < first_interior:
+            self._med_sum.add(-med.popleft()[1])
+        self._med_min.expire(first_interior)
+        self._med_max.expire(first_interior)
+
+        self._sum_x.add(-x)
+        self._sum_y.add(-y)
+        for ext in (self._x_min, self._x_max, self._y_min, self._y_max):
+            ext.expire(self._left)
+
+    def _edge_medians(self) -> List[float]:
+        """Median-filter outputs for positions without a full kernel (both window ends)."""
+        n = len(self)
+        h = self.half
+        if n <= 0:
+            return []
+        if len(self._med) == 0:
+            # No interior positions: the whole window is edge.
+            return _apply_median_filter(list(self._fz), self.kernel)
+        head = list(islice(self._fz, 0, 2 * h))
+        tail = list(islice(self._fz, n - 2 * h, n))
+        out: List[float] = []
+        for i in range(h):
+            out.append(_median(head[0 : i + h + 1]))
+        # tail[j] is window position n - 2h + j; edge positions are n-h .. n-1.
+        for j in range(h, 2 * h):
+            out.append(_median(tail[j - h : 2 * h]))
+        return out
+
+    def fz_stats(self) -> Tuple[float, float, float]:
+        """(min, max, mean) of the median-filtered Fz over the window."""
+        edges = self._edge_medians()
+        n = len(self)
+        lo = self._med_min.value()
+        hi = self._med_max.value()
+        if edges:
+            e_lo, e_hi = min(edges), max(edges)
+            lo = e_lo if lo is None else min(lo, e_lo)
+            hi = e_hi if hi is None else max(hi, e_hi)
+        if len(self._med) == 0:
+            mean = math.fsum(edges) / n
+        else:
+            mean = self._med_sum.total(edges) / n
+        return float(lo), float(hi), float(mean)
+
+    def cop_centroid(self) -> Tuple[float, float]:
+        n = len(self)
+        return self._sum_x.total() / n, self._sum_y.total() / n
+
+    def cop_radius_bound(self, cx: float, cy: float) -> float:
+        """Upper bound on the max distance of any COP sample from (cx, cy): farthest bbox corner."""
+        dx = max(self._x_max.value() - cx, cx - self._x_min.value())  # type: ignore[operator]
+        dy = max(self._y_max.value() - cy, cy - self._y_min.value())  # type: ignore[operator]
+        return math.hypot(dx, dy)
+
+    def cop_radius(self, cx: float, cy: float) -> float:
+        n = len(self)
+        xs = np.fromiter(self._x, dtype=np.float64, count=n) - cx
+        ys = np.fromiter(self._y, dtype=np.float64, count=n) - cy
+        return float(np.sqrt(xs * xs + ys * ys).max())
+
+
 class LiveMeasurementEngine:
     """
     Implements the live-testing arming -> stability -> capture state machine.
@@ -104,6 +336,7 @@ class LiveMeasurementEngine:
         self._active_cell: Optional[Tuple[int, int]] = None
         # (t_ms, cop_x_mm, cop_y_mm, fz_abs_n)
         self._window: Deque[Tuple[int, float, float, float]] = deque()
+        self._stability = _StabilityTracker(self.cfg.median_filter_size)
         self._last_status: str = ""
         # UI-friendly summary (keep it simple: idle|arming|measuring)
         self._phase: str = "idle"
@@ -131,12 +364,76 @@ class LiveMeasurementEngine:
     def status(self) -> str:
         return self._last_status
 
+    def _append_window(self, t_ms: int, cop_x_mm: float, cop_y_mm: float, fz_abs: float) -> None:
+        self._window.append((t_ms, cop_x_mm, cop_y_mm, fz_abs))
+        if self.cfg.incremental_stability:
+            self._stability.append(cop_x_mm, cop_y_mm, fz_abs)
+
+    def _trim_window(self, cutoff_ms: int) -> None:
+        incremental = self.cfg.incremental_stability
+        while self._window and self._window[0][0] < cutoff_ms:
+            self._window.popleft()
+            if incremental:
+                self._stability.pop_oldest()
+
+    def _clear_window(self) -> None:
+        self._window.clear()
+        self._stability.clear()
+
     def _check_stability(self) -> Tuple[bool, float, float, float, str]:
         """
         Check if the current window is stable.
 
         Returns: (is_stable, fz_range, fz_threshold, cop_range, reason)
+
+        cop_range is exact whenever the COP check fails; when it passes on the
+        bounding-box estimate alone the (<= limit) upper bound is returned instead.
+
+        The tracker's means come from exactly-rounded running sums, while the reference
+        (`_check_stability_full`) sums left to right, so the reported mean/threshold/range
+        may differ from it in the last few ulps. Verdicts never do: within
+        `_VERDICT_MARGIN` of either threshold the reference decides.
         """
+        if not self.cfg.incremental_stability:
+            return self._check_stability_full()
+        if len(self._window) < 3:
+            return False, 0.0, 0.0, 0.0, "collecting"
+
+        st = self._stability
+        fz_min, fz_max, fz_mean = st.fz_stats()
+        fz_range = fz_max - fz_min
+        fz_threshold = max(10.0, fz_mean * self.cfg.stability_fz_range_pct)
+        fz_ok = fz_range <= fz_threshold
+
+        cop_limit = float(self.cfg.stability_cop_range_max_mm)
+        cx, cy = st.cop_centroid()
+        upper = st.cop_radius_bound(cx, cy)
+        # A failing COP check needs the exact radius anyway for the status text.
+        if upper < cop_limit - _VERDICT_MARGIN * max(1.0, abs(cop_limit)):
+            cop_range = upper
+        else:
+            cop_range = st.cop_radius(cx, cy)
+        cop_ok = cop_range <= cop_limit
+
+        if _near(fz_range, fz_threshold) or _near(cop_range, cop_limit):
+            return self._check_stability_full()
+        return (fz_ok and cop_ok), fz_range, fz_threshold, cop_range, self._stability_reason(
+            fz_ok, cop_ok, fz_range, fz_threshold, fz_mean, cop_range
+        )
+
+    def _stability_reason(
+        self, fz_ok: bool, cop_ok: bool, fz_range: float, fz_threshold: float, fz_mean: float, cop_range: float
+    ) -> str:
+        if not fz_ok and not cop_ok:
+            return f"Fz ±{fz_range:.1f}N (need ≤{fz_threshold:.1f}N), COP {cop_range:.0f}mm"
+        if not fz_ok:
+            return f"Fz ±{fz_range:.1f}N (need ≤{fz_threshold:.1f}N @ {fz_mean:.0f}N)"
+        if not cop_ok:
+            return f"COP {cop_range:.0f}mm (need ≤{self.cfg.stability_cop_range_max_mm:.0f}mm)"
+        return "stable"
+
+    def _check_stability_full(self) -> Tuple[bool, float, float, float, str]:
+        """Reference implementation: re-filter and re-scan the whole window."""
         if len(self._window) < 3:
             return False, 0.0, 0.0, 0.0, "collecting"
 
@@ -166,19 +463,9 @@ class LiveMeasurementEngine:
             dist = ((x - cop_x_mean) ** 2 + (y - cop_y_mean) ** 2) ** 0.5
             cop_range = max(cop_range, dist)
 
-        # Build reason string for status
         fz_ok = fz_range <= fz_threshold
         cop_ok = cop_range <= self.cfg.stability_cop_range_max_mm
-
-        if not fz_ok and not cop_ok:
-            reason = f"Fz ±{fz_range:.1f}N (need ≤{fz_threshold:.1f}N), COP {cop_range:.0f}mm"
-        elif not fz_ok:
-            reason = f"Fz ±{fz_range:.1f}N (need ≤{fz_threshold:.1f}N @ {fz_mean:.0f}N)"
-        elif not cop_ok:
-            reason = f"COP {cop_range:.0f}mm (need ≤{self.cfg.stability_cop_range_max_mm:.0f}mm)"
-        else:
-            reason = "stable"
-
+        reason = self._stability_reason(fz_ok, cop_ok, fz_range, fz_threshold, fz_mean, cop_range)
         return (fz_ok and cop_ok), fz_range, fz_threshold, cop_range, reason
 
     def process_sample(
@@ -208,7 +495,7 @@ class LiveMeasurementEngine:
             self._arming_cell = None
             self._arming_start_ms = None
             self._active_cell = None
-            self._window.clear()
+            self._clear_window()
             self._stable_since_ms = None
             self._last_status = "Move load onto plate to arm…"
             self._phase = "idle"
@@ -246,7 +533,7 @@ class LiveMeasurementEngine:
             self._arming_cell = None
             self._arming_start_ms = None
             self._active_cell = None
-            self._window.clear()
+            self._clear_window()
             self._stable_since_ms = None
             self._last_status = "Move load onto plate to arm…"
             self._phase = "idle"
@@ -256,10 +543,8 @@ class LiveMeasurementEngine:
         row, col = int(cell_rc[0]), int(cell_rc[1])
 
         # Always add to sliding window and trim old samples
-        self._window.append((int(t_ms), float(cop_x_mm), float(cop_y_mm), float(fz_abs)))
-        cutoff = int(t_ms) - int(self.cfg.stability_duration_ms)
-        while self._window and self._window[0][0] < cutoff:
-            self._window.popleft()
+        self._append_window(int(t_ms), float(cop_x_mm), float(cop_y_mm), float(fz_abs))
+        self._trim_window(int(t_ms) - int(self.cfg.stability_duration_ms))
 
         # ===== ARMING PHASE =====
         if self._active_cell is None:
@@ -267,7 +552,7 @@ class LiveMeasurementEngine:
             if is_cell_already_done(int(row), int(col)):
                 self._arming_cell = None
                 self._arming_start_ms = None
-                self._window.clear()
+                self._clear_window()
                 self._stable_since_ms = None
                 self._last_status = "Already captured — move to next cell."
                 self._phase = "idle"
@@ -314,7 +599,7 @@ class LiveMeasurementEngine:
         # Must remain in the same cell
         if (row, col) != self._active_cell:
             self._active_cell = None
-            self._window.clear()
+            self._clear_window()
             self._stable_since_ms = None
             self._last_status = f"Cell changed — need ≥{self.cfg.arming_min_fz_n:.0f}N to re-arm"
             self._phase = "idle"
@@ -387,7 +672,7 @@ class LiveMeasurementEngine:
 
                 # Reset for next cell
                 self._active_cell = None
-                self._window.clear()
+                self._clear_window()
                 self._stable_since_ms = None
                 self._last_status = "Captured! Move to next cell."
                 self._phase = "idle"
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from PySide6 import QtCore
+
+from ..diagnostics import live_profiler
+from .hardware import HardwareService
+from .live_frame_store import merge_batches
+
+
+# Raw capture column prefixes -> sensor names used by the live stream.
+_SENSOR_NAMES = {
+    "rear-right-outer": "Rear Right Outer",
+    "rear-right-inner": "Rear Right Inner",
+    "rear-left-outer": "Rear Left Outer",
+    "rear-left-inner": "Rear Left Inner",
+    "front-left-outer": "Front Left Outer",
+    "front-left-inner": "Front Left Inner",
+    "front-right-outer": "Front Right Outer",
+    "front-right-inner": "Front Right Inner",
+    "sum": "Sum",
+}
+
+
+@dataclass(frozen=True)
+class ReplayFrame:
+    t_s: float  # capture-relative time of this payload (seconds)
+    payload: dict
+
+
+def _num(v: object) -> float:
+    try:
+        return float(v)  # type: ignore[arg-type]
+    except Exception:
+        return 0.0
+
+
+def iter_raw_csv_frames(csv_path: str, device_id: str | None = None) -> Iterator[ReplayFrame]:
+    """
+    Turn a raw capture CSV (time, <sensor>-x/y/z/t, sum-*, moments-*, COPx/COPy) into
+    raw-stream payloads: { deviceId, time, sensors:[{name,x,y,z}], cop, moments, avgTemperatureF }.
+    """
+    with open(csv_path, "r", newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        if not header:
+            return
+        idx = {h.strip().lower(): i for i, h in enumerate(header)}
+        time_idx = next((idx[k] for k in ("time", "time_ms", "elapsed_time") if k in idx), -1)
+        if time_idx < 0:
+            raise ValueError(f"CSV missing time column: {csv_path}")
+        dev_idx = next((idx[k] for k in ("device_id", "deviceid") if k in idx), -1)
+        sensors = [
+            (name, idx.get(f"{prefix}-x"), idx.get(f"{prefix}-y"), idx.get(f"{prefix}-z"))
+            for prefix, name in _SENSOR_NAMES.items()
+            if f"{prefix}-z" in idx
+        ]
+        temp_idx = idx.get("sum-t")
+        mx_idx, my_idx, mz_idx = idx.get("moments-x"), idx.get("moments-y"), idx.get("moments-z")
+        copx_idx = idx.get("copx", idx.get("cop_x"))
+        copy_idx = idx.get("copy", idx.get("cop_y"))
+        fallback_id = str(device_id or "").strip() or os.path.splitext(os.path.basename(csv_path))[0]
+
+        def _at(row: list, i: Optional[int]) -> float:
+            return _num(row[i]) if i is not None and i < len(row) else 0.0
+
+        t0: Optional[float] = None
+        for row in reader:
+            if len(row) <= time_idx:
+                continue
+            try:
+                t_ms = float(row[time_idx])
+            except ValueError:
+                continue
+            if t0 is None:
+                t0 = t_ms
+            did = str(device_id or (row[dev_idx] if 0 <= dev_idx < len(row) else "") or fallback_id)
+            payload = {
+                "deviceId": did,
+                "time": int(t_ms),
+                "sensors": [{"name": n, "x": _at(row, xi), "y": _at(row, yi), "z": _at(row, zi)} for n, xi, yi, zi in sensors],
+                "cop": {"x": _at(row, copx_idx), "y": _at(row, copy_idx)},
+                "moments": {"x": _at(row, mx_idx), "y": _at(row, my_idx), "z": _at(row, mz_idx)},
+                "avgTemperatureF": _at(row, temp_idx),
+            }
+            yield ReplayFrame(t_s=(t_ms - t0) / 1000.0, payload=payload)
+
+
+def iter_socket_log_frames(log_path: str) -> Iterator[ReplayFrame]:
+    """Read a JSONL socket log written by `SocketLogRecorder`."""
+    with open(log_path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            payload = rec.get("payload")
+            if isinstance(payload, (dict, list)):
+                yield ReplayFrame(t_s=float(rec.get("t") or 0.0), payload=payload)  # type: ignore[arg-type]
+
+
+def load_replay_frames(path: str, device_id: str | None = None) -> List[ReplayFrame]:
+    """Load a recording by extension: .csv (raw capture) or .jsonl (socket log)."""
+    if str(path).lower().endswith(".csv"):
+        return list(iter_raw_csv_frames(path, device_id=device_id))
+    return list(iter_socket_log_frames(path))
+
+
+class SocketLogRecorder:
+    """
+    Append live payloads to a JSONL socket log ({"t": seconds_since_start, "payload": ...}).
+
+    Enable for a session with FLUXLITE_RECORD_SOCKET=<path>; HardwareService records every
+    payload it receives (binary blocks as a list of frame dicts per block) so the run can be
+    replayed later without hardware. The file is flushed about once a second and closed on
+    disconnect; `open()` resumes the same log (same time base) on the next connect.
+    """
+
+    _FLUSH_INTERVAL_S = 1.0
+
+    def __init__(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._fh = None
+        self._t0 = time.perf_counter()
+        self._last_flush = self._t0
+        self._lock = threading.Lock()
+        self.open()
+
+    def open(self) -> None:
+        with self._lock:
+            if self._fh is None:
+                self._fh = open(self.path, "a", encoding="utf-8")
+
+    def record(self, payload: object) -> None:
+        now = time.perf_counter()
+        line = json.dumps({"t": round(now - self._t0, 6), "payload": payload}, separators=(",", ":"))
+        with self._lock:
+            if self._fh is not None:
+                self._fh.write(line + "\n")
+                if (now - self._last_flush) >= self._FLUSH_INTERVAL_S:
+                    self._fh.flush()
+                    self._last_flush = now
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+@dataclass
+class ReplayReport:
+    source: str
+    speed: float
+    frames_total: int = 0
+    frames_sent: int = 0
+    frames_delivered: int = 0
+    frames_dropped: int = 0
+    wall_s: float = 0.0
+    sustained_fps: float = 0.0
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    profile: Dict[str, object] = field(default_factory=dict)  # live_profiler snapshot (--profile)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    vals = sorted(values)
+
+    def _p(q: float) -> float:
+        return float(vals[min(len(vals) - 1, int(round(q * (len(vals) - 1))))])
+
+    return {
+        "mean": float(sum(vals) / len(vals)),
+        "p50": _p(0.50),
+        "p95": _p(0.95),
+        "p99": _p(0.99),
+        "max": float(vals[-1]),
+    }
+
+
+class LiveReplaySource(QtCore.QObject):
+    """
+    Drive `HardwareService` with a recorded session at N x real time.
+
+    Payloads are pushed from a background thread through `HardwareService._on_json`, exactly like
+    the socket thread does, so the frame store and every `frames_available` consumer see the same
+    traffic as a live run. A probe slot connected after the existing consumers reads how many
+    payloads they have drained from the store (`packets_taken`) and measures send -> handled
+    latency per frame.
+
+    speed: 1.0 = real time, 10.0 = 10x, <= 0 = as fast as possible.
+    In paced mode a frame whose send time is already more than `max_lag_ms` behind schedule is
+    dropped (the backend would have moved on too); undelivered frames at the end also count as dropped.
+    """
+
+    finished = QtCore.Signal(object)  # ReplayReport
+
+    def __init__(
+        self,
+        hardware: HardwareService,
+        frames: List[ReplayFrame],
+        *,
+        speed: float = 1.0,
+        max_lag_ms: float = 100.0,
+        drain_timeout_s: float = 5.0,
+        source: str = "",
+        parent: Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._hw = hardware
+        self._frames = list(frames)
+        self._speed = float(speed)
+        self._max_lag_s = max(0.0, float(max_lag_ms)) / 1000.0
+        self._drain_timeout_s = float(drain_timeout_s)
+        self._sent_at: deque[float] = deque()  # send times, in send order, not yet drained
+        self._taken_base = 0
+        self._delivered = 0
+        self._latencies_ms: List[float] = []
+        self._report = ReplayReport(source=str(source), speed=self._speed, frames_total=len(self._frames))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._t_start = 0.0
+        self._t_send_done: Optional[float] = None
+        self._drain_timer = QtCore.QTimer(self)
+        self._drain_timer.setInterval(20)
+        self._drain_timer.timeout.connect(self._check_drained)
+
+    @property
+    def report(self) -> ReplayReport:
+        return self._report
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._taken_base = self._hw.frame_store.packets_taken
+        self._hw.frames_available.connect(self._on_delivered)
+        self._t_start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="LiveReplayThread", daemon=True)
+        self._thread.start()
+        self._drain_timer.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        t0 = time.perf_counter()
+        first_t = self._frames[0].t_s if self._frames else 0.0
+        paced = self._speed > 0.0
+        for fr in self._frames:
+            if self._stop.is_set():
+                break
+            if paced:
+                due = t0 + (fr.t_s - first_t) / self._speed
+                now = time.perf_counter()
+                if due > now:
+                    time.sleep(due - now)
+                elif (now - due) > self._max_lag_s:
+                    self._report.frames_dropped += 1
+                    continue
+            payload = fr.payload
+            self._sent_at.append(time.perf_counter())
+            self._report.frames_sent += 1
+            if live_profiler.enabled:
+                live_profiler.mark_arrival(live_profiler.now())
+            try:
+                self._hw._on_json(payload)
+            except Exception:
+                pass
+        self._t_send_done = time.perf_counter()
+
+    @QtCore.Slot()
+    def _on_delivered(self) -> None:
+        try:
+            taken = self._hw.frame_store.packets_taken - self._taken_base
+            now = time.perf_counter()
+            while self._delivered < taken and self._sent_at:
+                sent = self._sent_at.popleft()
+                self._latencies_ms.append((now - sent) * 1000.0)
+                self._delivered += 1
+                self._report.frames_delivered += 1
+        except Exception:
+            pass
+
+    def _check_drained(self) -> None:
+        if self._t_send_done is None:
+            return
+        drained = not self._sent_at
+        timed_out = (time.perf_counter() - self._t_send_done) >= self._drain_timeout_s
+        if not (drained or timed_out):
+            return
+        self._drain_timer.stop()
+        try:
+            self._hw.frames_available.disconnect(self._on_delivered)
+        except Exception:
+            pass
+        rep = self._report
+        rep.frames_dropped += len(self._sent_at)
+        rep.wall_s = max(1e-9, time.perf_counter() - self._t_start)
+        rep.sustained_fps = float(rep.frames_delivered) / rep.wall_s
+        rep.latency_ms = _percentiles(self._latencies_ms)
+        self.finished.emit(rep)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Headless replay benchmark.
+
+        python -m src.app_services.live_replay capture.csv --speed 10 --device 07.00000051
+        python -m src.app_services.live_replay session.jsonl --speed 0 --pipeline page --json out.json
+        python -m src.app_services.live_replay session.jsonl --pipeline page --headless --profile
+    """
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Replay a recorded live session through the FluxLite pipeline.")
+    ap.add_argument("path", help="raw capture .csv or socket log .jsonl")
+    ap.add_argument("--speed", type=float, default=1.0, help="1 = real time, 10 = 10x, 0 = as fast as possible")
+    ap.add_argument("--device", default="", help="device id to stamp on CSV rows / select in the page")
+    ap.add_argument("--pipeline", choices=("core", "page"), default="core", help="core: service + frame parsing; page: full FluxLitePage")
+    ap.add_argument("--max-lag-ms", type=float, default=100.0)
+    ap.add_argument("--json", default="", help="write the report to this path")
+    ap.add_argument("--headless", action="store_true", help="use the offscreen Qt platform (no display/GPU needed)")
+    ap.add_argument("--profile", action="store_true", help="enable the live pipeline profiler and add its snapshot to the report")
+    args = ap.parse_args(argv)
+
+    if args.headless:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PySide6 import QtWidgets
+
+    from .. import config
+
+    if args.profile:
+        live_profiler.reset()
+        live_profiler.set_enabled(True)
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    frames = load_replay_frames(args.path, device_id=args.device or None)
+    if not frames:
+        print(f"[replay] no frames in {args.path}")
+        return 1
+
+    page = None
+    if args.pipeline == "page":
+        # Replay owns the data feed: never auto-connect to a real backend.
+        config.AUTO_CONNECT = False
+        from ..ui.fluxlite_page import FluxLitePage
+
+        page = FluxLitePage()
+        hardware = page.controller.hardware
+        did = args.device or str((frames[0].payload or {}).get("deviceId") or "")
+        page.state.display_mode = "single"
+        page.state.selected_device_id = did
+        page.resize(1280, 800)
+        page.show()
+    else:
+        hardware = HardwareService()
+        hardware.frames_available.connect(lambda: merge_batches(hardware.frame_store.take_dirty()))
+
+    replay = LiveReplaySource(hardware, frames, speed=args.speed, max_lag_ms=args.max_lag_ms, source=os.path.basename(args.path))
+    result: Dict[str, ReplayReport] = {}
+
+    def _done(rep: ReplayReport) -> None:
+        result["report"] = rep
+        app.quit()
+
+    replay.finished.connect(_done)
+    QtCore.QTimer.singleShot(0, replay.start)
+    app.exec()
+
+    rep = result.get("report")
+    if rep is None:
+        return 1
+    if args.profile:
+        rep.profile = live_profiler.snapshot()
+    print(json.dumps(rep.to_dict(), indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(rep.to_dict(), fh, indent=2)
+    if page is not None:
+        try:
+            page.shutdown()
+        except Exception:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,51 +1,106 @@
 from __future__ import annotations
 
-import csv
+import fnmatch
+import multiprocessing
 import os
-from typing import Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Optional
 
+from ... import config
+from ...infra.csv_downsample import DownsampleStats, downsample_csv, downsample_job
 
-class CsvTransformRepository:
-    def downsample_csv_to_50hz(self, source_csv: str, dest_csv: str) -> str:
-        os.makedirs(os.path.dirname(dest_csv), exist_ok=True)
-        with open(source_csv, "r", newline="", encoding="utf-8") as fin, open(dest_csv, "w", newline="", encoding="utf-8") as fout:
-            reader = csv.reader(fin)
-            writer = csv.writer(fout)
-            header = next(reader, None)
-            if not header:
-                raise ValueError("CSV header missing")
-            writer.writerow(header)
-
-            headers_map = {h.strip().lower(): i for i, h in enumerate(header)}
-            time_idx = -1
-            for k in ("time", "time_ms"):
-                if k in headers_map:
-                    time_idx = headers_map[k]
-                    break
-
-            if time_idx < 0:
-                raise ValueError("CSV missing required 'time' column")
-
-            last_t: Optional[float] = None
-            target_interval = 20.0  # 50Hz = 20ms
-
-            for row in reader:
-                if len(row) <= time_idx:
-                    continue
-                try:
-                    t_val = float(row[time_idx])
-                except Exception:
-                    continue
 
-                if last_t is None:
-                    writer.writerow(row)
-                    last_t = t_val
-                    continue
-
-                if (t_val - last_t) >= target_interval:
-                    writer.writerow(row)
-                    last_t = t_val
+class CsvTransformRepository:
+    def downsample_csv(
+        self,
+        source_csv: str,
+        dest_csv: str,
+        *,
+        rate_hz: float = 50.0,
+        strategy: Optional[str] = None,
+        key_column: Optional[str] = None,
+    ) -> str:
+        """
+        Downsample a capture to `rate_hz` (strategy defaults to config.CSV_DOWNSAMPLE_STRATEGY).
 
+        Written to a temp file and renamed into place, so `dest_csv` either does not exist or is
+        complete; callers that reuse an existing trimmed CSV never pick up a partial one.
+        """
+        tmp = f"{dest_csv}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            downsample_csv(
+                source_csv,
+                tmp,
+                rate_hz=float(rate_hz),
+                strategy=strategy or config.CSV_DOWNSAMPLE_STRATEGY,
+                key_column=key_column,
+                chunk_rows=int(config.CSV_DOWNSAMPLE_CHUNK_ROWS),
+            )
+            os.replace(tmp, dest_csv)
+        finally:
+            if os.path.exists(tmp):
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
         return dest_csv
 
+    def downsample_csv_to_50hz(self, source_csv: str, dest_csv: str) -> str:
+        return self.downsample_csv(source_csv, dest_csv, rate_hz=50.0)
+
+    def downsample_directory(
+        self,
+        source_dir: str,
+        dest_dir: str,
+        *,
+        rate_hz: float = 50.0,
+        strategy: Optional[str] = None,
+        key_column: Optional[str] = None,
+        pattern: str = "*.csv",
+        workers: Optional[int] = None,
+    ) -> List[DownsampleStats]:
+        """
+        Downsample every CSV in `source_dir` matching `pattern` into `dest_dir` (same file names).
 
+        Files are converted in a process pool (config.CSV_DOWNSAMPLE_WORKERS); a file that
+        fails is logged and skipped. Returns stats for the converted files, in name order.
+        """
+        names = sorted(n for n in os.listdir(source_dir) if fnmatch.fnmatch(n, pattern) and os.path.isfile(os.path.join(source_dir, n)))
+        os.makedirs(dest_dir, exist_ok=True)
+        jobs = [
+            (
+                os.path.join(source_dir, n),
+                os.path.join(dest_dir, n),
+                float(rate_hz),
+                strategy or config.CSV_DOWNSAMPLE_STRATEGY,
+                key_column,
+                int(config.CSV_DOWNSAMPLE_CHUNK_ROWS),
+            )
+            for n in names
+        ]
+        n_workers = int(config.CSV_DOWNSAMPLE_WORKERS if workers is None else workers)
+        results: List[DownsampleStats] = []
+        pool = None
+        if n_workers > 0 and len(jobs) > 1:
+            try:
+                pool = ProcessPoolExecutor(max_workers=min(n_workers, len(jobs)), mp_context=multiprocessing.get_context("spawn"))
+            except Exception as exc:
+                print(f"[csv] process pool unavailable, downsampling in-thread: {exc}")
+                pool = None
+        if pool is None:
+            for job in jobs:
+                try:
+                    results.append(downsample_job(job))
+                except Exception as exc:
+                    print(f"[csv] downsample failed for {job[0]}: {exc}")
+        else:
+            with pool:
+                futures = {pool.submit(downsample_job, job): job for job in jobs}
+                for fut in as_completed(futures):
+                    try:
+                        results.append(fut.result())
+                    except Exception as exc:
+                        print(f"[csv] downsample failed for {futures[fut][0]}: {exc}")
+        results.sort(key=lambda s: s.source)
+        return results
@@ -0,0 +1,326 @@
+"""
+Persistent index of the temp_testing tree, stored in meta_store's SQLite DB.
+
+Listing calls used to `listdir` every device folder and parse every meta JSON each time a
+panel refreshed or a rollup ran. The index keeps:
+
+  temp_index_dirs   directory -> change stamp at the last scan
+  temp_devices      device folders under a temp_testing root
+  temp_tests        raw test CSVs per device folder
+  temp_processed    candidate processed-output CSVs per folder (listing order kept)
+  temp_test_meta    *.meta.json text keyed by path + stamp/size, with the extracted temperature
+
+Files and directories are compared by their change stamp, max(st_mtime_ns, st_ctime_ns):
+sync and copy tools restore the original mtime after rewriting a file, but they cannot
+restore ctime. A directory is rescanned only when its stamp differs from the recorded one
+(creating, deleting or renaming an entry bumps it), so a listing costs one `stat`. Meta
+files are rewritten in place, which does not touch the folder, so each meta row is
+validated with a `stat` of its own file (stamp and size) before use. Anything changed
+within `_RACY_NS` of being indexed is not trusted (coarse filesystem timestamps could hide
+a second write in the same tick) and is read again next time.
+
+Validated rows are also held in memory, so SQLite is only touched when something changed
+on disk or the process starts cold. Every method returns None when the index cannot be
+used; callers then crawl the disk as before.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ... import config, meta_store
+
+_RACY_NS = 2_000_000_000
+AVG_PRESENT = "avg"  # avg_checked marker: meta already carries avg_temp
+
+
+def _is_test_csv(name: str) -> bool:
+    lower = name.lower()
+    return lower.endswith(".csv") and lower.startswith("temp-raw-")
+
+
+def _is_output_csv(name: str) -> bool:
+    lower = name.lower()
+    return lower.endswith(".csv") and not (lower.startswith("temp-raw-") or lower.startswith("temp-trimmed-"))
+
+
+def _stamp(st: os.stat_result) -> int:
+    """Change stamp of a file or directory (stored in the index's mtime_ns columns)."""
+    return max(int(st.st_mtime_ns), int(st.st_ctime_ns))
+
+
+def _trusted(stamp_ns: int, recorded_at_ns: int) -> bool:
+    return recorded_at_ns - stamp_ns >= _RACY_NS
+
+
+def file_signature(path: str) -> Optional[str]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{_stamp(st)}:{int(st.st_size)}"
+
+
+@dataclass
+class MetaEntry:
+    meta_path: str
+    meta_json: Optional[str]  # file text when it parses as JSON, else None
+    temp_f: Optional[float]
+    avg_checked: Optional[str]  # AVG_PRESENT, or the raw CSV signature an estimate was last attempted for
+
+    def meta(self) -> Optional[dict]:
+        """The meta dict (fresh copy), or None when the file is not a JSON object."""
+        if self.meta_json is None:
+            return None
+        try:
+            data = json.loads(self.meta_json)
+        except Exception:
+            return None
+        return data if isinstance(data, dict) else None
+
+
+@dataclass
+class _Folder:
+    mtime_ns: int
+    scanned_at_ns: int
+    tests: List[str]
+    outputs: List[str]
+
+    def outputs_for(self, base_without_prefix: str) -> List[str]:
+        """Outputs whose name contains the raw test's base name, in listing order (same match as the crawl)."""
+        return [name for name in self.outputs if base_without_prefix in name]
+
+
+class TemperatureTestIndex:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ready: Optional[bool] = None
+        self._devices: Dict[str, Tuple[int, int, List[str]]] = {}
+        self._folders: Dict[str, _Folder] = {}
+        self._meta: Dict[str, Tuple[int, int, int, MetaEntry]] = {}
+
+    def _available(self) -> bool:
+        with self._lock:
+            if self._ready is None:
+                try:
+                    meta_store.init_db()
+                    self._ready = True
+                except Exception as exc:
+                    print(f"[temp_index] index unavailable, crawling instead: {exc}")
+                    self._ready = False
+            return self._ready
+
+    def _fallback(self, exc: Exception) -> None:
+        print(f"[temp_index] index error, crawling instead: {exc}")
+
+    # --- directories ---
+
+    def _stored_dir_is_current(self, dir_path: str, mtime_ns: int) -> Optional[int]:
+        """scanned_at_ns of the stored listing if it is still valid for this stamp, else None."""
+        rec = meta_store.get_temp_index_dir(dir_path)
+        if rec is None or rec[0] != mtime_ns or not _trusted(rec[0], rec[1]):
+            return None
+        return rec[1]
+
+    def _folder(self, folder: str) -> _Folder:
+        mtime_ns = _stamp(os.stat(folder))
+        with self._lock:
+            hit = self._folders.get(folder)
+        if hit is not None and hit.mtime_ns == mtime_ns and _trusted(hit.mtime_ns, hit.scanned_at_ns):
+            return hit
+        scanned_at_ns = self._stored_dir_is_current(folder, mtime_ns)
+        if scanned_at_ns is not None:
+            entry = _Folder(
+                mtime_ns,
+                scanned_at_ns,
+                meta_store.list_temp_index_tests(folder),
+                meta_store.list_temp_index_processed(folder),
+            )
+        else:
+            scanned_at_ns = time.time_ns()
+            names = os.listdir(folder)
+            entry = _Folder(
+                mtime_ns,
+                scanned_at_ns,
+                sorted(n for n in names if _is_test_csv(n)),
+                [n for n in names if _is_output_csv(n)],
+            )
+            meta_store.replace_temp_index_folder(
+                folder,
+                mtime_ns,
+                scanned_at_ns,
+                tests=entry.tests,
+                processed=entry.outputs,
+                meta_names=[n for n in names if n.endswith(".meta.json")],
+            )
+        with self._lock:
+            self._folders[folder] = entry
+        return entry
+
+    def devices(self, base_dir: str) -> Optional[List[str]]:
+        """Sorted device folder names under a temp_testing root."""
+        if not self._available():
+            return None
+        try:
+            mtime_ns = _stamp(os.stat(base_dir))
+            with self._lock:
+                hit = self._devices.get(base_dir)
+            if hit is not None and hit[0] == mtime_ns and _trusted(hit[0], hit[1]):
+                return list(hit[2])
+            scanned_at_ns = self._stored_dir_is_current(base_dir, mtime_ns)
+            if scanned_at_ns is not None:
+                found = meta_store.list_temp_index_devices(base_dir)
+            else:
+                scanned_at_ns = time.time_ns()
+                found = sorted(d for d in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, d)))
+                meta_store.replace_temp_index_devices(base_dir, mtime_ns, scanned_at_ns, found)
+            with self._lock:
+                self._devices[base_dir] = (mtime_ns, scanned_at_ns, found)
+            return list(found)
+        except Exception as exc:
+            self._fallback(exc)
+            return None
+
+    def tests(self, device_dir: str) -> Optional[List[str]]:
+        """Sorted raw test CSV paths in a device folder."""
+        if not self._available():
+            return None
+        try:
+            return [os.path.join(device_dir, n) for n in self._folder(device_dir).tests]
+        except Exception as exc:
+            self._fallback(exc)
+            return None
+
+    def output_names(self, folder: str, base_without_prefix: str) -> Optional[List[str]]:
+        """Processed-output CSV names in `folder` for one raw test, in listing order."""
+        if not self._available():
+            return None
+        try:
+            return self._folder(folder).outputs_for(base_without_prefix)
+        except Exception as exc:
+            self._fallback(exc)
+            return None
+
+    # --- meta ---
+
+    def meta_entries(
+        self,
+        meta_paths: List[str],
+        *,
+        temp_fn: Callable[[Dict[str, object]], Optional[float]],
+    ) -> Optional[Dict[str, MetaEntry]]:
+        """
+        Current meta for each path that exists (missing files are left out).
+
+        Rows are reused while the file's stamp/size still match; otherwise the file is read
+        again and its row replaced. `temp_fn` extracts the indexed temperature from a meta dict.
+        """
+        if not self._available():
+            return None
+        try:
+            out: Dict[str, MetaEntry] = {}
+            stale: Dict[str, List[Tuple[str, int, int]]] = {}
+            gone: List[str] = []
+            for p in meta_paths:
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    with self._lock:
+                        if self._meta.pop(p, None) is not None:
+                            gone.append(p)
+                    continue
+                mtime_ns, size = _stamp(st), int(st.st_size)
+                with self._lock:
+                    hit = self._meta.get(p)
+                if hit is not None and hit[0] == mtime_ns and hit[1] == size and _trusted(mtime_ns, hit[2]):
+                    out[p] = hit[3]
+                else:
+                    stale.setdefault(os.path.dirname(p), []).append((p, mtime_ns, size))
+
+            for folder, items in stale.items():
+                rows = meta_store.get_temp_test_meta_rows(folder)
+                updates: List[dict] = []
+                for p, mtime_ns, size in items:
+                    row = rows.get(p)
+                    if row is not None and row["mtime_ns"] == mtime_ns and row["size"] == size and _trusted(mtime_ns, row["indexed_at_ns"]):
+                        entry = MetaEntry(p, row["meta_json"], row["temp_f"], row["avg_checked"])
+                        indexed_at_ns = int(row["indexed_at_ns"])
+                    else:
+                        indexed_at_ns = time.time_ns()
+                        entry = self._read_meta(p, temp_fn=temp_fn, previous=row)
+                        updates.append(
+                            {
+                                "meta_path": p,
+                                "folder": folder,
+                                "mtime_ns": mtime_ns,
+                                "size": size,
+                                "indexed_at_ns": indexed_at_ns,
+                                "meta_json": entry.meta_json,
+                                "temp_f": entry.temp_f,
+                                "avg_checked": entry.avg_checked,
+                            }
+                        )
+                    out[p] = entry
+                    with self._lock:
+                        self._meta[p] = (mtime_ns, size, indexed_at_ns, entry)
+                meta_store.upsert_temp_test_meta(updates)
+            meta_store.delete_temp_test_meta(gone)
+            return out
+        except Exception as exc:
+            self._fallback(exc)
+            return None
+
+    def _read_meta(self, meta_path: str, *, temp_fn, previous: Optional[dict]) -> MetaEntry:
+        text: Optional[str] = None
+        data = None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as mf:
+                text = mf.read()
+            data = json.loads(text)
+        except Exception:
+            text = None
+        temp_f = None
+        avg_checked = None
+        if isinstance(data, dict):
+            try:
+                temp_f = temp_fn(data)
+            except Exception:
+                temp_f = None
+            if data.get("avg_temp") is not None:
+                avg_checked = AVG_PRESENT
+        if avg_checked is None and previous is not None and previous.get("avg_checked") != AVG_PRESENT:
+            avg_checked = previous.get("avg_checked")
+        return MetaEntry(meta_path, text, temp_f, avg_checked)
+
+    def mark_avg_checked(self, meta_path: str, csv_signature: str) -> None:
+        """Remember that an avg_temp estimate was attempted for this raw CSV version (and failed)."""
+        if not self._available():
+            return
+        with self._lock:
+            hit = self._meta.get(meta_path)
+            if hit is not None:
+                hit[3].avg_checked = csv_signature
+        try:
+            meta_store.set_temp_test_meta_avg_checked(meta_path, csv_signature)
+        except Exception as exc:
+            self._fallback(exc)
+
+
+_shared: Optional[TemperatureTestIndex] = None
+_shared_lock = threading.Lock()
+
+
+def shared_index() -> Optional[TemperatureTestIndex]:
+    """Process-wide index (None when TEMP_TEST_INDEX_ENABLED is off)."""
+    global _shared
+    if not bool(getattr(config, "TEMP_TEST_INDEX_ENABLED", True)):
+        return None
+    with _shared_lock:
+        if _shared is None:
+            _shared = TemperatureTestIndex()
+        return _shared
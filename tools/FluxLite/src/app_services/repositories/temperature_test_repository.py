@@ -4,10 +4,43 @@ import csv
 import json
 import os
 import random
+import threading
 import time
 from typing import Dict, List, Optional, Tuple, Any
 
 from ...project_paths import data_dir
+from .temperature_test_index import AVG_PRESENT, file_signature, shared_index
+
+# Meta files are read-modify-written from several threads at once (batch rollups process many
+# coef sets of one test concurrently); one lock per meta path keeps those updates from losing
+# each other's processed_variants.
+_meta_locks: Dict[str, threading.Lock] = {}
+_meta_locks_guard = threading.Lock()
+
+
+def _meta_lock(meta_path: str) -> threading.Lock:
+    key = os.path.normcase(os.path.abspath(meta_path))
+    with _meta_locks_guard:
+        lock = _meta_locks.get(key)
+        if lock is None:
+            lock = _meta_locks[key] = threading.Lock()
+        return lock
+
+
+def _write_meta(meta_path: str, meta: dict) -> None:
+    """Write via tmp + rename so concurrent readers never see a half-written meta."""
+    os.makedirs(os.path.dirname(meta_path) or ".", exist_ok=True)
+    tmp = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as mf:
+            json.dump(meta, mf, indent=2, sort_keys=True)
+        os.replace(tmp, meta_path)
+    finally:
+        if os.path.exists(tmp):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
 
 
 class TemperatureTestRepository:
@@ -22,21 +55,26 @@ class TemperatureTestRepository:
         if not os.path.isdir(device_dir):
             return []
 
-        files = []
-        try:
-            for f in os.listdir(device_dir):
-                lower = f.lower()
-                if not lower.endswith(".csv"):
-                    continue
-                if not lower.startswith("temp-raw-"):
-                    continue
-                files.append(os.path.join(device_dir, f))
-        except Exception:
-            pass
+        index = shared_index()
+        files = index.tests(device_dir) if index is not None else None
+        if files is None:
+            files = []
+            try:
+                for f in os.listdir(device_dir):
+                    lower = f.lower()
+                    if not lower.endswith(".csv"):
+                        continue
+                    if not lower.startswith("temp-raw-"):
+                        continue
+                    files.append(os.path.join(device_dir, f))
+            except Exception:
+                pass
+            files = sorted(files)
+            for path in files:
+                self._ensure_meta_avg_temperature(path)
+            return files
 
-        files = sorted(files)
-        for path in files:
-            self._ensure_meta_avg_temperature(path)
+        self._ensure_indexed_avg_temperatures(files)
         return files
 
     def list_temperature_room_baseline_tests(
@@ -53,7 +91,27 @@ class TemperatureTestRepository:
           { "csv_path": str, "meta_path": str, "temp_f": float | None, "meta": dict }
         """
         out: List[Dict[str, object]] = []
-        for csv_path in self.list_temperature_tests(device_id):
+        tests = self.list_temperature_tests(device_id)
+        entries = self._indexed_meta([self._meta_path_for_csv(p) for p in tests])
+        if entries is not None:
+            # Filter on the indexed temperature; only matching tests have their meta decoded.
+            for csv_path in tests:
+                meta_path = self._meta_path_for_csv(csv_path)
+                entry = entries.get(meta_path)
+                if entry is None or entry.temp_f is None:
+                    continue
+                if float(min_temp_f) <= float(entry.temp_f) <= float(max_temp_f):
+                    out.append(
+                        {
+                            "csv_path": csv_path,
+                            "meta_path": meta_path,
+                            "temp_f": float(entry.temp_f),
+                            "meta": dict(entry.meta() or {}),
+                        }
+                    )
+            return out
+
+        for csv_path in tests:
             meta = self.load_meta_for_csv(csv_path) or {}
             temp_f = self.extract_temperature_f(meta)
             if temp_f is None:
@@ -71,6 +129,10 @@ class TemperatureTestRepository:
 
     def load_meta_for_csv(self, csv_path: str) -> Optional[Dict[str, object]]:
         meta_path = self._meta_path_for_csv(csv_path)
+        entries = self._indexed_meta([meta_path])
+        if entries is not None:
+            entry = entries.get(meta_path)
+            return entry.meta() if entry is not None else None
         if not os.path.isfile(meta_path):
             return None
         try:
@@ -128,6 +190,11 @@ class TemperatureTestRepository:
         if not os.path.isdir(base_dir):
             return []
 
+        index = shared_index()
+        indexed = index.devices(base_dir) if index is not None else None
+        if indexed is not None:
+            return indexed
+
         devices = []
         try:
             for d in os.listdir(base_dir):
@@ -140,7 +207,11 @@ class TemperatureTestRepository:
     def get_temperature_test_details(self, csv_path: str) -> Dict[str, object]:
         meta_path = self._meta_path_for_csv(csv_path)
         meta: Dict[str, object] = {}
-        if os.path.isfile(meta_path):
+        entries = self._indexed_meta([meta_path])
+        if entries is not None:
+            entry = entries.get(meta_path)
+            meta = (entry.meta() if entry is not None else None) or {}
+        elif os.path.isfile(meta_path):
             try:
                 with open(meta_path, "r", encoding="utf-8") as mf:
                     meta = json.load(mf) or {}
@@ -284,6 +355,18 @@ class TemperatureTestRepository:
         processed_on: str,
         slopes: dict,
         mode: str = "legacy",
+    ) -> None:
+        with _meta_lock(meta_path):
+            self._update_meta_with_processed_locked(meta_path, trimmed_csv, processed_off, processed_on, slopes, mode)
+
+    def _update_meta_with_processed_locked(
+        self,
+        meta_path: str,
+        trimmed_csv: str,
+        processed_off: str,
+        processed_on: str,
+        slopes: dict,
+        mode: str,
     ) -> None:
         meta: Dict[str, object] = {}
         if os.path.isfile(meta_path):
@@ -336,9 +419,7 @@ class TemperatureTestRepository:
         )
         meta["processed"] = legacy
 
-        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
-        with open(meta_path, "w", encoding="utf-8") as mf:
-            json.dump(meta, mf, indent=2, sort_keys=True)
+        _write_meta(meta_path, meta)
 
     def update_meta_with_baseline_only(
         self,
@@ -352,24 +433,23 @@ class TemperatureTestRepository:
         This is used by bias-controlled grading baseline generation, where we don't want to
         create a 'temp correction on' variant.
         """
-        meta: Dict[str, object] = {}
-        if os.path.isfile(meta_path):
-            try:
-                with open(meta_path, "r", encoding="utf-8") as mf:
-                    meta = json.load(mf) or {}
-            except Exception:
-                meta = {}
-
-        now_ms = int(time.time() * 1000)
-        meta["processed_baseline"] = {
-            "trimmed_csv": os.path.basename(str(trimmed_csv)),
-            "processed_off": os.path.basename(str(processed_off)),
-            "updated_at_ms": now_ms,
-        }
+        with _meta_lock(meta_path):
+            meta: Dict[str, object] = {}
+            if os.path.isfile(meta_path):
+                try:
+                    with open(meta_path, "r", encoding="utf-8") as mf:
+                        meta = json.load(mf) or {}
+                except Exception:
+                    meta = {}
+
+            now_ms = int(time.time() * 1000)
+            meta["processed_baseline"] = {
+                "trimmed_csv": os.path.basename(str(trimmed_csv)),
+                "processed_off": os.path.basename(str(processed_off)),
+                "updated_at_ms": now_ms,
+            }
 
-        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
-        with open(meta_path, "w", encoding="utf-8") as mf:
-            json.dump(meta, mf, indent=2, sort_keys=True)
+            _write_meta(meta_path, meta)
 
     def format_slopes_label(self, slopes: dict, mode: str = "legacy") -> str:
         """
@@ -432,28 +512,59 @@ class TemperatureTestRepository:
             name = f"temp-raw-{name.split('-', 1)[-1]}"
         return os.path.join(folder, f"{name}.meta.json")
 
-    def _ensure_meta_avg_temperature(self, csv_path: str) -> None:
+    def _indexed_meta(self, meta_paths: List[str]):
+        """Index entries for these meta paths (missing files left out), or None to read the disk."""
+        index = shared_index()
+        if index is None:
+            return None
+        return index.meta_entries(meta_paths, temp_fn=self.extract_temperature_f)
+
+    def _ensure_indexed_avg_temperatures(self, csv_paths: List[str]) -> None:
+        """
+        Index-backed `_ensure_meta_avg_temperature` for a listing: only metas without
+        avg_temp are opened, and a failed estimate is not retried until the raw CSV changes.
+        """
+        index = shared_index()
+        entries = self._indexed_meta([self._meta_path_for_csv(p) for p in csv_paths])
+        if index is None or entries is None:
+            for path in csv_paths:
+                self._ensure_meta_avg_temperature(path)
+            return
+        for csv_path in csv_paths:
+            meta_path = self._meta_path_for_csv(csv_path)
+            entry = entries.get(meta_path)
+            if entry is None or entry.meta_json is None or entry.avg_checked == AVG_PRESENT:
+                continue
+            signature = file_signature(csv_path)
+            if signature is not None and entry.avg_checked == signature:
+                continue
+            if not self._ensure_meta_avg_temperature(csv_path) and signature is not None:
+                index.mark_avg_checked(meta_path, signature)
+
+    def _ensure_meta_avg_temperature(self, csv_path: str) -> bool:
+        """Fill in meta["avg_temp"] from the raw CSV if missing. True if the meta was rewritten."""
         meta_path = self._meta_path_for_csv(csv_path)
         if not os.path.isfile(meta_path):
-            return
-        try:
-            with open(meta_path, "r", encoding="utf-8") as mf:
-                meta = json.load(mf) or {}
-        except Exception:
-            return
-        if not isinstance(meta, dict):
-            meta = {}
-        if meta.get("avg_temp") is not None:
-            return
-        avg_temp = self._estimate_avg_temperature_from_csv(csv_path)
-        if avg_temp is None:
-            return
-        meta["avg_temp"] = float(avg_temp)
-        try:
-            with open(meta_path, "w", encoding="utf-8") as mf:
-                json.dump(meta, mf, indent=2, sort_keys=True)
-        except Exception:
-            pass
+            return False
+        with _meta_lock(meta_path):
+            try:
+                with open(meta_path, "r", encoding="utf-8") as mf:
+                    meta = json.load(mf) or {}
+            except Exception:
+                return False
+            if not isinstance(meta, dict):
+                meta = {}
+            if meta.get("avg_temp") is not None:
+                return False
+            avg_temp = self._estimate_avg_temperature_from_csv(csv_path)
+            if avg_temp is None:
+                return False
+            meta["avg_temp"] = float(avg_temp)
+            try:
+                _write_meta(meta_path, meta)
+            except Exception:
+                return False
+        return True
 
     def _estimate_avg_temperature_from_csv(self, csv_path: str, sample_size: int = 100) -> Optional[float]:
         if not os.path.isfile(csv_path):
@@ -510,10 +621,13 @@ class TemperatureTestRepository:
             return runs
         known_paths = {str(run.get("path") or "") for run in runs}
         baseline_present = any(run.get("is_baseline") for run in runs)
-        try:
-            files = os.listdir(folder)
-        except Exception:
-            return runs
+        index = shared_index()
+        files = index.output_names(folder, base_without_prefix) if index is not None else None
+        if files is None:
+            try:
+                files = os.listdir(folder)
+            except Exception:
+                return runs
         suffix = f"-{base_without_prefix}"
         for fname in files:
             lower = fname.lower()
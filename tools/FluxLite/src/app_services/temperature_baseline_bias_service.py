@@ -1,15 +1,67 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from .. import config
 from .analysis.temperature_analyzer import TemperatureAnalyzer
 from .repositories.test_file_repository import TestFileRepository
 from .temperature_processing_service import TemperatureProcessingService
 
 
+_SPREAD_PERCENTILES = (50.0, 10.0, 90.0)
+
+
+def _pct_map(cells: List[dict], target: float) -> Dict[Tuple[int, int], float]:
+    """Fractional deviation from target per (row, col); a later duplicate cell wins."""
+    out: Dict[Tuple[int, int], float] = {}
+    for cell in cells:
+        try:
+            rr = int(cell.get("row", 0))
+            cc = int(cell.get("col", 0))
+            mean_n = float(cell.get("mean_n", 0.0))
+        except Exception:
+            continue
+        if target <= 0:
+            continue
+        out[(rr, cc)] = (mean_n - target) / target
+    return out
+
+
+def _bias_stack(per_baseline: List[Dict[Tuple[int, int], float]], rows: int, cols: int) -> np.ndarray:
+    """
+    [baseline, row, col] bias for one stage. Cells a baseline did not measure get that
+    baseline's stage average; out-of-grid cells count toward the average but are not placed.
+    """
+    n = len(per_baseline)
+    avgs = np.asarray([sum(p.values()) / float(len(p)) if p else 0.0 for p in per_baseline], dtype=np.float64)
+    stack = np.repeat(avgs, rows * cols).reshape(n, rows, cols)
+    b_idx: List[int] = []
+    cells: List[Tuple[int, int]] = []
+    vals: List[float] = []
+    for b, pcts in enumerate(per_baseline):
+        b_idx.extend([b] * len(pcts))
+        cells.extend(pcts.keys())
+        vals.extend(pcts.values())
+    if vals:
+        bi = np.asarray(b_idx, dtype=np.int64)
+        rc = np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+        v = np.asarray(vals, dtype=np.float64)
+        ok = (rc[:, 0] >= 0) & (rc[:, 0] < rows) & (rc[:, 1] >= 0) & (rc[:, 1] < cols)
+        stack[bi[ok], rc[ok, 0], rc[ok, 1]] = v[ok]
+    return stack
+
+
+def _spread(stack: np.ndarray) -> Dict[str, List[List[float]]]:
+    median, p10, p90 = np.percentile(stack, _SPREAD_PERCENTILES, axis=0)
+    return {"median": median.tolist(), "p10": p10.tolist(), "p90": p90.tolist()}
+
+
 class TemperatureBaselineBiasService:
     """
     Computes per-device, per-cell baseline bias from room-temperature tests.
@@ -69,18 +121,6 @@ class TemperatureBaselineBiasService:
 
         emit({"status": "running", "message": f"Computing bias from {len(baselines)} room-temp baseline(s)...", "progress": 5})
 
-        # Collect per-baseline per-cell bias matrices.
-        # Each is [baseline][row][col] of fractional bias (e.g. 0.10 = +10%).
-        per_baseline_bias_all: List[List[List[float]]] = []
-        per_baseline_bias_db: List[List[List[float]]] = []
-        per_baseline_bias_bw: List[List[List[float]]] = []
-        baseline_summaries: List[Dict[str, object]] = []
-        errors: List[str] = []
-
-        rows: Optional[int] = None
-        cols: Optional[int] = None
-        device_type: Optional[str] = None
-
         db_truth = float(
             getattr(
                 config,
@@ -89,174 +129,95 @@ class TemperatureBaselineBiasService:
             )
         )
 
-        for idx, entry in enumerate(baselines):
-            raw_csv = str(entry.get("csv_path") or "")
-            meta = dict(entry.get("meta") or {})
-            temp_f = entry.get("temp_f")
-            temp_label = f"{float(temp_f):.1f}°F" if temp_f is not None else "—°F"
+        # Processing + analysis per baseline run concurrently; results are folded in baseline
+        # order below so errors, grid checks and summaries match a serial pass.
+        workers = max(1, min(int(getattr(config, "TEMP_BIAS_WORKERS", 4)), len(baselines)))
+        done = 0
+        done_lock = threading.Lock()
 
-            if not raw_csv or not os.path.isfile(raw_csv):
-                errors.append(f"Baseline missing CSV: {raw_csv}")
-                continue
-
-            # Process OFF for this baseline (only if missing).
-            folder = os.path.dirname(raw_csv)
-            room_temp_f = float(temp_f) if temp_f is not None else float(meta.get("room_temperature_f") or 72.0)
-            emit(
-                {
-                    "status": "running",
-                    "message": f"Baseline {idx+1}/{len(baselines)}: ensuring temp-off processed ({temp_label})...",
-                    "progress": 10 + int(30 * (idx / max(1, len(baselines)))),
-                }
-            )
+        def analyze(idx: int, entry: dict) -> Dict[str, object]:
+            nonlocal done
             try:
-                processed_off = self._processing.ensure_temp_off_processed(
-                    folder=folder,
-                    device_id=dev,
-                    csv_path=raw_csv,
-                    room_temp_f=room_temp_f,
-                    status_cb=status_cb,
+                return self._analyze_baseline(dev, entry, db_truth=db_truth, status_cb=status_cb)
+            finally:
+                with done_lock:
+                    done += 1
+                    n_done = done
+                emit(
+                    {
+                        "status": "running",
+                        "message": f"Baseline {n_done}/{len(baselines)} analyzed",
+                        "progress": 10 + int(70 * (n_done / max(1, len(baselines)))),
+                    }
                 )
-            except Exception as exc:
-                errors.append(f"Baseline {temp_label}: failed to process temp-off for {os.path.basename(raw_csv)}: {exc}")
-                continue
 
-            # Analyze processed-off.
-            try:
-                analysis = self._analyzer.analyze_single_processed_csv(processed_off, meta)
-            except Exception as exc:
-                errors.append(f"Baseline {temp_label}: failed to analyze {os.path.basename(processed_off)}: {exc}")
-                continue
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bias") as pool:
+                results = list(pool.map(analyze, range(len(baselines)), baselines))
+        else:
+            results = [analyze(i, e) for i, e in enumerate(baselines)]
 
-            grid = dict(analysis.get("grid") or {})
-            data = dict(analysis.get("data") or {})
-            stage_map = dict((data.get("stages") or {}))
+        # Per-baseline per-cell bias, stacked as [baseline, row, col] of fractional bias
+        # (e.g. 0.10 = +10%).
+        per_baseline_db: List[Dict[Tuple[int, int], float]] = []
+        per_baseline_bw: List[Dict[Tuple[int, int], float]] = []
+        baseline_summaries: List[Dict[str, object]] = []
+        errors: List[str] = []
 
-            r = int(grid.get("rows") or 0)
-            c = int(grid.get("cols") or 0)
-            dt = str(grid.get("device_type") or "")
-            if r <= 0 or c <= 0:
-                errors.append(f"Baseline {temp_label}: invalid grid dimensions for {os.path.basename(raw_csv)}")
-                continue
+        rows: Optional[int] = None
+        cols: Optional[int] = None
+        device_type: Optional[str] = None
 
-            if rows is None:
-                rows, cols, device_type = r, c, dt
-            else:
-                if rows != r or cols != c:
-                    errors.append(
-                        f"Baseline {temp_label}: grid mismatch (expected {rows}x{cols}, got {r}x{c}) for {os.path.basename(raw_csv)}"
-                    )
-                    continue
-
-            db_stage = dict(stage_map.get("db") or {})
-            bw_stage = dict(stage_map.get("bw") or {})
-            db_cells = list(db_stage.get("cells") or [])
-            bw_cells = list(bw_stage.get("cells") or [])
-
-            # Rule: if ANY baseline has zero detected windows for a stage, bias mode is invalid.
-            if len(db_cells) == 0 or len(bw_cells) == 0:
-                errors.append(
-                    f"Baseline {temp_label} ({os.path.basename(raw_csv)}): missing stage windows "
-                    f"(45lb cells={len(db_cells)}, bodyweight cells={len(bw_cells)})"
-                )
+        for res in results:
+            if res.get("error"):
+                errors.append(str(res["error"]))
                 continue
-
-            # Per-stage target truths used to compute baseline-stage pct.
-            db_target = float(db_stage.get("target_n") or db_truth)
-            bw_target = float(bw_stage.get("target_n") or 0.0)
-            if db_target <= 0.0 or bw_target <= 0.0:
+            r, c = int(res["rows"]), int(res["cols"])
+            if rows is None:
+                rows, cols, device_type = r, c, str(res["device_type"])
+            elif rows != r or cols != c:
                 errors.append(
-                    f"Baseline {temp_label} ({os.path.basename(raw_csv)}): invalid targets "
-                    f"(db_target={db_target:.1f}, bw_target={bw_target:.1f})"
+                    f"Baseline {res['temp_label']}: grid mismatch (expected {rows}x{cols}, got {r}x{c}) for {res['csv_name']}"
                 )
                 continue
-
-            def _pct_map(cells: List[dict], target: float) -> Dict[Tuple[int, int], float]:
-                out: Dict[Tuple[int, int], float] = {}
-                for cell in cells:
-                    try:
-                        rr = int(cell.get("row", 0))
-                        cc = int(cell.get("col", 0))
-                        mean_n = float(cell.get("mean_n", 0.0))
-                    except Exception:
-                        continue
-                    if target <= 0:
-                        continue
-                    out[(rr, cc)] = (mean_n - target) / target
-                return out
-
-            db_pcts = _pct_map(db_cells, db_target)
-            bw_pcts = _pct_map(bw_cells, bw_target)
-
-            # Stage averages across all cells that do have the stage.
-            avg_db = sum(db_pcts.values()) / float(len(db_pcts)) if db_pcts else 0.0
-            avg_bw = sum(bw_pcts.values()) / float(len(bw_pcts)) if bw_pcts else 0.0
-
-            # Per-cell pct for this baseline (fill missing stage with stage average).
-            baseline_db_bias: List[List[float]] = []
-            baseline_bw_bias: List[List[float]] = []
-            baseline_all_bias: List[List[float]] = []
-            for rr in range(r):
-                row_db: List[float] = []
-                row_bw: List[float] = []
-                row_all: List[float] = []
-                for cc in range(c):
-                    pct45 = float(db_pcts.get((rr, cc), avg_db))
-                    pctbw = float(bw_pcts.get((rr, cc), avg_bw))
-                    row_db.append(pct45)
-                    row_bw.append(pctbw)
-                    row_all.append(0.5 * pct45 + 0.5 * pctbw)
-                baseline_db_bias.append(row_db)
-                baseline_bw_bias.append(row_bw)
-                baseline_all_bias.append(row_all)
-
-            per_baseline_bias_db.append(baseline_db_bias)
-            per_baseline_bias_bw.append(baseline_bw_bias)
-            per_baseline_bias_all.append(baseline_all_bias)
-            baseline_summaries.append(
-                {
-                    "csv": os.path.basename(raw_csv),
-                    "temp_f": float(temp_f) if temp_f is not None else None,
-                    "processed_off": os.path.basename(processed_off),
-                    "db_target_n": db_target,
-                    "bw_target_n": bw_target,
-                    "db_cells_measured": len(db_pcts),
-                    "bw_cells_measured": len(bw_pcts),
-                }
-            )
+            per_baseline_db.append(res["db_pcts"])
+            per_baseline_bw.append(res["bw_pcts"])
+            baseline_summaries.append(dict(res["summary"]))
 
         if errors:
             msg = "Bias-controlled grading disabled: one or more room-temp baseline files are not usable."
             return {"ok": False, "message": msg, "cache_path": None, "payload": None, "errors": errors}
 
-        if rows is None or cols is None or device_type is None or not per_baseline_bias_all:
+        if rows is None or cols is None or device_type is None or not per_baseline_db:
             msg = "Bias-controlled grading disabled: no usable room-temp baselines were found."
             return {"ok": False, "message": msg, "cache_path": None, "payload": None, "errors": [msg]}
 
         emit({"status": "running", "message": "Averaging baseline biases per cell...", "progress": 85})
 
-        # Average across baselines per cell.
-        bias_all: List[List[float]] = [[0.0 for _ in range(cols)] for _ in range(rows)]
-        bias_db: List[List[float]] = [[0.0 for _ in range(cols)] for _ in range(rows)]
-        bias_bw: List[List[float]] = [[0.0 for _ in range(cols)] for _ in range(rows)]
-
-        n = float(len(per_baseline_bias_all))
-        for rr in range(rows):
-            for cc in range(cols):
-                bias_all[rr][cc] = sum(b[rr][cc] for b in per_baseline_bias_all) / n
-                bias_db[rr][cc] = sum(b[rr][cc] for b in per_baseline_bias_db) / n
-                bias_bw[rr][cc] = sum(b[rr][cc] for b in per_baseline_bias_bw) / n
-
-        def _summarize_counts(key: str) -> Dict[str, float]:
-            vals: List[float] = []
-            for b in baseline_summaries:
-                try:
-                    vals.append(float(b.get(key) or 0.0))
-                except Exception:
-                    continue
-            if not vals:
+        # Reduce across baselines per cell. Summing along axis 0 adds the baselines in order,
+        # so the means are bit-identical to a per-cell Python sum.
+        stack_db = _bias_stack(per_baseline_db, rows, cols)
+        stack_bw = _bias_stack(per_baseline_bw, rows, cols)
+        stack_all = 0.5 * stack_db + 0.5 * stack_bw
+        n = float(stack_db.shape[0])
+        bias_all = (stack_all.sum(axis=0) / n).tolist()
+        bias_db = (stack_db.sum(axis=0) / n).tolist()
+        bias_bw = (stack_bw.sum(axis=0) / n).tolist()
+        spread = {
+            key: _spread(stack)
+            for key, stack in (("all", stack_all), ("db", stack_db), ("bw", stack_bw))
+        }
+
+        counts = np.asarray(
+            [[float(b.get("db_cells_measured") or 0.0), float(b.get("bw_cells_measured") or 0.0)] for b in baseline_summaries],
+            dtype=np.float64,
+        ).reshape(-1, 2)
+
+        def _summarize_counts(col: int) -> Dict[str, float]:
+            vals = counts[:, col]
+            if vals.size == 0:
                 return {"mean": 0.0, "min": 0.0, "max": 0.0}
-            return {"mean": sum(vals) / float(len(vals)), "min": float(min(vals)), "max": float(max(vals))}
+            return {"mean": float(vals.sum() / vals.size), "min": float(vals.min()), "max": float(vals.max())}
 
         payload: Dict[str, object] = {
             "version": 1,
@@ -275,14 +236,115 @@ class TemperatureBaselineBiasService:
             "bias_db": bias_db,
             "bias_bw": bias_bw,
             "measured_cells": {
-                "db": _summarize_counts("db_cells_measured"),
-                "bw": _summarize_counts("bw_cells_measured"),
+                "db": _summarize_counts(0),
+                "bw": _summarize_counts(1),
             },
         }
 
         cache_path = self._repo.save_temperature_bias_cache(dev, payload)
         emit({"status": "completed", "message": "Bias baseline computed", "progress": 100})
 
-        return {"ok": True, "message": "Bias baseline computed", "cache_path": cache_path, "payload": payload, "errors": []}
+        return {
+            "ok": True,
+            "message": "Bias baseline computed",
+            "cache_path": cache_path,
+            "payload": payload,
+            "errors": [],
+            # Per-cell spread across baselines (median / p10 / p90); diagnostics only, not cached.
+            "bias_spread": spread,
+        }
+
+    def _analyze_baseline(
+        self,
+        dev: str,
+        entry: dict,
+        *,
+        db_truth: float,
+        status_cb: Callable[[dict], None] | None,
+    ) -> Dict[str, object]:
+        """
+        Process (temp-off, only if missing) and analyze one baseline test.
+
+        Returns {error} or {rows, cols, device_type, db_pcts, bw_pcts, summary, temp_label, csv_name}.
+        """
+        raw_csv = str(entry.get("csv_path") or "")
+        meta = dict(entry.get("meta") or {})
+        temp_f = entry.get("temp_f")
+        temp_label = f"{float(temp_f):.1f}°F" if temp_f is not None else "—°F"
+
+        if not raw_csv or not os.path.isfile(raw_csv):
+            return {"error": f"Baseline missing CSV: {raw_csv}"}
+
+        # Process OFF for this baseline (only if missing).
+        folder = os.path.dirname(raw_csv)
+        room_temp_f = float(temp_f) if temp_f is not None else float(meta.get("room_temperature_f") or 72.0)
+        try:
+            processed_off = self._processing.ensure_temp_off_processed(
+                folder=folder,
+                device_id=dev,
+                csv_path=raw_csv,
+                room_temp_f=room_temp_f,
+                status_cb=status_cb,
+            )
+        except Exception as exc:
+            return {"error": f"Baseline {temp_label}: failed to process temp-off for {os.path.basename(raw_csv)}: {exc}"}
+
+        # Analyze processed-off.
+        try:
+            analysis = self._analyzer.analyze_single_processed_csv(processed_off, meta)
+        except Exception as exc:
+            return {"error": f"Baseline {temp_label}: failed to analyze {os.path.basename(processed_off)}: {exc}"}
+
+        grid = dict(analysis.get("grid") or {})
+        data = dict(analysis.get("data") or {})
+        stage_map = dict((data.get("stages") or {}))
+
+        r = int(grid.get("rows") or 0)
+        c = int(grid.get("cols") or 0)
+        dt = str(grid.get("device_type") or "")
+        if r <= 0 or c <= 0:
+            return {"error": f"Baseline {temp_label}: invalid grid dimensions for {os.path.basename(raw_csv)}"}
+
+        db_stage = dict(stage_map.get("db") or {})
+        bw_stage = dict(stage_map.get("bw") or {})
+        db_cells = list(db_stage.get("cells") or [])
+        bw_cells = list(bw_stage.get("cells") or [])
+
+        # Rule: if ANY baseline has zero detected windows for a stage, bias mode is invalid.
+        if len(db_cells) == 0 or len(bw_cells) == 0:
+            return {
+                "error": f"Baseline {temp_label} ({os.path.basename(raw_csv)}): missing stage windows "
+                f"(45lb cells={len(db_cells)}, bodyweight cells={len(bw_cells)})"
+            }
+
+        # Per-stage target truths used to compute baseline-stage pct.
+        db_target = float(db_stage.get("target_n") or db_truth)
+        bw_target = float(bw_stage.get("target_n") or 0.0)
+        if db_target <= 0.0 or bw_target <= 0.0:
+            return {
+                "error": f"Baseline {temp_label} ({os.path.basename(raw_csv)}): invalid targets "
+                f"(db_target={db_target:.1f}, bw_target={bw_target:.1f})"
+            }
+
+        db_pcts = _pct_map(db_cells, db_target)
+        bw_pcts = _pct_map(bw_cells, bw_target)
+        return {
+            "rows": r,
+            "cols": c,
+            "device_type": dt,
+            "db_pcts": db_pcts,
+            "bw_pcts": bw_pcts,
+            "temp_label": temp_label,
+            "csv_name": os.path.basename(raw_csv),
+            "summary": {
+                "csv": os.path.basename(raw_csv),
+                "temp_f": float(temp_f) if temp_f is not None else None,
+                "processed_off": os.path.basename(processed_off),
+                "db_target_n": db_target,
+                "bw_target_n": bw_target,
+                "db_cells_measured": len(db_pcts),
+                "bw_cells_measured": len(bw_pcts),
+            },
+        }
 
 
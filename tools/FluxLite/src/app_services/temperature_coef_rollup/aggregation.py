@@ -95,6 +95,90 @@ def aggregate_mean_signed_for_coef_key(
     }
 
 
+def top3_group_key(run: dict) -> str:
+    """Top-3 grouping key: coef_key, plus post_key when the run was post-corrected."""
+    ck = str(run.get("coef_key") or "")
+    post_key = str((run.get("post_correction") or {}).get("post_key") or "")
+    return f"{ck} | {post_key}".strip() if post_key else ck
+
+
+def top3_row_for_group(ck: str, by_dev: Dict[str, List[dict]]) -> Optional[Dict[str, object]]:
+    """Leaderboard row for one coef group (runs grouped by device, in rollup order), or None if ineligible."""
+    eligible_runs: List[dict] = []
+    eligible_devices = 0
+    all_temps: List[float] = []
+    for dev, dev_runs in by_dev.items():
+        temps = set()
+        for rr in dev_runs:
+            tf = rr.get("temp_f")
+            if tf is None:
+                continue
+            try:
+                temps.add(float(tf))
+            except Exception:
+                continue
+        if len(temps) < 2:
+            continue
+        eligible_devices += 1
+        all_temps.extend(list(temps))
+        eligible_runs.extend(dev_runs)
+
+    # Require >=2 devices (matches top-3 intent/documentation).
+    if eligible_devices < 2:
+        return None
+
+    mean_abs_vals: List[float] = []
+    mean_signed_vals: List[float] = []
+    std_signed_vals: List[float] = []
+    for rr in eligible_runs:
+        sel = (rr.get("selected") or {}).get("all") or {}
+        try:
+            mean_abs_vals.append(float(sel.get("mean_abs")))
+        except Exception:
+            pass
+        try:
+            mean_signed_vals.append(float(sel.get("mean_signed")))
+        except Exception:
+            pass
+        try:
+            std_signed_vals.append(float(sel.get("std_signed")))
+        except Exception:
+            pass
+
+    if not mean_abs_vals:
+        return None
+
+    score_mean_abs = sum(mean_abs_vals) / float(len(mean_abs_vals))
+    mean_signed = sum(mean_signed_vals) / float(len(mean_signed_vals)) if mean_signed_vals else 0.0
+    std_signed = sum(std_signed_vals) / float(len(std_signed_vals)) if std_signed_vals else 0.0
+    coverage = f"{eligible_devices} devices, {len(eligible_runs)} tests"
+    if all_temps:
+        try:
+            coverage = f"{coverage}, temps {min(all_temps):.1f}–{max(all_temps):.1f}°F"
+        except Exception:
+            pass
+
+    return {
+        "coef_key": ck,
+        "coef_label": ck,
+        "score_mean_abs": score_mean_abs,
+        "mean_signed": mean_signed,
+        "std_signed": std_signed,
+        "coverage": coverage,
+    }
+
+
+def sort_top3_rows(rows: List[Dict[str, object]], sort_by: str = "mean_abs") -> List[Dict[str, object]]:
+    """Best three group rows (stable: ties keep the given order)."""
+    rows = list(rows)
+    sb = str(sort_by or "mean_abs").strip().lower()
+    if sb in ("signed", "signed_abs", "abs_signed", "mean_signed_abs"):
+        rows.sort(key=lambda r: abs(float(r.get("mean_signed") or 1e9)))
+    else:
+        rows.sort(key=lambda r: float(r.get("score_mean_abs") or 1e9))
+    return rows[:3]
+
+
 def top3_rows_for_plate_type(*, runs: List[dict], sort_by: str = "mean_abs") -> List[Dict[str, object]]:
     """
     Compute top-3 coefficient combos for a plate type using bias-controlled scoring only.
@@ -107,9 +191,7 @@ def top3_rows_for_plate_type(*, runs: List[dict], sort_by: str = "mean_abs") ->
     by_coef: Dict[str, Dict[str, List[dict]]] = {}
     for r in runs or []:
         try:
-            ck = str(r.get("coef_key") or "")
-            post_key = str((r.get("post_correction") or {}).get("post_key") or "")
-            ck_group = f"{ck} | {post_key}".strip() if post_key else ck
+            ck_group = top3_group_key(r)
             dev = str(r.get("device_id") or "")
         except Exception:
             continue
@@ -119,76 +201,7 @@ def top3_rows_for_plate_type(*, runs: List[dict], sort_by: str = "mean_abs") ->
 
     rows: List[Dict[str, object]] = []
     for ck, by_dev in by_coef.items():
-        eligible_runs: List[dict] = []
-        eligible_devices = 0
-        all_temps: List[float] = []
-        for dev, dev_runs in by_dev.items():
-            temps = set()
-            for rr in dev_runs:
-                tf = rr.get("temp_f")
-                if tf is None:
-                    continue
-                try:
-                    temps.add(float(tf))
-                except Exception:
-                    continue
-            if len(temps) < 2:
-                continue
-            eligible_devices += 1
-            all_temps.extend(list(temps))
-            eligible_runs.extend(dev_runs)
-
-        # Require >=2 devices (matches top-3 intent/documentation).
-        if eligible_devices < 2:
-            continue
-
-        mean_abs_vals: List[float] = []
-        mean_signed_vals: List[float] = []
-        std_signed_vals: List[float] = []
-        for rr in eligible_runs:
-            sel = (rr.get("selected") or {}).get("all") or {}
-            try:
-                mean_abs_vals.append(float(sel.get("mean_abs")))
-            except Exception:
-                pass
-            try:
-                mean_signed_vals.append(float(sel.get("mean_signed")))
-            except Exception:
-                pass
-            try:
-                std_signed_vals.append(float(sel.get("std_signed")))
-            except Exception:
-                pass
-
-        if not mean_abs_vals:
-            continue
-
-        score_mean_abs = sum(mean_abs_vals) / float(len(mean_abs_vals))
-        mean_signed = sum(mean_signed_vals) / float(len(mean_signed_vals)) if mean_signed_vals else 0.0
-        std_signed = sum(std_signed_vals) / float(len(std_signed_vals)) if std_signed_vals else 0.0
-        coverage = f"{eligible_devices} devices, {len(eligible_runs)} tests"
-        if all_temps:
-            try:
-                coverage = f"{coverage}, temps {min(all_temps):.1f}–{max(all_temps):.1f}°F"
-            except Exception:
-                pass
-
-        rows.append(
-            {
-                "coef_key": ck,
-                "coef_label": ck,
-                "score_mean_abs": score_mean_abs,
-                "mean_signed": mean_signed,
-                "std_signed": std_signed,
-                "coverage": coverage,
-            }
-        )
-
-    sb = str(sort_by or "mean_abs").strip().lower()
-    if sb in ("signed", "signed_abs", "abs_signed", "mean_signed_abs"):
-        rows.sort(key=lambda r: abs(float(r.get("mean_signed") or 1e9)))
-    else:
-        rows.sort(key=lambda r: float(r.get("score_mean_abs") or 1e9))
-    return rows[:3]
-
-
+        row = top3_row_for_group(ck, by_dev)
+        if row is not None:
+            rows.append(row)
+    return sort_top3_rows(rows, sort_by)
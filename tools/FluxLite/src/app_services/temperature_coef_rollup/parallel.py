@@ -0,0 +1,61 @@
+"""
+Worker pools for batch rollups.
+
+Backend processing is I/O bound (HTTP to the local backend) and runs on a thread pool;
+window analysis + bias scoring is CPU bound and runs in a process pool. The process
+pool uses the "spawn" start method so it is safe to create from a QThread.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Optional
+
+from ..analysis.temperature_analyzer import TemperatureAnalyzer
+from .scoring import score_run_against_bias
+
+STAGE_KEYS = ("all", "db", "bw")
+
+_worker_analyzer: Optional[TemperatureAnalyzer] = None
+
+
+def score_payload(payload: dict, *, plate_type: str, bias_map: list) -> Dict[str, object]:
+    """Bias-controlled scores for both runs of an analysis payload: {device_type, baseline, selected}."""
+    grid = dict(payload.get("grid") or {})
+    device_type = str(grid.get("device_type") or plate_type)
+    body_weight_n = float((payload.get("meta") or {}).get("body_weight_n") or 0.0)
+    out: Dict[str, object] = {"device_type": device_type}
+    for side in ("baseline", "selected"):
+        out[side] = {
+            k: score_run_against_bias(
+                run_data=payload.get(side) or {},
+                stage_key=k,
+                device_type=device_type,
+                body_weight_n=body_weight_n,
+                bias_map=bias_map,
+            )
+            for k in STAGE_KEYS
+        }
+    return out
+
+
+def analyze_and_score(baseline_path: str, selected_path: str, meta: dict, plate_type: str, bias_map: list) -> Dict[str, object]:
+    """Process-pool task: analyze processed off/on CSVs and score them against the device bias."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = TemperatureAnalyzer()
+    payload = _worker_analyzer.analyze_temperature_processed_runs(baseline_path, selected_path, meta)
+    return score_payload(payload, plate_type=plate_type, bias_map=bias_map)
+
+
+def make_cpu_pool(workers: int, jobs: int) -> Optional[Executor]:
+    """Process pool for analysis, or None to analyze in the calling thread (disabled, single job, or unavailable)."""
+    n = min(int(workers), int(jobs))
+    if int(workers) <= 0 or int(jobs) < 2:
+        return None
+    try:
+        return ProcessPoolExecutor(max_workers=max(1, n), mp_context=multiprocessing.get_context("spawn"))
+    except Exception as exc:
+        print(f"[rollup] process pool unavailable, analyzing in-thread: {exc}")
+        return None
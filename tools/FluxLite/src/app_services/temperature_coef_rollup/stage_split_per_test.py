@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import os
 from typing import Callable, Dict, List, Optional, Tuple
 
 from ... import config
-from ...project_paths import data_dir
+from ...infra import disk_lru
+from ...project_paths import data_dir, user_cache_dir
 from ..analysis.temperature_analyzer import TemperatureAnalyzer
 from ..repositories.test_file_repository import TestFileRepository
 from ..temperature_baseline_bias_service import TemperatureBaselineBiasService
+from ..temperature_linear_response import linear_response_for, response_mode
+from ..temperature_post_correction import extract_temp_f_from_meta
 from ..temperature_processing_service import TemperatureProcessingService
+from .scoring import score_run_against_bias
 from .unified_k import compute_c_and_k_from_stage_split_rows, evaluate_unified_k_bias_metrics, save_cache
 
 
@@ -63,6 +68,58 @@ def _find_processed_paths_for_coef(details: dict, *, mode: str, coef: float) ->
     return baseline_path, selected_path
 
 
+def _linear_response_cache_dir() -> str:
+    configured = str(getattr(config, "TEMP_LINEAR_RESPONSE_CACHE_DIR", "") or "").strip()
+    return configured or user_cache_dir("linear_response")
+
+
+def _linear_response_selected_path(
+    *,
+    processing: TemperatureProcessingService,
+    device_id: str,
+    raw_csv: str,
+    meta: dict,
+    baseline_path: str,
+    coef: float,
+    room_temp_f: float,
+    status_cb: Callable[[dict], None] | None,
+) -> tuple[str, str]:
+    """
+    (baseline_path, selected_path) with the selected run derived from the OFF output by the
+    linear-response shortcut instead of a backend run. Written to the linear_response cache
+    (user cache dir, LRU-trimmed) so the test's processed_runs list only ever holds real backend
+    outputs. ("", "") on failure.
+    """
+    if not (baseline_path and os.path.isfile(baseline_path)):
+        baseline_path = processing.ensure_temp_off_processed(
+            folder=os.path.dirname(raw_csv),
+            device_id=device_id,
+            csv_path=raw_csv,
+            room_temp_f=room_temp_f,
+            status_cb=status_cb,
+        )
+    model = linear_response_for(baseline_path, room_temp_f=room_temp_f, temp_f=extract_temp_f_from_meta(meta))
+    if model is None:
+        return ("", "")
+    # Key on the OFF output's identity (path + mtime + size) so a reprocessed baseline is not served stale.
+    st = os.stat(baseline_path)
+    ident = f"{os.path.abspath(baseline_path)}|{int(st.st_mtime_ns)}|{int(st.st_size)}"
+    tag = hashlib.sha1(ident.encode("utf-8")).hexdigest()[:16]
+    cache_root = _linear_response_cache_dir()
+    out_path = os.path.join(cache_root, f"{tag}__scalar_{coef:.6f}_g{model.gain:g}.csv")
+    if os.path.isfile(out_path):
+        disk_lru.touch(out_path)
+    else:
+        model.write_candidate_csv({"x": coef, "y": coef, "z": coef}, out_path)
+        disk_lru.trim(
+            cache_root,
+            suffix=".csv",
+            max_bytes=int(float(getattr(config, "TEMP_LINEAR_RESPONSE_CACHE_MAX_MB", 2048)) * 1024 * 1024),
+            max_entries=int(getattr(config, "TEMP_LINEAR_RESPONSE_CACHE_MAX_ENTRIES", 2000)),
+        )
+    return (baseline_path, out_path)
+
+
 def _ensure_eval_scores_for_coef(
     *,
     repo: TestFileRepository,
@@ -93,6 +150,24 @@ def _ensure_eval_scores_for_coef(
     folder = os.path.dirname(raw_csv)
     room_temp_f = float(getattr(config, "TEMP_IDEAL_ROOM_TEMP_F", 76.0))
 
+    lr_mode = response_mode() if str(mode or "scalar").strip().lower() == "scalar" else "off"
+    have_selected = bool(baseline_path and selected_path and os.path.isfile(baseline_path) and os.path.isfile(selected_path))
+    if not have_selected and lr_mode == "on":
+        try:
+            baseline_path, selected_path = _linear_response_selected_path(
+                processing=processing,
+                device_id=device_id,
+                raw_csv=raw_csv,
+                meta=meta,
+                baseline_path=baseline_path,
+                coef=c,
+                room_temp_f=room_temp_f,
+                status_cb=status_cb,
+            )
+        except Exception as exc:
+            print(f"[stage_split] linear-response shortcut failed for {os.path.basename(raw_csv)} @ {c:.4f}: {exc}")
+            baseline_path, selected_path = "", ""
+
     # If missing processed files, run processing for this coef (this also ensures baseline-off exists).
     if not (baseline_path and selected_path and os.path.isfile(baseline_path) and os.path.isfile(selected_path)):
         if status_cb is not None:
@@ -122,6 +197,19 @@ def _ensure_eval_scores_for_coef(
         cache[key] = None
         return None
 
+    if lr_mode == "validate":
+        model = linear_response_for(baseline_path, room_temp_f=room_temp_f, temp_f=extract_temp_f_from_meta(meta))
+        if model is not None:
+            try:
+                check = model.compare_with_backend({"x": c, "y": c, "z": c}, selected_path)
+                z = check.get("z") or {}
+                print(
+                    f"[stage_split] linear-response check {os.path.basename(raw_csv)} @ {c:.4f}: "
+                    f"z rel_rms={z.get('rel_rms_error')} fitted_gain={z.get('fitted_gain')} rows={check.get('rows')}"
+                )
+            except Exception as exc:
+                print(f"[stage_split] linear-response check failed for {os.path.basename(raw_csv)}: {exc}")
+
     payload = analyzer.analyze_temperature_processed_runs(baseline_path, selected_path, meta)
     grid = dict(payload.get("grid") or {})
     device_type = str(grid.get("device_type") or _plate_type_from_device_id(device_id) or "")
@@ -0,0 +1,309 @@
+"""
+Append-only rollup store with materialized leaderboard aggregates.
+
+A plate type's rollup is a JSONL log (`type<pt>.jsonl`): one run row per line, keyed by
+(coef_key, device_id, raw_csv). A later line for the same key replaces the earlier one
+but keeps its position, which is exactly the dedupe/overwrite rule the single-file JSON
+rollup used, so replaying the log yields the same ordered run list. Writing a batch
+appends only the rows that changed; the log is compacted once superseded lines outnumber
+live ones.
+
+The store stays in memory per process and picks up lines appended by other writers by
+reading from its last offset. Top-3 group rows and per-coef_key mean_signed aggregates
+are cached per group and recomputed only for groups touched by an upsert (or all of them
+when the excluded room-baseline set changes), so leaderboard queries do not rescan the
+rollup.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .aggregation import aggregate_mean_signed_for_coef_key, sort_top3_rows, top3_group_key, top3_row_for_group
+
+RunKey = Tuple[str, ...]
+
+_COMPACT_MIN_LINES = 256
+
+
+def run_key(row: dict, fallback: int) -> RunKey:
+    """Dedupe key of a run; rows missing a key part are never merged (unique fallback key)."""
+    try:
+        key = (str(row.get("coef_key") or ""), str(row.get("device_id") or ""), str(row.get("raw_csv") or ""))
+    except Exception:
+        key = ("", "", "")
+    if key[0] and key[1] and key[2]:
+        return key
+    return ("", "", "", str(fallback))
+
+
+class RollupStore:
+    def __init__(self, path: str, plate_type: str, *, legacy_json_path: str = "") -> None:
+        self.path = os.path.abspath(path)
+        self.plate_type = str(plate_type)
+        self.legacy_json_path = legacy_json_path
+        self._lock = threading.RLock()
+        self._reset_memory()
+
+    def _reset_memory(self) -> None:
+        self._rows: Dict[RunKey, dict] = {}
+        self._seq: Dict[RunKey, int] = {}
+        self._next_seq = 0
+        self._lines = 0
+        self._offset = 0
+        self._file_id: Optional[Tuple[int, int]] = None
+        self.updated_at_ms = 0
+        self._groups: Dict[str, Dict[RunKey, None]] = {}  # top3 group -> keys
+        self._by_coef: Dict[str, Dict[RunKey, None]] = {}  # coef_key -> keys
+        self._devices: Dict[str, int] = {}
+        self._group_rows: Dict[str, Optional[Tuple[int, dict]]] = {}
+        self._signed: Dict[str, Optional[dict]] = {}
+        self._exclude: Optional[FrozenSet[str]] = None
+        self._top3: Dict[str, List[dict]] = {}
+
+    # --- log ---
+
+    def _apply(self, row: dict) -> None:
+        key = run_key(row, self._next_seq)
+        old = self._rows.get(key)
+        if old is None:
+            self._seq[key] = self._next_seq
+            self._next_seq += 1
+        else:
+            self._unindex(key, old)
+        self._rows[key] = row
+        self._index(key, row)
+
+    def _index(self, key: RunKey, row: dict) -> None:
+        try:
+            group = top3_group_key(row)
+            ck = str(row.get("coef_key") or "")
+            dev = str(row.get("device_id") or "")
+        except Exception:
+            return
+        if group and dev:
+            self._groups.setdefault(group, {})[key] = None
+            self._group_rows.pop(group, None)
+            self._devices[dev] = self._devices.get(dev, 0) + 1
+        if ck:
+            self._by_coef.setdefault(ck, {})[key] = None
+            self._signed.pop(ck, None)
+        self._top3.clear()
+
+    def _unindex(self, key: RunKey, row: dict) -> None:
+        try:
+            group = top3_group_key(row)
+            ck = str(row.get("coef_key") or "")
+            dev = str(row.get("device_id") or "")
+        except Exception:
+            return
+        if group and dev:
+            keys = self._groups.get(group)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    self._groups.pop(group, None)
+            self._group_rows.pop(group, None)
+            n = self._devices.get(dev, 0) - 1
+            if n > 0:
+                self._devices[dev] = n
+            else:
+                self._devices.pop(dev, None)
+        if ck:
+            keys = self._by_coef.get(ck)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    self._by_coef.pop(ck, None)
+            self._signed.pop(ck, None)
+        self._top3.clear()
+
+    def _read_from(self, offset: int) -> None:
+        with open(self.path, "rb") as h:
+            h.seek(offset)
+            data = h.read()
+        # Only consume complete lines; a writer may be mid-append.
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(row, dict):
+                self._apply(row)
+                self._lines += 1
+        self._offset = offset + end
+
+    def refresh(self) -> None:
+        """Catch up with the log on disk (tail-read appends; full reload if it was replaced)."""
+        with self._lock:
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                if self._file_id is not None or self._rows:
+                    self._reset_memory()
+                self._migrate_legacy()
+                return
+            file_id = (int(st.st_dev), int(st.st_ino))
+            if file_id != self._file_id or st.st_size < self._offset:
+                self._reset_memory()
+                self._file_id = file_id
+            if st.st_size > self._offset:
+                self._read_from(self._offset)
+            self.updated_at_ms = int(st.st_mtime * 1000)
+
+    def _migrate_legacy(self) -> None:
+        """Import a single-file JSON rollup (pre-log format) once, then move it aside."""
+        legacy = self.legacy_json_path
+        if not legacy or not os.path.isfile(legacy):
+            return
+        try:
+            with open(legacy, "r", encoding="utf-8") as h:
+                data = json.load(h)
+            runs = list((data or {}).get("runs") or []) if isinstance(data, dict) else []
+        except Exception as exc:
+            print(f"[rollup] could not import {legacy}: {exc}")
+            return
+        self._write_all([r for r in runs if isinstance(r, dict)])
+        try:
+            os.replace(legacy, f"{legacy}.migrated")
+        except Exception:
+            pass
+        print(f"[rollup] imported {len(runs)} runs from {os.path.basename(legacy)}")
+
+    def _write_all(self, rows: List[dict]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        with open(tmp, "w", encoding="utf-8") as h:
+            for r in rows:
+                h.write(json.dumps(r, sort_keys=True))
+                h.write("\n")
+        os.replace(tmp, self.path)
+        self._reset_memory()
+        self.refresh()
+
+    # --- writes ---
+
+    def upsert(self, rows: Iterable[dict]) -> int:
+        """Append rows (replacing same-key rows in place). Returns the number appended."""
+        rows = [r for r in rows if isinstance(r, dict)]
+        if not rows:
+            return 0
+        with self._lock:
+            self.refresh()
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as h:
+                for r in rows:
+                    h.write(json.dumps(r, sort_keys=True))
+                    h.write("\n")
+            self.refresh()
+            if self._lines >= _COMPACT_MIN_LINES and self._lines > 2 * len(self._rows):
+                self.compact()
+        return len(rows)
+
+    def replace_all(self, rows: List[dict]) -> None:
+        with self._lock:
+            self._write_all(list(rows))
+
+    def compact(self) -> None:
+        """Rewrite the log with one line per live run, keeping run order."""
+        with self._lock:
+            self._write_all(self.runs())
+
+    # --- reads ---
+
+    def runs(self) -> List[dict]:
+        """Ordered run list (same order the single-file rollup would hold)."""
+        with self._lock:
+            self.refresh()
+            return list(self._rows.values())
+
+    def get(self, key: RunKey) -> Optional[dict]:
+        with self._lock:
+            self.refresh()
+            return self._rows.get(tuple(key))
+
+    def device_ids(self) -> List[str]:
+        with self._lock:
+            self.refresh()
+            return list(self._devices)
+
+    def coef_keys(self) -> List[str]:
+        with self._lock:
+            self.refresh()
+            return list(self._by_coef)
+
+    def _ordered(self, keys: Iterable[RunKey], exclude: FrozenSet[str] = frozenset()) -> List[Tuple[int, dict]]:
+        out = []
+        for k in keys:
+            r = self._rows[k]
+            if exclude and str(r.get("raw_csv") or "") in exclude:
+                continue
+            out.append((self._seq[k], r))
+        out.sort(key=lambda t: t[0])
+        return out
+
+    def top3(self, *, sort_by: str = "mean_abs", exclude_raw_csvs: Iterable[str] = ()) -> List[Dict[str, object]]:
+        """Top-3 rows, equal to `top3_rows_for_plate_type` over the runs minus excluded raw CSVs."""
+        exclude = frozenset(exclude_raw_csvs or ())
+        sb = str(sort_by or "mean_abs")
+        with self._lock:
+            self.refresh()
+            if exclude != self._exclude:
+                self._exclude = exclude
+                self._group_rows.clear()
+                self._top3.clear()
+            hit = self._top3.get(sb)
+            if hit is not None:
+                return [dict(r) for r in hit]
+            for group, keys in self._groups.items():
+                if group in self._group_rows:
+                    continue
+                ordered = self._ordered(keys, exclude)
+                by_dev: Dict[str, List[dict]] = {}
+                for _seq, r in ordered:
+                    by_dev.setdefault(str(r.get("device_id") or ""), []).append(r)
+                row = top3_row_for_group(group, by_dev) if ordered else None
+                self._group_rows[group] = (ordered[0][0], row) if row is not None else None
+            # Groups in first-appearance order so score ties resolve as in a full recompute.
+            rows = [gr[1] for gr in sorted((v for v in self._group_rows.values() if v is not None), key=lambda t: t[0])]
+            best = sort_top3_rows(rows, sb)
+            self._top3[sb] = best
+            return [dict(r) for r in best]
+
+    def mean_signed(self, coef_key: str) -> Optional[dict]:
+        """Cached `aggregate_mean_signed_for_coef_key` for one coef_key."""
+        ck = str(coef_key or "")
+        with self._lock:
+            self.refresh()
+            if ck not in self._signed:
+                keys = self._by_coef.get(ck) or {}
+                runs = [r for _seq, r in self._ordered(keys)]
+                self._signed[ck] = aggregate_mean_signed_for_coef_key(runs=runs, coef_key=ck) if runs else None
+            out = self._signed[ck]
+            return dict(out) if isinstance(out, dict) else None
+
+    def as_payload(self) -> Dict[str, object]:
+        """Rollup in the single-file JSON shape ({version, plate_type, updated_at_ms, runs})."""
+        runs = self.runs()
+        return {"version": 1, "plate_type": self.plate_type, "updated_at_ms": int(self.updated_at_ms), "runs": runs}
+
+
+_stores: Dict[str, RollupStore] = {}
+_stores_lock = threading.Lock()
+
+
+def rollup_store(path: str, plate_type: str, *, legacy_json_path: str = "") -> RollupStore:
+    """Process-wide store for a rollup log path."""
+    key = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = RollupStore(key, plate_type, legacy_json_path=legacy_json_path)
+            _stores[key] = store
+        return store
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
 from typing import Callable, Dict, List, Optional, Tuple
 
 from .. import config
 from ..project_paths import data_dir
 from .analysis.temperature_analyzer import TemperatureAnalyzer
+from .backend_csv_processor import sanitized_csv_for_backend
 from .repositories.test_file_repository import TestFileRepository
 from .temperature_baseline_bias_service import TemperatureBaselineBiasService
 from .temperature_processing_service import TemperatureProcessingService
-from .temperature_coef_rollup.aggregation import aggregate_mean_signed_for_coef_key, top3_rows_for_plate_type
 from .temperature_coef_rollup.coef_key import parse_coef_key
 from .temperature_coef_rollup.distinct_experiment import export_distinct_experiment_report
-from .temperature_coef_rollup.scoring import score_run_against_bias
+from .temperature_coef_rollup.parallel import analyze_and_score, make_cpu_pool, score_payload
 from .temperature_coef_rollup.eligibility import baseline_csvs_for_devices
+from .temperature_coef_rollup.store import RollupStore, rollup_store
+
+# Bump when scoring changes so every stored run counts as stale on the next batch.
+_ROLLUP_INPUTS_VERSION = 1
 
 
 def _plate_type_from_device_id(device_id: str) -> str:
@@ -26,6 +35,19 @@ def _plate_type_from_device_id(device_id: str) -> str:
     return d.split(".", 1)[0].strip()
 
 
+_rollup_locks: Dict[str, threading.Lock] = {}
+_rollup_locks_guard = threading.Lock()
+
+
+def _rollup_lock(plate_type: str) -> threading.Lock:
+    with _rollup_locks_guard:
+        lock = _rollup_locks.get(plate_type)
+        if lock is None:
+            lock = threading.Lock()
+            _rollup_locks[plate_type] = lock
+        return lock
+
+
 def _coef_key(mode: str, coefs: dict) -> str:
     m = str(mode or "legacy").strip().lower()
     x = float((coefs or {}).get("x", 0.0))
@@ -34,6 +56,46 @@ def _coef_key(mode: str, coefs: dict) -> str:
     return f"{m}:x={x:.6f},y={y:.6f},z={z:.6f}"
 
 
+def _file_sig(path: str) -> str:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return ""
+    return f"{int(st.st_mtime_ns)}:{int(st.st_size)}"
+
+
+def _test_inputs_hash(*, plate_type: str, bias_map: list, meta: dict, temp_f: Optional[float]) -> str:
+    """
+    Hash of the per-test scoring inputs that do not depend on the coef set. The meta's
+    processed_* bookkeeping is left out: it changes whenever any coef set is processed.
+    """
+    meta_core = {k: v for k, v in (meta or {}).items() if not str(k).startswith("processed")}
+    payload = json.dumps(
+        {"v": _ROLLUP_INPUTS_VERSION, "pt": plate_type, "bias": bias_map, "meta": meta_core, "temp_f": temp_f},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _RollupJob:
+    """One (coef set, device, test) unit of batch work; processed paths are filled in by the I/O stage."""
+
+    device_id: str
+    raw_csv: str
+    meta: dict
+    temp_f: Optional[float]
+    bias_map: list
+    coef_set: int = 0
+    coefs: dict = field(default_factory=dict)
+    coef_key: str = ""
+    baseline_path: str = ""
+    selected_path: str = ""
+    test_inputs: str = ""  # _test_inputs_hash
+    inputs: str = ""  # test_inputs + processed output signatures; stored on the rollup row
+
+
 class TemperatureCoefRollupService:
     """
     Batch runner + rollup generator for temperature coefficients.
@@ -59,30 +121,28 @@ class TemperatureCoefRollupService:
         return _coef_key(mode, coefs)
 
     def rollup_path(self, plate_type: str) -> str:
+        """Append-only run log for a plate type (see temperature_coef_rollup/store.py)."""
         base = os.path.join(data_dir("analysis"), "temp_coef_rollup")
         os.makedirs(base, exist_ok=True)
         pt = str(plate_type or "").strip() or "unknown"
-        return os.path.join(base, f"type{pt}.json")
+        return os.path.join(base, f"type{pt}.jsonl")
+
+    def _legacy_rollup_path(self, plate_type: str) -> str:
+        """Single-file JSON rollup written by older versions (imported into the log on first use)."""
+        return os.path.splitext(self.rollup_path(plate_type))[0] + ".json"
+
+    def _store(self, plate_type: str) -> RollupStore:
+        pt = str(plate_type or "").strip() or "unknown"
+        return rollup_store(self.rollup_path(pt), pt, legacy_json_path=self._legacy_rollup_path(pt))
 
     def load_rollup(self, plate_type: str) -> Dict[str, object]:
-        path = self.rollup_path(plate_type)
-        if not os.path.isfile(path):
-            return {"version": 1, "plate_type": plate_type, "updated_at_ms": 0, "runs": []}
-        try:
-            with open(path, "r", encoding="utf-8") as h:
-                data = json.load(h)
-            if isinstance(data, dict):
-                return data
-        except Exception:
-            pass
-        return {"version": 1, "plate_type": plate_type, "updated_at_ms": 0, "runs": []}
+        return self._store(plate_type).as_payload()
 
     def save_rollup(self, plate_type: str, payload: Dict[str, object]) -> str:
-        path = self.rollup_path(plate_type)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as h:
-            json.dump(payload, h, indent=2, sort_keys=True)
-        return path
+        """Replace the whole rollup with payload["runs"] (batches append through the store instead)."""
+        store = self._store(plate_type)
+        store.replace_all([r for r in list((payload or {}).get("runs") or []) if isinstance(r, dict)])
+        return store.path
 
     def reset_rollup(self, plate_type: str, *, backup: bool = True) -> Dict[str, object]:
         """
@@ -96,6 +156,13 @@ class TemperatureCoefRollupService:
             return {"ok": False, "message": "Missing plate type", "rollup_path": None, "backup_path": None}
 
         path = self.rollup_path(pt)
+        legacy = self._legacy_rollup_path(pt)
+        if os.path.isfile(legacy):
+            # Not yet imported into the log: move it aside too so it is not imported later.
+            try:
+                os.replace(legacy, f"{legacy}.bak.{int(time.time() * 1000)}" if backup else f"{legacy}.migrated")
+            except Exception:
+                pass
         if not os.path.isfile(path):
             return {"ok": True, "message": f"No rollup found for type {pt} (already reset)", "rollup_path": path, "backup_path": None}
 
@@ -118,6 +185,7 @@ class TemperatureCoefRollupService:
             except Exception as exc:
                 return {"ok": False, "message": f"Failed to delete rollup: {exc}", "rollup_path": path, "backup_path": None}
 
+        self._store(pt).refresh()
         return {"ok": True, "message": f"Cleared rollup cache for type {pt}", "rollup_path": path, "backup_path": backup_path}
 
     def run_coefs_across_plate_type(
@@ -134,216 +202,392 @@ class TemperatureCoefRollupService:
 
         Returns { ok, message, rollup_path, errors }
         """
+        return self.run_coef_sets_across_plate_type(plate_type=plate_type, coef_sets=[coefs], mode=mode, status_cb=status_cb)[0]
+
+    def run_coef_sets_across_plate_type(
+        self,
+        *,
+        plate_type: str,
+        coef_sets: List[dict],
+        mode: str,
+        status_cb: Callable[[dict], None] | None = None,
+    ) -> List[Dict[str, object]]:
+        """
+        Batch form of `run_coefs_across_plate_type` for several coef sets at once.
+
+        Work fans out per (coef set, device, test): bias baselines (once per device) and
+        backend processing run on a bounded thread pool (TEMP_ROLLUP_IO_WORKERS), analysis +
+        scoring on a process pool (TEMP_ROLLUP_CPU_WORKERS). Rows and errors are merged in
+        coef-set/device/test order under a per-plate-type lock, so the rollup matches a
+        serial run of each coef set.
+
+        A (device, test, coef) entry whose inputs (bias map, meta, temp, processed output
+        files) match the stored row is not re-analyzed or rewritten; only changed rows are
+        appended to the rollup log.
+
+        Returns one { ok, message, rollup_path, errors, updated, unchanged } per coef set, in order.
+        """
+
+        emit_lock = threading.Lock()
 
         def emit(p: dict) -> None:
             if status_cb is None:
                 return
             try:
-                status_cb(dict(p or {}))
+                with emit_lock:
+                    status_cb(dict(p or {}))
             except Exception:
                 pass
 
+        coef_sets = [dict(c or {}) for c in (coef_sets or [])]
         pt = str(plate_type or "").strip()
         if not pt:
-            return {"ok": False, "message": "Missing plate type", "rollup_path": None, "errors": ["Missing plate type"]}
+            return [{"ok": False, "message": "Missing plate type", "rollup_path": None, "errors": ["Missing plate type"]} for _ in coef_sets]
 
         # Find devices with this prefix
         devices = [d for d in (self._repo.list_temperature_devices() or []) if _plate_type_from_device_id(d) == pt]
         if not devices:
-            return {"ok": False, "message": f"No devices found for plate type {pt}", "rollup_path": None, "errors": []}
+            return [{"ok": False, "message": f"No devices found for plate type {pt}", "rollup_path": None, "errors": []} for _ in coef_sets]
+
+        coef_keys = [_coef_key(mode, c) for c in coef_sets]
+        io_workers = max(1, int(getattr(config, "TEMP_ROLLUP_IO_WORKERS", 4)))
+        cpu_workers = int(getattr(config, "TEMP_ROLLUP_CPU_WORKERS", 0))
+        label = coef_keys[0] if len(coef_keys) == 1 else f"{len(coef_keys)} coef sets"
+        emit({"status": "running", "message": f"Batch run {label} across type {pt} ({len(devices)} devices)...", "progress": 1})
+
+        with ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="rollup-io") as io_pool:
+            # Bias cache per device (required for bias-controlled scoring); devices are independent.
+            emit({"status": "running", "message": f"Checking bias baselines for {len(devices)} devices...", "progress": 3})
+            bias_by_device = list(io_pool.map(lambda d: self._device_bias_map(d, status_cb=emit), devices))
+
+            tests: List[_RollupJob] = []
+            for device_id, (bias_map, _errs) in zip(devices, bias_by_device):
+                if bias_map is not None:
+                    tests.extend(self._jobs_for_device(device_id, bias_map))
+            # The 50 Hz trimmed CSV and the OFF baseline are shared by every coef set of a test.
+            # Produce them once per raw CSV before fanning out, so K coef sets never race to
+            # write the same temp-trimmed-* / temp-processed-* files.
+            emit({"status": "running", "message": f"Preparing baselines for {len(tests)} tests...", "progress": 4})
+            baseline_errors = dict(zip((t.raw_csv for t in tests), io_pool.map(lambda t: self._ensure_test_baseline(t, mode), tests)))
+
+            jobs: List[_RollupJob] = [
+                replace(t, coef_set=ci, coefs=coefs, coef_key=ck)
+                for ci, (coefs, ck) in enumerate(zip(coef_sets, coef_keys))
+                for t in tests
+            ]
+
+            results: Dict[int, Dict[str, object]] = {}
+            job_errors: Dict[int, str] = {}
+            total = len(jobs)
+            done = 0
+
+            def finish(
+                idx: int, *, scores: Optional[Dict[str, object]] = None, error: str = "", unchanged: bool = False
+            ) -> None:
+                nonlocal done
+                done += 1
+                if error:
+                    job_errors[idx] = error
+                elif unchanged:
+                    results[idx] = {"unchanged": True}
+                else:
+                    results[idx] = {"scores": scores, "recorded_at_ms": int(time.time() * 1000)}
+                job = jobs[idx]
+                emit(
+                    {
+                        "status": "running",
+                        "message": f"{job.device_id}: analyzed {done}/{total} tests",
+                        "progress": 5 + int(90 * done / max(1, total)),
+                    }
+                )
 
-        coef_key = _coef_key(mode, coefs)
-        rollup = self.load_rollup(pt)
-        runs: List[Dict[str, object]] = list(rollup.get("runs") or [])
-        errors: List[str] = []
-        # Keyed by (coef_key, device_id, raw_csv) for dedupe/overwrite.
-        existing_idx: Dict[tuple, int] = {}
-        for i, r in enumerate(runs):
+            cpu_pool = owned_pool = make_cpu_pool(cpu_workers, total)
             try:
-                key = (str(r.get("coef_key") or ""), str(r.get("device_id") or ""), str(r.get("raw_csv") or ""))
-            except Exception:
-                continue
-            if key[0] and key[1] and key[2]:
-                existing_idx[key] = i
-
-        emit({"status": "running", "message": f"Batch run {coef_key} across type {pt} ({len(devices)} devices)...", "progress": 1})
-
-        # For each device, compute bias cache if missing/invalid (required for bias-controlled scoring).
-        for di, device_id in enumerate(devices):
-            emit({"status": "running", "message": f"Device {di+1}/{len(devices)}: {device_id}", "progress": 5})
-
-            bias_res = self._bias.compute_and_store_bias_for_device(device_id=device_id, status_cb=status_cb)
-            if not bool((bias_res or {}).get("ok")):
-                errs = list((bias_res or {}).get("errors") or [])
-                msg = str((bias_res or {}).get("message") or "bias failed")
-                errors.append(f"{device_id}: bias baseline invalid: {msg}")
-                for e in errs:
-                    errors.append(f"{device_id}: {e}")
-                continue
+                pending: Dict[Future, Tuple[str, int]] = {}
+                for idx, job in enumerate(jobs):
+                    if baseline_errors.get(job.raw_csv):
+                        finish(idx, error=baseline_errors[job.raw_csv])
+                        continue
+                    inline = cpu_pool is None
+                    fut = io_pool.submit(self._prepare_job, job, mode, pt, inline, emit)
+                    pending[fut] = ("prepare", idx)
+
+                while pending:
+                    finished, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        stage, idx = pending.pop(fut)
+                        job = jobs[idx]
+                        try:
+                            res = fut.result()
+                            if stage == "analyze":
+                                res = {"scores": res}
+                        except BrokenProcessPool as exc:
+                            # A worker died (e.g. spawn failed in a frozen build): finish the rest in-thread.
+                            if cpu_pool is not None:
+                                print(f"[rollup] process pool broken, analyzing in-thread: {exc}")
+                            cpu_pool = None
+                            res = self._analyze_job(job, pt)
+                        except Exception as exc:
+                            res = {"error": f"{job.device_id}: {stage} failed {os.path.basename(job.raw_csv)}: {exc}"}
+
+                        if res.get("error"):
+                            finish(idx, error=str(res["error"]))
+                            continue
+                        if res.get("unchanged"):
+                            finish(idx, unchanged=True)
+                            continue
+                        if "scores" in res:
+                            finish(idx, scores=res["scores"])
+                            continue
+                        # Processed paths are ready: hand the CPU-bound part to the process pool.
+                        job.baseline_path = str(res.get("baseline_path") or "")
+                        job.selected_path = str(res.get("selected_path") or "")
+                        if cpu_pool is not None:
+                            try:
+                                afut = cpu_pool.submit(
+                                    analyze_and_score, job.baseline_path, job.selected_path, job.meta, pt, job.bias_map
+                                )
+                                pending[afut] = ("analyze", idx)
+                                continue
+                            except Exception as exc:
+                                print(f"[rollup] process pool submit failed, analyzing in-thread: {exc}")
+                                cpu_pool = None
+                        res = self._analyze_job(job, pt)
+                        finish(idx, error=str(res.get("error") or ""), scores=res.get("scores"))
+            finally:
+                if owned_pool is not None:
+                    owned_pool.shutdown(wait=True)
+
+        # Deterministic merge: coef set, then device, then test order, regardless of completion order.
+        # Rows are appended under the lock so concurrent batches for this plate type don't interleave.
+        store = self._store(pt)
+        errors_by_set: List[List[str]] = [[] for _ in coef_sets]
+        updated_by_set = [0 for _ in coef_sets]
+        unchanged_by_set = [0 for _ in coef_sets]
+        with _rollup_lock(pt):
+            rows: List[Dict[str, object]] = []
+            for ci, (coefs, coef_key) in enumerate(zip(coef_sets, coef_keys)):
+                errors = errors_by_set[ci]
+                for device_id, (_bias_map, errs) in zip(devices, bias_by_device):
+                    errors.extend(errs)
+                    for idx, job in enumerate(jobs):
+                        if job.coef_set != ci or job.device_id != device_id:
+                            continue
+                        if idx in job_errors:
+                            errors.append(job_errors[idx])
+                            continue
+                        res = results.get(idx)
+                        if not res:
+                            continue
+                        if res.get("unchanged"):
+                            unchanged_by_set[ci] += 1
+                            continue
+                        scores = res["scores"] or {}
+                        rows.append(
+                            {
+                                "plate_type": pt,
+                                "device_id": device_id,
+                                "device_type": str(scores.get("device_type") or pt),
+                                "coef_key": coef_key,
+                                "mode": str(mode or "legacy"),
+                                "coefs": {"x": float(coefs.get("x", 0.0)), "y": float(coefs.get("y", 0.0)), "z": float(coefs.get("z", 0.0))},
+                                "raw_csv": job.raw_csv,
+                                "temp_f": job.temp_f,
+                                "baseline_csv": job.baseline_path,
+                                "selected_csv": job.selected_path,
+                                "baseline": scores.get("baseline"),
+                                "selected": scores.get("selected"),
+                                "recorded_at_ms": res["recorded_at_ms"],
+                                "inputs": job.inputs,
+                            }
+                        )
+                        updated_by_set[ci] += 1
+            store.upsert(rows)
+        path = store.path
 
-            bias_cache = self._repo.load_temperature_bias_cache(device_id) or {}
-            bias_map = (bias_cache.get("bias_all") or bias_cache.get("bias")) if isinstance(bias_cache, dict) else None
-            if not isinstance(bias_map, list):
-                errors.append(f"{device_id}: bias cache missing bias map")
-                continue
+        out: List[Dict[str, object]] = []
+        for coef_key, errors, updated, unchanged in zip(coef_keys, errors_by_set, updated_by_set, unchanged_by_set):
+            msg = f"Batch run complete for type {pt} ({coef_key}; {updated} updated, {unchanged} unchanged)"
+            if errors:
+                msg = f"{msg} (with errors)"
+            out.append({"ok": True, "message": msg, "rollup_path": path, "errors": errors, "updated": updated, "unchanged": unchanged})
+        return out
 
-            # IMPORTANT: exclude room-temp baseline raw tests from rollup scoring.
-            # Those tests are used to *learn* the bias baseline and will make top-3 look artificially good.
-            tmin = float(getattr(config, "TEMP_BASELINE_ROOM_TEMP_MIN_F", 71.0))
-            tmax = float(getattr(config, "TEMP_BASELINE_ROOM_TEMP_MAX_F", 77.0))
+    def _device_bias_map(self, device_id: str, *, status_cb: Callable[[dict], None] | None = None) -> Tuple[Optional[list], List[str]]:
+        """Compute/validate the device's bias cache. Returns (bias_map or None, errors)."""
+        errors: List[str] = []
+        bias_res = self._bias.compute_and_store_bias_for_device(device_id=device_id, status_cb=status_cb)
+        if not bool((bias_res or {}).get("ok")):
+            errs = list((bias_res or {}).get("errors") or [])
+            msg = str((bias_res or {}).get("message") or "bias failed")
+            errors.append(f"{device_id}: bias baseline invalid: {msg}")
+            for e in errs:
+                errors.append(f"{device_id}: {e}")
+            return None, errors
+
+        bias_cache = self._repo.load_temperature_bias_cache(device_id) or {}
+        bias_map = (bias_cache.get("bias_all") or bias_cache.get("bias")) if isinstance(bias_cache, dict) else None
+        if not isinstance(bias_map, list):
+            errors.append(f"{device_id}: bias cache missing bias map")
+            return None, errors
+        return bias_map, errors
+
+    def _jobs_for_device(self, device_id: str, bias_map: list) -> List["_RollupJob"]:
+        # IMPORTANT: exclude room-temp baseline raw tests from rollup scoring.
+        # Those tests are used to *learn* the bias baseline and will make top-3 look artificially good.
+        tmin = float(getattr(config, "TEMP_BASELINE_ROOM_TEMP_MIN_F", 71.0))
+        tmax = float(getattr(config, "TEMP_BASELINE_ROOM_TEMP_MAX_F", 77.0))
+        try:
+            baseline_csvs = baseline_csvs_for_devices(repo=self._repo, device_ids=[device_id], min_temp_f=tmin, max_temp_f=tmax)
+        except Exception:
+            baseline_csvs = set()
+
+        jobs: List[_RollupJob] = []
+        for raw_csv in self._repo.list_temperature_tests(device_id):
+            if raw_csv in baseline_csvs:
+                continue
+            meta = self._repo.load_temperature_meta_for_csv(raw_csv)
+            if not meta:
+                continue  # only tests with meta
+            # Need a temperature for "2 temps per plate" eligibility later; use meta's temp if present.
+            temp_f = None
             try:
-                baseline_csvs = baseline_csvs_for_devices(repo=self._repo, device_ids=[device_id], min_temp_f=tmin, max_temp_f=tmax)
+                temp_f = self._repo.extract_temperature_f(meta)
             except Exception:
-                baseline_csvs = set()
-
-            tests = self._repo.list_temperature_tests(device_id)
-            for ti, raw_csv in enumerate(tests):
-                if raw_csv in baseline_csvs:
-                    continue
-                meta = self._repo.load_temperature_meta_for_csv(raw_csv)
-                if not meta:
-                    continue  # only tests with meta
-                # Need a temperature for "2 temps per plate" eligibility later; use meta's temp if present.
                 temp_f = None
-                try:
-                    temp_f = self._repo.extract_temperature_f(meta)
-                except Exception:
-                    temp_f = None
-
-                folder = os.path.dirname(raw_csv)
-                # IMPORTANT: room_temp_f is the *ideal reference temp*, not the test's measured temp.
-                room_temp_f = float(getattr(config, "TEMP_IDEAL_ROOM_TEMP_F", 76.0))
-
-                emit(
-                    {
-                        "status": "running",
-                        "message": f"{device_id}: processing {ti+1}/{len(tests)}",
-                        "progress": 5,
-                    }
+            jobs.append(
+                _RollupJob(
+                    device_id=device_id,
+                    raw_csv=raw_csv,
+                    meta=dict(meta),
+                    temp_f=temp_f,
+                    bias_map=bias_map,
+                    test_inputs=_test_inputs_hash(
+                        plate_type=_plate_type_from_device_id(device_id), bias_map=bias_map, meta=meta, temp_f=temp_f
+                    ),
                 )
+            )
+        return jobs
 
-                # If this coef set already exists for this test, skip processing and just analyze it.
-                try:
-                    details_existing = self._repo.get_temperature_test_details(raw_csv)
-                    proc_runs_existing = list(details_existing.get("processed_runs") or [])
-                except Exception:
-                    proc_runs_existing = []
-
-                baseline_path = ""
-                selected_path = ""
-                for r in proc_runs_existing:
-                    if r.get("is_baseline") and not baseline_path:
-                        baseline_path = str(r.get("path") or "")
-                        continue
-                    if r.get("is_baseline"):
-                        continue
-                    if _coef_key(str(r.get("mode") or "legacy"), dict(r.get("slopes") or {})) == coef_key:
-                        selected_path = str(r.get("path") or "")
-                        break
-
-                if baseline_path and selected_path and os.path.isfile(baseline_path) and os.path.isfile(selected_path):
-                    try:
-                        payload = self._analyzer.analyze_temperature_processed_runs(baseline_path, selected_path, meta)
-                    except Exception as exc:
-                        errors.append(f"{device_id}: analyze failed {os.path.basename(raw_csv)}: {exc}")
-                        continue
-                else:
-                    try:
-                        # Ensure baseline off exists; run full processing to create the on-variant for this coef set.
-                        self._processing.run_temperature_processing(
-                            folder=folder,
-                            device_id=device_id,
-                            csv_path=raw_csv,
-                            slopes=coefs,
-                            room_temp_f=room_temp_f,
-                            mode=str(mode or "legacy"),
-                            status_cb=status_cb,
-                        )
-                    except Exception as exc:
-                        errors.append(f"{device_id}: failed processing {os.path.basename(raw_csv)}: {exc}")
-                        continue
+    def _ensure_test_baseline(self, job: "_RollupJob", mode: str) -> str:
+        """Make sure the test's trimmed CSV and OFF baseline exist. Returns '' or an error message."""
+        try:
+            paths = self._repo.derive_temperature_paths(job.raw_csv, job.device_id, str(mode or "legacy"))
+        except Exception:
+            return ""  # unexpected file name: the per-job processing reports it
+        folder = os.path.dirname(job.raw_csv)
+        if not (os.path.isfile(paths["trimmed"]) and os.path.isfile(os.path.join(folder, paths["processed_off_name"]))):
+            try:
+                self._processing.ensure_temp_off_processed(
+                    folder=folder,
+                    device_id=job.device_id,
+                    csv_path=job.raw_csv,
+                    room_temp_f=float(getattr(config, "TEMP_IDEAL_ROOM_TEMP_F", 76.0)),
+                )
+            except Exception as exc:
+                return f"{job.device_id}: failed baseline processing {os.path.basename(job.raw_csv)}: {exc}"
+        # Every coef set sends the trimmed CSV with sanitize_header=True (its headers keep the raw
+        # padding); build that sanitized copy here so the fanned-out jobs only ever reuse it.
+        try:
+            sanitized_csv_for_backend(paths["trimmed"], folder)
+        except Exception:
+            pass  # each backend call sanitizes (or falls back to the trimmed CSV) on its own
+        return ""
 
-                    # Resolve processed paths from meta (authoritative).
-                    details = self._repo.get_temperature_test_details(raw_csv)
-                    proc_runs = list(details.get("processed_runs") or [])
-                    for r in proc_runs:
-                        if r.get("is_baseline"):
-                            baseline_path = str(r.get("path") or "")
-                            break
-                    for r in proc_runs:
-                        if r.get("is_baseline"):
-                            continue
-                        if _coef_key(str(r.get("mode") or "legacy"), dict(r.get("slopes") or {})) == coef_key:
-                            selected_path = str(r.get("path") or "")
-                            break
-                    if not baseline_path or not selected_path:
-                        errors.append(f"{device_id}: missing processed paths after processing: {os.path.basename(raw_csv)}")
-                        continue
+    def _prepare_job(
+        self,
+        job: "_RollupJob",
+        mode: str,
+        plate_type: str,
+        analyze_inline: bool,
+        emit: Callable[[dict], None],
+    ) -> Dict[str, object]:
+        """
+        I/O stage for one test: make sure off/on processed CSVs exist for the coef set.
 
-                    # Analyze baseline(off) vs selected(on).
-                    try:
-                        payload = self._analyzer.analyze_temperature_processed_runs(baseline_path, selected_path, meta)
-                    except Exception as exc:
-                        errors.append(f"{device_id}: analyze failed {os.path.basename(raw_csv)}: {exc}")
-                        continue
-                    # end else (processing path)
-
-                grid = dict(payload.get("grid") or {})
-                device_type = str(grid.get("device_type") or pt)
-                body_weight_n = float((payload.get("meta") or {}).get("body_weight_n") or 0.0)
-                baseline_scores = {
-                    k: score_run_against_bias(
-                        run_data=payload.get("baseline") or {},
-                        stage_key=k,
-                        device_type=device_type,
-                        body_weight_n=body_weight_n,
-                        bias_map=bias_map,
-                    )
-                    for k in ("all", "db", "bw")
-                }
-                selected_scores = {
-                    k: score_run_against_bias(
-                        run_data=payload.get("selected") or {},
-                        stage_key=k,
-                        device_type=device_type,
-                        body_weight_n=body_weight_n,
-                        bias_map=bias_map,
-                    )
-                    for k in ("all", "db", "bw")
-                }
+        Returns {baseline_path, selected_path}, {error}, {unchanged} when the stored row
+        was scored from the same inputs, or (when analyze_inline) {scores}.
+        """
+        name = os.path.basename(job.raw_csv)
+
+        # If this coef set already exists for this test, skip processing and just analyze it
+        # (or skip it entirely when nothing it was scored from has changed).
+        baseline_path, selected_path = self._processed_paths_for(job.raw_csv, job.coef_key)
+        if baseline_path and selected_path and os.path.isfile(baseline_path) and os.path.isfile(selected_path):
+            job.inputs = self._job_inputs(job, baseline_path, selected_path)
+            prev = self._store(plate_type).get((job.coef_key, job.device_id, job.raw_csv))
+            if prev is not None and str(prev.get("inputs") or "") == job.inputs:
+                return {"unchanged": True}
+        else:
+            emit({"status": "running", "message": f"{job.device_id}: processing {name}", "progress": 5})
 
-                row = {
-                    "plate_type": pt,
-                    "device_id": device_id,
-                    "device_type": device_type,
-                    "coef_key": coef_key,
-                    "mode": str(mode or "legacy"),
-                    "coefs": {"x": float(coefs.get("x", 0.0)), "y": float(coefs.get("y", 0.0)), "z": float(coefs.get("z", 0.0))},
-                    "raw_csv": raw_csv,
-                    "temp_f": temp_f,
-                    "baseline_csv": baseline_path,
-                    "selected_csv": selected_path,
-                    "baseline": baseline_scores,
-                    "selected": selected_scores,
-                    "recorded_at_ms": int(time.time() * 1000),
-                }
-                k_existing = (coef_key, device_id, raw_csv)
-                if k_existing in existing_idx:
-                    runs[existing_idx[k_existing]] = row
-                else:
-                    existing_idx[k_existing] = len(runs)
-                    runs.append(row)
+            def sub_status(p: dict) -> None:
+                # Per-test "completed" must not read as the whole batch finishing.
+                p = dict(p or {})
+                if p.get("status") == "completed":
+                    p["status"] = "running"
+                p["message"] = f"{job.device_id} {name}: {p.get('message') or ''}"
+                p.pop("progress", None)
+                emit(p)
 
-        rollup["version"] = 1
-        rollup["plate_type"] = pt
-        rollup["updated_at_ms"] = int(time.time() * 1000)
-        rollup["runs"] = runs
-        path = self.save_rollup(pt, rollup)
+            try:
+                # Ensure baseline off exists; run full processing to create the on-variant for this coef set.
+                # IMPORTANT: room_temp_f is the *ideal reference temp*, not the test's measured temp.
+                self._processing.run_temperature_processing(
+                    folder=os.path.dirname(job.raw_csv),
+                    device_id=job.device_id,
+                    csv_path=job.raw_csv,
+                    slopes=job.coefs,
+                    room_temp_f=float(getattr(config, "TEMP_IDEAL_ROOM_TEMP_F", 76.0)),
+                    mode=str(mode or "legacy"),
+                    status_cb=sub_status,
+                )
+            except Exception as exc:
+                return {"error": f"{job.device_id}: failed processing {name}: {exc}"}
+
+            # Resolve processed paths from meta (authoritative).
+            baseline_path, selected_path = self._processed_paths_for(job.raw_csv, job.coef_key, strict=True)
+            if not baseline_path or not selected_path:
+                return {"error": f"{job.device_id}: missing processed paths after processing: {name}"}
+            job.inputs = self._job_inputs(job, baseline_path, selected_path)
+
+        if analyze_inline:
+            job.baseline_path = baseline_path
+            job.selected_path = selected_path
+            return self._analyze_job(job, plate_type)
+        return {"baseline_path": baseline_path, "selected_path": selected_path}
+
+    def _job_inputs(self, job: "_RollupJob", baseline_path: str, selected_path: str) -> str:
+        """Fingerprint of everything a rollup row is scored from (stored as row["inputs"])."""
+        sig = f"{job.test_inputs}|{baseline_path}={_file_sig(baseline_path)}|{selected_path}={_file_sig(selected_path)}"
+        return hashlib.sha1(sig.encode("utf-8")).hexdigest()
+
+    def _processed_paths_for(self, raw_csv: str, coef_key: str, *, strict: bool = False) -> Tuple[str, str]:
+        """(baseline off path, selected on path) recorded in the test's meta for coef_key ('' when absent)."""
+        try:
+            details = self._repo.get_temperature_test_details(raw_csv)
+            proc_runs = list(details.get("processed_runs") or [])
+        except Exception:
+            if strict:
+                raise
+            proc_runs = []
+        baseline_path = ""
+        selected_path = ""
+        for r in proc_runs:
+            if r.get("is_baseline"):
+                baseline_path = baseline_path or str(r.get("path") or "")
+                continue
+            if not selected_path and _coef_key(str(r.get("mode") or "legacy"), dict(r.get("slopes") or {})) == coef_key:
+                selected_path = str(r.get("path") or "")
+        return baseline_path, selected_path
 
-        msg = f"Batch run complete for type {pt} ({coef_key})"
-        if errors:
-            msg = f"{msg} (with errors)"
-        return {"ok": True, "message": msg, "rollup_path": path, "errors": errors}
+    def _analyze_job(self, job: "_RollupJob", plate_type: str) -> Dict[str, object]:
+        """CPU stage run in the calling thread (process pool disabled or unavailable)."""
+        try:
+            payload = self._analyzer.analyze_temperature_processed_runs(job.baseline_path, job.selected_path, job.meta)
+        except Exception as exc:
+            return {"error": f"{job.device_id}: analyze failed {os.path.basename(job.raw_csv)}: {exc}"}
+        return {"scores": score_payload(payload, plate_type=plate_type, bias_map=job.bias_map)}
 
     def top3_for_plate_type(self, plate_type: str, *, sort_by: str = "mean_abs") -> List[Dict[str, object]]:
         """
@@ -356,20 +600,19 @@ class TemperatureCoefRollupService:
           - mean of selected/all mean_abs across included runs
         """
         pt = str(plate_type or "").strip()
-        rollup = self.load_rollup(pt)
-        runs = list(rollup.get("runs") or [])
+        store = self._store(pt)
 
         # Filter out room-temp baseline raw tests (even if they exist in an older rollup file).
+        # Group rows are cached in the store and only recomputed when this set or the group changes.
+        baseline_csvs: set = set()
         try:
             tmin = float(getattr(config, "TEMP_BASELINE_ROOM_TEMP_MIN_F", 71.0))
             tmax = float(getattr(config, "TEMP_BASELINE_ROOM_TEMP_MAX_F", 77.0))
-            devs = {str(r.get("device_id") or "") for r in runs if str(r.get("device_id") or "")}
+            devs = {d for d in store.device_ids() if d}
             baseline_csvs = baseline_csvs_for_devices(repo=self._repo, device_ids=devs, min_temp_f=tmin, max_temp_f=tmax)
-            if baseline_csvs:
-                runs = [r for r in runs if str(r.get("raw_csv") or "") not in baseline_csvs]
         except Exception:
             pass
-        return top3_rows_for_plate_type(runs=runs, sort_by=str(sort_by or "mean_abs"))
+        return store.top3(sort_by=str(sort_by or "mean_abs"), exclude_raw_csvs=baseline_csvs)
 
     def aggregate_selected_all_mean_signed(self, plate_type: str, *, coef_key: str) -> Optional[dict]:
         """
@@ -379,9 +622,7 @@ class TemperatureCoefRollupService:
         pt = str(plate_type or "").strip()
         if not pt:
             return None
-        rollup = self.load_rollup(pt)
-        runs = list(rollup.get("runs") or [])
-        return aggregate_mean_signed_for_coef_key(runs=runs, coef_key=str(coef_key or ""))
+        return self._store(pt).mean_signed(str(coef_key or ""))
 
     def list_existing_unified_candidates(
         self,
@@ -400,16 +641,10 @@ class TemperatureCoefRollupService:
         if not pt:
             return []
         m = str(mode or "scalar").strip().lower()
-        rollup = self.load_rollup(pt)
-        runs = list(rollup.get("runs") or [])
 
         # Collect unique coef_keys for this mode that appear in the rollup.
         keys = set()
-        for r in runs:
-            try:
-                ck = str(r.get("coef_key") or "")
-            except Exception:
-                continue
+        for ck in self._store(pt).coef_keys():
             if not ck:
                 continue
             parsed = parse_coef_key(ck)
@@ -0,0 +1,210 @@
+"""
+Linear-response shortcut for scalar-mode temperature correction.
+
+In scalar mode the backend scales every raw sensor channel by
+
+    sf = 1 + (t_sensor - room_temp_f) * c_axis
+
+before the NN. Sensor temperatures come from the row's average temperature, so every
+sensor in a row gets the same factor. If the NN responds linearly to a uniform input
+scale, the corrected output is the temperature-off output times
+
+    scale = 1 + gain * c_axis * (t_row - room_temp_f)
+
+so one OFF backend run is enough to derive the output for any (cx, cy, cz). `gain` is
+the NN's effective response to input scaling (1.0 = perfectly linear; the gain-analysis
+tool measures it per device). The shortcut is only valid for `mode == "scalar"`.
+
+TEMP_LINEAR_RESPONSE_MODE selects how callers use it:
+  "off"       always call the backend
+  "on"        derive candidate outputs locally from the OFF run
+  "validate"  call the backend, and also compare its output with the shortcut
+              (`compare_with_backend`) so the approximation can be checked on real data
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .. import config
+
+AXES = ("x", "y", "z")
+_SUM_COLUMNS = {a: (f"sum-{a}", f"sum_{a}") for a in AXES}
+_TEMP_COLUMNS = ("sum-t", "sum_t", "avgTemperatureF", "temp_f")
+
+
+def response_mode() -> str:
+    m = str(getattr(config, "TEMP_LINEAR_RESPONSE_MODE", "off") or "off").strip().lower()
+    return m if m in ("off", "on", "validate") else "off"
+
+
+def _float_or_nan(cell: str) -> float:
+    try:
+        return float(cell)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class _Table:
+    """Raw rows of a backend output CSV (kept verbatim so a candidate can be rewritten from them)."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "r", encoding="utf-8", newline="") as handle:
+            # No skipinitialspace: cells are written back as read; float() ignores the padding.
+            reader = csv.reader(handle)
+            self.header = list(next(reader, []))
+            self.rows: List[List[str]] = [r for r in reader if r]
+        self._lower: Dict[str, int] = {}
+        for i, h in enumerate(self.header):
+            self._lower.setdefault(str(h or "").lstrip("\ufeff").strip().lower(), i)
+
+    def find(self, names: Tuple[str, ...]) -> Optional[int]:
+        for name in names:
+            if name.lower() in self._lower:
+                return self._lower[name.lower()]
+        return None
+
+    def values(self, idx: int) -> np.ndarray:
+        return np.fromiter(
+            (_float_or_nan(r[idx]) if idx < len(r) else float("nan") for r in self.rows),
+            dtype=np.float64,
+            count=len(self.rows),
+        )
+
+    def sums(self) -> Dict[str, Tuple[int, np.ndarray]]:
+        out = {}
+        for axis in AXES:
+            idx = self.find(_SUM_COLUMNS[axis])
+            if idx is not None:
+                out[axis] = (idx, self.values(idx))
+        return out
+
+
+class LinearResponse:
+    """Candidate scalar-mode outputs derived from one temperature-off backend output."""
+
+    def __init__(
+        self,
+        off_csv_path: str,
+        *,
+        room_temp_f: float,
+        temp_f: Optional[float] = None,
+        gain: Optional[float] = None,
+    ) -> None:
+        self.off_csv_path = str(off_csv_path)
+        self.room_temp_f = float(room_temp_f)
+        self.gain = float(gain if gain is not None else getattr(config, "TEMP_LINEAR_RESPONSE_GAIN", 1.0))
+
+        table = _Table(self.off_csv_path)
+        self._header = table.header
+        self._rows = table.rows
+        sums = table.sums()
+        if not sums:
+            raise ValueError(f"{self.off_csv_path}: no sum-x/y/z columns")
+        self._sum_idx: Dict[str, int] = {axis: idx for axis, (idx, _v) in sums.items()}
+        self.off_sums: Dict[str, np.ndarray] = {axis: v for axis, (_idx, v) in sums.items()}
+
+        t_idx = table.find(_TEMP_COLUMNS)
+        temps = table.values(t_idx) if t_idx is not None else np.full(len(self._rows), np.nan)
+        if temp_f is not None:
+            temps = np.where(np.isfinite(temps), temps, float(temp_f))
+        if not np.isfinite(temps).any():
+            raise ValueError(f"{self.off_csv_path}: no temperature column and no temp_f given")
+        # Rows without a temperature keep the OFF value (zero sensitivity).
+        self.sensitivity = np.where(np.isfinite(temps), temps - self.room_temp_f, 0.0)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self._rows)
+
+    def scale(self, coeffs: Dict[str, float], axis: str) -> np.ndarray:
+        c = float((coeffs or {}).get(axis, 0.0) or 0.0)
+        return 1.0 + self.gain * c * self.sensitivity
+
+    def sums(self, coeffs: Dict[str, float]) -> Dict[str, np.ndarray]:
+        """Predicted corrected sum-{axis} columns for `coeffs` (NaN where the OFF cell was not a number)."""
+        return {axis: off * self.scale(coeffs, axis) for axis, off in self.off_sums.items()}
+
+    def write_candidate_csv(self, coeffs: Dict[str, float], dest_path: str) -> str:
+        """Write the OFF output with sum-x/y/z replaced by the predicted corrected values; every other cell is copied as is."""
+        predicted = {axis: v.tolist() for axis, v in self.sums(coeffs).items()}
+        cols = [(self._sum_idx[a], predicted[a]) for a in self._sum_idx]
+        os.makedirs(os.path.dirname(os.path.abspath(dest_path)) or ".", exist_ok=True)
+        tmp = f"{dest_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+        with open(tmp, "w", encoding="utf-8", newline="") as handle:
+            w = csv.writer(handle, lineterminator="\n")
+            w.writerow(self._header)
+            for i, row in enumerate(self._rows):
+                out = list(row)
+                for idx, vals in cols:
+                    v = vals[i]
+                    if idx < len(out) and v == v:
+                        out[idx] = f"{v:.6f}"
+                w.writerow(out)
+        os.replace(tmp, dest_path)
+        return dest_path
+
+    def compare_with_backend(self, coeffs: Dict[str, float], backend_csv_path: str) -> Dict[str, object]:
+        """
+        Shortcut vs a real backend output for the same coefficients (validation mode).
+
+        Rows are matched by position. Per axis: relative RMS error of the predicted sum
+        against the backend's, the largest absolute error, and the gain that would best
+        explain the backend's response (least squares over rows).
+        """
+        other = _Table(backend_csv_path)
+        backend_sums = other.sums()
+        n = min(self.n_rows, len(other.rows))
+        out: Dict[str, object] = {"coeffs": dict(coeffs or {}), "rows": int(n), "row_mismatch": int(abs(self.n_rows - len(other.rows)))}
+        predicted = self.sums(coeffs)
+        for axis, pred in predicted.items():
+            if axis not in backend_sums:
+                continue
+            actual = backend_sums[axis][1]
+            p, a, off = pred[:n], actual[:n], self.off_sums[axis][:n]
+            ok = np.isfinite(p) & np.isfinite(a)
+            if not ok.any():
+                continue
+            err = p[ok] - a[ok]
+            denom = float(np.sqrt(np.mean(a[ok] ** 2))) or 1.0
+            x = off[ok] * float((coeffs or {}).get(axis, 0.0) or 0.0) * self.sensitivity[:n][ok]
+            xx = float(x @ x)
+            out[axis] = {
+                "rel_rms_error": float(np.sqrt(np.mean(err**2))) / denom,
+                "max_abs_error": float(np.max(np.abs(err))),
+                "fitted_gain": (float(x @ (a[ok] - off[ok])) / xx) if xx > 0.0 else None,
+            }
+        return out
+
+
+_models: Dict[Tuple[str, int, int, float, Optional[float], float], LinearResponse] = {}
+_models_lock = threading.Lock()
+
+
+def linear_response_for(off_csv_path: str, *, room_temp_f: float, temp_f: Optional[float] = None) -> Optional[LinearResponse]:
+    """Memoized model for an OFF output (keyed on path + mtime/size); None if it cannot be built."""
+    try:
+        st = os.stat(off_csv_path)
+    except OSError:
+        return None
+    gain = float(getattr(config, "TEMP_LINEAR_RESPONSE_GAIN", 1.0))
+    key = (os.path.abspath(off_csv_path), int(st.st_mtime_ns), int(st.st_size), float(room_temp_f), temp_f, gain)
+    with _models_lock:
+        hit = _models.get(key)
+    if hit is not None:
+        return hit
+    try:
+        model = LinearResponse(off_csv_path, room_temp_f=room_temp_f, temp_f=temp_f, gain=gain)
+    except Exception as exc:
+        print(f"[linear_response] cannot model {off_csv_path}: {exc}")
+        return None
+    with _models_lock:
+        if len(_models) > 16:
+            _models.clear()
+        _models[key] = model
+    return model
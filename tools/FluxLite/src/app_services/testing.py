@@ -51,6 +51,17 @@ class TestingService(QtCore.QObject):
         self.session_manager.session_ended.connect(self.session_ended.emit)
         self.session_manager.stage_changed.connect(self.stage_changed.emit)
         self.session_manager.cell_updated.connect(self.cell_updated.emit)
+        # Discrete temp sessions buffer named per-sensor samples, which only the dict stream carries.
+        self.session_manager.session_started.connect(self._sync_discrete_stream_format)
+        self.session_manager.session_ended.connect(lambda _s: self._sync_discrete_stream_format(None))
+
+    def _sync_discrete_stream_format(self, session: Optional[TestSession]) -> None:
+        if self._hardware is None:
+            return
+        try:
+            self._hardware.hold_dict_stream("discrete_temp", bool(session is not None and session.is_discrete_temp))
+        except Exception:
+            pass
 
     # --- Session Management Delegates ---
 
@@ -182,6 +193,21 @@ class TestingService(QtCore.QObject):
             status_cb=self.processing_status.emit,
         )
 
+    def run_temperature_coef_sets_across_plate_type(
+        self,
+        *,
+        plate_type: str,
+        coef_sets: List[dict],
+        mode: str,
+    ) -> List[Dict[str, object]]:
+        """Run several coef sets in one batch (shared bias + worker pools); one result per set."""
+        return self._temp_rollup.run_coef_sets_across_plate_type(
+            plate_type=plate_type,
+            coef_sets=list(coef_sets or []),
+            mode=mode,
+            status_cb=self.processing_status.emit,
+        )
+
     def top3_temperature_coefs_for_plate_type(self, plate_type: str, *, sort_by: str = "mean_abs") -> List[Dict[str, object]]:
         return self._temp_rollup.top3_for_plate_type(plate_type, sort_by=str(sort_by or "mean_abs"))
 
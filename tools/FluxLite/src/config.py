@@ -7,11 +7,64 @@ from typing import Tuple
 SOCKET_HOST: str = os.environ.get("SOCKET_HOST", "http://localhost")
 SOCKET_PORT: int = int(os.environ.get("SOCKET_PORT", "3000"))
 HTTP_PORT: int = int(os.environ.get("HTTP_PORT", "3001"))
+# Auto-connect to the backend on startup (offline replay/benchmarks turn this off)
+AUTO_CONNECT: bool = bool(int(os.environ.get("AUTO_CONNECT", "1")))
 UI_TICK_HZ: int = int(os.environ.get("UI_TICK_HZ", "60"))
+# simpleJsonData msgpack frames arriving within this window are delivered as one batch (0 = per frame)
+SOCKET_BATCH_WINDOW_MS: float = float(os.environ.get("SOCKET_BATCH_WINDOW_MS", "0"))
+SOCKET_BATCH_MAX_FRAMES: int = int(os.environ.get("SOCKET_BATCH_MAX_FRAMES", "256"))
+# Negotiate the packed binary live stream (axf-f32-v1) on connect; backends without support keep sending dicts
+LIVE_STREAM_BINARY: bool = bool(int(os.environ.get("LIVE_STREAM_BINARY", "1")))
+# Live frame store: samples retained per device (~16 s at 500 Hz)
+LIVE_FRAME_STORE_CAPACITY: int = int(os.environ.get("LIVE_FRAME_STORE_CAPACITY", "8192"))
+# Live pipeline profiler (per-stage timings, queue depths, frame age); also togglable from the debug panel
+LIVE_PROFILING_ENABLED: bool = bool(int(os.environ.get("LIVE_PROFILING_ENABLED", "0")))
+# Rolling window the profiler histograms cover
+LIVE_PROFILING_WINDOW_S: float = float(os.environ.get("LIVE_PROFILING_WINDOW_S", "60"))
 PLOT_AUTOSCALE_DAMP_ENABLED: bool = bool(int(os.environ.get("PLOT_AUTOSCALE_DAMP_ENABLED", "1")))
 PLOT_AUTOSCALE_DAMP_EVERY_N: int = int(os.environ.get("PLOT_AUTOSCALE_DAMP_EVERY_N", "2"))
 # Plot backend: 1=use pyqtgraph for live force plot (fallback to painter if unavailable)
 USE_PYQTGRAPH_FORCE_PLOT: bool = bool(int(os.environ.get("USE_PYQTGRAPH_FORCE_PLOT", "1")))
+# Live force plot: visible time window, samples kept per series, and repaint cap (also limited by the screen refresh rate)
+PLOT_WINDOW_MS: int = int(os.environ.get("PLOT_WINDOW_MS", "10000"))
+PLOT_BUFFER_CAPACITY: int = int(os.environ.get("PLOT_BUFFER_CAPACITY", "16384"))
+PLOT_MAX_FPS: float = float(os.environ.get("PLOT_MAX_FPS", "60"))
+
+# Columnar CSV cache for processed runs (NPZ per CSV keyed on path/mtime/size), LRU-trimmed to the
+# byte/entry budget. Empty dir = <user cache dir>/csv_cache (see project_paths.user_cache_root)
+CSV_CACHE_ENABLED: bool = bool(int(os.environ.get("CSV_CACHE_ENABLED", "1")))
+CSV_CACHE_DIR: str = os.environ.get("CSV_CACHE_DIR", "").strip()
+CSV_CACHE_MAX_MB: float = float(os.environ.get("CSV_CACHE_MAX_MB", "2048"))
+CSV_CACHE_MAX_ENTRIES: int = int(os.environ.get("CSV_CACHE_MAX_ENTRIES", "2000"))
+# Writes between full directory walks while the in-memory size estimate stays under budget (0 = only when over).
+CSV_CACHE_TRIM_EVERY_N: int = int(os.environ.get("CSV_CACHE_TRIM_EVERY_N", "256"))
+
+# CSV downsampling (the 50 Hz trim before backend processing, and batch conversion of capture folders).
+# Strategy: decimate (legacy first-row-after-interval) | mean | fir (anti-aliased) | envelope (min/max of sum-z).
+CSV_DOWNSAMPLE_STRATEGY: str = os.environ.get("CSV_DOWNSAMPLE_STRATEGY", "decimate").strip().lower()
+CSV_DOWNSAMPLE_CHUNK_ROWS: int = int(os.environ.get("CSV_DOWNSAMPLE_CHUNK_ROWS", "65536"))
+# Processes for whole-directory conversion (0 = convert in the calling thread).
+CSV_DOWNSAMPLE_WORKERS: int = int(os.environ.get("CSV_DOWNSAMPLE_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) - 1)))))
+
+# OneDrive data sync: files copied / merged concurrently (I/O bound), and whether the per-root
+# manifest (.aflite/sync_manifest.json) may skip files unchanged on both sides since the last sync.
+DATA_SYNC_WORKERS: int = int(os.environ.get("DATA_SYNC_WORKERS", "4"))
+DATA_SYNC_MANIFEST_ENABLED: bool = bool(int(os.environ.get("DATA_SYNC_MANIFEST_ENABLED", "1")))
+
+# Content-addressed cache of backend process-csv outputs (input bytes + device/mode/coefs/room temp),
+# shared by every processing flow; LRU-trimmed to the byte/entry budget. Empty dir = <user cache dir>/processed_cache
+PROCESSED_CACHE_ENABLED: bool = bool(int(os.environ.get("PROCESSED_CACHE_ENABLED", "1")))
+PROCESSED_CACHE_DIR: str = os.environ.get("PROCESSED_CACHE_DIR", "").strip()
+PROCESSED_CACHE_MAX_MB: float = float(os.environ.get("PROCESSED_CACHE_MAX_MB", "4096"))
+PROCESSED_CACHE_MAX_ENTRIES: int = int(os.environ.get("PROCESSED_CACHE_MAX_ENTRIES", "5000"))
+# Backend identity folded into every cache key, so outputs from another backend/NN build are never served:
+# an explicit version string, else the git HEAD of the backend checkout (empty dir = <repo>/fluxdeluxe/DynamoDeluxe).
+PROCESSED_CACHE_BACKEND_VERSION: str = os.environ.get("PROCESSED_CACHE_BACKEND_VERSION", "").strip()
+PROCESSED_CACHE_BACKEND_DIR: str = os.environ.get("PROCESSED_CACHE_BACKEND_DIR", "").strip()
+
+# SQLite index of the temp_testing tree (tests, meta, processed outputs) kept in .aflite/meta.db;
+# refreshed by directory/file mtime. 0 = crawl the disk on every listing call.
+TEMP_TEST_INDEX_ENABLED: bool = bool(int(os.environ.get("TEMP_TEST_INDEX_ENABLED", "1")))
 
 # Optional embedded tools (Streamlit)
 # Provide a path to a Streamlit entrypoint, e.g.:
@@ -192,6 +245,54 @@ TEMP_BASELINE_ROOM_TEMP_MAX_F: float = 77.0
 # This should NOT be the measured test temperature; it's the reference/anchor temperature.
 TEMP_IDEAL_ROOM_TEMP_F: float = 76.0
 
+# Temperature Testing: batch rollup parallelism. I/O workers drive backend processing (HTTP);
+# CPU workers analyze processed CSVs in separate processes (0 = analyze in the I/O threads).
+TEMP_ROLLUP_IO_WORKERS: int = int(os.environ.get("TEMP_ROLLUP_IO_WORKERS", "4"))
+TEMP_ROLLUP_CPU_WORKERS: int = int(os.environ.get("TEMP_ROLLUP_CPU_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) - 1)))))
+# Room-temp baselines processed + analyzed concurrently when (re)computing a device's bias map.
+TEMP_BIAS_WORKERS: int = int(os.environ.get("TEMP_BIAS_WORKERS", "4"))
+# Unified coef auto search: candidates evaluated per round (k-section / speculative bracketing).
+# 1 = sequential bisection.
+TEMP_AUTO_SEARCH_PARALLEL_K: int = int(os.environ.get("TEMP_AUTO_SEARCH_PARALLEL_K", "3"))
+# Discrete temp tuning (pair sweep / local refine): backend candidate runs kept in flight at once.
+# 1 = evaluate candidates one at a time.
+TUNING_MAX_IN_FLIGHT: int = int(os.environ.get("TUNING_MAX_IN_FLIGHT", "4"))
+
+# Backend HTTP client (infra.http_client): one keep-alive connection pool shared by every backend
+# REST call. The pool covers the widest concurrent caller above plus headroom for UI requests.
+HTTP_POOL_MAXSIZE: int = int(os.environ.get(
+    "HTTP_POOL_MAXSIZE",
+    str(max(TEMP_ROLLUP_IO_WORKERS, TEMP_BIAS_WORKERS, TUNING_MAX_IN_FLIGHT, TEMP_AUTO_SEARCH_PARALLEL_K) + 2),
+))
+# Connect timeout is separate from the (per-endpoint) read timeout so a dead backend fails fast.
+HTTP_CONNECT_TIMEOUT_S: float = float(os.environ.get("HTTP_CONNECT_TIMEOUT_S", "3.05"))
+# Retries for failures that are safe to repeat (connection refused/reset before the request was
+# sent; for GETs also read timeouts and 502/503/504), with full-jitter exponential backoff.
+HTTP_RETRIES: int = int(os.environ.get("HTTP_RETRIES", "2"))
+HTTP_RETRY_BACKOFF_S: float = float(os.environ.get("HTTP_RETRY_BACKOFF_S", "0.25"))
+# Read timeout by request path when the caller does not pass one (default otherwise).
+HTTP_DEFAULT_TIMEOUT_S: float = 30.0
+HTTP_ENDPOINT_TIMEOUTS_S = {
+    "/api/device/process-csv": 300.0,
+    "/api/get-groups": 10.0,
+}
+# Surrogate pruning: skip candidates whose quadratic-fit lower bound (mean - Z * stderr) is worse
+# than (1 + MARGIN) * best. Needs MIN_POINTS scored runs; every AUDIT_EVERY-th prune is run anyway.
+TUNING_SURROGATE_ENABLED: bool = bool(int(os.environ.get("TUNING_SURROGATE_ENABLED", "1")))
+TUNING_SURROGATE_MIN_POINTS: int = int(os.environ.get("TUNING_SURROGATE_MIN_POINTS", "20"))
+TUNING_SURROGATE_MARGIN: float = float(os.environ.get("TUNING_SURROGATE_MARGIN", "0.25"))
+TUNING_SURROGATE_Z: float = float(os.environ.get("TUNING_SURROGATE_Z", "2.0"))
+TUNING_SURROGATE_AUDIT_EVERY: int = int(os.environ.get("TUNING_SURROGATE_AUDIT_EVERY", "10"))
+# Scalar-mode linear-response shortcut (see app_services/temperature_linear_response.py):
+# "off" = always call the backend, "on" = derive candidates from the OFF run, "validate" = call the
+# backend and record the shortcut's error. GAIN is the NN's response to input scaling (gain analysis).
+TEMP_LINEAR_RESPONSE_MODE: str = os.environ.get("TEMP_LINEAR_RESPONSE_MODE", "off").strip().lower()
+TEMP_LINEAR_RESPONSE_GAIN: float = float(os.environ.get("TEMP_LINEAR_RESPONSE_GAIN", "1.0"))
+# Shortcut candidate CSVs, LRU-trimmed to the byte/entry budget. Empty dir = <user cache dir>/linear_response
+TEMP_LINEAR_RESPONSE_CACHE_DIR: str = os.environ.get("TEMP_LINEAR_RESPONSE_CACHE_DIR", "").strip()
+TEMP_LINEAR_RESPONSE_CACHE_MAX_MB: float = float(os.environ.get("TEMP_LINEAR_RESPONSE_CACHE_MAX_MB", "2048"))
+TEMP_LINEAR_RESPONSE_CACHE_MAX_ENTRIES: int = int(os.environ.get("TEMP_LINEAR_RESPONSE_CACHE_MAX_ENTRIES", "2000"))
+
 # Temperature Testing: post-processing correction reference force (N).
 TEMP_POST_CORRECTION_FREF_N: float = 550.0
 
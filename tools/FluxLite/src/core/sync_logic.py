@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 import os
 import shutil
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from .. import config
 
 
 def _repo_root() -> str:
@@ -79,10 +83,154 @@ def _collect_csvs(base_dir: str) -> Dict[str, str]:
     return _collect_files(base_dir, (".csv",))
 
 
+class _UnorderedCsv(Exception):
+    """A CSV is not ordered by a parseable 'time' column; the streaming merge does not apply."""
+
+
+def _csv_header(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return [h.strip() for h in next(csv.reader([f.readline()]), [])]
+
+
+def _iter_timed_rows(path: str, fieldnames: List[str]):
+    """Yield (time, row tuple in `fieldnames` order) for a CSV, raising _UnorderedCsv if time goes backwards."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        header = [h.strip() for h in next(csv.reader([f.readline()]), [])]
+        pos = {h: i for i, h in enumerate(header)}  # duplicate names: last column wins, as with DictReader
+        if "time" not in pos:
+            raise _UnorderedCsv(path)
+        t_idx = pos["time"]
+        idx = [pos.get(h, -1) for h in fieldnames]
+        width = len(fieldnames)
+        same_layout = idx == list(range(width))
+        last = float("-inf")
+        for row in csv.reader(f):
+            if not row:
+                continue
+            try:
+                t = float(row[t_idx])
+            except (IndexError, ValueError):
+                raise _UnorderedCsv(path)
+            if not t >= last:  # also rejects NaN
+                raise _UnorderedCsv(path)
+            last = t
+            if same_layout and len(row) == width:
+                yield t, tuple(row)
+            else:
+                yield t, tuple(row[i] if 0 <= i < len(row) else "" for i in idx)
+
+
+def _install(src_tmp: str, dest: str, *, move: bool) -> None:
+    """Put `src_tmp`'s content at `dest` atomically, keeping the previous file as dest.bak."""
+    staged = src_tmp
+    if not move:
+        staged = dest + ".tmp"
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copyfile(src_tmp, staged)
+    if os.path.exists(dest):
+        bak = dest + ".bak"
+        try:
+            if os.path.lexists(bak):
+                os.remove(bak)
+            os.link(dest, bak)  # the old inode survives the replace below; no data copied
+        except Exception:
+            try:
+                shutil.copy2(dest, bak)
+            except Exception:
+                pass
+    os.replace(staged, dest)
+
+
+def _merge_csv_streaming(local_path: str, remote_path: str) -> bool:
+    """
+    Two-pointer merge of two time-ordered CSVs into one temp file, installed on both sides.
+
+    Rows are tuples in the union column order; on equal times local rows come first, and
+    identical rows are collapsed within each run of equal times (identical rows always share
+    a time, so this matches a global dedupe). Memory does not grow with file size.
+    Returns False, having written nothing, when either side is missing, empty or not
+    time-ordered.
+    """
+    for path in (local_path, remote_path):
+        if not os.path.isfile(path) or os.path.getsize(path) == 0:
+            return False
+    lf = _csv_header(local_path)
+    rf = _csv_header(remote_path)
+    if not lf or not rf:
+        return False
+    fieldnames = list(dict.fromkeys(lf)) + [h for h in dict.fromkeys(rf) if h not in lf]
+    tmp = local_path + ".tmp"
+    written = 0
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="") as out:
+            writer = csv.writer(out)
+            writer.writerow(fieldnames)
+            a = _iter_timed_rows(local_path, fieldnames)
+            b = _iter_timed_rows(remote_path, fieldnames)
+            ra = next(a, None)
+            rb = next(b, None)
+            run_t: Optional[float] = None
+            run_rows: set = set()
+            while ra is not None or rb is not None:
+                if rb is None or (ra is not None and ra[0] <= rb[0]):
+                    t, row = ra
+                    ra = next(a, None)
+                else:
+                    t, row = rb
+                    rb = next(b, None)
+                if t != run_t:
+                    run_t = t
+                    run_rows.clear()
+                elif row in run_rows:
+                    continue
+                run_rows.add(row)
+                writer.writerow(row)
+                written += 1
+    except _UnorderedCsv:
+        _remove_quietly(tmp)
+        return False
+    except Exception:
+        _remove_quietly(tmp)
+        raise
+    if written == 0:
+        _remove_quietly(tmp)
+        return True
+    try:
+        _install(tmp, remote_path, move=False)
+        _install(tmp, local_path, move=True)
+    finally:
+        _remove_quietly(tmp)
+    return True
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except Exception:
+        pass
+
+
 def _merge_csv_two_way(local_path: str, remote_path: str) -> None:
     """
     Merge two CSV files by 'time' column (if present), writing the merged result back to both.
 
+    Time-ordered files (capture logs) take the streaming merge; anything else is merged in memory.
+    """
+    try:
+        if _merge_csv_streaming(local_path, remote_path):
+            return
+    except Exception as e:
+        print(f"[sync] Merge failed for {local_path}: {e}")
+        return
+    _merge_csv_in_memory(local_path, remote_path)
+
+
+def _merge_csv_in_memory(local_path: str, remote_path: str) -> None:
+    """
+    In-memory merge for CSVs the streaming merge cannot take (no time column, unordered rows,
+    or one side missing/empty).
+
     - Creates a backup (.bak) of the local file before overwriting.
     - Fails safely: if merge produces empty/invalid result or throws exception,
       logs error and DOES NOT overwrite existing files.
@@ -139,6 +287,12 @@ def _merge_csv_two_way(local_path: str, remote_path: str) -> None:
                     pass
             raise
 
+    def _time_key(row: Dict[str, str]) -> Tuple[int, float]:
+        try:
+            return 0, float(row.get("time") or "")
+        except Exception:
+            return 1, 0.0
+
     try:
         lf, lrows = _load(local_path)
         rf, rrows = _load(remote_path)
@@ -152,6 +306,23 @@ def _merge_csv_two_way(local_path: str, remote_path: str) -> None:
             _copy_newer(local_path, remote_path)
             return
 
+        # Union of columns (local order first), identical rows collapsed, ordered by time.
+        fieldnames = list(lf) + [h for h in rf if h not in lf]
+        if not fieldnames:
+            return
+        seen = set()
+        merged: List[Dict[str, str]] = []
+        for row in lrows + rrows:
+            key = tuple(str(row.get(h, "") or "") for h in fieldnames)
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append({h: row.get(h, "") or "" for h in fieldnames})
+        if "time" in fieldnames:
+            merged.sort(key=_time_key)
+        if not merged:
+            return
+
         _write(local_path, fieldnames, merged)
         _write(remote_path, fieldnames, merged)
 
@@ -234,6 +405,263 @@ def _merge_json_two_way(local_path: str, remote_path: str) -> None:
         _copy_newer(local_path, remote_path)
 
 
+class SyncManifest:
+    """
+    State of every synced file at the end of its last sync, per OneDrive root.
+
+    Entry (keyed "<tree>/<rel path>"): local and remote [size, mtime_ns] as left by the
+    sync, the shared content size, its sha1, and a head+tail fingerprint of that content
+    (enough to recognise an append-only extension without re-reading the whole prefix).
+    A file whose stat matches on both sides is skipped without being opened.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, remote_root: str) -> None:
+        self.path = path
+        self.key = os.path.normcase(os.path.abspath(remote_root))
+        self._doc: Dict[str, object] = {"version": self.VERSION, "roots": {}}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                doc = json.load(f) or {}
+            if int(doc.get("version") or 0) == self.VERSION and isinstance(doc.get("roots"), dict):
+                self._doc = doc
+        except Exception:
+            pass
+        roots = self._doc["roots"]  # type: ignore[index]
+        self.files: Dict[str, Dict[str, object]] = roots.setdefault(self.key, {})  # type: ignore[union-attr]
+
+    def get(self, rel: str) -> Optional[Dict[str, object]]:
+        return self.files.get(rel)
+
+    def put(self, rel: str, entry: Optional[Dict[str, object]]) -> None:
+        if entry is None:
+            self.files.pop(rel, None)
+        else:
+            self.files[rel] = entry
+
+    def clear(self) -> None:
+        self.files.clear()
+
+    def save(self) -> None:
+        tmp = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._doc, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"[sync] Could not save manifest: {e}")
+
+
+def _manifest_path() -> str:
+    return os.path.join(os.path.dirname(_config_path()), "sync_manifest.json")
+
+
+_FP_BLOCK = 64 * 1024
+_COPY_BLOCK = 1024 * 1024
+
+
+def _scan_files(base_dir: str, exts: Tuple[str, ...]) -> Dict[str, Tuple[str, int, int]]:
+    """Like _collect_files, with (abs path, size, mtime_ns) from the directory listing itself."""
+    out: Dict[str, Tuple[str, int, int]] = {}
+    if not base_dir or not os.path.isdir(base_dir):
+        return out
+    exts_lower = tuple(e.lower() for e in exts)
+    stack = [(base_dir, "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=True):
+                            stack.append((entry.path, prefix + entry.name + "/"))
+                        elif entry.name.lower().endswith(exts_lower):
+                            st = entry.stat()
+                            out[prefix + entry.name] = (entry.path, int(st.st_size), int(st.st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return out
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+        return int(st.st_size), int(st.st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _file_sha1(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_COPY_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _fingerprint(path: str, size: int) -> str:
+    """sha1 of the first and last _FP_BLOCK bytes of the file's first `size` bytes."""
+    h = hashlib.sha1(str(int(size)).encode("ascii"))
+    with open(path, "rb") as f:
+        h.update(f.read(min(_FP_BLOCK, size)))
+        f.seek(max(0, size - _FP_BLOCK))
+        h.update(f.read(min(_FP_BLOCK, size)))
+    return h.hexdigest()
+
+
+def _entry_for(local_path: str, remote_path: str) -> Optional[Dict[str, object]]:
+    """Manifest entry for a pair that now holds the same content (hashed from the local copy)."""
+    ls = _stat(local_path)
+    rs = _stat(remote_path)
+    if ls is None or rs is None or ls[0] != rs[0]:
+        return None
+    return {
+        "l": list(ls),
+        "r": list(rs),
+        "size": ls[0],
+        "sha1": _file_sha1(local_path),
+        "fp": _fingerprint(local_path, ls[0]),
+    }
+
+
+def _append_tail(src: str, dst: str, prev: Dict[str, object]) -> bool:
+    """
+    If `src` is the last-synced content plus new rows and `dst` is still the last-synced
+    content, stream just the new bytes onto `dst`. Returns False (nothing written) otherwise.
+    """
+    n = int(prev.get("size") or 0)
+    ss = _stat(src)
+    ds = _stat(dst)
+    if n <= 0 or ss is None or ds is None or ss[0] <= n or ds[0] != n:
+        return False
+    try:
+        if _fingerprint(src, n) != prev.get("fp"):
+            return False
+        with open(src, "rb") as fi:
+            fi.seek(n - 1)
+            if fi.read(1) != b"\n":
+                return False  # last synced row was incomplete; needs a real merge
+            with open(dst, "ab") as fo:
+                shutil.copyfileobj(fi, fo, _COPY_BLOCK)
+        return True
+    except Exception as e:
+        print(f"[sync] Append failed for {dst}: {e}")
+        return False
+
+
+def _copy_file(src: str, dst: str) -> bool:
+    try:
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.copy2(src, dst)
+        return True
+    except Exception:
+        return False
+
+
+def _sync_pair(
+    kind: str,
+    local_path: Optional[str],
+    remote_path: Optional[str],
+    prev: Optional[Dict[str, object]],
+) -> Tuple[str, Optional[Dict[str, object]]]:
+    """Bring one file into agreement on both sides. Returns (action, manifest entry or None)."""
+    if not remote_path or not local_path:
+        return "failed", None
+    lexists = os.path.isfile(local_path)
+    rexists = os.path.isfile(remote_path)
+    if lexists and not rexists:
+        return ("copied", _entry_for(local_path, remote_path)) if _copy_file(local_path, remote_path) else ("failed", None)
+    if rexists and not lexists:
+        return ("copied", _entry_for(local_path, remote_path)) if _copy_file(remote_path, local_path) else ("failed", None)
+
+    ls = _stat(local_path)
+    rs = _stat(remote_path)
+    if prev is not None and ls is not None and rs is not None:
+        l_same = ls == tuple(prev.get("l") or ())
+        r_same = rs == tuple(prev.get("r") or ())
+        # Stat drift with identical bytes (e.g. the OneDrive client touching mtimes).
+        try:
+            if not l_same and ls[0] == prev.get("size") and _file_sha1(local_path) == prev.get("sha1"):
+                l_same = True
+            if not r_same and rs[0] == prev.get("size") and _file_sha1(remote_path) == prev.get("sha1"):
+                r_same = True
+        except Exception:
+            pass
+        if l_same and r_same:
+            if ls != tuple(prev.get("l") or ()) or rs != tuple(prev.get("r") or ()):
+                prev = dict(prev, l=list(ls), r=list(rs))
+            return "unchanged", prev
+        if kind == "csv" and l_same != r_same:
+            src, dst = (remote_path, local_path) if l_same else (local_path, remote_path)
+            if _append_tail(src, dst, prev):
+                return "appended", _entry_for(local_path, remote_path)
+    elif ls is not None and rs is not None and ls[0] == rs[0]:
+        # Not in the manifest yet (first sync): identical bytes need no merge.
+        try:
+            if _file_sha1(local_path) == _file_sha1(remote_path):
+                return "unchanged", _entry_for(local_path, remote_path)
+        except Exception:
+            pass
+
+    if kind == "csv":
+        _merge_csv_two_way(local_path, remote_path)
+    else:
+        _merge_json_two_way(local_path, remote_path)
+    entry = _entry_for(local_path, remote_path)
+    return ("merged", entry) if entry is not None else ("failed", None)
+
+
+def _sync_files(
+    tree: str,
+    local_base: str,
+    remote_base: str,
+    kind: str,
+    manifest: Optional[SyncManifest] = None,
+    pool: Optional[ThreadPoolExecutor] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> None:
+    """Sync one tree's CSV ("csv") or JSON ("json") files, skipping pairs the manifest shows unchanged."""
+    if not local_base or not remote_base:
+        return
+    exts = (".csv",) if kind == "csv" else (".json",)
+    local_map = _scan_files(local_base, exts)
+    remote_map = _scan_files(remote_base, exts)
+    stats = stats if stats is not None else {}
+    jobs = []
+    for rel in sorted(set(local_map) | set(remote_map)):
+        key = f"{tree}/{rel}"
+        lp = local_map.get(rel)
+        rp = remote_map.get(rel)
+        prev = manifest.get(key) if manifest is not None else None
+        if lp and rp and prev is not None and (lp[1], lp[2]) == tuple(prev.get("l") or ()) and (rp[1], rp[2]) == tuple(prev.get("r") or ()):
+            stats["unchanged"] = stats.get("unchanged", 0) + 1
+            continue
+        local_path = lp[0] if lp else os.path.join(local_base, rel.replace("/", os.sep))
+        remote_path = rp[0] if rp else os.path.join(remote_base, rel.replace("/", os.sep))
+        jobs.append((key, local_path, remote_path, prev))
+
+    def _record(key: str, action: str, entry: Optional[Dict[str, object]]) -> None:
+        stats[action] = stats.get(action, 0) + 1
+        if manifest is not None:
+            manifest.put(key, entry)
+
+    if pool is None:
+        for key, lpath, rpath, prev in jobs:
+            _record(key, *_sync_pair(kind, lpath, rpath, prev))
+        return
+    futures = {pool.submit(_sync_pair, kind, lpath, rpath, prev): key for key, lpath, rpath, prev in jobs}
+    for fut in as_completed(futures):
+        try:
+            _record(futures[fut], *fut.result())
+        except Exception as e:
+            print(f"[sync] {futures[fut]}: {e}")
+            _record(futures[fut], "failed", None)
+
+
 def _sync_tree(local_base: str, remote_base: str) -> None:
     """
     Sync CSV files between local_base and remote_base:
@@ -241,35 +669,7 @@ def _sync_tree(local_base: str, remote_base: str) -> None:
     - If file exists in both, merge by time and write back to both.
     - If file exists only on one side, copy it to the other side.
     """
-    if not local_base or not remote_base:
-        return
-    local_map = _collect_csvs(local_base)
-    remote_map = _collect_csvs(remote_base)
-    keys = set(local_map) | set(remote_map)
-    for rel in sorted(keys):
-        local_path = local_map.get(rel)
-        remote_path = remote_map.get(rel)
-        # Both sides: merge
-        if local_path and remote_path:
-            _merge_csv_two_way(local_path, remote_path)
-            continue
-        # Local only -> copy to remote
-        if local_path and not remote_path:
-            remote_path = os.path.join(remote_base, rel.replace("/", os.sep))
-            try:
-                os.makedirs(os.path.dirname(remote_path), exist_ok=True)
-                shutil.copy2(local_path, remote_path)
-            except Exception:
-                pass
-            continue
-        # Remote only -> copy to local
-        if remote_path and not local_path:
-            local_path = os.path.join(local_base, rel.replace("/", os.sep))
-            try:
-                os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                shutil.copy2(remote_path, local_path)
-            except Exception:
-                pass
+    _sync_files(os.path.basename(os.path.normpath(local_base or "")), local_base, remote_base, "csv")
 
 
 def _sync_json_tree(local_base: str, remote_base: str) -> None:
@@ -279,35 +679,13 @@ def _sync_json_tree(local_base: str, remote_base: str) -> None:
     - If file exists in both, merge dict fields and write back to both.
     - If file exists only on one side, copy it to the other side.
     """
-    if not local_base or not remote_base:
-        return
-    local_map = _collect_files(local_base, (".json",))
-    remote_map = _collect_files(remote_base, (".json",))
-    keys = set(local_map) | set(remote_map)
-    for rel in sorted(keys):
-        local_path = local_map.get(rel)
-        remote_path = remote_map.get(rel)
-        if local_path and remote_path:
-            _merge_json_two_way(local_path, remote_path)
-            continue
-        if local_path and not remote_path:
-            remote_path = os.path.join(remote_base, rel.replace("/", os.sep))
-            try:
-                os.makedirs(os.path.dirname(remote_path), exist_ok=True)
-                shutil.copy2(local_path, remote_path)
-            except Exception:
-                pass
-            continue
-        if remote_path and not local_path:
-            local_path = os.path.join(local_base, rel.replace("/", os.sep))
-            try:
-                os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                shutil.copy2(remote_path, local_path)
-            except Exception:
-                pass
+    _sync_files(os.path.basename(os.path.normpath(local_base or "")), local_base, remote_base, "json")
 
 
-def sync_all_data(onedrive_root: str) -> None:
+SYNC_TREES = ("discrete_temp_testing", "temp_testing", "live_test_logs")
+
+
+def sync_all_data(onedrive_root: str, *, full: bool = False) -> Dict[str, int]:
     """
     Sync CSV-based data between the local repo and a OneDrive-mirrored root.
 
@@ -315,25 +693,34 @@ def sync_all_data(onedrive_root: str) -> None:
         - discrete_temp_testing
         - temp_testing
         - live_test_logs
+
+    Files whose size/mtime on both sides still match the sync manifest are skipped; a CSV
+    that only grew on one side gets just its new rows appended to the other. `full=True`
+    ignores the manifest and re-examines every file. Returns counts per action
+    (unchanged, copied, appended, merged, failed).
     """
     root = _repo_root()
     onedrive_root = str(onedrive_root or "").strip()
+    stats: Dict[str, int] = {}
     if not onedrive_root:
-        return
-    # discrete_temp_testing
-    local_disc = os.path.join(root, "discrete_temp_testing")
-    remote_disc = os.path.join(onedrive_root, "discrete_temp_testing")
-    _sync_tree(local_disc, remote_disc)
-    _sync_json_tree(local_disc, remote_disc)
-    # temp_testing
-    local_temp = os.path.join(root, "temp_testing")
-    remote_temp = os.path.join(onedrive_root, "temp_testing")
-    _sync_tree(local_temp, remote_temp)
-    _sync_json_tree(local_temp, remote_temp)
-    # live_test_logs
-    local_live = os.path.join(root, "live_test_logs")
-    remote_live = os.path.join(onedrive_root, "live_test_logs")
-    _sync_tree(local_live, remote_live)
-    _sync_json_tree(local_live, remote_live)
-
-
+        return stats
+    manifest: Optional[SyncManifest] = None
+    if bool(getattr(config, "DATA_SYNC_MANIFEST_ENABLED", True)):
+        manifest = SyncManifest(_manifest_path(), onedrive_root)
+        if full:
+            manifest.clear()
+    workers = int(getattr(config, "DATA_SYNC_WORKERS", 4))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync") if workers > 1 else None
+    try:
+        for tree in SYNC_TREES:
+            local_base = os.path.join(root, tree)
+            remote_base = os.path.join(onedrive_root, tree)
+            _sync_files(tree, local_base, remote_base, "csv", manifest, pool, stats)
+            _sync_files(tree, local_base, remote_base, "json", manifest, pool, stats)
+            if manifest is not None:
+                manifest.save()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    print("[sync] " + ", ".join(f"{k} {v}" for k, v in sorted(stats.items())))
+    return stats
@@ -0,0 +1,332 @@
+"""
+Live pipeline profiler: per-stage timings, queue depths and frame age at render.
+
+Hook sites on the live path (IoClient decode, HardwareService._on_json, the queued
+`frames_available` dispatch, FluxLitePage._on_frames_available, merge_batches, the live
+measurement engine, WorldCanvas/ForcePlotWidget rendering) check the module-level
+`enabled` flag before reading the clock, so a disabled profiler costs one global lookup
+per hook and nothing else. Hook modules look their histograms up once at import and record
+through the handle:
+
+    _PROF_DECODE = live_profiler.histogram("decode")
+    ...
+    if live_profiler.enabled:
+        t0 = live_profiler.now()
+    ...
+    if live_profiler.enabled:
+        _PROF_DECODE.record_since(t0)
+
+Each metric is a rolling HDR-style histogram: 16 linear sub-buckets per power of two
+(about 6% relative resolution from 1 ns up to ~35 minutes) kept in `_SLICES` time slices,
+so a snapshot covers the last LIVE_PROFILING_WINDOW_S seconds. Recording only appends
+(t, value) to a pending list; bucketing runs in order when `_PENDING_MAX` records have
+piled up or a snapshot is taken, so the hot path is a clock read and a list append.
+Histograms are written by one thread each (socket thread for decode/on_json, GUI thread for
+the rest); folding takes a per-histogram lock, recording never does. `reset()` clears the
+histograms in place, so handles held by hook modules stay valid.
+
+Metrics:
+  decode, on_json, dispatch, on_live_data, extract_frames, measurement,
+  render.world, render.plot                      stage durations (ns)
+  frame_age.world, frame_age.plot                newest socket frame -> end of the first
+                                                 render after it arrived (ns)
+  queue.batch, queue.dispatch                    IoClient batch size at delivery, store
+                                                 notifications not yet handled by the page
+
+`snapshot()` returns percentiles per metric (what the debug panel shows) and
+`dump_json(path)` writes it together with the non-empty buckets.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import numpy as np
+
+from .. import config
+
+now = time.perf_counter_ns
+
+enabled: bool = bool(getattr(config, "LIVE_PROFILING_ENABLED", False))
+
+_SUB_BITS = 4
+_SUB = 1 << _SUB_BITS
+_MAX_SHIFT = 36
+N_BUCKETS = _SUB + (_MAX_SHIFT + 1) * _SUB
+_SLICES = 6
+_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+_PENDING_MAX = 2048  # flat list entries (1024 records) before a fold
+
+UNIT_NS = "ns"
+UNIT_COUNT = "count"
+
+
+def bucket_index(value: int) -> int:
+    """Log-linear bucket of a non-negative integer (values below 16 are exact)."""
+    if value < _SUB:
+        return value if value > 0 else 0
+    shift = value.bit_length() - _SUB_BITS - 1
+    if shift > _MAX_SHIFT:
+        return N_BUCKETS - 1
+    return _SUB + shift * _SUB + ((value >> shift) - _SUB)
+
+
+def bucket_indexes(values: np.ndarray) -> np.ndarray:
+    """`bucket_index` over an int64 array of non-negative values."""
+    values = np.asarray(values, dtype=np.int64)
+    # frexp's exponent is the bit length (exact below 2**53; larger values land in the last bucket).
+    shift = np.frexp(values.astype(np.float64))[1].astype(np.int64) - _SUB_BITS - 1
+    big = shift >= 0
+    out = values.copy()
+    s = shift[big]
+    out[big] = np.where(s > _MAX_SHIFT, N_BUCKETS - 1, _SUB + s * _SUB + ((values[big] >> np.minimum(s, _MAX_SHIFT)) - _SUB))
+    return out
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """Inclusive [low, high] value range of a bucket."""
+    if index < _SUB:
+        return index, index
+    shift, sub = divmod(index - _SUB, _SUB)
+    low = (_SUB + sub) << shift
+    return low, low + (1 << shift) - 1
+
+
+class RollingHistogram:
+    """Log-bucketed histogram over a rolling window made of `slices` equal time slices."""
+
+    def __init__(self, unit: str = UNIT_NS, *, window_s: float = 60.0, slices: int = _SLICES) -> None:
+        self.unit = unit
+        self.window_s = float(window_s)
+        self._n = max(1, int(slices))
+        self._slice_ns = max(1, int(self.window_s * 1e9 / self._n))
+        self._pending: List[int] = []  # flat t, value, t, value, ...
+        self._fold_lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop everything recorded so far (the object stays usable by whoever holds it)."""
+        with self._fold_lock:
+            self._counts = np.zeros((self._n, N_BUCKETS), dtype=np.int64)
+            self._sums: List[int] = [0] * self._n
+            self._maxes: List[int] = [0] * self._n
+            self._cur = 0
+            self._slice_end = 0
+            self._folded = 0
+            del self._pending[:]
+
+    @property
+    def total(self) -> int:
+        """Lifetime count, not windowed."""
+        return self._folded + len(self._pending) // 2
+
+    def _rotate(self, t_ns: int) -> None:
+        if self._slice_end == 0:
+            self._slice_end = t_ns + self._slice_ns
+            return
+        steps = (t_ns - self._slice_end) // self._slice_ns + 1
+        for _ in range(min(steps, self._n)):
+            self._cur = (self._cur + 1) % self._n
+            self._counts[self._cur] = 0
+            self._sums[self._cur] = 0
+            self._maxes[self._cur] = 0
+        self._slice_end += steps * self._slice_ns
+
+    def record(self, value: int, t_ns: int) -> None:
+        pending = self._pending
+        pending.extend((t_ns, value))
+        if len(pending) >= _PENDING_MAX:
+            self._fold()
+
+    def record_since(self, t0_ns: int) -> int:
+        """Record `now - t0_ns`; returns now so consecutive stages can chain."""
+        t = now()
+        pending = self._pending
+        pending.extend((t, t - t0_ns))
+        if len(pending) >= _PENDING_MAX:
+            self._fold()
+        return t
+
+    def _fold(self) -> None:
+        """Bucket the pending records in arrival order (records appended meanwhile stay pending)."""
+        with self._fold_lock:
+            pending = self._pending
+            n = len(pending) // 2
+            if not n:
+                return
+            batch = np.fromiter(pending[:2 * n], dtype=np.int64, count=2 * n).reshape(n, 2)
+            del pending[:2 * n]
+            t = batch[:, 0]
+            values = np.maximum(batch[:, 1], 0)
+            index = bucket_indexes(values)
+            i = 0
+            while i < n:
+                if t[i] >= self._slice_end:
+                    self._rotate(int(t[i]))
+                later = np.flatnonzero(t[i:] >= self._slice_end)
+                j = i + int(later[0]) if later.size else n
+                cur = self._cur
+                self._counts[cur] += np.bincount(index[i:j], minlength=N_BUCKETS)
+                self._sums[cur] += int(values[i:j].sum())
+                self._maxes[cur] = max(self._maxes[cur], int(values[i:j].max()))
+                i = j
+            self._folded += n
+
+    def _live_slices(self, t_ns: int) -> List[int]:
+        """Slice indexes still inside the window at `t_ns`, newest first (no mutation)."""
+        if self._slice_end == 0:
+            return []
+        elapsed = 0 if t_ns < self._slice_end else (t_ns - self._slice_end) // self._slice_ns + 1
+        return [(self._cur - age) % self._n for age in range(self._n) if age + elapsed < self._n]
+
+    def merged(self, t_ns: Optional[int] = None) -> tuple[List[int], int, int]:
+        """(bucket counts, sum, max) over the window."""
+        self._fold()
+        t = now() if t_ns is None else int(t_ns)
+        live = self._live_slices(t)
+        counts = self._counts[live].sum(axis=0) if live else np.zeros(N_BUCKETS, dtype=np.int64)
+        total_sum = sum(self._sums[k] for k in live)
+        vmax = max((self._maxes[k] for k in live), default=0)
+        return counts.tolist(), total_sum, vmax
+
+    def snapshot(self, t_ns: Optional[int] = None, *, buckets: bool = False) -> Dict[str, object]:
+        counts, total_sum, vmax = self.merged(t_ns)
+        n = sum(counts)
+        out: Dict[str, object] = {"unit": self.unit, "count": n, "total": self.total}
+        if n:
+            out["mean"] = total_sum / n
+            out["max"] = vmax
+            out["min"] = bucket_bounds(next(i for i, c in enumerate(counts) if c))[0]
+            for p in _PERCENTILES:
+                out[f"p{p:g}"] = min(vmax, _value_at(counts, n, p))
+        if buckets:
+            out["buckets"] = [[*bucket_bounds(i), c] for i, c in enumerate(counts) if c]
+        return out
+
+
+def _value_at(counts: List[int], n: int, pct: float) -> float:
+    """Bucket midpoint holding the `pct` percentile (HDR-style equivalent value)."""
+    rank = max(1, int(-(-pct * n // 100)))
+    seen = 0
+    for i, c in enumerate(counts):
+        seen += c
+        if seen >= rank:
+            low, high = bucket_bounds(i)
+            return (low + high) / 2.0
+    return 0.0
+
+
+_hists: Dict[str, RollingHistogram] = {}
+_hists_lock = threading.Lock()
+_emitted: Deque[int] = deque(maxlen=8192)
+_last_arrival_ns = 0
+_rendered_arrival: Dict[str, int] = {}
+_render_hists: Dict[str, tuple[RollingHistogram, RollingHistogram]] = {}
+
+
+def histogram(name: str, unit: str = UNIT_NS) -> RollingHistogram:
+    h = _hists.get(name)
+    if h is None:
+        with _hists_lock:
+            h = _hists.get(name)
+            if h is None:
+                h = RollingHistogram(unit, window_s=float(getattr(config, "LIVE_PROFILING_WINDOW_S", 60.0)))
+                _hists[name] = h
+    return h
+
+
+def record(name: str, elapsed_ns: int, t_ns: int) -> None:
+    histogram(name).record(elapsed_ns, t_ns)
+
+
+def record_since(name: str, t0_ns: int) -> int:
+    """Record `now - t0_ns` under `name`; returns now so consecutive stages can chain."""
+    return histogram(name).record_since(t0_ns)
+
+
+_DISPATCH = histogram("dispatch")
+_QUEUE_DISPATCH = histogram("queue.dispatch", UNIT_COUNT)
+
+
+def gauge(name: str, value: int) -> None:
+    histogram(name, UNIT_COUNT).record(int(value), now())
+
+
+def mark_arrival(t_ns: int) -> None:
+    """A socket frame arrived at `t_ns` (reference point for frame age at render)."""
+    global _last_arrival_ns
+    _last_arrival_ns = t_ns
+
+
+def mark_emitted(t_ns: int) -> None:
+    """A notification was queued to the GUI thread (paired FIFO with `take_emitted`)."""
+    _emitted.append(t_ns)
+
+
+def take_emitted(t_ns: int) -> None:
+    """The GUI slot picked up the oldest queued notification: records dispatch latency and backlog."""
+    try:
+        t0 = _emitted.popleft()
+    except IndexError:
+        return
+    _DISPATCH.record(t_ns - t0, t_ns)
+    _QUEUE_DISPATCH.record(len(_emitted), t_ns)
+
+
+def record_render(target: str, t0_ns: int) -> None:
+    """Render duration for `target`, plus the age of the newest frame on its first render."""
+    hists = _render_hists.get(target)
+    if hists is None:
+        hists = _render_hists[target] = (histogram(f"render.{target}"), histogram(f"frame_age.{target}"))
+    t = hists[0].record_since(t0_ns)
+    arrival = _last_arrival_ns
+    if arrival and _rendered_arrival.get(target) != arrival:
+        _rendered_arrival[target] = arrival
+        hists[1].record(t - arrival, t)
+
+
+def set_enabled(on: bool) -> None:
+    """Toggle recording; in-flight dispatch stamps are dropped so the FIFO realigns."""
+    global enabled
+    _emitted.clear()
+    enabled = bool(on)
+
+
+def reset() -> None:
+    global _last_arrival_ns
+    with _hists_lock:
+        hists = list(_hists.values())
+    for h in hists:
+        h.clear()
+    _emitted.clear()
+    _rendered_arrival.clear()
+    _last_arrival_ns = 0
+
+
+def snapshot(*, buckets: bool = False) -> Dict[str, object]:
+    t = now()
+    with _hists_lock:
+        items = sorted(_hists.items())
+    return {
+        "enabled": bool(enabled),
+        "window_s": float(getattr(config, "LIVE_PROFILING_WINDOW_S", 60.0)),
+        "taken_at_ms": int(time.time() * 1000),
+        "metrics": {name: h.snapshot(t, buckets=buckets) for name, h in items if h.total},
+    }
+
+
+def dump_json(path: str) -> str:
+    """Write a snapshot (with histogram buckets) to `path`; returns the absolute path."""
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(snapshot(buckets=True), fh, indent=2)
+    os.replace(tmp, path)
+    print(f"[live_profiler] wrote {path}")
+    return path
@@ -0,0 +1,162 @@
+"""Packed binary live-frame wire format ("axf-f32-v1").
+
+Layout (all little-endian):
+
+    frame header (16 bytes)
+        magic      4s   b"AXFB"
+        version    u8   1
+        reserved   u8
+        n_blocks   u16
+        reserved   u64
+
+    per device block
+        id_len     u16
+        n_channels u16
+        n_samples  u32
+        id         id_len bytes (utf-8), zero-padded to a multiple of 8
+        records    n_samples * (time_ms i8, n_channels * f4)
+
+The first `len(CHANNELS)` channels follow `CHANNELS`; any extra channels (per-sensor
+data on raw streams) are carried through untouched.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+
+FORMAT_NAME = "axf-f32-v1"
+FORMAT_DICT = "dict"
+
+MAGIC = b"AXFB"
+VERSION = 1
+
+CHANNELS: tuple[str, ...] = ("fx", "fy", "fz", "cop_x", "cop_y", "mx", "my", "mz", "temp_f")
+
+_FRAME_HEADER = struct.Struct("<4sBBHQ")
+_BLOCK_HEADER = struct.Struct("<HHI")
+_TIME_DTYPE = np.dtype("<i8")
+_CHAN_DTYPE = np.dtype("<f4")
+
+
+def record_dtype(n_channels: int) -> np.dtype:
+    """Packed per-sample record: int64 time followed by `n_channels` float32 values."""
+    return np.dtype([("t", _TIME_DTYPE), ("ch", _CHAN_DTYPE, (int(n_channels),))])
+
+
+class BinaryFrameError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class BinaryBlock:
+    device_id: str
+    time_ms: np.ndarray  # (n,) int64
+    channels: np.ndarray  # (n, n_channels) float32
+
+    def __len__(self) -> int:
+        return int(self.time_ms.shape[0])
+
+    def channel(self, name: str) -> np.ndarray:
+        return self.channels[:, CHANNELS.index(name)]
+
+    @property
+    def extra(self) -> np.ndarray:
+        """Channels beyond `CHANNELS` (per-sensor data on raw streams); (n, 0) when there are none."""
+        return self.channels[:, len(CHANNELS) :]
+
+    def to_frames(self) -> list[dict]:
+        """
+        Expand into per-sample frame dicts (the legacy processed-stream shape). Extra channels,
+        when present, ride along as an `"extra"` list of floats per frame.
+        """
+        out: list[dict] = []
+        if self.channels.shape[1] < len(CHANNELS):
+            return out
+        rows = self.channels[:, : len(CHANNELS)].astype(np.float64).tolist()
+        extra = self.extra.astype(np.float64).tolist() if self.channels.shape[1] > len(CHANNELS) else None
+        for i, (t, (fx, fy, fz, cx, cy, mx, my, mz, temp)) in enumerate(zip(self.time_ms.tolist(), rows)):
+            frame = {
+                "id": self.device_id,
+                "time": int(t),
+                "fx": fx,
+                "fy": fy,
+                "fz": fz,
+                "cop": {"x": cx, "y": cy},
+                "moments": {"x": mx, "y": my, "z": mz},
+                "avgTemperatureF": temp,
+            }
+            if extra is not None:
+                frame["extra"] = extra[i]
+            out.append(frame)
+        return out
+
+
+def _pad8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def encode_frame(blocks: Mapping[str, Tuple[Sequence[int], Sequence[Sequence[float]]]] | Iterable[BinaryBlock]) -> bytes:
+    """Pack device blocks into one wire frame. Accepts {device_id: (time_ms, channels)} or BinaryBlocks."""
+    items: List[Tuple[str, np.ndarray, np.ndarray]] = []
+    if isinstance(blocks, Mapping):
+        for did, (t, ch) in blocks.items():
+            items.append((str(did), np.asarray(t, dtype=_TIME_DTYPE), np.asarray(ch, dtype=_CHAN_DTYPE)))
+    else:
+        for b in blocks:
+            items.append((b.device_id, np.asarray(b.time_ms, dtype=_TIME_DTYPE), np.asarray(b.channels, dtype=_CHAN_DTYPE)))
+
+    parts: list[bytes] = [_FRAME_HEADER.pack(MAGIC, VERSION, 0, len(items), 0)]
+    for did, t, ch in items:
+        if ch.ndim != 2 or ch.shape[0] != t.shape[0]:
+            raise BinaryFrameError(f"block {did!r}: channels shape {ch.shape} does not match {t.shape[0]} samples")
+        id_bytes = did.encode("utf-8")
+        parts.append(_BLOCK_HEADER.pack(len(id_bytes), int(ch.shape[1]), int(t.shape[0])))
+        parts.append(id_bytes.ljust(_pad8(len(id_bytes)), b"\0"))
+        rec = np.empty(t.shape[0], dtype=record_dtype(ch.shape[1]))
+        rec["t"] = t
+        rec["ch"] = ch
+        parts.append(rec.tobytes())
+    return b"".join(parts)
+
+
+def decode_frame(buf: bytes | bytearray | memoryview) -> list[BinaryBlock]:
+    """
+    Decode one wire frame. Each block is a single `numpy.frombuffer` over its records;
+    `time_ms`/`channels` are zero-copy (strided) field views into `buf`.
+    """
+    mv = memoryview(buf)
+    if mv.nbytes < _FRAME_HEADER.size:
+        raise BinaryFrameError("frame shorter than header")
+    magic, version, _r0, n_blocks, _r1 = _FRAME_HEADER.unpack_from(mv, 0)
+    if magic != MAGIC:
+        raise BinaryFrameError(f"bad magic {magic!r}")
+    if version != VERSION:
+        raise BinaryFrameError(f"unsupported version {version}")
+
+    off = _FRAME_HEADER.size
+    out: list[BinaryBlock] = []
+    for _ in range(int(n_blocks)):
+        if off + _BLOCK_HEADER.size > mv.nbytes:
+            raise BinaryFrameError("truncated block header")
+        id_len, n_channels, n_samples = _BLOCK_HEADER.unpack_from(mv, off)
+        off += _BLOCK_HEADER.size
+        if off + _pad8(id_len) > mv.nbytes:
+            raise BinaryFrameError("truncated block id")
+        try:
+            did = bytes(mv[off : off + id_len]).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise BinaryFrameError(f"block id is not utf-8: {e}") from e
+        off += _pad8(id_len)
+        dt = record_dtype(n_channels)
+        nbytes = n_samples * dt.itemsize
+        if off + nbytes > mv.nbytes:
+            raise BinaryFrameError(f"truncated block {did!r}")
+        rec = np.frombuffer(mv, dtype=dt, count=n_samples, offset=off)
+        off += nbytes
+        out.append(BinaryBlock(device_id=did, time_ms=rec["t"], channels=rec["ch"]))
+    return out
@@ -0,0 +1,362 @@
+"""Columnar CSV loader with an on-disk NPZ cache.
+
+Processed runs are re-read many times during analysis and tuning (every stage, axis and
+candidate scorer opens the same files). `load_csv_columns` parses a CSV once into typed
+NumPy columns and stores them in a cache file keyed on the CSV's absolute path, mtime
+and size. Later loads read the NPZ, and repeat loads in the same process hit a small
+in-memory memo. Editing or replacing the CSV changes its mtime/size and invalidates the
+entry. The cache lives in the per-user cache dir (never the repo) and is LRU-trimmed to
+config.CSV_CACHE_MAX_MB / CSV_CACHE_MAX_ENTRIES; writes keep a running size estimate and
+only walk the directory when it passes the budget (or every CSV_CACHE_TRIM_EVERY_N writes).
+
+Every column gets a float64 array (NaN where a cell is blank or unparseable) plus
+`blank`/`bad` masks, so callers can reproduce the usual `float(v or 0.0)` vs
+skip-the-row rules. Columns with any non-numeric cell also keep their strings as
+categorical codes, which is how phase/phase_name are matched.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .. import config
+from ..project_paths import user_cache_dir
+from . import disk_lru
+
+_CACHE_VERSION = 1
+_MEMO_MAX = 32
+
+_memo: "OrderedDict[Tuple[str, int, int], CsvColumns]" = OrderedDict()
+_memo_lock = threading.Lock()
+_trim_throttle = disk_lru.TrimThrottle(".npz")
+
+
+@dataclass
+class CsvColumns:
+    path: str
+    headers: Tuple[str, ...]
+    n_rows: int
+    values: Dict[str, np.ndarray]  # float64, NaN for blank/bad cells
+    blank_masks: Dict[str, np.ndarray] = field(default_factory=dict)  # only columns with blanks
+    bad_masks: Dict[str, np.ndarray] = field(default_factory=dict)  # only columns with unparseable cells
+    text_codes: Dict[str, np.ndarray] = field(default_factory=dict)  # int32 codes into text_categories
+    text_categories: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    _lower: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        for h in self.headers:
+            self._lower.setdefault(h.lower(), h)
+
+    def find(self, *names: str) -> Optional[str]:
+        """First header matching one of `names` (exact, then case-insensitive)."""
+        for name in names:
+            if name in self.values:
+                return name
+        for name in names:
+            h = self._lower.get(str(name).lower())
+            if h is not None:
+                return h
+        return None
+
+    def has(self, *names: str) -> bool:
+        return self.find(*names) is not None
+
+    def column(self, *names: str) -> Optional[np.ndarray]:
+        h = self.find(*names)
+        return None if h is None else self.values[h]
+
+    def blank(self, name: str) -> np.ndarray:
+        """True where the cell is empty or the row is too short. All True for a missing column."""
+        h = self.find(name)
+        if h is None:
+            return np.ones(self.n_rows, dtype=bool)
+        m = self.blank_masks.get(h)
+        return m if m is not None else np.zeros(self.n_rows, dtype=bool)
+
+    def bad(self, name: str) -> np.ndarray:
+        """True where a non-empty cell does not parse as a float."""
+        h = self.find(name)
+        m = self.bad_masks.get(h) if h is not None else None
+        return m if m is not None else np.zeros(self.n_rows, dtype=bool)
+
+    def valid(self, *names: str) -> np.ndarray:
+        """Rows where every named column holds a parseable number."""
+        ok = np.ones(self.n_rows, dtype=bool)
+        for name in names:
+            if self.find(name) is None:
+                return np.zeros(self.n_rows, dtype=bool)
+            ok &= ~self.blank(name) & ~self.bad(name)
+        return ok
+
+    def number_or(self, name: str, default: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """`float(cell or default)` semantics: (values, usable_mask); blank/missing -> default."""
+        h = self.find(name)
+        if h is None:
+            return np.full(self.n_rows, float(default)), np.ones(self.n_rows, dtype=bool)
+        vals = np.where(self.blank(h), float(default), self.values[h])
+        return vals, ~self.bad(h)
+
+    def text(self, name: str, normalize: Optional[Callable[[str], object]] = None) -> np.ndarray:
+        """Column as an object array of strings ('' for blank/missing), optionally normalized per category."""
+        h = self.find(name)
+        if h is None:
+            return np.full(self.n_rows, normalize("") if normalize else "", dtype=object)
+        codes = self.text_codes.get(h)
+        if codes is None:
+            # Purely numeric column: rebuild strings from the parsed values.
+            raw = ["" if b else repr(float(v)) for v, b in zip(self.values[h].tolist(), self.blank(h).tolist())]
+            cats, codes = np.unique(np.asarray(raw, dtype=object), return_inverse=True)
+            cats_t = tuple(str(c) for c in cats)
+        else:
+            cats_t = self.text_categories[h]
+        lut = np.empty(len(cats_t), dtype=object)
+        lut[:] = [normalize(c) if normalize else c for c in cats_t]
+        return lut[codes]
+
+
+def _normalize_header(h: str) -> str:
+    return str(h or "").lstrip("\ufeff").strip()
+
+
+def _parse(path: str) -> CsvColumns:
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle, skipinitialspace=True)
+        header = next(reader, [])
+        headers = [_normalize_header(h) for h in header]
+        rows = [r for r in reader if r]
+
+    n = len(rows)
+    n_cols = len(headers)
+    if n_cols == 0:
+        return CsvColumns(path=path, headers=(), n_rows=0, values={})
+    # Pad short rows with '' and drop cells beyond the header (csv.DictReader semantics).
+    columns = list(zip_longest(*rows, fillvalue=""))[:n_cols] if rows else []
+    while len(columns) < n_cols:
+        columns.append(("",) * n)
+
+    values: Dict[str, np.ndarray] = {}
+    blanks: Dict[str, np.ndarray] = {}
+    bads: Dict[str, np.ndarray] = {}
+    codes_by: Dict[str, np.ndarray] = {}
+    cats_by: Dict[str, Tuple[str, ...]] = {}
+    seen: set[str] = set()
+    # Walk right-to-left: for duplicate headers the last column wins, as with DictReader.
+    for h, cells in reversed(list(zip(headers, columns))):
+        if h in seen or not h:
+            continue
+        seen.add(h)
+        obj = np.asarray(cells, dtype=object)
+        blank = obj == ""
+        try:
+            # Fast path: float() per cell in C; blanks become NaN.
+            obj[blank] = "nan"
+            arr = obj.astype(np.float64)
+            bad = None
+        except (ValueError, TypeError):
+            # Text / mixed column: encode distinct stripped strings, parse each once.
+            index: Dict[str, int] = {}
+            codes = np.fromiter((index.setdefault(c.strip(), len(index)) for c in cells), dtype=np.int32, count=n)
+            cats = tuple(index)
+            cat_vals = np.full(len(cats), np.nan)
+            cat_bad = np.zeros(len(cats), dtype=bool)
+            for i, c in enumerate(cats):
+                if c == "":
+                    continue
+                try:
+                    cat_vals[i] = float(c)
+                except ValueError:
+                    cat_bad[i] = True
+            arr = cat_vals[codes]
+            bad = cat_bad[codes]
+            blank = np.asarray([c == "" for c in cats], dtype=bool)[codes]
+            codes_by[h] = codes
+            cats_by[h] = cats
+        values[h] = arr
+        if blank.any():
+            blanks[h] = blank
+        if bad is not None and bad.any():
+            bads[h] = bad
+    ordered = tuple(dict.fromkeys(h for h in headers if h))
+    return CsvColumns(
+        path=path,
+        headers=ordered,
+        n_rows=n,
+        values={h: values[h] for h in ordered},
+        blank_masks=blanks,
+        bad_masks=bads,
+        text_codes=codes_by,
+        text_categories=cats_by,
+    )
+
+
+def cache_dir() -> str:
+    configured = str(getattr(config, "CSV_CACHE_DIR", "") or "").strip()
+    return configured or user_cache_dir("csv_cache")
+
+
+def _budget() -> Dict[str, int]:
+    return {
+        "max_bytes": int(float(getattr(config, "CSV_CACHE_MAX_MB", 2048)) * 1024 * 1024),
+        "max_entries": int(getattr(config, "CSV_CACHE_MAX_ENTRIES", 2000)),
+    }
+
+
+def evict() -> int:
+    """Trim the NPZ cache to its byte/entry budget (least recently loaded first)."""
+    return _trim_throttle.trim(cache_dir(), **_budget())
+
+
+def _evict_after_write(size: int) -> int:
+    every = int(getattr(config, "CSV_CACHE_TRIM_EVERY_N", 256))
+    return _trim_throttle.after_write(cache_dir(), size, every=every, **_budget())
+
+
+def _cache_path(abs_path: str) -> str:
+    digest = hashlib.sha1(abs_path.encode("utf-8", "surrogatepass")).hexdigest()[:24]
+    return os.path.join(cache_dir(), f"{digest}.npz")
+
+
+def _save(cols: CsvColumns, cache_file: str, mtime_ns: int, size: int) -> int:
+    """Write the NPZ entry atomically; returns its size in bytes."""
+    arrays: Dict[str, np.ndarray] = {}
+    index = {h: i for i, h in enumerate(cols.values)}
+    for h, i in index.items():
+        arrays[f"v{i}"] = cols.values[h]
+        if h in cols.blank_masks:
+            arrays[f"b{i}"] = cols.blank_masks[h]
+        if h in cols.bad_masks:
+            arrays[f"x{i}"] = cols.bad_masks[h]
+        if h in cols.text_codes:
+            arrays[f"c{i}"] = cols.text_codes[h]
+            arrays[f"k{i}"] = np.asarray(cols.text_categories[h], dtype=str)
+    meta = {
+        "version": _CACHE_VERSION,
+        "path": cols.path,
+        "mtime_ns": int(mtime_ns),
+        "size": int(size),
+        "n_rows": int(cols.n_rows),
+        "headers": list(cols.headers),
+        "columns": list(index.keys()),
+    }
+    arrays["meta"] = np.asarray(json.dumps(meta))
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as fh:
+        np.savez(fh, **arrays)
+        written = fh.tell()
+    os.replace(tmp, cache_file)
+    return written
+
+
+def _load_cached(cache_file: str, abs_path: str, mtime_ns: int, size: int) -> Optional[CsvColumns]:
+    if not os.path.isfile(cache_file):
+        return None
+    try:
+        with np.load(cache_file, allow_pickle=False) as z:
+            meta = json.loads(str(z["meta"]))
+            if (
+                meta.get("version") != _CACHE_VERSION
+                or meta.get("path") != abs_path
+                or int(meta.get("mtime_ns", -1)) != int(mtime_ns)
+                or int(meta.get("size", -1)) != int(size)
+            ):
+                return None
+            files = set(z.files)
+            cols = CsvColumns(path=abs_path, headers=tuple(meta["headers"]), n_rows=int(meta["n_rows"]), values={})
+            for i, h in enumerate(meta["columns"]):
+                cols.values[h] = z[f"v{i}"]
+                if f"b{i}" in files:
+                    cols.blank_masks[h] = z[f"b{i}"]
+                if f"x{i}" in files:
+                    cols.bad_masks[h] = z[f"x{i}"]
+                if f"c{i}" in files:
+                    cols.text_codes[h] = z[f"c{i}"]
+                    cols.text_categories[h] = tuple(str(s) for s in z[f"k{i}"].tolist())
+            cols.__post_init__()
+            return cols
+    except Exception:
+        return None
+
+
+def load_csv_columns(csv_path: str, *, use_cache: Optional[bool] = None) -> Optional[CsvColumns]:
+    """
+    Parse `csv_path` into columns, reusing the NPZ cache when the file is unchanged.
+
+    Returns None when the file is missing, empty or unreadable. The returned arrays are
+    shared with the in-process memo; treat them as read-only.
+    """
+    if not csv_path:
+        return None
+    try:
+        abs_path = os.path.abspath(csv_path)
+        st = os.stat(abs_path)
+    except OSError:
+        return None
+    if st.st_size <= 0:
+        return None
+    key = (abs_path, int(st.st_mtime_ns), int(st.st_size))
+    with _memo_lock:
+        hit = _memo.get(key)
+        if hit is not None:
+            _memo.move_to_end(key)
+            return hit
+
+    if use_cache is None:
+        use_cache = bool(getattr(config, "CSV_CACHE_ENABLED", True))
+    cols: Optional[CsvColumns] = None
+    cache_file = _cache_path(abs_path) if use_cache else ""
+    if use_cache:
+        cols = _load_cached(cache_file, abs_path, key[1], key[2])
+        if cols is not None:
+            disk_lru.touch(cache_file)
+    if cols is None:
+        try:
+            cols = _parse(abs_path)
+        except Exception:
+            return None
+        cols.path = abs_path
+        if use_cache:
+            try:
+                _evict_after_write(_save(cols, cache_file, key[1], key[2]))
+            except Exception as exc:
+                print(f"[columnar_csv] cache write failed for {os.path.basename(abs_path)}: {exc}")
+
+    with _memo_lock:
+        _memo[key] = cols
+        _memo.move_to_end(key)
+        while len(_memo) > _MEMO_MAX:
+            _memo.popitem(last=False)
+    return cols
+
+
+def clear_memo() -> None:
+    with _memo_lock:
+        _memo.clear()
+
+
+def phase_mask(cols: CsvColumns, phase_name: str, *columns: str) -> np.ndarray:
+    """Rows whose phase (first non-blank of `columns`, default phase_name/phase) equals `phase_name`, case-insensitively."""
+    want = str(phase_name or "").strip().lower()
+    names: List[str] = list(columns) or ["phase_name", "phase"]
+    out = np.zeros(cols.n_rows, dtype=bool)
+    pending = np.ones(cols.n_rows, dtype=bool)
+    for name in names:
+        if not cols.has(name):
+            continue
+        txt = cols.text(name, lambda s: s.strip().lower())
+        present = pending & (txt != "")
+        out |= present & (txt == want)
+        pending &= ~present
+    if want == "":
+        out |= pending
+    return out
@@ -0,0 +1,536 @@
+"""Chunked, vectorized CSV downsampler.
+
+Captures are read `chunk_rows` lines at a time, so memory stays bounded however long the
+recording is. Output rows are picked the way the original 50 Hz trim did it: a row is
+kept when its time is at least one interval after the previous kept row. Rows with a
+missing or unparseable time are dropped. Each kept row opens a bin that runs up to the
+next kept row. The strategies differ in what they write for a bin:
+
+- "decimate": the kept row, verbatim. This is byte-identical to the legacy trim.
+- "mean":     the kept row's time and text cells, with each numeric column averaged over the bin.
+- "fir":      the kept row's time and text cells, with numeric columns low-pass filtered
+              (windowed-sinc, cutoff just under the output Nyquist) at that instant, so
+              content above the output rate does not alias into the result.
+- "envelope": the bin's rows holding the min and the max of a key column (default sum-z),
+              verbatim and in file order (one row when they coincide). Spikes survive.
+
+Numeric columns are every column except time and the text columns (device_id, phase, ...
+or anything that does not parse). Blank cells are skipped by "mean". "fir" drops them from
+the window and renormalizes by the taps that saw a value; when those carry less than half of
+the filter's weight it falls back to the finite sample nearest the kept row (blank only if
+the whole window is blank).
+
+Lines without quotes are split directly and kept lines are written back as-is, which
+skips the per-field CSV round trip. From the first chunk that contains a quote onwards,
+the file goes through csv.reader. Both paths write identical output.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+import os
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+STRATEGIES = ("decimate", "mean", "fir", "envelope")
+
+DEFAULT_CHUNK_ROWS = 65536
+_TIME_COLUMNS = ("time", "time_ms")
+_TEXT_COLUMNS = frozenset({"device_id", "device", "phase", "phase_name", "phase_id", "label", "tag", "notes"})
+_ENVELOPE_KEYS = ("sum-z", "fz", "sum_z")
+
+
+@dataclass
+class DownsampleStats:
+    source: str
+    dest: str
+    strategy: str
+    rate_hz: float
+    rows_in: int = 0
+    rows_out: int = 0
+    rows_skipped: int = 0  # missing/unparseable time
+
+
+def _parse_floats(cells: Sequence[str]) -> np.ndarray:
+    """float64 per cell, NaN for blank / unparseable cells."""
+    obj = np.array(cells, dtype=object)
+    try:
+        return obj.astype(np.float64)
+    except (ValueError, TypeError):
+        pass
+    try:
+        # Blanks are the usual culprit; retry in C before going cell by cell.
+        obj[obj == ""] = "nan"
+        return obj.astype(np.float64)
+    except (ValueError, TypeError):
+        out = np.full(len(cells), np.nan)
+        for i, c in enumerate(cells):
+            try:
+                out[i] = float(c)
+            except (ValueError, TypeError):
+                pass
+        return out
+
+
+def _fields(rec) -> List[str]:
+    """Record -> fields; records are raw quote-free lines (no terminator) or csv.reader rows."""
+    return rec.split(",") if isinstance(rec, str) else rec
+
+
+def _column_cells(records: Sequence, j: int) -> List[str]:
+    if records and isinstance(records[0], str):
+        if j == 0:
+            return [r.partition(",")[0] for r in records]
+        out = []
+        for r in records:
+            parts = r.split(",", j + 1)
+            out.append(parts[j] if len(parts) > j else "")
+        return out
+    return [r[j] if len(r) > j else "" for r in records]
+
+
+def _object_table(records: Sequence, width: int) -> np.ndarray:
+    fields = list(map(_fields, records))
+    if any(len(f) != width for f in fields):
+        # Short rows pad with '', cells past the header are dropped.
+        fields = [f[:width] + [""] * (width - len(f)) for f in fields]
+    return np.array(fields, dtype=object).reshape(len(fields), width)
+
+
+def _numeric_table(records: Sequence, width: int, cols: np.ndarray, table: Optional[np.ndarray] = None) -> np.ndarray:
+    """(rows, len(cols)) float64; NaN for blank / unparseable cells."""
+    if not len(cols):
+        return np.empty((len(records), 0))
+    if table is None and isinstance(records[0], str):
+        try:
+            # C parser; any blank, short or odd row sends the chunk down the object path.
+            return np.loadtxt(records, delimiter=",", usecols=[int(j) for j in cols], dtype=np.float64, ndmin=2, comments=None)
+        except (ValueError, TypeError):
+            pass
+    if table is None:
+        table = _object_table(records, width)
+    try:
+        return table[:, cols].astype(np.float64)
+    except (ValueError, TypeError):
+        out = np.empty((len(records), len(cols)))
+        for k, j in enumerate(cols):
+            out[:, k] = _parse_floats(table[:, j])
+        return out
+
+
+def _detect_numeric(records: Sequence, width: int, cand: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Columns of `cand` with no unparseable cells (and not all blank) in the first chunk, plus their values."""
+    idx = np.asarray(cand, dtype=np.int64)
+    if isinstance(records[0], str):
+        try:
+            return idx, np.loadtxt(records, delimiter=",", usecols=cand, dtype=np.float64, ndmin=2, comments=None)
+        except (ValueError, TypeError):
+            pass
+    table = _object_table(records, width)
+    keep: List[int] = []
+    vals: List[np.ndarray] = []
+    for j in cand:
+        col = _parse_floats(table[:, j])
+        blank = table[:, j] == ""
+        if bool(np.all(np.isnan(col) <= blank)) and not bool(blank.all()):
+            keep.append(j)
+            vals.append(col)
+    num = np.stack(vals, axis=1) if vals else np.empty((len(records), 0))
+    return np.asarray(keep, dtype=np.int64), num
+
+
+def _fmt(v: float) -> str:
+    return "" if v != v else f"{v:.10g}"
+
+
+def select_rows(t: np.ndarray, last_t: Optional[float], interval: float) -> Tuple[np.ndarray, Optional[float]]:
+    """
+    Indices in `t` (no NaNs) kept by the first-row-after-interval rule, continuing from `last_t`.
+
+    Sorted times use a searchsorted hop per kept row; anything else falls back to the
+    plain sequential scan so out-of-order rows are treated exactly like the legacy trim.
+    """
+    n = int(t.size)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), last_t
+    kept: List[int] = []
+    if n > 1 and not bool(np.all(t[1:] >= t[:-1])):
+        for i in range(n):
+            tv = float(t[i])
+            if last_t is None or (tv - last_t) >= interval:
+                kept.append(i)
+                last_t = tv
+        return np.asarray(kept, dtype=np.int64), last_t
+    p = 0
+    if last_t is None:
+        kept.append(0)
+        last_t = float(t[0])
+        p = 1
+    while p < n:
+        q = int(np.searchsorted(t, last_t + interval, side="left"))
+        # Match the legacy `(t - last) >= interval` test exactly around rounding.
+        while q > p and float(t[q - 1]) - last_t >= interval:
+            q -= 1
+        while q < n and float(t[q]) - last_t < interval:
+            q += 1
+        if q < p:
+            q = p
+        if q >= n:
+            break
+        kept.append(q)
+        last_t = float(t[q])
+        p = q + 1
+    return np.asarray(kept, dtype=np.int64), last_t
+
+
+def fir_taps(source_hz: float, rate_hz: float) -> np.ndarray:
+    """Hamming-windowed sinc low-pass for `source_hz` -> `rate_hz`, unity DC gain (odd length)."""
+    ratio = float(source_hz) / float(rate_hz) if rate_hz > 0 else 1.0
+    if not math.isfinite(ratio) or ratio <= 1.0:
+        return np.ones(1)
+    half = int(math.ceil(2.0 * ratio))
+    k = np.arange(-half, half + 1, dtype=np.float64)
+    fc = 0.45 / ratio  # cycles/sample: just under the output Nyquist (0.5 / ratio)
+    h = 2.0 * fc * np.sinc(2.0 * fc * k) * np.hamming(k.size)
+    return h / h.sum()
+
+
+class _Writer:
+    """Turns (kept-row, numeric values) pairs into output CSV rows."""
+
+    def __init__(self, fout, writer, width: int, num_idx: np.ndarray) -> None:
+        self._f = fout
+        self._w = writer
+        self._width = width
+        self._num_idx = [int(i) for i in num_idx]
+        self.rows_out = 0
+
+    def raw(self, records: Iterable) -> None:
+        for rec in records:
+            if isinstance(rec, str):
+                # Same bytes csv.writer produces for a quote-free row.
+                self._f.write(rec + "\r\n")
+            else:
+                self._w.writerow(rec)
+            self.rows_out += 1
+
+    def numeric(self, heads: Sequence, values: np.ndarray) -> None:
+        out = []
+        for head, vals in zip(heads, values):
+            row = list(_fields(head)[: self._width])
+            if len(row) < self._width:
+                row.extend([""] * (self._width - len(row)))
+            for i, v in zip(self._num_idx, vals.tolist()):
+                row[i] = _fmt(v)
+            out.append(row)
+        self._w.writerows(out)
+        self.rows_out += len(out)
+
+
+class _Reducer:
+    def feed(self, rows: Sequence, num: Optional[np.ndarray], starts: np.ndarray) -> None:
+        """`rows` are one chunk's records, `num` their numeric columns, `starts` the kept-row indices."""
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        pass
+
+
+class _Decimate(_Reducer):
+    def __init__(self, out: _Writer) -> None:
+        self._out = out
+
+    def feed(self, rows, num, starts) -> None:
+        self._out.raw(rows[i] for i in starts.tolist())
+
+
+class _Mean(_Reducer):
+    def __init__(self, out: _Writer, n_cols: int) -> None:
+        self._out = out
+        self._head: Optional[List[str]] = None
+        self._sum = np.zeros(n_cols)
+        self._cnt = np.zeros(n_cols)
+
+    def _emit_open(self) -> None:
+        if self._head is None:
+            return
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(self._cnt > 0, self._sum / np.maximum(self._cnt, 1), np.nan)
+        self._out.numeric([self._head], mean[None, :])
+        self._head = None
+
+    def feed(self, rows, num, starts) -> None:
+        finite = ~np.isnan(num)
+        vals = np.where(finite, num, 0.0)
+        lead = int(starts[0]) if starts.size else len(rows)
+        if lead and self._head is not None:
+            self._sum += vals[:lead].sum(axis=0)
+            self._cnt += finite[:lead].sum(axis=0)
+        if not starts.size:
+            return
+        self._emit_open()
+        sums = np.add.reduceat(vals, starts, axis=0)
+        cnts = np.add.reduceat(finite.astype(np.int64), starts, axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(cnts > 0, sums / np.maximum(cnts, 1), np.nan)
+        if starts.size > 1:
+            self._out.numeric([rows[i] for i in starts[:-1].tolist()], means[:-1])
+        self._head = rows[int(starts[-1])]
+        self._sum = sums[-1].astype(np.float64)
+        self._cnt = cnts[-1].astype(np.float64)
+
+    def finish(self) -> None:
+        self._emit_open()
+
+
+class _Envelope(_Reducer):
+    def __init__(self, out: _Writer, key_pos: int) -> None:
+        self._out = out
+        self._key = int(key_pos)
+        # Open bin: (value, seq, row) of its min and max; seq orders them as in the file.
+        self._lo: Optional[Tuple[float, int, List[str]]] = None
+        self._hi: Optional[Tuple[float, int, List[str]]] = None
+        self._first: Optional[Tuple[int, List[str]]] = None
+        self._seq = 0
+
+    def _absorb(self, rows, key: np.ndarray, a: int, b: int) -> None:
+        seg = key[a:b]
+        if self._first is None:
+            self._first = (self._seq + a, rows[a])
+        if seg.size == 0 or bool(np.all(np.isnan(seg))):
+            return
+        i_lo = a + int(np.nanargmin(seg))
+        i_hi = a + int(np.nanargmax(seg))
+        if self._lo is None or float(key[i_lo]) < self._lo[0]:
+            self._lo = (float(key[i_lo]), self._seq + i_lo, rows[i_lo])
+        if self._hi is None or float(key[i_hi]) > self._hi[0]:
+            self._hi = (float(key[i_hi]), self._seq + i_hi, rows[i_hi])
+
+    def _emit_open(self) -> None:
+        if self._first is None:
+            return
+        if self._lo is None or self._hi is None:
+            self._out.raw([self._first[1]])
+        elif self._lo[1] == self._hi[1]:
+            self._out.raw([self._lo[2]])
+        else:
+            pair = sorted((self._lo, self._hi), key=lambda e: e[1])
+            self._out.raw([pair[0][2], pair[1][2]])
+        self._lo = self._hi = self._first = None
+
+    def feed(self, rows, num, starts) -> None:
+        key = num[:, self._key]
+        bounds = starts.tolist()
+        lead = bounds[0] if bounds else len(rows)
+        if lead and self._first is not None:
+            self._absorb(rows, key, 0, lead)
+        for j, a in enumerate(bounds):
+            self._emit_open()
+            b = bounds[j + 1] if j + 1 < len(bounds) else len(rows)
+            self._absorb(rows, key, a, b)
+        self._seq += len(rows)
+
+    def finish(self) -> None:
+        self._emit_open()
+
+
+# "fir": renormalize over finite samples only while they hold at least this share of the tap weight.
+_FIR_MIN_COVERAGE = 0.5
+
+
+def _fir_nan_aware(win: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """`win @ h` over (rows, cols, taps) windows, treating NaN cells as missing (see module docstring)."""
+    finite = np.isfinite(win)
+    if finite.all():
+        return win @ h
+    out = np.where(finite, win, 0.0) @ h
+    weight = finite @ h
+    good = weight >= _FIR_MIN_COVERAGE * float(h.sum())
+    out = np.divide(out, weight, out=np.full_like(out, np.nan), where=good)
+    if not good.all():
+        # Sparse windows: nearest finite sample to the centre tap (ties go to the earlier one).
+        half = (h.size - 1) // 2
+        dist = np.abs(np.arange(h.size) - half).astype(np.float64)
+        r, c = np.nonzero(~good)
+        d = np.where(finite[r, c], dist, np.inf)
+        k = np.argmin(d, axis=1)
+        picked = win[r, c, k]
+        out[r, c] = np.where(np.isfinite(d[np.arange(k.size), k]), picked, np.nan)
+    return out
+
+
+class _Fir(_Reducer):
+    """Zero-phase FIR evaluated only at kept rows; carries the filter history across chunks."""
+
+    def __init__(self, out: _Writer, taps: np.ndarray) -> None:
+        self._out = out
+        self._h = np.asarray(taps, dtype=np.float64)
+        self._half = (self._h.size - 1) // 2
+        self._buf: Optional[np.ndarray] = None
+        self._buf_g0 = 0  # global valid-row index of _buf[0]
+        self._seen = 0  # valid rows fed so far
+        self._pending: List[Tuple[int, List[str]]] = []
+
+    def _flush(self, upto: int) -> None:
+        """Emit pending rows whose window ends before global row `upto`."""
+        half = self._half
+        ready = [p for p in self._pending if p[0] + half < upto]
+        if not ready:
+            return
+        self._pending = self._pending[len(ready):]
+        idx = np.asarray([g for g, _ in ready], dtype=np.int64) - half - self._buf_g0
+        win = np.lib.stride_tricks.sliding_window_view(self._buf, self._h.size, axis=0)[idx]
+        self._out.numeric([r for _, r in ready], _fir_nan_aware(win, self._h))
+
+    def feed(self, rows, num, starts) -> None:
+        half = self._half
+        if self._buf is None:
+            # Edge-replicate the first row so the opening windows are full.
+            self._buf = np.concatenate([np.repeat(num[:1], half, axis=0), num]) if len(num) else num
+            self._buf_g0 = -half
+        else:
+            self._buf = np.concatenate([self._buf, num])
+        g0 = self._seen
+        self._seen += len(rows)
+        self._pending.extend((g0 + i, rows[i]) for i in starts.tolist())
+        self._flush(self._seen)
+        keep_from = (self._pending[0][0] if self._pending else self._seen) - half
+        cut = max(0, keep_from - self._buf_g0)
+        if cut:
+            self._buf = self._buf[cut:]
+            self._buf_g0 += cut
+
+    def finish(self) -> None:
+        if self._buf is None or not self._pending:
+            return
+        self._buf = np.concatenate([self._buf, np.repeat(self._buf[-1:], self._half, axis=0)])
+        self._flush(self._seen + self._half + 1)
+
+
+def _estimate_source_hz(t: np.ndarray) -> float:
+    if t.size < 2:
+        return 0.0
+    dt = np.diff(t)
+    dt = dt[dt > 0]
+    if not dt.size:
+        return 0.0
+    return 1000.0 / float(np.median(dt))
+
+
+def downsample_csv(
+    source_csv: str,
+    dest_csv: str,
+    *,
+    rate_hz: float = 50.0,
+    strategy: str = "decimate",
+    key_column: Optional[str] = None,
+    text_columns: Optional[Iterable[str]] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> DownsampleStats:
+    """Downsample `source_csv` to `rate_hz` (times in ms) into `dest_csv` with `strategy`."""
+    strategy = str(strategy or "decimate").strip().lower()
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown downsample strategy '{strategy}' (expected one of {', '.join(STRATEGIES)})")
+    if not rate_hz or float(rate_hz) <= 0:
+        raise ValueError("rate_hz must be positive")
+    interval = 1000.0 / float(rate_hz)
+    chunk_rows = max(1024, int(chunk_rows))
+    stats = DownsampleStats(source_csv, dest_csv, strategy, float(rate_hz))
+
+    os.makedirs(os.path.dirname(dest_csv) or ".", exist_ok=True)
+    with open(source_csv, "r", newline="", encoding="utf-8") as fin, open(dest_csv, "w", newline="", encoding="utf-8") as fout:
+        writer = csv.writer(fout)
+        first = fin.readline()
+        header = next(csv.reader([first]), None) if first else None
+        if not header:
+            raise ValueError("CSV header missing")
+        writer.writerow(header)
+
+        headers_map = {h.strip().lower(): i for i, h in enumerate(header)}
+        time_idx = -1
+        for k in _TIME_COLUMNS:
+            if k in headers_map:
+                time_idx = headers_map[k]
+                break
+        if time_idx < 0:
+            raise ValueError("CSV missing required 'time' column")
+        width = len(header)
+        text = {str(c).strip().lower() for c in (text_columns if text_columns is not None else _TEXT_COLUMNS)}
+
+        reducer: Optional[_Reducer] = None
+        out: Optional[_Writer] = None
+        num_idx = np.empty(0, dtype=np.int64)
+        last_t: Optional[float] = None
+        env_col = -1
+
+        reader = None  # csv.reader once a quote shows up
+        while True:
+            if reader is None:
+                lines = list(islice(fin, chunk_rows))
+                if any('"' in ln for ln in lines):
+                    reader = csv.reader(chain(lines, fin))
+                    chunk = list(islice(reader, chunk_rows))
+                else:
+                    chunk = [ln.rstrip("\r\n") for ln in lines]
+            else:
+                chunk = list(islice(reader, chunk_rows))
+            if not chunk:
+                break
+            stats.rows_in += len(chunk)
+            t = _parse_floats(_column_cells(chunk, time_idx))
+            ok = ~np.isnan(t)
+            if not bool(ok.all()):
+                chunk = [r for r, good in zip(chunk, ok.tolist()) if good]
+                t = t[ok]
+                stats.rows_skipped += int((~ok).sum())
+            if not chunk:
+                continue
+
+            num: Optional[np.ndarray] = None
+            if strategy == "envelope" and reducer is not None:
+                num = _parse_floats(_column_cells(chunk, env_col))[:, None]
+            elif strategy != "decimate":
+                if reducer is None:
+                    cand = [j for j in range(width) if j != time_idx and header[j].strip().lower() not in text]
+                    num_idx, num = _detect_numeric(chunk, width, cand)
+                else:
+                    num = _numeric_table(chunk, width, num_idx)
+
+            if reducer is None:
+                out = _Writer(fout, writer, width, num_idx)
+                if strategy == "decimate":
+                    reducer = _Decimate(out)
+                elif strategy == "mean":
+                    reducer = _Mean(out, int(num_idx.size))
+                elif strategy == "envelope":
+                    key = key_column.strip().lower() if key_column else None
+                    names = [header[j].strip().lower() for j in num_idx.tolist()]
+                    cands = (key,) if key else _ENVELOPE_KEYS
+                    pos = next((names.index(c) for c in cands if c in names), None)
+                    if pos is None:
+                        if key or not names:
+                            raise ValueError(f"CSV has no numeric column '{key or 'sum-z'}' for the envelope")
+                        pos = 0
+                    env_col = int(num_idx[pos])
+                    num = num[:, pos : pos + 1]
+                    reducer = _Envelope(out, 0)
+                else:
+                    reducer = _Fir(out, fir_taps(_estimate_source_hz(t), float(rate_hz)))
+
+            starts, last_t = select_rows(t, last_t, interval)
+            reducer.feed(chunk, num, starts)
+
+        if reducer is not None:
+            reducer.finish()
+            stats.rows_out = out.rows_out if out is not None else 0
+    return stats
+
+
+def downsample_job(args: Tuple[str, str, float, str, Optional[str], int]) -> DownsampleStats:
+    """Process-pool task: one file of a batch conversion."""
+    source, dest, rate_hz, strategy, key_column, chunk_rows = args
+    return downsample_csv(source, dest, rate_hz=rate_hz, strategy=strategy, key_column=key_column, chunk_rows=chunk_rows)
@@ -0,0 +1,123 @@
+"""
+Byte/entry budget for on-disk cache directories.
+
+Caches that keep one file per entry use the file's mtime as its LRU timestamp: `touch()`
+on every hit, and `trim()` after inserts drops the least recently used files until the
+directory fits its budget. Safe to run concurrently with readers; a file removed under a
+reader just turns into a cache miss on the next lookup.
+
+Hot write paths use a `TrimThrottle` instead of calling `trim()` on every insert: it keeps a
+running byte/entry estimate of the directory and only walks it when the estimate passes the
+budget (or every N writes, to pick up files written by other processes).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import List, Optional, Tuple
+
+
+def touch(path: str) -> None:
+    """Mark `path` as just used (best-effort)."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def trim(root: str, *, suffix: str, max_bytes: int, max_entries: int) -> int:
+    """
+    Remove least-recently-used `*suffix` files under `root` (recursively) until the total is
+    within `max_bytes` and `max_entries`. Returns the number of files removed.
+    """
+    return _trim(root, suffix=suffix, max_bytes=max_bytes, max_entries=max_entries)[0]
+
+
+def _trim(root: str, *, suffix: str, max_bytes: int, max_entries: int) -> Tuple[int, int, int]:
+    """`trim()` that also reports what is left: (removed, total_bytes, entries)."""
+    entries: List[Tuple[float, int, str]] = []
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if not name.endswith(suffix):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+    if total <= int(max_bytes) and len(entries) <= int(max_entries):
+        return 0, total, len(entries)
+    entries.sort()
+    removed = 0
+    count = len(entries)
+    for _mtime, size, path in entries:
+        if total <= int(max_bytes) and count <= int(max_entries):
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        count -= 1
+        removed += 1
+    return removed, total, count
+
+
+class TrimThrottle:
+    """
+    Decides when a cache directory needs a `trim()` walk.
+
+    The first write after start-up (or after the root changes) always trims and records the
+    directory's size; later writes only add to that estimate. Overwritten entries are counted
+    again, so the estimate errs high and trims early rather than late. Trims triggered by a
+    write go down to `low_water` of the budget, so a full cache is not walked on every insert.
+    """
+
+    def __init__(self, suffix: str, *, low_water: float = 0.9) -> None:
+        self.suffix = suffix
+        self.low_water = min(1.0, max(0.0, float(low_water)))
+        self.scans = 0
+        self._lock = threading.Lock()
+        self._root: Optional[str] = None
+        self._bytes = 0
+        self._entries = 0
+        self._writes = 0
+
+    def trim(self, root: str, *, max_bytes: int, max_entries: int) -> int:
+        """Trim now and resync the estimate. Returns the number of files removed."""
+        with self._lock:
+            return self._trim_locked(root, max_bytes, max_entries)
+
+    def after_write(self, root: str, size: int, *, max_bytes: int, max_entries: int, every: int = 0) -> int:
+        """
+        Account for one `size`-byte file written under `root`; trim only when the estimate is
+        over budget or `every` writes (> 0) have passed since the last walk.
+        """
+        with self._lock:
+            self._writes += 1
+            due = (
+                self._root != root
+                or self._bytes + int(size) > int(max_bytes)
+                or self._entries + 1 > int(max_entries)
+                or (int(every) > 0 and self._writes >= int(every))
+            )
+            if not due:
+                self._bytes += int(size)
+                self._entries += 1
+                return 0
+            return self._trim_locked(root, int(int(max_bytes) * self.low_water), int(int(max_entries) * self.low_water))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._root = None
+
+    def _trim_locked(self, root: str, max_bytes: int, max_entries: int) -> int:
+        removed, self._bytes, self._entries = _trim(root, suffix=self.suffix, max_bytes=max_bytes, max_entries=max_entries)
+        self._root = root
+        self._writes = 0
+        self.scans += 1
+        return removed
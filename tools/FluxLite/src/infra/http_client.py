@@ -1,10 +1,38 @@
+"""
+Backend HTTP client: one pooled keep-alive `requests.Session` shared by every backend REST call.
+
+All backend callers (CSV processing, calibration runner, group mapping, socket-port discovery)
+go through `shared_client()`, so tuning sweeps and rollups reuse a warm connection instead of
+opening a new TCP connection per request. The pool is sized by config.HTTP_POOL_MAXSIZE.
+
+- Timeouts are (connect, read): connect is config.HTTP_CONNECT_TIMEOUT_S; read is the caller's
+  `timeout_s`, else config.HTTP_ENDPOINT_TIMEOUTS_S for the request path, else the default.
+- Retries (config.HTTP_RETRIES, full-jitter exponential backoff) only cover failures that are
+  safe to repeat: the connection was never established, or the request is a GET.
+- Per-endpoint ("METHOD /path") latency goes into rolling histograms (see
+  `diagnostics.live_profiler.RollingHistogram`); `metrics_snapshot()` reports percentiles
+  with request/error/retry counts.
+"""
+
 from __future__ import annotations
 
 import json
+import random
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Mapping
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from .. import config
+from ..diagnostics.live_profiler import UNIT_NS, RollingHistogram
+
+_METRICS_WINDOW_S = 300.0
+_RETRY_STATUS = (502, 503, 504)
 
 
 @dataclass(frozen=True)
@@ -19,31 +47,186 @@ class HttpJsonError(RuntimeError):
         return f"HTTP {code} for {self.url}: {self.message}"
 
 
+class _EndpointStats:
+    def __init__(self) -> None:
+        self.latency = RollingHistogram(UNIT_NS, window_s=_METRICS_WINDOW_S)
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.last_error = ""
+
+
+def _endpoint_key(method: str, url: str) -> str:
+    return f"{method.upper()} {urlparse(url).path or '/'}"
+
+
+def _never_sent(exc: Exception) -> bool:
+    """True when the connection was never established, so the server cannot have seen the request."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        reason = exc.args[0] if exc.args else None
+        reason = getattr(reason, "reason", reason)
+        return isinstance(reason, (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError))
+    return False
+
+
+class BackendHttpClient:
+    """Thread-safe pooled client; use `shared_client()` rather than constructing one per call."""
+
+    def __init__(
+        self,
+        *,
+        pool_maxsize: Optional[int] = None,
+        connect_timeout_s: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff_s: Optional[float] = None,
+    ) -> None:
+        self.pool_maxsize = max(1, int(pool_maxsize if pool_maxsize is not None else config.HTTP_POOL_MAXSIZE))
+        self.connect_timeout_s = float(connect_timeout_s if connect_timeout_s is not None else config.HTTP_CONNECT_TIMEOUT_S)
+        self.retries = max(0, int(retries if retries is not None else config.HTTP_RETRIES))
+        self.backoff_s = float(backoff_s if backoff_s is not None else config.HTTP_RETRY_BACKOFF_S)
+        self.session = requests.Session()
+        # Retries are handled here (method-aware, with metrics), not by urllib3. pool_block keeps
+        # connections bounded: a caller beyond the pool waits for a free connection.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_maxsize, max_retries=0, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._stats: Dict[str, _EndpointStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def read_timeout_for(self, url: str) -> float:
+        path = urlparse(url).path or "/"
+        table = getattr(config, "HTTP_ENDPOINT_TIMEOUTS_S", {}) or {}
+        return float(table.get(path, getattr(config, "HTTP_DEFAULT_TIMEOUT_S", 30.0)))
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout_s: Optional[float] = None,
+        connect_timeout_s: Optional[float] = None,
+        retries: Optional[int] = None,
+        headers: Mapping[str, str] | None = None,
+        data: Any = None,
+    ) -> requests.Response:
+        """Send one request through the pool; raises the last `requests` exception if every attempt failed."""
+        method = method.upper()
+        url = str(url)
+        key = _endpoint_key(method, url)
+        timeout = (
+            float(connect_timeout_s) if connect_timeout_s is not None else self.connect_timeout_s,
+            float(timeout_s) if timeout_s is not None else self.read_timeout_for(url),
+        )
+        attempts = 1 + (self.retries if retries is None else max(0, int(retries)))
+        idempotent = method in ("GET", "HEAD", "OPTIONS")
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            t0 = time.perf_counter_ns()
+            try:
+                resp = self.session.request(method, url, headers=dict(headers or {}), data=data, timeout=timeout)
+            except requests.exceptions.RequestException as exc:
+                retry = not last and (idempotent or _never_sent(exc))
+                self._record(key, None, error=str(exc), retried=retry)
+                if not retry:
+                    raise
+            else:
+                retry = not last and idempotent and resp.status_code in _RETRY_STATUS
+                self._record(key, time.perf_counter_ns() - t0, error=f"HTTP {resp.status_code}" if resp.status_code >= 500 else "", retried=retry)
+                if not retry:
+                    return resp
+                resp.close()
+            time.sleep(random.uniform(0.0, self.backoff_s * (2 ** attempt)))
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _record(self, key: str, elapsed_ns: Optional[int], *, error: str, retried: bool) -> None:
+        with self._stats_lock:
+            st = self._stats.get(key)
+            if st is None:
+                st = self._stats[key] = _EndpointStats()
+            st.requests += 1
+            if elapsed_ns is not None:
+                st.latency.record(int(elapsed_ns), time.perf_counter_ns())
+            if error:
+                st.errors += 1
+                st.last_error = error[:200]
+            if retried:
+                st.retries += 1
+
+    def metrics_snapshot(self) -> Dict[str, object]:
+        """Per-endpoint request/error/retry counts and latency percentiles (ms) over the window."""
+        t = time.perf_counter_ns()
+        out: Dict[str, object] = {}
+        with self._stats_lock:
+            for key, st in sorted(self._stats.items()):
+                lat = st.latency.snapshot(t)
+                out[key] = {
+                    "requests": st.requests,
+                    "errors": st.errors,
+                    "retries": st.retries,
+                    "last_error": st.last_error,
+                    "latency_ms": {k: float(v) / 1e6 for k, v in lat.items() if k not in ("unit", "count", "total")},
+                    "latency_count": lat.get("count", 0),
+                }
+        return {"window_s": _METRICS_WINDOW_S, "pool_maxsize": self.pool_maxsize, "endpoints": out}
+
+    def reset_metrics(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+
+_shared: Optional[BackendHttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> BackendHttpClient:
+    global _shared
+    client = _shared
+    if client is None:
+        with _shared_lock:
+            client = _shared
+            if client is None:
+                client = _shared = BackendHttpClient()
+    return client
+
+
+def metrics_snapshot() -> Dict[str, object]:
+    return shared_client().metrics_snapshot()
+
+
+def _json_or_raise(url: str, resp: requests.Response) -> dict:
+    try:
+        return resp.json() or {}
+    except Exception as e:
+        raise HttpJsonError(url=str(url), status_code=int(resp.status_code), message=f"Invalid JSON response: {e}", response_text=resp.text) from e
+
+
 def get_json(
     url: str,
     *,
-    timeout_s: float = 10.0,
+    timeout_s: float | None = None,
     headers: Mapping[str, str] | None = None,
 ) -> dict:
-    resp = requests.get(str(url), headers=dict(headers or {}), timeout=float(timeout_s))
+    resp = shared_client().request("GET", url, timeout_s=timeout_s, headers=headers)
     if resp.status_code // 100 != 2:
         raise HttpJsonError(url=str(url), status_code=int(resp.status_code), message=resp.text[:500], response_text=resp.text)
-    try:
-        return resp.json() or {}
-    except Exception as e:
-        raise HttpJsonError(url=str(url), status_code=int(resp.status_code), message=f"Invalid JSON response: {e}", response_text=resp.text) from e
+    return _json_or_raise(url, resp)
 
 
 def post_json(
     url: str,
     body: Any,
     *,
-    timeout_s: float = 30.0,
+    timeout_s: float | None = None,
     headers: Mapping[str, str] | None = None,
 ) -> dict:
     hdrs = {"Content-Type": "application/json"}
     hdrs.update(dict(headers or {}))
-    resp = requests.post(str(url), data=json.dumps(body), headers=hdrs, timeout=float(timeout_s))
+    resp = shared_client().request("POST", url, timeout_s=timeout_s, headers=hdrs, data=json.dumps(body))
     if resp.status_code // 100 != 2:
         # Try to pull a useful error message out of JSON, but fall back to text.
         msg = resp.text
@@ -53,9 +236,4 @@ def post_json(
         except Exception:
             pass
         raise HttpJsonError(url=str(url), status_code=int(resp.status_code), message=str(msg)[:500], response_text=resp.text)
-    try:
-        return resp.json() or {}
-    except Exception as e:
-        raise HttpJsonError(url=str(url), status_code=int(resp.status_code), message=f"Invalid JSON response: {e}", response_text=resp.text) from e
-
-
+    return _json_or_raise(url, resp)
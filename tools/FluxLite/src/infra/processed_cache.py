@@ -0,0 +1,249 @@
+"""
+Content-addressed cache of backend `process-csv` outputs.
+
+An entry is keyed on the sha256 of the CSV bytes sent to the backend plus every request
+parameter that can change the NN output (device, temperature-correction flag, mode,
+coefficients, room temperature) and the backend version (`backend_version()`: the git HEAD
+of the DynamoDeluxe checkout, or PROCESSED_CACHE_BACKEND_VERSION), so a backend or model
+update never serves outputs of the previous build. With temperature correction off the
+coefficient mode does not apply, so those runs are all keyed as `OFF_MODE` whatever mode
+string the caller sends. Identical requests from any flow (temperature testing, tuning
+sweeps, rollups, gain analysis) are therefore served from disk instead of the NN.
+
+Entries are plain CSV files under one directory (by default in the per-user cache dir,
+outside the repo), kept within a byte and entry budget by `disk_lru`: a file's mtime
+doubles as its LRU timestamp (touched on every hit), and the directory is trimmed after
+each insert.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .. import config
+from ..project_paths import project_root, user_cache_dir
+from . import disk_lru
+
+_KEY_VERSION = 2
+_HASH_CHUNK = 1 << 20
+# Mode the temperature-testing flow sends for its correction-off baselines.
+OFF_MODE = "legacy"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class ProcessedOutputCache:
+    def __init__(self, root: str, *, max_bytes: int, max_entries: int, backend_version: str = "") -> None:
+        self.root = os.path.abspath(root)
+        self.max_bytes = int(max_bytes)
+        self.max_entries = int(max_entries)
+        self.backend_version = str(backend_version or "")
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        # key -> [lock, holders]; an entry lives only while someone holds or waits on it.
+        self._key_locks: Dict[str, List] = {}
+        self._hash_memo: Dict[Tuple[str, int, int], str] = {}
+
+    # --- keys ---
+
+    def content_hash(self, path: str) -> str:
+        """sha256 of the file bytes, memoized per (path, mtime_ns, size)."""
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+        memo_key = (abs_path, int(st.st_mtime_ns), int(st.st_size))
+        with self._lock:
+            hit = self._hash_memo.get(memo_key)
+        if hit is not None:
+            return hit
+        h = hashlib.sha256()
+        with open(abs_path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            if len(self._hash_memo) > 4096:
+                self._hash_memo.clear()
+            self._hash_memo[memo_key] = digest
+        return digest
+
+    def key(
+        self,
+        *,
+        input_csv_path: str,
+        device_id: str,
+        use_temperature_correction: bool,
+        mode: str,
+        coefficients: Optional[dict],
+        room_temp_f: float,
+    ) -> str:
+        coefs = None
+        if coefficients:
+            coefs = {axis: round(float(coefficients.get(axis, 0.0)), 9) for axis in ("x", "y", "z")}
+        payload = {
+            "v": _KEY_VERSION,
+            "backend": self.backend_version,
+            "input": self.content_hash(input_csv_path),
+            "device_id": str(device_id or "").strip(),
+            "tc": bool(use_temperature_correction),
+            "mode": str(mode or "scalar").strip().lower() if use_temperature_correction else OFF_MODE,
+            "coefs": coefs,
+            "room_temp_f": round(float(room_temp_f), 4),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:40]
+
+    @contextmanager
+    def key_lock(self, key: str) -> Iterator[None]:
+        """
+        Hold the lock for `key` so concurrent identical requests wait for the first instead of all
+        hitting the backend. The lock is dropped once its last holder leaves.
+        """
+        with self._lock:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._key_locks[key]
+
+    # --- entries ---
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.csv")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.entry_path(key)
+        try:
+            if os.path.getsize(path) <= 0:
+                raise OSError
+        except OSError:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        disk_lru.touch(path)
+        with self._lock:
+            self.stats.hits += 1
+        return path
+
+    def materialize(self, key: str, dest_path: str) -> bool:
+        """Copy the cached output for `key` to `dest_path` (atomically). False on miss."""
+        src = self.get(key)
+        if src is None:
+            return False
+        try:
+            _atomic_copy(src, dest_path)
+        except OSError as exc:
+            print(f"[processed_cache] failed to copy cached output to {dest_path}: {exc}")
+            return False
+        return True
+
+    def put(self, key: str, src_path: str) -> Optional[str]:
+        """Store a copy of `src_path` under `key`; returns the entry path (None if the copy failed)."""
+        path = self.entry_path(key)
+        try:
+            _atomic_copy(src_path, path)
+        except OSError as exc:
+            print(f"[processed_cache] failed to store {src_path}: {exc}")
+            return None
+        with self._lock:
+            self.stats.stores += 1
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until within max_bytes / max_entries. Returns the number removed."""
+        removed = disk_lru.trim(self.root, suffix=".csv", max_bytes=self.max_bytes, max_entries=self.max_entries)
+        with self._lock:
+            self.stats.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def _atomic_copy(src: str, dest: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+    tmp = f"{dest}.tmp.{os.getpid()}.{threading.get_ident()}.{int(time.time() * 1e6)}"
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    finally:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def backend_version() -> str:
+    """
+    Version string of the backend that produces outputs (resolved once per process).
+
+    PROCESSED_CACHE_BACKEND_VERSION wins; otherwise the git HEAD of the DynamoDeluxe checkout
+    (PROCESSED_CACHE_BACKEND_DIR, default <repo>/fluxdeluxe/DynamoDeluxe) with a "-dirty"
+    suffix for local changes. Empty when neither is available.
+    """
+    override = str(getattr(config, "PROCESSED_CACHE_BACKEND_VERSION", "") or "").strip()
+    if override:
+        return override
+    path = str(getattr(config, "PROCESSED_CACHE_BACKEND_DIR", "") or "").strip()
+    if not path:
+        path = os.path.join(project_root(), "..", "..", "fluxdeluxe", "DynamoDeluxe")
+    path = os.path.abspath(path)
+    if not os.path.exists(os.path.join(path, ".git")):
+        # Missing or uninitialized submodule (git would report the outer repo's HEAD).
+        return ""
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=path, capture_output=True, text=True, timeout=10, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=path, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except Exception as exc:
+        print(f"[processed_cache] backend version unavailable ({path}): {exc}")
+        return ""
+    return f"{head}-dirty" if head and dirty else head
+
+
+_shared: Optional[ProcessedOutputCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> Optional[ProcessedOutputCache]:
+    """Process-wide cache configured from config (None when PROCESSED_CACHE_ENABLED is off)."""
+    global _shared
+    if not bool(getattr(config, "PROCESSED_CACHE_ENABLED", True)):
+        return None
+    with _shared_lock:
+        if _shared is None:
+            root = str(getattr(config, "PROCESSED_CACHE_DIR", "") or "").strip() or user_cache_dir("processed_cache")
+            _shared = ProcessedOutputCache(
+                root,
+                max_bytes=int(float(getattr(config, "PROCESSED_CACHE_MAX_MB", 4096)) * 1024 * 1024),
+                max_entries=int(getattr(config, "PROCESSED_CACHE_MAX_ENTRIES", 5000)),
+                backend_version=backend_version(),
+            )
+        return _shared
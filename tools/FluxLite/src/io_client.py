@@ -4,14 +4,45 @@ import os
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 import socketio  # type: ignore
 
 from . import config
+from .diagnostics import live_profiler
+from .infra import binary_frames
 
 
 JsonCallback = Callable[[dict], None]
+JsonBatchCallback = Callable[[List[dict]], None]
+BinaryBlocksCallback = Callable[[List["binary_frames.BinaryBlock"]], None]
+
+_PROF_DECODE = live_profiler.histogram("decode")
+_PROF_BATCH = live_profiler.histogram("queue.batch", live_profiler.UNIT_COUNT)
+
+
+def _unpack_message(payload) -> list:
+    """
+    Decode every msgpack object in one simpleJsonData message, reading the socket buffer in place.
+
+    Each message stands alone: a truncated or corrupt message is rejected whole and never
+    carries bytes over into the next one.
+    """
+    try:
+        import msgpack  # type: ignore
+
+        out = []
+        buf = payload
+        while True:
+            try:
+                out.append(msgpack.unpackb(buf, raw=False))
+                return out
+            except msgpack.ExtraData as e:
+                # Several objects packed back to back in one message.
+                out.append(e.unpacked)
+                buf = e.extra
+    except Exception as e:
+        raise RuntimeError(f"failed to decode simpleJsonData msgpack: {e}") from e
 
 
 @dataclass
@@ -30,9 +61,25 @@ class IoClient:
         # NOTE: reconnection is handled by our own loop in _run_forever; keep socketio reconnection off.
         self._sio = socketio.Client(reconnection=False, logger=debug, engineio_logger=debug)
         self._on_json: Optional[JsonCallback] = None
+        self._on_json_batch: Optional[JsonBatchCallback] = None
         self.status = ConnectionStatus()
         self._lock = threading.Lock()
 
+        # simpleJsonData is decoded straight from the socket buffer, one message at a time. Frames
+        # arriving within `batch_window_ms` are coalesced into one batch callback (0 = deliver each
+        # frame immediately).
+        self._batch_window_s = max(0.0, float(getattr(config, "SOCKET_BATCH_WINDOW_MS", 0.0)) / 1000.0)
+        self._batch_max_frames = max(1, int(getattr(config, "SOCKET_BATCH_MAX_FRAMES", 256)))
+        self._batch: List[dict] = []
+        self._batch_started = 0.0
+        self._batch_cond = threading.Condition()
+        self._batch_thread: Optional[threading.Thread] = None
+
+        # Live stream wire format. Starts as the legacy per-sample dict stream; switches to the packed
+        # binary layout only after the backend acknowledges `negotiateStreamFormat`.
+        self.stream_format: str = binary_frames.FORMAT_DICT
+        self._on_blocks: Optional[BinaryBlocksCallback] = None
+
         # Wire events.
         #
         # IMPORTANT: do NOT register internal connect/disconnect handlers here because
@@ -42,6 +89,8 @@ class IoClient:
         # misleading connection state and missing logs.
         self._sio.on("jsonData", self._on_json_data)
         self._sio.on("simpleJsonData", self._on_simple_json_data)
+        self._sio.on("binaryFrameData", self._on_binary_frame_data)
+        self._sio.on("negotiateStreamFormatStatus", self._on_stream_format_status)
         # Optional catch-all: helps diagnose which events are actually arriving.
         # Enable with FLUXLITE_SOCKET_DEBUG_EVENTS=1.
         try:
@@ -58,6 +107,15 @@ class IoClient:
     def set_json_callback(self, cb: JsonCallback) -> None:
         self._on_json = cb
 
+    def set_json_batch_callback(self, cb: Optional[JsonBatchCallback], window_ms: float | None = None) -> None:
+        """
+        Receive coalesced simpleJsonData frames as one list per `window_ms` instead of one
+        `json_callback` call per frame. Pass `cb=None` to go back to per-frame delivery.
+        """
+        self._on_json_batch = cb
+        if window_ms is not None:
+            self._batch_window_s = max(0.0, float(window_ms) / 1000.0)
+
     # NOTE: connect/disconnect handlers are registered by the owner (HardwareService).
 
     def _on_json_data(self, data: dict) -> None:
@@ -68,27 +126,84 @@ class IoClient:
                 # Swallow to avoid breaking the socket thread
                 pass
 
+    def set_binary_blocks_callback(self, cb: Optional[BinaryBlocksCallback]) -> None:
+        """Receive decoded `binaryFrameData` blocks directly (otherwise they are expanded to dict frames)."""
+        self._on_blocks = cb
+
+    def request_stream_format(self, formats: Optional[List[str]] = None) -> None:
+        """
+        Ask the backend for the packed binary stream. Backends that do not know the event
+        simply never answer, and we keep receiving the dict stream.
+        """
+        fmts = list(formats or [binary_frames.FORMAT_NAME, binary_frames.FORMAT_DICT])
+        self.emit("negotiateStreamFormat", {"formats": fmts, "channels": list(binary_frames.CHANNELS)})
+
+    def _on_stream_format_status(self, payload) -> None:
+        try:
+            fmt = str((payload or {}).get("format") or "").strip() if isinstance(payload, dict) else str(payload or "")
+        except Exception:
+            fmt = ""
+        if fmt not in (binary_frames.FORMAT_NAME, binary_frames.FORMAT_DICT):
+            fmt = binary_frames.FORMAT_DICT
+        self.stream_format = fmt
+        try:
+            print(f"[IoClient] stream format: {fmt}")
+        except Exception:
+            pass
+
+    def _on_binary_frame_data(self, payload) -> None:
+        """Decode a packed `axf-f32-v1` frame (one `numpy.frombuffer` per device block)."""
+        try:
+            if not isinstance(payload, (bytes, bytearray, memoryview)):
+                return
+            if live_profiler.enabled:
+                t0 = live_profiler.now()
+                live_profiler.mark_arrival(t0)
+                blocks = binary_frames.decode_frame(payload)
+                _PROF_DECODE.record_since(t0)
+            else:
+                blocks = binary_frames.decode_frame(payload)
+            if self._on_blocks is not None:
+                self._on_blocks(blocks)
+                return
+            for block in blocks:
+                for frame in block.to_frames():
+                    self._dispatch_frame(frame)
+        except Exception as e:
+            try:
+                self.status.last_error = str(e)
+            except Exception:
+                pass
+            try:
+                print(f"[IoClient] binaryFrameData decode failed: {e}")
+            except Exception:
+                pass
+
     def _on_simple_json_data(self, payload) -> None:
         """
         DynamoDeluxe can emit msgpack frames on `simpleJsonData`.
         Decode them and forward through the same json callback path so the UI behaves identically.
         """
-        if self._on_json is None:
+        if self._on_json is None and self._on_json_batch is None:
             return
         try:
             # Server sends bytes from msgpack.packb(...)
             if isinstance(payload, (bytes, bytearray, memoryview)):
-                try:
-                    import msgpack  # type: ignore
-
-                    data = msgpack.unpackb(bytes(payload), raw=False)
-                except Exception as e:
-                    raise RuntimeError(f"failed to decode simpleJsonData msgpack: {e}") from e
+                if live_profiler.enabled:
+                    t0 = live_profiler.now()
+                    live_profiler.mark_arrival(t0)
+                    frames = _unpack_message(payload)
+                    _PROF_DECODE.record_since(t0)
+                else:
+                    frames = _unpack_message(payload)
             else:
                 # Some servers may send already-decoded dicts.
-                data = payload
-            if isinstance(data, dict):
-                self._on_json(data)
+                frames = [payload]
+                if live_profiler.enabled:
+                    live_profiler.mark_arrival(live_profiler.now())
+            for data in frames:
+                if isinstance(data, dict):
+                    self._dispatch_frame(data)
         except Exception as e:
             try:
                 self.status.last_error = str(e)
@@ -99,6 +214,54 @@ class IoClient:
             except Exception:
                 pass
 
+    def _dispatch_frame(self, data: dict) -> None:
+        if self._on_json_batch is None or self._batch_window_s <= 0.0:
+            if self._on_json_batch is not None:
+                self._on_json_batch([data])
+            elif self._on_json is not None:
+                self._on_json(data)
+            return
+        with self._batch_cond:
+            if not self._batch:
+                self._batch_started = time.monotonic()
+                self._batch_cond.notify()
+            self._batch.append(data)
+            if len(self._batch) >= self._batch_max_frames:
+                self._batch_cond.notify()
+
+    def _batch_flush_loop(self) -> None:
+        """Deliver coalesced frames once the batch window has elapsed (or the batch is full)."""
+        while not self._stop_flag.is_set():
+            with self._batch_cond:
+                if not self._batch:
+                    self._batch_cond.wait(0.25)
+                    continue
+                remaining = (self._batch_started + self._batch_window_s) - time.monotonic()
+                if remaining > 0 and len(self._batch) < self._batch_max_frames:
+                    self._batch_cond.wait(remaining)
+                    continue
+                batch, self._batch = self._batch, []
+            self._deliver_batch(batch)
+        # Drain anything left so stop() never drops already-decoded frames silently.
+        with self._batch_cond:
+            batch, self._batch = self._batch, []
+        if batch:
+            self._deliver_batch(batch)
+
+    def _deliver_batch(self, batch: List[dict]) -> None:
+        if live_profiler.enabled:
+            _PROF_BATCH.record(len(batch), live_profiler.now())
+        try:
+            cb = self._on_json_batch
+            if cb is not None:
+                cb(batch)
+            elif self._on_json is not None:
+                for data in batch:
+                    self._on_json(data)
+        except Exception:
+            # Swallow to avoid breaking the flush thread
+            pass
+
     def _on_any_event(self, event, *args) -> None:
         try:
             # Avoid printing huge payloads; just show event + type summary.
@@ -120,6 +283,8 @@ class IoClient:
         self._url = url
         while not self._stop_flag.is_set():
             try:
+                # Re-negotiate the wire format on every connect.
+                self.stream_format = binary_frames.FORMAT_DICT
                 self._sio.connect(url, wait=True, wait_timeout=2.0)
                 # Block here; will return on disconnect or stop
                 while not self._stop_flag.is_set() and self._sio.connected:
@@ -142,6 +307,9 @@ class IoClient:
         self._stop_flag.clear()
         self._thread = threading.Thread(target=self._run_forever, name="IoClientThread", daemon=True)
         self._thread.start()
+        if self._batch_thread is None or not self._batch_thread.is_alive():
+            self._batch_thread = threading.Thread(target=self._batch_flush_loop, name="IoClientBatchThread", daemon=True)
+            self._batch_thread.start()
 
     def stop(self) -> None:
         self._stop_flag.set()
@@ -152,6 +320,10 @@ class IoClient:
             pass
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
+        with self._batch_cond:
+            self._batch_cond.notify_all()
+        if self._batch_thread and self._batch_thread.is_alive():
+            self._batch_thread.join(timeout=1.0)
 
     # Public emit API
     def emit(self, event: str, data: Optional[dict] = None) -> None:
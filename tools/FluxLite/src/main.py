@@ -96,6 +96,10 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Batch rollups analyze in spawned worker processes; required for frozen Windows builds.
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     raise SystemExit(main())
 
 
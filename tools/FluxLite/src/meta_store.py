@@ -74,6 +74,61 @@ def init_db() -> None:
             )
             """
         )
+        # Temperature test index (see app_services/repositories/temperature_test_index.py).
+        # A directory's listing is trusted while its stamp matches the one recorded at scan time.
+        # The mtime_ns columns hold max(st_mtime_ns, st_ctime_ns), not the raw mtime.
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS temp_index_dirs (
+                dir_path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                scanned_at_ns INTEGER NOT NULL
+            )
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS temp_devices (
+                base_dir TEXT NOT NULL,
+                device_id TEXT NOT NULL,
+                PRIMARY KEY (base_dir, device_id)
+            )
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS temp_tests (
+                folder TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                PRIMARY KEY (folder, filename)
+            )
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS temp_processed (
+                folder TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                pos INTEGER NOT NULL,
+                PRIMARY KEY (folder, filename)
+            )
+            """
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS temp_test_meta (
+                meta_path TEXT PRIMARY KEY,
+                folder TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                indexed_at_ns INTEGER NOT NULL,
+                meta_json TEXT,
+                temp_f REAL,
+                avg_checked TEXT
+            )
+            """
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS temp_test_meta_folder ON temp_test_meta (folder)")
         conn.commit()
     finally:
         conn.close()
@@ -351,3 +406,223 @@ def get_runs_for_csv(csv_path: str) -> list[dict]:
     finally:
         conn.close()
 
+
+# --- Temperature test index ---------------------------------------------------
+
+
+def get_temp_index_dir(dir_path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, scanned_at_ns) recorded for an indexed directory, or None if never scanned."""
+    path = _db_file_path()
+    if not os.path.isfile(path):
+        return None
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT mtime_ns, scanned_at_ns FROM temp_index_dirs WHERE dir_path = ?",
+            (str(dir_path),),
+        )
+        row = cur.fetchone()
+        return (int(row[0]), int(row[1])) if row else None
+    finally:
+        conn.close()
+
+
+def _set_temp_index_dir(cur: sqlite3.Cursor, dir_path: str, mtime_ns: int, scanned_at_ns: int) -> None:
+    cur.execute(
+        """
+        INSERT OR REPLACE INTO temp_index_dirs (dir_path, mtime_ns, scanned_at_ns)
+        VALUES (?, ?, ?)
+        """,
+        (str(dir_path), int(mtime_ns), int(scanned_at_ns)),
+    )
+
+
+def replace_temp_index_devices(base_dir: str, mtime_ns: int, scanned_at_ns: int, device_ids: list[str]) -> None:
+    """Replace the indexed device folders of a temp_testing root with a fresh listing."""
+    path = _db_file_path()
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM temp_devices WHERE base_dir = ?", (str(base_dir),))
+        cur.executemany(
+            "INSERT OR IGNORE INTO temp_devices (base_dir, device_id) VALUES (?, ?)",
+            [(str(base_dir), str(d)) for d in device_ids],
+        )
+        _set_temp_index_dir(cur, base_dir, mtime_ns, scanned_at_ns)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def replace_temp_index_folder(
+    folder: str,
+    mtime_ns: int,
+    scanned_at_ns: int,
+    tests: list[str],
+    processed: list[str],
+    meta_names: list[str],
+) -> None:
+    """
+    Replace the indexed listing of one device folder.
+
+    `tests` are raw test CSV names, `processed` every other candidate output CSV name in
+    listing order, `meta_names` the *.meta.json names present (cached meta rows for files
+    that are gone are dropped).
+    """
+    path = _db_file_path()
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        f = str(folder)
+        cur.execute("DELETE FROM temp_tests WHERE folder = ?", (f,))
+        cur.executemany("INSERT OR IGNORE INTO temp_tests (folder, filename) VALUES (?, ?)", [(f, n) for n in tests])
+        cur.execute("DELETE FROM temp_processed WHERE folder = ?", (f,))
+        cur.executemany(
+            "INSERT OR IGNORE INTO temp_processed (folder, filename, pos) VALUES (?, ?, ?)",
+            [(f, n, i) for i, n in enumerate(processed)],
+        )
+        present = {os.path.join(f, n) for n in meta_names}
+        cur.execute("SELECT meta_path FROM temp_test_meta WHERE folder = ?", (f,))
+        gone = [(r[0],) for r in (cur.fetchall() or []) if r[0] not in present]
+        if gone:
+            cur.executemany("DELETE FROM temp_test_meta WHERE meta_path = ?", gone)
+        _set_temp_index_dir(cur, f, mtime_ns, scanned_at_ns)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def list_temp_index_devices(base_dir: str) -> list[str]:
+    path = _db_file_path()
+    if not os.path.isfile(path):
+        return []
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT device_id FROM temp_devices WHERE base_dir = ? ORDER BY device_id", (str(base_dir),))
+        return [str(r[0]) for r in (cur.fetchall() or [])]
+    finally:
+        conn.close()
+
+
+def list_temp_index_tests(folder: str) -> list[str]:
+    path = _db_file_path()
+    if not os.path.isfile(path):
+        return []
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT filename FROM temp_tests WHERE folder = ? ORDER BY filename", (str(folder),))
+        return [str(r[0]) for r in (cur.fetchall() or [])]
+    finally:
+        conn.close()
+
+
+def list_temp_index_processed(folder: str) -> list[str]:
+    """Indexed output CSV names in `folder`, in listing order."""
+    path = _db_file_path()
+    if not os.path.isfile(path):
+        return []
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.execute("SELECT filename FROM temp_processed WHERE folder = ? ORDER BY pos ASC", (str(folder),))
+        return [str(r[0]) for r in (cur.fetchall() or [])]
+    finally:
+        conn.close()
+
+
+def get_temp_test_meta_rows(folder: str) -> dict[str, dict]:
+    """Cached meta rows of one folder keyed by meta_path."""
+    path = _db_file_path()
+    if not os.path.isfile(path):
+        return {}
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.execute(
+            """
+            SELECT meta_path, mtime_ns, size, indexed_at_ns, meta_json, temp_f, avg_checked
+            FROM temp_test_meta
+            WHERE folder = ?
+            """,
+            (str(folder),),
+        )
+        out: dict[str, dict] = {}
+        for r in cur.fetchall() or []:
+            out[str(r[0])] = {
+                "mtime_ns": int(r[1]),
+                "size": int(r[2]),
+                "indexed_at_ns": int(r[3]),
+                "meta_json": r[4],
+                "temp_f": r[5],
+                "avg_checked": r[6],
+            }
+        return out
+    finally:
+        conn.close()
+
+
+def upsert_temp_test_meta(rows: list[dict]) -> None:
+    """Insert/replace cached meta rows (keys: meta_path, folder, mtime_ns, size, indexed_at_ns, meta_json, temp_f, avg_checked)."""
+    if not rows:
+        return
+    path = _db_file_path()
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.executemany(
+            """
+            INSERT OR REPLACE INTO temp_test_meta
+            (meta_path, folder, mtime_ns, size, indexed_at_ns, meta_json, temp_f, avg_checked)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    str(r["meta_path"]),
+                    str(r["folder"]),
+                    int(r["mtime_ns"]),
+                    int(r["size"]),
+                    int(r["indexed_at_ns"]),
+                    r.get("meta_json"),
+                    None if r.get("temp_f") is None else float(r["temp_f"]),
+                    r.get("avg_checked"),
+                )
+                for r in rows
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def delete_temp_test_meta(meta_paths: list[str]) -> None:
+    if not meta_paths:
+        return
+    path = _db_file_path()
+    if not os.path.isfile(path):
+        return
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.executemany("DELETE FROM temp_test_meta WHERE meta_path = ?", [(str(p),) for p in meta_paths])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def set_temp_test_meta_avg_checked(meta_path: str, avg_checked: str | None) -> None:
+    path = _db_file_path()
+    if not os.path.isfile(path):
+        return
+    conn = sqlite3.connect(path)
+    try:
+        cur = conn.cursor()
+        cur.execute(
+            "UPDATE temp_test_meta SET avg_checked = ? WHERE meta_path = ?",
+            (avg_checked, str(meta_path)),
+        )
+        conn.commit()
+    finally:
+        conn.close()
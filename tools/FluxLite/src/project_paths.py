@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from functools import lru_cache
 
 
@@ -26,3 +27,29 @@ def data_dir(folder_name: str) -> str:
     return os.path.join(project_root(), str(folder_name or "").strip())
 
 
+@lru_cache(maxsize=1)
+def user_cache_root() -> str:
+    """
+    Return the per-user cache directory for FluxLite (does not create it).
+
+    Derived caches (parsed CSV columns, backend outputs, analysis intermediates) live here
+    rather than in the repo so they never end up in a checkout or a commit. Override with
+    FLUXLITE_CACHE_DIR; otherwise %LOCALAPPDATA%/Axioforce/FluxLite/cache on Windows,
+    ~/Library/Caches/Axioforce/FluxLite on macOS and $XDG_CACHE_HOME (~/.cache)/axioforce/fluxlite elsewhere.
+    """
+    override = str(os.environ.get("FLUXLITE_CACHE_DIR", "") or "").strip()
+    if override:
+        return os.path.abspath(os.path.expanduser(override))
+    home = os.path.expanduser("~")
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local")
+        return os.path.join(base, "Axioforce", "FluxLite", "cache")
+    if sys.platform == "darwin":
+        return os.path.join(home, "Library", "Caches", "Axioforce", "FluxLite")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+    return os.path.join(base, "axioforce", "fluxlite")
+
+
+def user_cache_dir(folder_name: str) -> str:
+    """Return absolute path to a per-user cache folder (does not create it)."""
+    return os.path.join(user_cache_root(), str(folder_name or "").strip())
@@ -1,6 +1,10 @@
 from __future__ import annotations
+from typing import Optional
+
 from PySide6 import QtCore
 
+from ... import config
+
 from ...app_services.hardware import HardwareService
 from ...app_services.testing import TestingService
 from ...app_services.data_sync import DataSyncService
@@ -14,8 +18,18 @@ class MainController(QtCore.QObject):
     Main controller for the application.
     Coordinates services and provides a central access point for application logic.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        backend_host: Optional[str] = None,
+        http_port: Optional[int] = None,
+        socket_port: Optional[int] = None,
+    ):
         super().__init__()
+        # Backend endpoint handed over by the host (None = use config and discover the socket port)
+        self._backend_host = backend_host
+        self._http_port = http_port
+        self._socket_port = socket_port
         self.hardware = HardwareService()
         self.testing = TestingService(self.hardware)
         self.data_sync = DataSyncService()
@@ -28,7 +42,12 @@ class MainController(QtCore.QObject):
     def start(self):
         """Initialize services and start background tasks."""
         # Connect hardware signals to any global handlers if needed
-        self.hardware.auto_connect()
+        if bool(getattr(config, "AUTO_CONNECT", True)):
+            self.hardware.auto_connect(
+                host=self._backend_host or config.SOCKET_HOST,
+                http_port=int(self._http_port or config.HTTP_PORT),
+                socket_port=self._socket_port,
+            )
 
     def shutdown(self):
         """Cleanup and shutdown services."""
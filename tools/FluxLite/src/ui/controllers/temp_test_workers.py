@@ -4,6 +4,7 @@ from typing import Dict, Optional, List, Tuple
 
 from PySide6 import QtCore
 
+from ... import config
 from ...app_services.testing import TestingService
 from ...app_services.temperature_test_import_service import import_temperature_raw_tests
 
@@ -122,6 +123,8 @@ class PlateTypeAutoSearchWorker(QtCore.QThread):
         self.plate_type = str(plate_type or "").strip()
         self.mode = str(mode or "scalar")
         self.search_mode = str(search_mode or "unified").strip().lower()
+        self.parallel_k = max(1, int(getattr(config, "TEMP_AUTO_SEARCH_PARALLEL_K", 1)))
+        self._aggs: Dict[str, Optional[dict]] = {}
 
     @staticmethod
     def _quantize(v: float, step: float) -> float:
@@ -136,7 +139,7 @@ class PlateTypeAutoSearchWorker(QtCore.QThread):
         key = f"{c:.6f}"
         if key in cache:
             ms = cache[key]
-            return c, (float(ms) if ms is not None else None), None
+            return c, (float(ms) if ms is not None else None), self._aggs.get(key)
 
         coefs = {"x": c, "y": c, "z": c}
         self.status_ready.emit({"status": "running", "message": f"Auto search: evaluating coef {c:.4f}…"})
@@ -152,8 +155,89 @@ class PlateTypeAutoSearchWorker(QtCore.QThread):
             except Exception:
                 ms = None
         cache[key] = ms
+        self._aggs[key] = agg
         return c, ms, agg
 
+    def _eval_many(self, coefs: List[float], *, cache: dict) -> List[tuple[float, Optional[float], Optional[dict]]]:
+        """
+        Evaluate several candidates with one batched rollup (shared bias + worker pools).
+
+        Same clamping/quantization and cache as `_eval`; results come back in input order
+        (duplicates after quantization collapse to one entry).
+        """
+        cands: List[float] = []
+        for coef in coefs:
+            c = self._quantize(max(0.0, min(0.01, float(coef))), 0.0001)
+            if c not in cands:
+                cands.append(c)
+        todo = [c for c in cands if f"{c:.6f}" not in cache]
+        if len(todo) > 1:
+            self.status_ready.emit(
+                {"status": "running", "message": f"Auto search: evaluating coefs {', '.join(f'{c:.4f}' for c in todo)}…"}
+            )
+            self.service.run_temperature_coef_sets_across_plate_type(
+                plate_type=self.plate_type,
+                coef_sets=[{"x": c, "y": c, "z": c} for c in todo],
+                mode=self.mode,
+            )
+            for c in todo:
+                coefs_c = {"x": c, "y": c, "z": c}
+                agg = self.service.aggregate_temperature_coefs_for_plate_type(self.plate_type, coefs=coefs_c, mode=self.mode)
+                ms = None
+                if isinstance(agg, dict):
+                    try:
+                        ms = float(agg.get("mean_signed"))
+                    except Exception:
+                        ms = None
+                cache[f"{c:.6f}"] = ms
+                self._aggs[f"{c:.6f}"] = agg
+        return [self._eval(c, cache=cache) for c in cands]
+
+    def _ksection(
+        self,
+        low_c: float,
+        high_c: float,
+        low_ms: float,
+        high_ms: float,
+        *,
+        step: float,
+        cache: dict,
+        explored: set,
+        maybe_best,
+    ) -> None:
+        """
+        Shrink a sign-flip bracket down to adjacent `step` grid points.
+
+        Each round scores `parallel_k` evenly spaced interior points in one batch and keeps
+        the sub-interval that still contains the flip, so the bracket shrinks ~(K+1)-fold per
+        round instead of 2-fold.
+        """
+        k = self.parallel_k
+        for _ in range(60):
+            if (high_c - low_c) <= step:
+                break
+            width = high_c - low_c
+            pts: List[float] = []
+            for i in range(1, k + 1):
+                c = self._quantize(low_c + width * i / (k + 1), step)
+                if low_c < c < high_c and c not in pts:
+                    pts.append(c)
+            if not pts:
+                break
+            scored: List[Tuple[float, float]] = []
+            for cm, msm, aggm in self._eval_many(pts, cache=cache):
+                explored.add(cm)
+                maybe_best(cm, msm, aggm)
+                if msm is not None:
+                    scored.append((cm, float(msm)))
+            if not scored or any(ms == 0.0 for _, ms in scored):
+                break
+            chain = [(low_c, low_ms)] + sorted(scored) + [(high_c, high_ms)]
+            for (ca, ma), (cb, mb) in zip(chain, chain[1:]):
+                if (ma > 0) != (mb > 0):
+                    low_c, low_ms, high_c, high_ms = ca, ma, cb, mb
+                    break
+
     @staticmethod
     def _sign(v: float) -> int:
         if v > 0:
@@ -273,6 +357,19 @@ class PlateTypeAutoSearchWorker(QtCore.QThread):
             if hi < lo:
                 lo, hi = hi, lo
 
+            if self.parallel_k > 1:
+                self._ksection(
+                    low_c, high_c, low_ms, high_ms, step=refine_step, cache=cache, explored=explored, maybe_best=_maybe_best
+                )
+                self.result_ready.emit(
+                    {
+                        "ok": True,
+                        "message": f"Auto search complete (pre-run bracket): best coef {float(best['coef']):.4f} (mean signed {float(best['mean_signed']):+.2f}%).",
+                        "best": best,
+                    }
+                )
+                return
+
             # Build missing points list.
             pts = []
             n_steps = int(round((hi - lo) / refine_step))
@@ -333,6 +430,10 @@ class PlateTypeAutoSearchWorker(QtCore.QThread):
             next_c = prev_c + direction * coarse_step
             if next_c < min_c or next_c > max_c:
                 break
+            if self.parallel_k > 1 and f"{self._quantize(next_c, 0.0001):.6f}" not in cache:
+                # Speculatively score the next K coarse steps together; the walk below then hits the cache.
+                ahead = [prev_c + direction * coarse_step * j for j in range(1, self.parallel_k + 1)]
+                self._eval_many([c for c in ahead if min_c <= c <= max_c], cache=cache)
             c1, ms1, agg1 = self._eval(next_c, cache=cache)
             explored.add(c1)
             _maybe_best(c1, ms1, agg1)
@@ -367,6 +468,17 @@ class PlateTypeAutoSearchWorker(QtCore.QThread):
         low_c, high_c, low_ms, high_ms = bracket
         self.status_ready.emit({"status": "running", "message": f"Auto search: bracket found [{low_c:.4f}, {high_c:.4f}] (sign flip). Refining…"})
 
+        if self.parallel_k > 1:
+            self._ksection(low_c, high_c, low_ms, high_ms, step=refine_step, cache=cache, explored=explored, maybe_best=_maybe_best)
+            self.result_ready.emit(
+                {
+                    "ok": True,
+                    "message": f"Auto search complete: best coef {float(best['coef']):.4f} (mean signed {float(best['mean_signed']):+.2f}%).",
+                    "best": best,
+                }
+            )
+            return
+
         # Bisection refinement
         for _ in range(60):
             if (high_c - low_c) <= refine_step:
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Optional
+
+from PySide6 import QtCore, QtWidgets
+
+from ...diagnostics import live_profiler
+
+_COLUMNS = ("Metric", "Count", "Mean", "p50", "p90", "p99", "p99.9", "Max")
+_VALUE_KEYS = ("mean", "p50", "p90", "p99", "p99.9", "max")
+
+
+def _fmt(value: object, unit: str) -> str:
+    if value is None:
+        return "—"
+    v = float(value)  # type: ignore[arg-type]
+    if unit == live_profiler.UNIT_COUNT:
+        return f"{v:.1f}" if v % 1 else f"{int(v)}"
+    if v >= 1e6:
+        return f"{v / 1e6:.2f} ms"
+    return f"{v / 1e3:.1f} µs"
+
+
+class LiveProfilerDialog(QtWidgets.QDialog):
+    """Debug panel for the live pipeline profiler (Ctrl+Shift+P on the FluxLite page)."""
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Live Pipeline Profiler")
+        self.setModal(False)
+        self.resize(720, 420)
+
+        root = QtWidgets.QVBoxLayout(self)
+
+        top = QtWidgets.QHBoxLayout()
+        self.chk_enabled = QtWidgets.QCheckBox("Profiling enabled")
+        self.chk_enabled.setChecked(bool(live_profiler.enabled))
+        self.chk_enabled.toggled.connect(live_profiler.set_enabled)
+        self.lbl_window = QtWidgets.QLabel("")
+        top.addWidget(self.chk_enabled)
+        top.addStretch(1)
+        top.addWidget(self.lbl_window)
+        root.addLayout(top)
+
+        self.table = QtWidgets.QTableWidget(0, len(_COLUMNS))
+        self.table.setHorizontalHeaderLabels(list(_COLUMNS))
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        root.addWidget(self.table, 1)
+
+        self.btn_reset = QtWidgets.QPushButton("Reset")
+        self.btn_save = QtWidgets.QPushButton("Save JSON…")
+        self.btn_close = QtWidgets.QPushButton("Close")
+        btn_row = QtWidgets.QHBoxLayout()
+        btn_row.addWidget(self.btn_reset)
+        btn_row.addStretch(1)
+        btn_row.addWidget(self.btn_save)
+        btn_row.addWidget(self.btn_close)
+        root.addLayout(btn_row)
+
+        self.btn_reset.clicked.connect(self._on_reset)
+        self.btn_save.clicked.connect(self._on_save)
+        self.btn_close.clicked.connect(self.close)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event) -> None:  # noqa: N802
+        super().showEvent(event)
+        self.chk_enabled.setChecked(bool(live_profiler.enabled))
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:  # noqa: N802
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self) -> None:
+        snap = live_profiler.snapshot()
+        metrics = dict(snap.get("metrics") or {})
+        self.lbl_window.setText(f"last {float(snap.get('window_s') or 0.0):g} s")
+        self.table.setRowCount(len(metrics))
+        for row, (name, m) in enumerate(metrics.items()):
+            unit = str(m.get("unit") or live_profiler.UNIT_NS)
+            cells = [name, str(int(m.get("count") or 0))] + [_fmt(m.get(k), unit) for k in _VALUE_KEYS]
+            for col, text in enumerate(cells):
+                item = QtWidgets.QTableWidgetItem(text)
+                if col > 0:
+                    item.setTextAlignment(int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter))
+                self.table.setItem(row, col, item)
+
+    def _on_reset(self) -> None:
+        live_profiler.reset()
+        self.refresh()
+
+    def _on_save(self) -> None:
+        default = os.path.join(os.getcwd(), f"live-profile-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save profile", default, "JSON (*.json)")
+        if not path:
+            return
+        try:
+            live_profiler.dump_json(path)
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "Save profile", f"Could not write {path}:\n{e}")
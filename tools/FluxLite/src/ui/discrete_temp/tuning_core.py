@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import csv
 import json
 import os
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
+
+from ... import config
 from ...app_services.backend_csv_processor import process_csv_via_backend
+from ...app_services.temperature_linear_response import linear_response_for, response_mode
+from ...infra.columnar_csv import load_csv_columns, phase_mask
 
 Point = Tuple[float, float]  # (temperature_f, value)
 
@@ -33,35 +38,22 @@ def _read_sum_points(csv_path: str, phase_name: str, axis: str) -> List[Point]:
     """
     Read (sum-t, sum-{axis}) points for a given phase from a discrete-temp-style CSV.
     """
-    if not csv_path or (not os.path.isfile(csv_path)) or os.path.getsize(csv_path) <= 0:
-        return []
-
     axis = str(axis or "").strip().lower()
     if axis not in ("x", "y", "z"):
         return []
 
-    out: List[Point] = []
-    try:
-        with open(csv_path, "r", encoding="utf-8", newline="") as f:
-            # Normalize headers (strip whitespace/BOM) for safety
-            header = next(csv.reader([f.readline()]), [])
-            headers = [(h or "").lstrip("\ufeff").strip() for h in header]
-            reader = csv.DictReader(f, fieldnames=headers, skipinitialspace=True)
-            y_key = f"sum-{axis}"
-            for row in reader:
-                try:
-                    if str(row.get("phase") or "").strip().lower() != str(phase_name).strip().lower():
-                        continue
-                    t = float(row.get("sum-t") or 0.0)
-                    y = float(row.get(y_key) or 0.0)
-                except Exception:
-                    continue
-                out.append((float(t), float(y)))
-    except Exception:
+    # Columns are parsed once per file (and cached on disk); each phase/axis is a mask.
+    table = load_csv_columns(csv_path)
+    if table is None:
         return []
-
-    out.sort(key=lambda p: p[0])
-    return out
+    keep = phase_mask(table, phase_name, "phase")
+    t, t_ok = table.number_or("sum-t")
+    y, y_ok = table.number_or(f"sum-{axis}")
+    keep &= t_ok & y_ok
+    t = t[keep]
+    y = y[keep]
+    order = np.argsort(t, kind="stable")
+    return list(zip(t[order].tolist(), y[order].tolist()))
 
 
 def compute_baseline_targets_from_off(
@@ -178,6 +170,190 @@ def run_backend_candidate(
     )
 
 
+@dataclass
+class CandidateRun:
+    """One (x, y, z) candidate for `evaluate_candidates_batch`; output_csv/score are filled in when it finishes."""
+
+    coeffs: Dict[str, float]
+    output_filename: str
+    output_csv: str = ""
+    score: Optional[TuneScore] = None
+    shortcut: bool = False  # output derived from the OFF run by the linear-response shortcut
+    linear_check: Optional[dict] = None  # shortcut vs backend comparison (validate mode)
+
+    def meta_fields(self) -> dict:
+        """Extra run-meta keys describing how the output was produced."""
+        out: dict = {}
+        if self.shortcut:
+            out["linear_response_shortcut"] = True
+        if self.linear_check is not None:
+            out["linear_response_check"] = self.linear_check
+        return out
+
+
+def evaluate_candidates_batch(
+    runs: Sequence[CandidateRun],
+    *,
+    input_csv_path: str,
+    device_id: str,
+    output_folder: str,
+    targets: Dict[str, Dict[str, float]],
+    baseline_low_f: float,
+    baseline_high_f: float,
+    axes: Tuple[str, ...],
+    weights: Tuple[float, float, float],
+    room_temp_f: float = 76.0,
+    timeout_s: int = 300,
+    sanitize_header: bool = True,
+    hardware: object | None = None,
+    max_in_flight: int | None = None,
+    cancel_cb: Callable[[], bool] | None = None,
+    off_csv_path: str | None = None,
+) -> Iterator[CandidateRun]:
+    """
+    Process and score candidates concurrently, yielding each run as soon as it finishes.
+
+    At most `max_in_flight` backend requests are outstanding at once (config
+    TUNING_MAX_IN_FLIGHT by default). A backend or scoring error cancels the rest of the
+    batch and is re-raised in the caller; `cancel_cb` is polled between completions and
+    raises TuningCancelled (requests already on the wire are abandoned, not awaited).
+
+    With `off_csv_path` (the temperature-off output of the same input), candidates follow
+    TEMP_LINEAR_RESPONSE_MODE: "on" derives them locally instead of calling the backend,
+    "validate" calls the backend and attaches the shortcut's error to each run.
+    """
+    runs = list(runs)
+    if max_in_flight is None:
+        max_in_flight = int(getattr(config, "TUNING_MAX_IN_FLIGHT", 4))
+    limit = max(1, min(int(max_in_flight), len(runs) or 1))
+
+    def _check_cancel() -> None:
+        if cancel_cb is None:
+            return
+        try:
+            requested = bool(cancel_cb())
+        except Exception:
+            return
+        if requested:
+            raise TuningCancelled()
+
+    lr_mode = response_mode() if off_csv_path else "off"
+    linear = linear_response_for(str(off_csv_path), room_temp_f=float(room_temp_f)) if lr_mode != "off" else None
+
+    def _one(run: CandidateRun) -> CandidateRun:
+        if linear is not None and lr_mode == "on":
+            run.output_csv = linear.write_candidate_csv(run.coeffs, os.path.join(output_folder, run.output_filename))
+            run.shortcut = True
+        else:
+            run.output_csv = _backend(run)
+            if linear is not None:
+                try:
+                    run.linear_check = linear.compare_with_backend(run.coeffs, run.output_csv)
+                except Exception as exc:
+                    print(f"[tuning] linear-response check failed for {run.output_filename}: {exc}")
+        run.score = score_candidate_against_targets(
+            run.output_csv,
+            targets,
+            baseline_low_f=float(baseline_low_f),
+            baseline_high_f=float(baseline_high_f),
+            axes=tuple(axes),
+            weights=tuple(weights),
+        )
+        return run
+
+    def _backend(run: CandidateRun) -> str:
+        return run_backend_candidate(
+            input_csv_path=input_csv_path,
+            device_id=device_id,
+            output_folder=output_folder,
+            output_filename=run.output_filename,
+            coeffs=dict(run.coeffs),
+            room_temp_f=float(room_temp_f),
+            timeout_s=int(timeout_s),
+            sanitize_header=bool(sanitize_header),
+            hardware=hardware,
+        )
+
+    if limit <= 1:
+        for run in runs:
+            _check_cancel()
+            yield _one(run)
+            _check_cancel()
+        return
+
+    pool = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="tuning-eval")
+    pending: set[Future] = set()
+    queue = iter(runs)
+    try:
+        for run in queue:
+            pending.add(pool.submit(_one, run))
+            if len(pending) >= limit:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                result = fut.result()
+                _check_cancel()
+                yield result
+            for run in queue:
+                _check_cancel()
+                pending.add(pool.submit(_one, run))
+                if len(pending) >= limit:
+                    break
+    finally:
+        for fut in pending:
+            fut.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class CoordinateWalk:
+    """
+    One direction of a stop-after-N-worse line search along a single axis.
+
+    `values` are visited in order; a score below the walk's best resets the worse streak,
+    anything else extends it, and the walk ends once the streak reaches `worse_limit`.
+    Because every value up to the next `worse_limit - streak` is visited whatever its
+    score, those can all be dispatched together without spending budget on runs the
+    sequential search would have skipped (`lookahead`).
+    """
+
+    def __init__(self, values: Iterable[float], *, worse_limit: int, best: float = float("inf")) -> None:
+        self._values = iter(values)
+        self._queued: List[float] = []
+        self.worse_limit = max(1, int(worse_limit))
+        self.best = float(best)
+        self.best_value: Optional[float] = None
+        self.streak = 0
+        self.done = False
+
+    def lookahead(self) -> List[float]:
+        """Values that will certainly be visited next (empty once the walk is done)."""
+        if self.done:
+            return []
+        want = self.worse_limit - self.streak
+        while len(self._queued) < want:
+            try:
+                self._queued.append(next(self._values))
+            except StopIteration:
+                break
+        if not self._queued:
+            self.done = True
+        return list(self._queued[:want])
+
+    def feed(self, score: float) -> None:
+        """Record the score of the next value (the head of `lookahead()`)."""
+        v = self._queued.pop(0)
+        s = float(score)
+        if s < self.best:
+            self.best = s
+            self.best_value = float(v)
+            self.streak = 0
+        else:
+            self.streak += 1
+            if self.streak >= self.worse_limit:
+                self.done = True
+
+
 def write_run_meta(path: str, payload: dict) -> None:
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
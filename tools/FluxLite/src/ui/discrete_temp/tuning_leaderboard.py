@@ -4,6 +4,8 @@ import json
 import os
 from typing import List
 
+from .tuning_surrogate import load_surrogate_stats
+
 
 def load_top_runs(test_folder: str, limit: int = 10) -> List[dict]:
     """
@@ -60,6 +62,8 @@ def load_leaderboard_and_exploration(
 ) -> tuple[list[dict], dict]:
     """
     Load top runs AND exploration stats for a test folder.
+
+    stats["surrogate"] holds the folder's cumulative surrogate-pruning stats ({} if none).
     """
     base = str(test_folder or "")
     runs_dir = os.path.join(base, "tuning", "runs")
@@ -149,6 +153,7 @@ def load_leaderboard_and_exploration(
             "pairs_explored_yz": int(ny * nz),
             "pairs_explored_total": int(pairs_total),
             "triples_total": int(triples_total),
+            "surrogate": load_surrogate_stats(os.path.join(base, "tuning")),
         }
         return (rows, stats)
 
@@ -162,6 +167,7 @@ def load_leaderboard_and_exploration(
         "pairs_explored_yz": int(len(pairs_yz)),
         "pairs_explored_total": int(len(pairs_xy) + len(pairs_xz) + len(pairs_yz)),
         "triples_total": int(triples_total),
+        "surrogate": load_surrogate_stats(os.path.join(base, "tuning")),
     }
     return (rows, stats)
 
@@ -2,18 +2,21 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from .tuning_core import (
+    CandidateRun,
+    CoordinateWalk,
     TuningCancelled,
     compute_baseline_targets_from_off,
+    evaluate_candidates_batch,
     fmt_coef_tag,
     now_ms,
-    run_backend_candidate,
     run_backend_off_baseline,
     score_candidate_against_targets,
     write_run_meta,
 )
+from .tuning_surrogate import make_surrogate, save_surrogate_stats
 
 
 def run_local_refine_tuning(
@@ -38,6 +41,7 @@ def run_local_refine_tuning(
     progress_cb: Callable[[dict], None] | None = None,
     cancel_cb: Callable[[], bool] | None = None,
     start_coeffs: dict | None = None,
+    max_in_flight: int | None = None,
 ) -> dict:
     def _check_cancel() -> None:
         if cancel_cb is not None:
@@ -160,6 +164,15 @@ def run_local_refine_tuning(
     new_runs = 0
     target_new = max(1, int(add_runs))
     cancelled = False
+    surrogate = make_surrogate()
+    pruned: dict[tuple[float, float, float], float] = {}
+    predictions: dict[tuple[float, float, float], Optional[float]] = {}
+
+    def _known(k: tuple[float, float, float]) -> Optional[float]:
+        """Real score if the triple was run, else its surrogate prediction if it was pruned."""
+        if k in score_cache:
+            return float(score_cache[k])
+        return pruned.get(k)
 
     def _emit_status(msg: str) -> None:
         if progress_cb is None:
@@ -178,46 +191,22 @@ def run_local_refine_tuning(
         except Exception:
             pass
 
-    def _eval(coeffs: dict, *, tag: str) -> Optional[float]:
-        nonlocal run_count, best_score, best_coeffs, best_csv_path, new_runs
-        _check_cancel()
-        k = _key(coeffs["x"], coeffs["y"], coeffs["z"])
-        if k in score_cache:
-            return float(score_cache[k])
-        if new_runs >= target_new:
-            return None
-        new_runs += 1
-        run_count += 1
-        out_tag = f"{fmt_coef_tag(coeffs['x'])}_{fmt_coef_tag(coeffs['y'])}_{fmt_coef_tag(coeffs['z'])}"
-        out_csv = f"run_{run_count:03d}__nn_scalar_{out_tag}.csv"
-        out_path = run_backend_candidate(
-            input_csv_path=input_csv_path,
-            device_id=device_id,
-            output_folder=runs_dir,
-            output_filename=out_csv,
-            coeffs=dict(coeffs),
-            room_temp_f=float(room_temp_f),
-            timeout_s=int(timeout_s),
-            sanitize_header=bool(sanitize_header),
-            hardware=hardware,
-        )
-        _check_cancel()
-        score = score_candidate_against_targets(
-            out_path,
-            targets,
-            baseline_low_f=float(baseline_low_f),
-            baseline_high_f=float(baseline_high_f),
-            axes=tuple(score_axes),
-            weights=tuple(score_weights),
-        )
+    def _record(run: CandidateRun, run_index: int, tag: str) -> float:
+        nonlocal best_score, best_coeffs, best_csv_path
+        coeffs = dict(run.coeffs)
+        out_path = str(run.output_csv)
+        score = run.score
         s = float(score.total)
+        k = _key(coeffs["x"], coeffs["y"], coeffs["z"])
         score_cache[k] = s
+        if surrogate is not None:
+            surrogate.observe(k, predictions.pop(k, None), s)
         if s < best_score:
             best_score = s
             best_coeffs = dict(coeffs)
-            best_csv_path = str(out_path)
+            best_csv_path = out_path
         meta = {
-            "run_index": run_count,
+            "run_index": int(run_index),
             "device_id": device_id,
             "coeffs": dict(coeffs),
             "pair_id": f"refine:{tag}",
@@ -226,21 +215,22 @@ def run_local_refine_tuning(
             "baseline_off_csv": str(off_path),
             "baseline_targets": targets,
             "baseline_score_total": float(baseline_score),
-            "output_csv": str(out_path),
+            "output_csv": out_path,
             "tuning_mode": "local_refine",
             "created_at_ms": now_ms(),
         }
-        write_run_meta(os.path.join(runs_dir, f"run_{run_count:03d}.json"), meta)
+        meta.update(run.meta_fields())
+        write_run_meta(os.path.join(runs_dir, f"run_{int(run_index):03d}.json"), meta)
         if progress_cb is not None:
             try:
                 progress_cb(
                     {
                         "event": "run_complete",
                         "run": {
-                            "run_index": int(run_count),
+                            "run_index": int(run_index),
                             "score_total": float(s),
                             "coeffs": dict(coeffs),
-                            "output_csv": str(out_path),
+                            "output_csv": out_path,
                             "tuning_mode": "local_refine",
                             "created_at_ms": int(meta.get("created_at_ms") or 0),
                         },
@@ -250,18 +240,133 @@ def run_local_refine_tuning(
                         "tuning_mode": "local_refine",
                         "runs_new": int(new_runs),
                         "budget": int(target_new),
+                        "surrogate": surrogate.stats.as_dict() if surrogate is not None else None,
                     }
                 )
             except Exception:
                 pass
         return s
 
+    def _eval_many(items: List[Tuple[dict, str]], *, screen: bool = True) -> Dict[tuple, Optional[float]]:
+        """
+        Score (coeffs, tag) candidates: cache hits directly, surrogate-pruned ones by their
+        prediction (when `screen`), the rest concurrently within the remaining budget.
+        """
+        nonlocal run_count, new_runs
+        _check_cancel()
+        out: Dict[tuple, Optional[float]] = {}
+        batch: List[CandidateRun] = []
+        info: Dict[int, tuple] = {}
+        use_surrogate = bool(screen) and surrogate is not None and surrogate.fit(score_cache)
+        for coeffs, tag in items:
+            k = _key(coeffs["x"], coeffs["y"], coeffs["z"])
+            if k in out:
+                continue
+            if k in score_cache:
+                out[k] = float(score_cache[k])
+                continue
+            if screen and k in pruned:
+                out[k] = float(pruned[k])
+                continue
+            out[k] = None
+            if new_runs >= target_new:
+                continue
+            if use_surrogate:
+                prune, predicted = surrogate.screen(k, best_score)
+                if prune:
+                    pruned[k] = float(predicted)
+                    out[k] = float(predicted)
+                    continue
+                predictions[k] = predicted
+            new_runs += 1
+            run_count += 1
+            out_tag = f"{fmt_coef_tag(coeffs['x'])}_{fmt_coef_tag(coeffs['y'])}_{fmt_coef_tag(coeffs['z'])}"
+            run = CandidateRun(coeffs=dict(coeffs), output_filename=f"run_{run_count:03d}__nn_scalar_{out_tag}.csv")
+            batch.append(run)
+            info[id(run)] = (k, run_count, tag)
+        for run in evaluate_candidates_batch(
+            batch,
+            input_csv_path=input_csv_path,
+            device_id=device_id,
+            output_folder=runs_dir,
+            targets=targets,
+            baseline_low_f=float(baseline_low_f),
+            baseline_high_f=float(baseline_high_f),
+            axes=tuple(score_axes),
+            weights=tuple(score_weights),
+            room_temp_f=float(room_temp_f),
+            timeout_s=int(timeout_s),
+            sanitize_header=bool(sanitize_header),
+            hardware=hardware,
+            max_in_flight=max_in_flight,
+            cancel_cb=cancel_cb,
+            off_csv_path=off_path,
+        ):
+            k, run_index, tag = info[id(run)]
+            out[k] = _record(run, run_index, tag)
+        return out
+
+    def _eval(coeffs: dict, *, tag: str, screen: bool = True) -> Optional[float]:
+        return _eval_many([(coeffs, tag)], screen=screen)[_key(coeffs["x"], coeffs["y"], coeffs["z"])]
+
+    def _walk_both(ax: str, origin: float, s_origin: float) -> List[CoordinateWalk]:
+        """Walk `ax` up and down from `origin` together; each wave submits what both directions will certainly visit."""
+
+        def _up() -> Iterator[float]:
+            v = round(origin + step_v, 7)
+            while v <= axis_max[ax] + 1e-12:
+                yield v
+                v = round(v + step_v, 7)
+
+        def _down() -> Iterator[float]:
+            v = round(origin - step_v, 7)
+            while v >= -1e-12:
+                yield round(max(0.0, v), 7)
+                v = round(v - step_v, 7)
+
+        walks = [
+            (CoordinateWalk(_up(), worse_limit=worse_limit, best=s_origin), f"{ax}:+"),
+            (CoordinateWalk(_down(), worse_limit=worse_limit, best=s_origin), f"{ax}:-"),
+        ]
+
+        def _cand(v: float) -> dict:
+            cand = dict(ref_best)
+            cand[ax] = float(v)
+            return cand
+
+        def _drain() -> None:
+            for walk, _tag in walks:
+                while True:
+                    ahead = walk.lookahead()
+                    if not ahead:
+                        break
+                    c = _cand(ahead[0])
+                    k = _key(c["x"], c["y"], c["z"])
+                    s = _known(k)
+                    if s is None:
+                        break
+                    walk.feed(s)
+
+        while True:
+            _check_cancel()
+            _drain()
+            wanted = [(_cand(v), tag) for walk, tag in walks for v in walk.lookahead()]
+            if not wanted:
+                break
+            scores = _eval_many(wanted)
+            if any(s is None for s in scores.values()):
+                _drain()
+                for walk, _tag in walks:
+                    walk.done = True
+                break
+        return [walk for walk, _tag in walks]
+
     start_key = _key(ref["x"], ref["y"], ref["z"])
     if start_key in score_cache:
         ref_score = float(score_cache[start_key])
     else:
         _emit_status("Refine: evaluating start point…")
-        s0 = _eval(dict(ref), tag="start")
+        s0 = _eval(dict(ref), tag="start", screen=False)
         ref_score = float("inf") if s0 is None else float(s0)
 
     ref_best = dict(ref)
@@ -289,45 +394,11 @@ def run_local_refine_tuning(
                 s_origin = _score_at(origin, f"{ax}:origin")
                 if s_origin is None:
                     break
-                best_dir = float(s_origin)
-                best_dir_val = float(origin)
-
-                worse_streak = 0
-                v = round(origin + step_v, 7)
-                while v <= axis_max[ax] + 1e-12:
-                    s = _score_at(v, f"{ax}:+")
-                    if s is None:
-                        break
-                    s = float(s)
-                    if s < best_dir:
-                        best_dir = s
-                        best_dir_val = float(v)
-                        worse_streak = 0
-                    else:
-                        worse_streak += 1
-                        if worse_streak >= worse_limit:
-                            break
-                    v = round(v + step_v, 7)
-
-                worse_streak = 0
-                v = round(origin - step_v, 7)
-                best_dir2 = float(s_origin)
-                best_dir_val2 = float(origin)
-                while v >= -1e-12:
-                    vc = round(max(0.0, v), 7)
-                    s = _score_at(vc, f"{ax}:-")
-                    if s is None:
-                        break
-                    s = float(s)
-                    if s < best_dir2:
-                        best_dir2 = s
-                        best_dir_val2 = float(vc)
-                        worse_streak = 0
-                    else:
-                        worse_streak += 1
-                        if worse_streak >= worse_limit:
-                            break
-                    v = round(v - step_v, 7)
+                up, down = _walk_both(ax, origin, float(s_origin))
+                best_dir = float(up.best)
+                best_dir_val = float(origin if up.best_value is None else up.best_value)
+                best_dir2 = float(down.best)
+                best_dir_val2 = float(origin if down.best_value is None else down.best_value)
 
                 cand_val = best_dir_val if best_dir < best_dir2 else best_dir_val2
                 cand_score = best_dir if best_dir < best_dir2 else best_dir2
@@ -367,7 +438,7 @@ def run_local_refine_tuning(
                                 ref_best_score = float("inf")
                             moved = True
                         continue
-                    s = _eval(cand, tag=f"nudge:{ax}")
+                    s = _eval(cand, tag=f"nudge:{ax}", screen=False)
                     if s is None:
                         continue
                     ref_best = cand
@@ -400,8 +471,11 @@ def run_local_refine_tuning(
         "completed_runs": int(run_count),
         "tuning_mode": "local_refine",
         "cancelled": bool(cancelled),
+        "surrogate": surrogate.stats.as_dict() if surrogate is not None else None,
         "created_at_ms": now_ms(),
     }
+    if surrogate is not None:
+        save_surrogate_stats(tuning_dir, surrogate.stats)
     write_run_meta(os.path.join(tuning_dir, "best.json"), best_payload)
     return best_payload
 
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+import itertools
 import json
 import os
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from .tuning_core import (
+    CandidateRun,
+    CoordinateWalk,
     TuningCancelled,
     compute_baseline_targets_from_off,
+    evaluate_candidates_batch,
     fmt_coef_tag,
     now_ms,
-    run_backend_candidate,
     run_backend_off_baseline,
     score_candidate_against_targets,
     write_run_meta,
 )
+from .tuning_surrogate import make_surrogate, save_surrogate_stats
 
 
 def _grid_from_max(max_v: float, step: float) -> List[float]:
@@ -69,6 +73,7 @@ def run_pair_sweep_tuning(
     precise_origin_coeffs: dict | None = None,
     precise_offset_max: float = 0.001,
     precise_offset_step: float = 0.0001,
+    max_in_flight: int | None = None,
 ) -> dict:
     from .tuning import tuning_folder_for_test  # avoid circular import at module load
 
@@ -186,49 +191,33 @@ def run_pair_sweep_tuning(
     new_runs = 0
     target_new = max(1, int(add_runs))
     cancelled = False
+    surrogate = make_surrogate()
+    pruned: dict[tuple[float, float, float], float] = {}
+    predictions: dict[tuple[float, float, float], Optional[float]] = {}
 
-    def _eval(coeffs: dict, *, pair_id: str | None = None) -> Optional[float]:
-        nonlocal run_count, best_score, best_coeffs, best_csv_path, new_runs
-        _check_cancel()
-        k = _key(coeffs["x"], coeffs["y"], coeffs["z"])
+    def _known(k: tuple[float, float, float]) -> Optional[float]:
+        """Real score if the triple was run, else its surrogate prediction if it was pruned."""
         if k in score_cache:
             return float(score_cache[k])
-        if new_runs >= target_new:
-            return None
-
-        new_runs += 1
-        run_count += 1
-        tag = f"{fmt_coef_tag(coeffs['x'])}_{fmt_coef_tag(coeffs['y'])}_{fmt_coef_tag(coeffs['z'])}"
-        out_csv = f"run_{run_count:03d}__nn_scalar_{tag}.csv"
-        out_path = run_backend_candidate(
-            input_csv_path=input_csv_path,
-            device_id=device_id,
-            output_folder=runs_dir,
-            output_filename=out_csv,
-            coeffs=dict(coeffs),
-            room_temp_f=float(room_temp_f),
-            timeout_s=int(timeout_s),
-            sanitize_header=bool(sanitize_header),
-            hardware=hardware,
-        )
-        _check_cancel()
-        score = score_candidate_against_targets(
-            out_path,
-            targets,
-            baseline_low_f=float(baseline_low_f),
-            baseline_high_f=float(baseline_high_f),
-            axes=tuple(score_axes),
-            weights=tuple(score_weights),
-        )
+        return pruned.get(k)
+
+    def _record(run: CandidateRun, run_index: int, pair_id: str | None) -> float:
+        nonlocal best_score, best_coeffs, best_csv_path
+        coeffs = dict(run.coeffs)
+        out_path = str(run.output_csv)
+        score = run.score
         s = float(score.total)
+        k = _key(coeffs["x"], coeffs["y"], coeffs["z"])
         score_cache[k] = s
+        if surrogate is not None:
+            surrogate.observe(k, predictions.pop(k, None), s)
         if s < best_score:
             best_score = s
             best_coeffs = dict(coeffs)
-            best_csv_path = str(out_path)
+            best_csv_path = out_path
 
         meta = {
-            "run_index": run_count,
+            "run_index": int(run_index),
             "device_id": device_id,
             "coeffs": dict(coeffs),
             "pair_id": str(pair_id or ""),
@@ -237,21 +226,22 @@ def run_pair_sweep_tuning(
             "baseline_off_csv": str(off_path),
             "baseline_targets": targets,
             "baseline_score_total": float(baseline_score),
-            "output_csv": str(out_path),
+            "output_csv": out_path,
             "tuning_mode": tuning_mode,
             "created_at_ms": now_ms(),
         }
-        write_run_meta(os.path.join(runs_dir, f"run_{run_count:03d}.json"), meta)
+        meta.update(run.meta_fields())
+        write_run_meta(os.path.join(runs_dir, f"run_{int(run_index):03d}.json"), meta)
         if progress_cb is not None:
             try:
                 progress_cb(
                     {
                         "event": "run_complete",
                         "run": {
-                            "run_index": int(run_count),
+                            "run_index": int(run_index),
                             "score_total": float(s),
                             "coeffs": dict(coeffs),
-                            "output_csv": str(out_path),
+                            "output_csv": out_path,
                             "tuning_mode": tuning_mode,
                             "created_at_ms": int(meta.get("created_at_ms") or 0),
                         },
@@ -259,12 +249,74 @@ def run_pair_sweep_tuning(
                         "best_coeffs": dict(best_coeffs or {}),
                         "best_output_csv": str(best_csv_path),
                         "tuning_mode": tuning_mode,
+                        "surrogate": surrogate.stats.as_dict() if surrogate is not None else None,
                     }
                 )
             except Exception:
                 pass
         return s
 
+    def _eval_many(items: List[Tuple[dict, str | None]], *, screen: bool = True) -> Dict[tuple, Optional[float]]:
+        """
+        Score a batch of (coeffs, pair_id) candidates: cached triples are answered from
+        `score_cache`, ones the surrogate rules out get its prediction, and the rest run
+        concurrently (within the remaining budget; None beyond it) and are recorded as each
+        one finishes.
+        """
+        nonlocal run_count, new_runs
+        _check_cancel()
+        out: Dict[tuple, Optional[float]] = {}
+        batch: List[CandidateRun] = []
+        info: Dict[int, tuple] = {}
+        use_surrogate = bool(screen) and surrogate is not None and surrogate.fit(score_cache)
+        for coeffs, pair_id in items:
+            k = _key(coeffs["x"], coeffs["y"], coeffs["z"])
+            if k in out:
+                continue
+            if k in score_cache:
+                out[k] = float(score_cache[k])
+                continue
+            if screen and k in pruned:
+                out[k] = float(pruned[k])
+                continue
+            out[k] = None
+            if new_runs >= target_new:
+                continue
+            if use_surrogate:
+                prune, predicted = surrogate.screen(k, best_score)
+                if prune:
+                    pruned[k] = float(predicted)
+                    out[k] = float(predicted)
+                    continue
+                predictions[k] = predicted
+            new_runs += 1
+            run_count += 1
+            tag = f"{fmt_coef_tag(coeffs['x'])}_{fmt_coef_tag(coeffs['y'])}_{fmt_coef_tag(coeffs['z'])}"
+            run = CandidateRun(coeffs=dict(coeffs), output_filename=f"run_{run_count:03d}__nn_scalar_{tag}.csv")
+            batch.append(run)
+            info[id(run)] = (k, run_count, pair_id)
+        for run in evaluate_candidates_batch(
+            batch,
+            input_csv_path=input_csv_path,
+            device_id=device_id,
+            output_folder=runs_dir,
+            targets=targets,
+            baseline_low_f=float(baseline_low_f),
+            baseline_high_f=float(baseline_high_f),
+            axes=tuple(score_axes),
+            weights=tuple(score_weights),
+            room_temp_f=float(room_temp_f),
+            timeout_s=int(timeout_s),
+            sanitize_header=bool(sanitize_header),
+            hardware=hardware,
+            max_in_flight=max_in_flight,
+            cancel_cb=cancel_cb,
+            off_csv_path=off_path,
+        ):
+            k, run_index, pair_id = info[id(run)]
+            out[k] = _record(run, run_index, pair_id)
+        return out
+
     pairs_total = (len(x_vals) * len(y_vals)) + (len(x_vals) * len(z_vals)) + (len(y_vals) * len(z_vals))
     pairs_done = 0
 
@@ -286,118 +338,119 @@ def run_pair_sweep_tuning(
         except Exception:
             return
 
+    def _precise_up(origin_v: float, step_p: float, axis_max: float) -> Iterator[float]:
+        v3 = round(origin_v + step_p, 7)
+        while v3 <= axis_max + 1e-12:
+            yield v3
+            v3 = round(v3 + step_p, 7)
+
+    def _precise_down(origin_v: float, step_p: float) -> Iterator[float]:
+        v3 = round(origin_v - step_p, 7)
+        while v3 >= -1e-12:
+            yield round(max(0.0, v3), 7)
+            v3 = round(v3 - step_p, 7)
+
+    class _Line:
+        """Search along `third` with the other two axes pinned; precise mode walks both directions from the origin."""
+
+        def __init__(self, third: str, fixed: dict, pair_id: str | None, walks: List[CoordinateWalk]) -> None:
+            self.third = third
+            self.fixed = fixed
+            self.pair_id = pair_id
+            self.walks = walks
+            self.best_local = float("inf")
+            self.best_local_coeffs: Optional[dict] = None
+            self.seen = False
+            self.finished = False
+
+        def cand(self, v3: float) -> dict:
+            c = {"x": 0.0, "y": 0.0, "z": 0.0}
+            c.update(self.fixed)
+            c[self.third] = float(v3)
+            return c
+
+        def drain(self) -> None:
+            """Feed every walk the scores already known (run or pruned), up to its first unscored value."""
+            for walk in self.walks:
+                while True:
+                    ahead = walk.lookahead()
+                    if not ahead:
+                        break
+                    c = self.cand(ahead[0])
+                    k = _key(c["x"], c["y"], c["z"])
+                    s = _known(k)
+                    if s is None:
+                        break
+                    walk.feed(s)
+                    self.seen = True
+                    if s < self.best_local:
+                        self.best_local = s
+                        self.best_local_coeffs = dict(c)
+
+        def done(self) -> bool:
+            return all(w.done for w in self.walks)
+
     def _sweep(third: str, fixed_a: str, fixed_b: str, a_vals: List[float], b_vals: List[float], third_vals: List[float]) -> None:
-        nonlocal pairs_done, best_score, best_coeffs
+        worse_limit = max(1, int(stop_after_worse))
+
+        def _new_line(va: float, vb: float) -> _Line:
+            pid = None
+            if tuning_mode == "precise":
+                origin_v = round(max(0.0, float(origin_by_axis.get(third, 0.0))), 7)
+                step_p = round(float(precise_offset_step if precise_offset_step else 0.0001), 7)
+                if step_p <= 0:
+                    step_p = 0.0001
+                axis_max = max(0.0, float(axis_max_by_axis.get(third, 0.0)))
+                walks = [
+                    CoordinateWalk(itertools.chain([origin_v], _precise_up(origin_v, step_p, axis_max)), worse_limit=worse_limit),
+                    CoordinateWalk(itertools.chain([origin_v], _precise_down(origin_v, step_p)), worse_limit=worse_limit),
+                ]
+            else:
+                pid = f"{fixed_a}{fixed_b}:{round(float(va),7):.7f},{round(float(vb),7):.7f}"
+                walks = [CoordinateWalk(third_vals, worse_limit=worse_limit)]
+            return _Line(third, {fixed_a: float(va), fixed_b: float(vb)}, pid, walks)
+
+        def _finish(line: _Line) -> None:
+            nonlocal pairs_done, best_score, best_coeffs
+            line.finished = True
+            pairs_done += 1
+            if line.best_local_coeffs is not None and line.best_local < best_score:
+                best_score = float(line.best_local)
+                best_coeffs = dict(line.best_local_coeffs)
+            _emit(line.best_local)
+
+        # Every (va, vb) line of a grid row is independent, so the row advances as one wave:
+        # each pass submits the values every live line is certain to visit next.
         for va in a_vals:
             _check_cancel()
             if new_runs >= target_new:
                 return
-            for vb in b_vals:
+            lines = [_new_line(va, vb) for vb in b_vals]
+            while True:
                 _check_cancel()
-                if new_runs >= target_new:
+                wanted: List[Tuple[dict, str | None]] = []
+                for line in lines:
+                    if line.finished:
+                        continue
+                    line.drain()
+                    if line.done():
+                        _finish(line)
+                        continue
+                    for walk in line.walks:
+                        wanted.extend((line.cand(v3), line.pair_id) for v3 in walk.lookahead())
+                if not wanted:
+                    break
+                scores = _eval_many(wanted)
+                if any(s is None for s in scores.values()):
+                    for line in lines:
+                        if line.finished:
+                            continue
+                        line.drain()
+                        for walk in line.walks:
+                            walk.done = True
+                        if line.seen:
+                            _finish(line)
                     return
-                best_local = float("inf")
-                best_local_coeffs: Optional[dict] = None
-                worse_limit = max(1, int(stop_after_worse))
-
-                def _try_v3(v3: float, *, worse_streak: int) -> tuple[bool, int]:
-                    _check_cancel()
-                    if new_runs >= target_new:
-                        return (False, worse_streak)
-                    cand = {"x": 0.0, "y": 0.0, "z": 0.0}
-                    cand[fixed_a] = float(va)
-                    cand[fixed_b] = float(vb)
-                    cand[third] = float(v3)
-                    pid = None
-                    if fixed_a == "x" and fixed_b == "y":
-                        pid = f"xy:{round(float(va),7):.7f},{round(float(vb),7):.7f}"
-                    elif fixed_a == "x" and fixed_b == "z":
-                        pid = f"xz:{round(float(va),7):.7f},{round(float(vb),7):.7f}"
-                    elif fixed_a == "y" and fixed_b == "z":
-                        pid = f"yz:{round(float(va),7):.7f},{round(float(vb),7):.7f}"
-                    s = _eval(cand, pair_id=pid)
-                    if s is None:
-                        return (False, worse_streak)
-                    s = float(s)
-                    nonlocal best_local, best_local_coeffs
-                    if s < best_local:
-                        best_local = s
-                        best_local_coeffs = dict(cand)
-                        return (True, 0)
-                    worse_streak += 1
-                    if worse_streak >= worse_limit:
-                        return (False, worse_streak)
-                    return (True, worse_streak)
-
-                if tuning_mode == "precise":
-                    origin_v = float(origin_by_axis.get(third, 0.0))
-                    origin_v = round(max(0.0, origin_v), 7)
-                    step_p = round(float(precise_offset_step if precise_offset_step else 0.0001), 7)
-                    if step_p <= 0:
-                        step_p = 0.0001
-                    axis_max = float(axis_max_by_axis.get(third, 0.0))
-                    axis_max = max(0.0, axis_max)
-
-                    def _score_at(v3: float) -> Optional[float]:
-                        _check_cancel()
-                        if new_runs >= target_new:
-                            return None
-                        cand = {"x": 0.0, "y": 0.0, "z": 0.0}
-                        cand[fixed_a] = float(va)
-                        cand[fixed_b] = float(vb)
-                        cand[third] = float(v3)
-                        s = _eval(cand)
-                        if s is None:
-                            return None
-                        s = float(s)
-                        nonlocal best_local, best_local_coeffs
-                        if s < best_local:
-                            best_local = s
-                            best_local_coeffs = dict(cand)
-                        return s
-
-                    def _run_direction(start_v: float, step_delta: float, *, clamp_min0: bool, clamp_max: bool) -> None:
-                        worse_streak = 0
-                        s0 = _score_at(start_v)
-                        if s0 is None:
-                            return
-                        best_dir = float(s0)
-                        v3 = round(start_v + step_delta, 7)
-                        while True:
-                            if clamp_min0 and v3 < -1e-12:
-                                break
-                            v_eval = v3
-                            if clamp_min0:
-                                v_eval = round(max(0.0, v_eval), 7)
-                            if clamp_max and v_eval > axis_max + 1e-12:
-                                break
-                            s = _score_at(v_eval)
-                            if s is None:
-                                return
-                            s = float(s)
-                            if s < best_dir:
-                                best_dir = s
-                                worse_streak = 0
-                            else:
-                                worse_streak += 1
-                                if worse_streak >= worse_limit:
-                                    break
-                            v3 = round(v3 + step_delta, 7)
-
-                    _run_direction(origin_v, step_p, clamp_min0=False, clamp_max=True)
-                    _run_direction(origin_v, -step_p, clamp_min0=True, clamp_max=False)
-                else:
-                    worse_streak = 0
-                    for v3 in third_vals:
-                        cont, worse_streak = _try_v3(v3, worse_streak=worse_streak)
-                        if not cont:
-                            break
-
-                pairs_done += 1
-                if best_local_coeffs is not None and best_local < best_score:
-                    best_score = float(best_local)
-                    best_coeffs = dict(best_local_coeffs)
-                _emit(best_local)
 
     try:
         _sweep("z", "x", "y", x_vals, y_vals, z_vals)
@@ -420,8 +473,11 @@ def run_pair_sweep_tuning(
         "pairs_done": int(pairs_done),
         "tuning_mode": tuning_mode,
         "cancelled": bool(cancelled),
+        "surrogate": surrogate.stats.as_dict() if surrogate is not None else None,
         "created_at_ms": now_ms(),
     }
+    if surrogate is not None:
+        save_surrogate_stats(tuning_dir, surrogate.stats)
     write_run_meta(os.path.join(tuning_dir, "best.json"), best_payload)
     return best_payload
 
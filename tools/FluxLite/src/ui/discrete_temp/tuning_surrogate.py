@@ -0,0 +1,201 @@
+"""
+Surrogate score model used to prune tuning candidates before backend calls.
+
+With scalar temperature coefficients the corrected sums move (close to) linearly with
+(cx, cy, cz), so the per-phase MSE score is close to a quadratic in the coefficients. A
+least-squares quadratic over the scores already in `score_cache` therefore predicts
+unseen candidates well once a couple of dozen runs exist. A candidate is pruned when
+even the optimistic end of its prediction interval is worse than the current best by
+more than `margin`; its predicted score stands in for the real one in the search walk
+but is never written to `score_cache` or the run metadata.
+
+Every `audit_every`-th would-be-pruned candidate is run anyway so the pruning rule is
+checked against real scores (`audit_misses` counts audits that came in within the
+margin, i.e. candidates the rule would have wrongly skipped).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from ... import config
+
+Key = Tuple[float, float, float]
+
+SURROGATE_STATS_FILENAME = "surrogate.json"
+
+# Coefficients are ~1e-3; work in units of 1e-3 so the normal equations stay well conditioned.
+_SCALE = 1000.0
+_N_FEATURES = 10
+
+
+@dataclass
+class SurrogateStats:
+    considered: int = 0  # unseen candidates screened by the model
+    pruned: int = 0  # skipped without a backend run
+    audited: int = 0  # would-be-pruned candidates run anyway
+    audit_misses: int = 0  # audited candidates whose real score was within the margin
+    predicted_runs: int = 0  # backend runs that had a prediction to compare against
+    abs_err_sum: float = 0.0
+    rel_err_sum: float = 0.0
+
+    def add(self, other: "SurrogateStats") -> None:
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    def as_dict(self) -> dict:
+        d = asdict(self)
+        d["pruning_ratio"] = float(self.pruned) / float(self.considered) if self.considered else 0.0
+        d["mean_abs_error"] = self.abs_err_sum / float(self.predicted_runs) if self.predicted_runs else None
+        d["mean_rel_error"] = self.rel_err_sum / float(self.predicted_runs) if self.predicted_runs else None
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "SurrogateStats":
+        out = cls()
+        for f in fields(cls):
+            try:
+                setattr(out, f.name, type(getattr(out, f.name))((d or {}).get(f.name) or 0))
+            except Exception:
+                pass
+        return out
+
+
+def _features(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+    x, y, z = x * _SCALE, y * _SCALE, z * _SCALE
+    return np.stack([np.ones_like(x), x, y, z, x * x, y * y, z * z, x * y, x * z, y * z], axis=-1)
+
+
+class QuadraticSurrogate:
+    def __init__(
+        self,
+        *,
+        min_points: int | None = None,
+        margin: float | None = None,
+        z_score: float | None = None,
+        audit_every: int | None = None,
+    ) -> None:
+        self.min_points = max(_N_FEATURES + 2, int(min_points if min_points is not None else config.TUNING_SURROGATE_MIN_POINTS))
+        self.margin = max(0.0, float(margin if margin is not None else config.TUNING_SURROGATE_MARGIN))
+        self.z_score = max(0.0, float(z_score if z_score is not None else config.TUNING_SURROGATE_Z))
+        self.audit_every = max(0, int(audit_every if audit_every is not None else config.TUNING_SURROGATE_AUDIT_EVERY))
+        self.stats = SurrogateStats()
+        self._beta: Optional[np.ndarray] = None
+        self._cov: Optional[np.ndarray] = None  # (Phi^T Phi)^-1
+        self._sigma = 0.0
+        self._fitted_n = -1
+        self._would_prune = 0
+        self._audit: Dict[Key, float] = {}  # audited key -> prune threshold at screening time
+
+    @property
+    def ready(self) -> bool:
+        return self._beta is not None
+
+    def fit(self, score_cache: Dict[Key, float]) -> bool:
+        """Refit on the finite scores in `score_cache` (no-op if its size has not changed)."""
+        n = len(score_cache)
+        if n == self._fitted_n:
+            return self.ready
+        self._fitted_n = n
+        self._beta = None
+        if n < self.min_points:
+            return False
+        pts = np.asarray(list(score_cache.keys()), dtype=np.float64).reshape(-1, 3)
+        s = np.asarray(list(score_cache.values()), dtype=np.float64)
+        ok = np.isfinite(s)
+        if int(ok.sum()) < self.min_points:
+            return False
+        phi = _features(pts[ok, 0], pts[ok, 1], pts[ok, 2])
+        s = s[ok]
+        try:
+            beta, _res, rank, _sv = np.linalg.lstsq(phi, s, rcond=None)
+            if int(rank) < _N_FEATURES:
+                return False
+            cov = np.linalg.pinv(phi.T @ phi)
+        except np.linalg.LinAlgError:
+            return False
+        resid = s - phi @ beta
+        dof = max(1, int(s.shape[0]) - _N_FEATURES)
+        self._beta = beta
+        self._cov = cov
+        self._sigma = float(np.sqrt(float(resid @ resid) / float(dof)))
+        return True
+
+    def predict(self, key: Key) -> Optional[Tuple[float, float]]:
+        """(predicted score, optimistic lower bound) for a candidate, or None before the first fit."""
+        if self._beta is None or self._cov is None:
+            return None
+        phi = _features(*(np.asarray([float(v)]) for v in key))[0]
+        mean = float(phi @ self._beta)
+        se = self._sigma * float(np.sqrt(1.0 + max(0.0, float(phi @ self._cov @ phi))))
+        return (max(0.0, mean), max(0.0, mean - self.z_score * se))
+
+    def screen(self, key: Key, best_score: float) -> Tuple[bool, Optional[float]]:
+        """Decide whether to skip an unseen candidate: (prune, predicted score)."""
+        pred = self.predict(key)
+        self.stats.considered += 1
+        if pred is None or not np.isfinite(best_score):
+            return (False, None if pred is None else pred[0])
+        mean, lower = pred
+        threshold = float(best_score) * (1.0 + self.margin)
+        if lower <= threshold:
+            return (False, mean)
+        self._would_prune += 1
+        if self.audit_every and self._would_prune % self.audit_every == 0:
+            self._audit[key] = threshold
+            self.stats.audited += 1
+            return (False, mean)
+        self.stats.pruned += 1
+        return (True, mean)
+
+    def observe(self, key: Key, predicted: Optional[float], actual: float) -> None:
+        """Record the real score of a run that was screened (prediction error + audit outcome)."""
+        threshold = self._audit.pop(key, None)
+        if threshold is not None and float(actual) <= threshold:
+            self.stats.audit_misses += 1
+        if predicted is None or not np.isfinite(actual):
+            return
+        err = abs(float(predicted) - float(actual))
+        self.stats.predicted_runs += 1
+        self.stats.abs_err_sum += err
+        self.stats.rel_err_sum += err / max(abs(float(actual)), 1e-12)
+
+
+def make_surrogate() -> Optional[QuadraticSurrogate]:
+    """Surrogate configured from config, or None when TUNING_SURROGATE_ENABLED is off."""
+    if not bool(getattr(config, "TUNING_SURROGATE_ENABLED", True)):
+        return None
+    return QuadraticSurrogate()
+
+
+def load_surrogate_stats(tuning_dir: str) -> dict:
+    """Cumulative surrogate stats for a tuning folder ({} if none were recorded)."""
+    try:
+        with open(os.path.join(str(tuning_dir), SURROGATE_STATS_FILENAME), "r", encoding="utf-8") as f:
+            return SurrogateStats.from_dict(json.load(f) or {}).as_dict()
+    except Exception:
+        return {}
+
+
+def save_surrogate_stats(tuning_dir: str, session: SurrogateStats) -> dict:
+    """Fold one tuning session's stats into the folder's cumulative totals; returns the totals."""
+    path = os.path.join(str(tuning_dir), SURROGATE_STATS_FILENAME)
+    total = SurrogateStats()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            total = SurrogateStats.from_dict(json.load(f) or {})
+    except Exception:
+        pass
+    total.add(session)
+    out = total.as_dict()
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(out, f, indent=2, sort_keys=True)
+    except Exception:
+        pass
+    return out
@@ -4,12 +4,15 @@ import copy
 import time
 from typing import Dict, Optional
 
+import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from .. import config
+from ..app_services.live_frame_store import COL, FrameBatch, LiveSamples, merge_batches
 from ..app_services.live_measurement_engine import LiveMeasurementEngine
 from ..app_services.live_test_capture import CaptureContext, TemperatureLiveCaptureManager
 from ..app_services.temperature_post_correction import apply_post_correction_to_run_data, compute_delta_t_f
+from ..diagnostics import live_profiler
 from .bridge import UiBridge  # Keep for compatibility if needed by other components
 from .controllers.main_controller import MainController
 from .pane_switcher import PaneSwitcher
@@ -21,13 +24,35 @@ from .widgets.temp_coef_widget import TempCoefWidget
 from .widgets.temp_plot_widget import TempPlotWidget
 from .widgets.world_canvas import WorldCanvas
 from .widgets.live_cell_details import LiveCellDetailsPanel
+from .dialogs.live_profiler_dialog import LiveProfilerDialog
 from .dialogs.stage_switch_prompt import StageSwitchPromptDialog
 from .mound_render_throttler import MoundRenderThrottler
 from .periodic_tare import PeriodicTareController
-from .live_data_frames import extract_device_frames
 from .live_session_gate_ui import LiveSessionGateUi
 from .live_measurement_ui import LiveMeasurementUi
 
+_PROF_ON_LIVE_DATA = live_profiler.histogram("on_live_data")
+_PROF_EXTRACT = live_profiler.histogram("extract_frames")
+_PROF_MEASUREMENT = live_profiler.histogram("measurement")
+
+
+def _cop_to_m(v: float) -> float:
+    """
+    Normalize COP units across backends.
+
+    Most streams provide COP in meters. Some provide COP in millimeters.
+    If magnitude is implausibly large for meters, assume mm and convert to m.
+    """
+    # COP in meters should typically be within about +/-0.5 m.
+    if abs(v) > 2.0:
+        return v / 1000.0
+    return v
+
+
+def _cop_to_m_array(v: np.ndarray) -> np.ndarray:
+    """`_cop_to_m` over a column."""
+    return np.where(np.abs(v) > 2.0, v / 1000.0, v)
+
 
 class FluxLitePage(QtWidgets.QWidget):
     """
@@ -38,14 +63,22 @@ class FluxLitePage(QtWidgets.QWidget):
 
     connection_status_changed = QtCore.Signal(str)
 
-    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+    def __init__(
+        self,
+        parent: QtWidgets.QWidget | None = None,
+        *,
+        backend_host: Optional[str] = None,
+        http_port: Optional[int] = None,
+        socket_port: Optional[int] = None,
+    ) -> None:
         super().__init__(parent)
 
         # Pane Switching Helper (internal to FluxLite tool)
         self.pane_switcher = PaneSwitcher()
 
         # Initialize Controller
-        self.controller = MainController()
+        # (a host that already knows the backend endpoint passes it through to skip port discovery)
+        self.controller = MainController(backend_host=backend_host, http_port=http_port, socket_port=socket_port)
 
         # Initialize State (View Model)
         self.state = ViewState()
@@ -108,6 +141,12 @@ class FluxLitePage(QtWidgets.QWidget):
         # Legacy Bridge (kept for compatibility)
         self.bridge = UiBridge()
 
+        # Live pipeline profiler debug panel
+        self._profiler_dialog: LiveProfilerDialog | None = None
+        self._profiler_shortcut = QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+P"), self)
+        self._profiler_shortcut.setContext(QtCore.Qt.WidgetWithChildrenShortcut)
+        self._profiler_shortcut.activated.connect(self.show_profiler_dialog)
+
         # UI Setup + wiring
         self._setup_ui()
         self._connect_signals()
@@ -115,6 +154,13 @@ class FluxLitePage(QtWidgets.QWidget):
         # Start Controller (triggers autoconnect)
         self.controller.start()
 
+    def show_profiler_dialog(self) -> None:
+        if self._profiler_dialog is None:
+            self._profiler_dialog = LiveProfilerDialog(self)
+        self._profiler_dialog.show()
+        self._profiler_dialog.raise_()
+        self._profiler_dialog.activateWindow()
+
     @QtCore.Slot()
     def _on_mound_render_tick(self) -> None:
         """
@@ -499,8 +545,8 @@ class FluxLitePage(QtWidgets.QWidget):
         except Exception:
             pass
 
-        # Data Signals
-        self.controller.hardware.data_received.connect(self._on_live_data)
+        # Data Signals: drain the hardware frame store once per coalesced notification
+        self.controller.hardware.frames_available.connect(self._on_frames_available)
 
         # Connect Control Panel signals to Controller
         self.controls.connect_requested.connect(self.controller.hardware.connect)
@@ -691,279 +737,318 @@ class FluxLitePage(QtWidgets.QWidget):
         except Exception as e:
             print(f"[FluxLitePage] Error handling mound group: {e}")
 
-    def _on_live_data(self, payload: dict) -> None:
-        """Handle live streaming data from the backend."""
+    def _on_frames_available(self) -> None:
+        """Handle live streaming data: drain everything the frame store received since the last tick."""
+        if not live_profiler.enabled:
+            self._process_live_batches(self.controller.hardware.frame_store.take_dirty())
+            return
+        t0 = live_profiler.now()
+        live_profiler.take_emitted(t0)
         try:
-            def _cop_to_m(v: object) -> float:
-                """
-                Normalize COP units across backends.
+            self._process_live_batches(self.controller.hardware.frame_store.take_dirty())
+        finally:
+            _PROF_ON_LIVE_DATA.record_since(t0)
 
-                Most streams provide COP in meters. Some provide COP in millimeters.
-                If magnitude is implausibly large for meters, assume mm and convert to m.
-                """
-                try:
-                    x = float(v or 0.0)
-                except Exception:
-                    return 0.0
-                # COP in meters should typically be within about +/-0.5 m.
-                if abs(x) > 2.0:
-                    return x / 1000.0
-                return x
-
-            # Buffer raw payload for discrete temperature testing
-            self.controller.testing.buffer_live_payload(payload)
-
-            # Extract list of device frames
-            frames = extract_device_frames(payload)
-
-            # Find the "active" device selected in UI
-            selected_id = (self.state.selected_device_id or "").strip()
-
-            # Also support mound mode mapping
-            mound_map = self.state.mound_devices if self.state.display_mode == "mound" else {}
-            launch_id = str(mound_map.get("Launch Zone") or "").strip()
-            upper_id = str(mound_map.get("Upper Landing Zone") or "").strip()
-            lower_id = str(mound_map.get("Lower Landing Zone") or "").strip()
-            mound_configured = bool(launch_id and upper_id and lower_id)
-            mound_group_id = str(getattr(self.state, "mound_group_id", "") or "").strip()
+    def _process_live_batches(self, batches: Dict[str, FrameBatch]) -> None:
+        """
+        Feed drained `FrameBatch`es to the live views from their NumPy columns.
 
-            # PERF: Once a mound group is ready, ignore per-plate frames and only process mound virtual frames.
-            # This prevents bogging down the UI when both raw plates and virtual devices are streaming.
-            if self.state.display_mode == "mound" and mound_group_id and isinstance(frames, list) and frames:
-                try:
-                    filtered = []
-                    for fr in frames:
-                        did = str((fr or {}).get("id") or (fr or {}).get("deviceId") or "").strip()
-                        if did.startswith("Pitching Mound."):
-                            filtered.append(fr)
-                    if filtered:
-                        frames = filtered
-                except Exception:
-                    pass
+        Single mode only needs the selected device's columns. Mound mode walks the merged
+        samples one backend packet ("seq") at a time, so plates sent together are paired even
+        when their timestamps differ.
+        """
+        if not batches:
+            return
+        try:
+            self._buffer_discrete_payloads(batches)
+        except Exception as e:
+            self._log_live_error("discrete buffer", e)
 
-            # Smarter mound throttling:
-            # When the mound group is active, just buffer the latest virtual zone samples here (fast),
-            # and let the QTimer render at a stable UI rate.
-            if self._mound_throttler.try_buffer_virtual_zone_frames(
-                display_mode=str(getattr(self.state, "display_mode", "") or ""),
-                mound_group_id=str(mound_group_id or ""),
-                frames=frames if isinstance(frames, list) else [],
-                cop_to_m=_cop_to_m,
-            ):
+        if self.state.display_mode == "mound":
+            try:
+                if live_profiler.enabled:
+                    t_extract = live_profiler.now()
+                samples = merge_batches(batches)
+                if live_profiler.enabled:
+                    _PROF_EXTRACT.record_since(t_extract)
+            except Exception as e:
+                self._log_live_error("merge", e)
                 return
+            self._process_mound_samples(samples)
+            return
 
-            # Sensor View: enable dual-series legend in mound mode
-            try:
-                is_mound = (self.state.display_mode == "mound")
-                if self.sensor_plot_left:
-                    self.sensor_plot_left.set_dual_series_enabled(bool(is_mound))
-                if self.sensor_plot_right:
-                    self.sensor_plot_right.set_dual_series_enabled(bool(is_mound))
-            except Exception:
-                pass
+        # Leaving mound mode restores the single fx/fy/fz series.
+        self._set_dual_series_enabled(False)
 
-            snapshots = {}  # For mound view
-            moments_data = {}  # For moments view
-            mound_samples: dict[str, tuple[int, float, float, float]] = {}  # did -> (t_ms, fx, fy, fz) for this packet
-            mound_virtual: dict[str, tuple[int, float, float, float]] = {}  # "launch"/"landing" -> sample
+        moments_data = {}
+        for did, batch in batches.items():
+            last = batch.rows[-1]
+            moments_data[did] = (int(last[COL["time_ms"]]), float(last[COL["mx"]]), float(last[COL["my"]]), float(last[COL["mz"]]))
+        self._set_moments(moments_data)
 
-            for frame in frames:
-                did = str(frame.get("id") or frame.get("deviceId") or "").strip()
-                if not did:
-                    continue
-                frame_group_id = str(frame.get("groupId") or frame.get("group_id") or "").strip()
+        if self.state.display_mode != "single":
+            return
+        batch = batches.get((self.state.selected_device_id or "").strip())
+        if batch is not None:
+            try:
+                self._process_selected_device(batch)
+            except Exception as e:
+                self._log_live_error("selected device", e)
 
-                try:
-                    fx = float(frame.get("fx", 0.0))
-                    fy = float(frame.get("fy", 0.0))
-                    fz = float(frame.get("fz", 0.0))
-                    t_ms = int(frame.get("time") or frame.get("t") or 0)
-                    # Some streams omit time or send stale timestamps; fall back to a monotonic local clock.
-                    if t_ms <= 0:
-                        try:
-                            t_ms = int(time.time() * 1000)
-                        except Exception:
-                            t_ms = 0
-                    if t_ms <= int(getattr(self, "_stream_time_last_ms", 0) or 0):
-                        try:
-                            t_ms = int(time.time() * 1000)
-                        except Exception:
-                            pass
-                    self._stream_time_last_ms = int(t_ms or 0)
-
-                    # COP
-                    cop = frame.get("cop") or {}
-                    cop_x = _cop_to_m(cop.get("x", 0.0))
-                    cop_y = _cop_to_m(cop.get("y", 0.0))
-
-                    # Moments
-                    moments = frame.get("moments") or {}
-                    mx = float(moments.get("x", 0.0))
-                    my = float(moments.get("y", 0.0))
-                    mz = float(moments.get("z", 0.0))
-                    moments_data[did] = (t_ms, mx, my, mz)
-
-                    # Is this the selected device?
-                    if self.state.display_mode == "single" and did == selected_id:
-                        # 1. Update Sensor Plot (Right pane by default)
-                        if self.sensor_plot_right:
-                            self.sensor_plot_right.add_point(t_ms, fx, fy, fz)
-
-                        # Update Temp Label (Left/Right Sensor Plot)
-                        try:
-                            avg_temp = float(frame.get("avgTemperatureF") or 0.0)
-                            if avg_temp > 1.0:
-                                if self.sensor_plot_left:
-                                    self.sensor_plot_left.set_temperature_f(avg_temp)
-                                if self.sensor_plot_right:
-                                    self.sensor_plot_right.set_temperature_f(avg_temp)
-                            else:
-                                if self.sensor_plot_left:
-                                    self.sensor_plot_left.set_temperature_f(None)
-                                if self.sensor_plot_right:
-                                    self.sensor_plot_right.set_temperature_f(None)
-                        except Exception:
-                            pass
-
-                        # 2. Update Plate View (Left pane by default) - Single Snapshot
-                        is_visible = abs(fz) > 5.0  # Basic threshold
-                        snap = (cop_x, cop_y, fz, t_ms, is_visible, cop_x, cop_y)
-                        self.canvas_left.set_single_snapshot(snap)
-                        self.canvas_right.set_single_snapshot(snap)  # Sync if both showing plate
-
-                        # If stage switch dialog is showing, update force and check threshold
-                        try:
-                            if self._stage_switch_pending and self._stage_switch_dialog is not None:
-                                self._update_stage_switch_dialog_force(float(abs(fz)))
-                        except Exception:
-                            pass
-
-                        # Live testing warmup/tare gating (must complete before measurement)
-                        try:
-                            self._live_gate_ui.process_sample(
-                                t_ms=int(t_ms),
-                                fz_abs_n=float(abs(fz)),
-                                stage_switch_pending=bool(self._stage_switch_pending),
-                            )
-                        except Exception:
-                            pass
-
-                        # Check periodic tare (every 90 seconds after initial tare)
-                        try:
-                            self._periodic_tare.tick(
-                                t_ms=int(t_ms),
-                                fz_abs_n=float(abs(fz)),
-                                    gate_phase=str(getattr(self._live_gate_ui, "phase", "inactive") or "inactive"),
-                                stage_switch_pending=bool(getattr(self, "_stage_switch_pending", False)),
-                                live_meas_phase=str(getattr(self._live_meas, "phase", "idle") or "idle"),
-                                live_meas_active_cell=getattr(self._live_meas, "active_cell", None),
-                            )
-                        except Exception:
-                            pass
-
-                        # Live testing measurement engine (arming -> stability -> capture)
-                        if self._live_gate_ui.is_active():
-                            try:
-                                self._live_measurement_ui.process_sample(
-                                    self,
-                                    t_ms=t_ms,
-                                    cop_x_m=cop_x,
-                                    cop_y_m=cop_y,
-                                    fz_n=fz,
-                                    is_visible=is_visible,
-                                )
-                            except Exception:
-                                pass
-
-                    # Mound mapping
-                    if self.state.display_mode == "mound":
-                        # Preferred (newer backends): virtual zone devices stream directly.
-                        # Only trust these once a mound group is ready, and optionally match group id.
-                        if did in ("Pitching Mound.Launch Zone", "Pitching Mound.Landing Zone"):
-                            if mound_group_id and frame_group_id and frame_group_id != mound_group_id:
-                                # Ignore packets from a different mound group.
-                                pass
-                            else:
-                                is_visible = abs(fz) > 5.0
-                                snap = (cop_x, cop_y, fz, t_ms, is_visible, cop_x, cop_y)
-                                if did.endswith("Launch Zone"):
-                                    snapshots["Launch Zone"] = snap
-                                    mound_virtual["launch"] = (t_ms, fx, fy, fz)
-                                else:
-                                    # Draw landing COP centered between the two 08 plates.
-                                    snapshots["Landing Zone"] = snap
-                                    mound_virtual["landing"] = (t_ms, fx, fy, fz)
-
-                        # Collect samples so we can avoid interleaving the two landing plates into one series.
-                        if mound_configured and did in (launch_id, upper_id, lower_id):
-                            mound_samples[did] = (t_ms, fx, fy, fz)
-
-                        for pos_name, mapped_id in mound_map.items():
-                            if mapped_id == did:
-                                is_visible = abs(fz) > 5.0
-                                snap = (cop_x, cop_y, fz, t_ms, is_visible, cop_x, cop_y)
-                                snapshots[pos_name] = snap
-                                break
+    def _set_dual_series_enabled(self, enabled: bool) -> None:
+        try:
+            if self.sensor_plot_left:
+                self.sensor_plot_left.set_dual_series_enabled(enabled)
+            if self.sensor_plot_right:
+                self.sensor_plot_right.set_dual_series_enabled(enabled)
+        except Exception:
+            pass
 
-                except Exception:
-                    continue
+    def _log_live_error(self, where: str, exc: Exception) -> None:
+        """Report a live-path failure without flooding the console (at most one line per second)."""
+        now = time.monotonic()
+        self._live_errors_suppressed = int(getattr(self, "_live_errors_suppressed", 0) or 0) + 1
+        if now - float(getattr(self, "_live_error_logged_at", 0.0) or 0.0) < 1.0:
+            return
+        n, self._live_errors_suppressed = self._live_errors_suppressed, 0
+        self._live_error_logged_at = now
+        more = f" (+{n - 1} more)" if n > 1 else ""
+        print(f"[FluxLitePage] live {where} failed: {exc!r}{more}")
+
+    def _buffer_discrete_payloads(self, batches: Dict[str, FrameBatch]) -> None:
+        """
+        Raw-stream samples of the discrete-temp session's device go to its buffer as payload dicts.
+        Binary batches carry no named sensors and are skipped; TestingService holds the stream on
+        dicts for the session, so only packets that arrive before the switch is acknowledged are lost.
+        """
+        sess = self.controller.testing.current_session
+        if not sess or not getattr(sess, "is_discrete_temp", False):
+            return
+        batch = batches.get(str(getattr(sess, "device_id", "") or "").strip())
+        if batch is None or batch.sensors is None:
+            return
+        for fr in batch.frames():
+            self.controller.testing.buffer_live_payload(fr)
 
-            if self.state.display_mode == "mound" and snapshots:
-                self.canvas_left.set_snapshots(snapshots)
-                self.canvas_right.set_snapshots(snapshots)
+    def _stream_times(self, t: np.ndarray) -> np.ndarray:
+        """
+        Stream timestamps, made monotonic: a missing or stale time falls back to the local clock.
+        Advances `_stream_time_last_ms`.
+        """
+        last = int(getattr(self, "_stream_time_last_ms", 0) or 0)
+        t = np.trunc(t)
+        if t.shape[0] and t[0] > last and t[0] > 0 and (t.shape[0] == 1 or bool(np.all(np.diff(t) > 0))):
+            self._stream_time_last_ms = int(t[-1])
+            return t
+        out = t.copy()
+        for i, t_ms in enumerate(t.tolist()):
+            if t_ms <= 0 or t_ms <= last:
+                t_ms = float(int(time.time() * 1000))
+            out[i] = t_ms
+            last = int(t_ms)
+        self._stream_time_last_ms = last
+        return out
+
+    def _set_moments(self, moments_data: dict) -> None:
+        if not moments_data:
+            return
+        try:
+            if self.moments_view_left:
+                self.moments_view_left.set_moments(moments_data)
+            if self.moments_view_right:
+                self.moments_view_right.set_moments(moments_data)
+        except Exception:
+            pass
 
-            # Sensor View (dual-series): Launch vs best landing (Upper or Lower) to avoid flicker.
-            if self.state.display_mode == "mound":
-                try:
-                    if mound_virtual:
-                        # Use the explicit virtual zone packets when available.
-                        if "launch" in mound_virtual:
-                            t_ms, fx, fy, fz = mound_virtual["launch"]
-                            if self.sensor_plot_left:
-                                self.sensor_plot_left.add_point_launch(t_ms, fx, fy, fz)
-                            if self.sensor_plot_right:
-                                self.sensor_plot_right.add_point_launch(t_ms, fx, fy, fz)
-                        if "landing" in mound_virtual:
-                            t_ms, fx, fy, fz = mound_virtual["landing"]
-                            if self.sensor_plot_left:
-                                self.sensor_plot_left.add_point_landing(t_ms, fx, fy, fz)
-                            if self.sensor_plot_right:
-                                self.sensor_plot_right.add_point_landing(t_ms, fx, fy, fz)
-                    elif mound_configured and mound_samples:
-                        # Back-compat: Launch vs best landing (Upper or Lower) to avoid flicker.
-                        if launch_id in mound_samples:
-                            t_ms, fx, fy, fz = mound_samples[launch_id]
-                            if self.sensor_plot_left:
-                                self.sensor_plot_left.add_point_launch(t_ms, fx, fy, fz)
-                            if self.sensor_plot_right:
-                                self.sensor_plot_right.add_point_launch(t_ms, fx, fy, fz)
-
-                        cand = []
-                        if upper_id in mound_samples:
-                            cand.append(mound_samples[upper_id])
-                        if lower_id in mound_samples:
-                            cand.append(mound_samples[lower_id])
-                        if cand:
-                            t_ms, fx, fy, fz = max(cand, key=lambda s: abs(float(s[3])))
-                            if self.sensor_plot_left:
-                                self.sensor_plot_left.add_point_landing(t_ms, fx, fy, fz)
-                            if self.sensor_plot_right:
-                                self.sensor_plot_right.add_point_landing(t_ms, fx, fy, fz)
-                except Exception:
-                    pass
+    def _process_selected_device(self, batch: FrameBatch) -> None:
+        """Single mode: sensor plot, plate view and the live measurement chain for the selected device."""
+        t = self._stream_times(batch.column("time_ms"))
+        fx, fy, fz = batch.column("fx"), batch.column("fy"), batch.column("fz")
+        cop_x = _cop_to_m_array(batch.column("cop_x"))
+        cop_y = _cop_to_m_array(batch.column("cop_y"))
 
-            if moments_data:
-                try:
-                    if self.moments_view_left:
-                        self.moments_view_left.set_moments(moments_data)
-                    if self.moments_view_right:
-                        self.moments_view_right.set_moments(moments_data)
-                except Exception:
-                    pass
+        # 1. Sensor plot (right pane by default): the whole run in one append
+        if self.sensor_plot_right:
+            self.sensor_plot_right.add_points(t, fx, fy, fz)
 
+        # Temperature label (left/right sensor plot) from the newest sample
+        try:
+            avg_temp = float(batch.rows[-1, COL["temp_f"]])
+            value = avg_temp if avg_temp > 1.0 else None
+            if self.sensor_plot_left:
+                self.sensor_plot_left.set_temperature_f(value)
+            if self.sensor_plot_right:
+                self.sensor_plot_right.set_temperature_f(value)
         except Exception:
             pass
 
+        # 2. Plate view (left pane by default): newest sample as the single snapshot
+        fz_last = float(fz[-1])
+        snap = (float(cop_x[-1]), float(cop_y[-1]), fz_last, int(t[-1]), abs(fz_last) > 5.0, float(cop_x[-1]), float(cop_y[-1]))
+        self.canvas_left.set_single_snapshot(snap)
+        self.canvas_right.set_single_snapshot(snap)  # Sync if both showing plate
+
+        # 3. Stateful per-sample consumers, in stream order
+        for t_ms, fz_n, cx, cy in zip(t.tolist(), fz.tolist(), cop_x.tolist(), cop_y.tolist()):
+            t_ms = int(t_ms)
+            fz_abs = abs(fz_n)
+            is_visible = fz_abs > 5.0  # Basic threshold
+
+            # If stage switch dialog is showing, update force and check threshold
+            try:
+                if self._stage_switch_pending and self._stage_switch_dialog is not None:
+                    self._update_stage_switch_dialog_force(fz_abs)
+            except Exception:
+                pass
+
+            # Live testing warmup/tare gating (must complete before measurement)
+            try:
+                self._live_gate_ui.process_sample(
+                    t_ms=t_ms,
+                    fz_abs_n=fz_abs,
+                    stage_switch_pending=bool(self._stage_switch_pending),
+                )
+            except Exception:
+                pass
+
+            # Check periodic tare (every 90 seconds after initial tare)
+            try:
+                self._periodic_tare.tick(
+                    t_ms=t_ms,
+                    fz_abs_n=fz_abs,
+                    gate_phase=str(getattr(self._live_gate_ui, "phase", "inactive") or "inactive"),
+                    stage_switch_pending=bool(getattr(self, "_stage_switch_pending", False)),
+                    live_meas_phase=str(getattr(self._live_meas, "phase", "idle") or "idle"),
+                    live_meas_active_cell=getattr(self._live_meas, "active_cell", None),
+                )
+            except Exception:
+                pass
+
+            # Live testing measurement engine (arming -> stability -> capture)
+            if self._live_gate_ui.is_active():
+                prof = live_profiler.enabled
+                if prof:
+                    t_meas = live_profiler.now()
+                try:
+                    self._live_measurement_ui.process_sample(
+                        self,
+                        t_ms=t_ms,
+                        cop_x_m=cx,
+                        cop_y_m=cy,
+                        fz_n=fz_n,
+                        is_visible=is_visible,
+                    )
+                except Exception as e:
+                    self._log_live_error("measurement", e)
+                if prof:
+                    _PROF_MEASUREMENT.record_since(t_meas)
+
+    def _process_mound_samples(self, samples: LiveSamples) -> None:
+        """Mound mode: one pass per backend packet, so the landing plates of one packet are paired."""
+        # Sensor View: dual-series legend in mound mode
+        self._set_dual_series_enabled(True)
+
+        rows = samples.rows.tolist()
+        dev = samples.device.tolist()
+        ids, gids = samples.device_ids, samples.group_ids
+        moments_data: dict = {}
+        for a, b in samples.packets():
+            try:
+                self._process_mound_packet([(ids[d], gids[d], r) for d, r in zip(dev[a:b], rows[a:b])], moments_data)
+            except Exception as e:
+                self._log_live_error("mound packet", e)
+        self._set_moments(moments_data)
+
+    def _process_mound_packet(self, packet: list, moments_data: dict) -> None:
+        """One backend packet of (device_id, group_id, FRAME_COLUMNS row) samples."""
+        mound_map = self.state.mound_devices or {}
+        launch_id = str(mound_map.get("Launch Zone") or "").strip()
+        upper_id = str(mound_map.get("Upper Landing Zone") or "").strip()
+        lower_id = str(mound_map.get("Lower Landing Zone") or "").strip()
+        mound_configured = bool(launch_id and upper_id and lower_id)
+        mound_group_id = str(getattr(self.state, "mound_group_id", "") or "").strip()
+
+        # PERF: Once a mound group is ready, ignore per-plate samples and only process mound virtual samples.
+        # This prevents bogging down the UI when both raw plates and virtual devices are streaming.
+        if mound_group_id:
+            virtual = [s for s in packet if s[0].startswith("Pitching Mound.")]
+            if virtual:
+                packet = virtual
+
+        # Smarter mound throttling:
+        # When the mound group is active, just buffer the latest virtual zone samples here (fast),
+        # and let the QTimer render at a stable UI rate.
+        if self._mound_throttler.try_buffer_virtual_zone_samples(
+            display_mode="mound",
+            mound_group_id=mound_group_id,
+            samples=packet,
+            cop_to_m=_cop_to_m,
+        ):
+            return
+
+        snapshots = {}
+        mound_samples: dict[str, tuple[int, float, float, float]] = {}  # did -> (t_ms, fx, fy, fz) for this packet
+        mound_virtual: dict[str, tuple[int, float, float, float]] = {}  # "launch"/"landing" -> sample
+
+        for did, frame_group_id, row in packet:
+            t_raw, fx, fy, fz, cx, cy, mx, my, mz = row[:9]
+            t_ms = int(t_raw)
+            # Some streams omit time or send stale timestamps; fall back to a monotonic local clock.
+            if t_ms <= 0 or t_ms <= int(getattr(self, "_stream_time_last_ms", 0) or 0):
+                t_ms = int(time.time() * 1000)
+            self._stream_time_last_ms = t_ms
+            cop_x = _cop_to_m(cx)
+            cop_y = _cop_to_m(cy)
+            moments_data[did] = (t_ms, mx, my, mz)
+            is_visible = abs(fz) > 5.0
+            snap = (cop_x, cop_y, fz, t_ms, is_visible, cop_x, cop_y)
+
+            # Preferred (newer backends): virtual zone devices stream directly.
+            # Only trust these once a mound group is ready, and optionally match group id.
+            if did in ("Pitching Mound.Launch Zone", "Pitching Mound.Landing Zone"):
+                if not (mound_group_id and frame_group_id and frame_group_id != mound_group_id):
+                    if did.endswith("Launch Zone"):
+                        snapshots["Launch Zone"] = snap
+                        mound_virtual["launch"] = (t_ms, fx, fy, fz)
+                    else:
+                        # Draw landing COP centered between the two 08 plates.
+                        snapshots["Landing Zone"] = snap
+                        mound_virtual["landing"] = (t_ms, fx, fy, fz)
+
+            # Collect samples so we can avoid interleaving the two landing plates into one series.
+            if mound_configured and did in (launch_id, upper_id, lower_id):
+                mound_samples[did] = (t_ms, fx, fy, fz)
+
+            for pos_name, mapped_id in mound_map.items():
+                if mapped_id == did:
+                    snapshots[pos_name] = snap
+                    break
+
+        if snapshots:
+            self.canvas_left.set_snapshots(snapshots)
+            self.canvas_right.set_snapshots(snapshots)
+
+        # Sensor View (dual-series): Launch vs best landing (Upper or Lower) to avoid flicker.
+        plots = [p for p in (self.sensor_plot_left, self.sensor_plot_right) if p]
+        if mound_virtual:
+            # Use the explicit virtual zone samples when available.
+            if "launch" in mound_virtual:
+                for p in plots:
+                    p.add_point_launch(*mound_virtual["launch"])
+            if "landing" in mound_virtual:
+                for p in plots:
+                    p.add_point_landing(*mound_virtual["landing"])
+        elif mound_configured and mound_samples:
+            # Back-compat: Launch vs best landing (Upper or Lower) to avoid flicker.
+            if launch_id in mound_samples:
+                for p in plots:
+                    p.add_point_launch(*mound_samples[launch_id])
+            cand = [mound_samples[d] for d in (upper_id, lower_id) if d in mound_samples]
+            if cand:
+                best = max(cand, key=lambda s: abs(float(s[3])))
+                for p in plots:
+                    p.add_point_landing(*best)
+
     def _on_live_session_started(self, _session) -> None:
         """Begin warmup + off-plate tare gating for the new session."""
         self._reset_live_gate("session_started")
@@ -28,54 +28,48 @@ class MoundRenderThrottler:
         self._latest: dict[str, dict] = {}
         self._last_rendered_ms: dict[str, int] = {"launch": 0, "landing": 0}
 
-    def try_buffer_virtual_zone_frames(
+    def try_buffer_virtual_zone_samples(
         self,
         *,
         display_mode: str,
         mound_group_id: str,
-        frames: list,
-        cop_to_m: Callable[[object], float],
+        samples: list,
+        cop_to_m: Callable[[float], float],
     ) -> bool:
         """
         Fast-path: if we're in mound mode and the mound group is active, buffer just the latest
-        virtual-zone frames ("Pitching Mound.Launch Zone" / "Pitching Mound.Landing Zone") and return True.
+        virtual-zone samples ("Pitching Mound.Launch Zone" / "Pitching Mound.Landing Zone") and return True.
+
+        `samples` are (device_id, group_id, row) with `row` in `live_frame_store.FRAME_COLUMNS` order.
         """
         if display_mode != "mound":
             return False
         if not mound_group_id:
             return False
-        if not isinstance(frames, list) or not frames:
+        if not isinstance(samples, list) or not samples:
             return False
 
         try:
-            for frame in frames:
-                did = str((frame or {}).get("id") or (frame or {}).get("deviceId") or "").strip()
+            for did, frame_group_id, row in samples:
                 if did not in ("Pitching Mound.Launch Zone", "Pitching Mound.Landing Zone"):
                     continue
 
-                frame_group_id = str((frame or {}).get("groupId") or (frame or {}).get("group_id") or "").strip()
                 if frame_group_id and frame_group_id != mound_group_id:
                     continue
 
-                t_ms = int((frame or {}).get("time") or (frame or {}).get("t") or 0)
+                t_raw, fx, fy, fz, cop_x, cop_y, mx, my, mz = row[:9]
+                t_ms = int(t_raw)
                 if t_ms <= 0:
                     t_ms = int(time.time() * 1000)
 
-                cop = (frame or {}).get("cop") or {}
-                moments = (frame or {}).get("moments") or {}
-
                 entry = {
                     "t_ms": int(t_ms),
-                    "fx": float((frame or {}).get("fx", 0.0)),
-                    "fy": float((frame or {}).get("fy", 0.0)),
-                    "fz": float((frame or {}).get("fz", 0.0)),
-                    "cop_x": float(cop_to_m(cop.get("x", 0.0))),
-                    "cop_y": float(cop_to_m(cop.get("y", 0.0))),
-                    "moments": {
-                        "x": float(moments.get("x", 0.0)),
-                        "y": float(moments.get("y", 0.0)),
-                        "z": float(moments.get("z", 0.0)),
-                    },
+                    "fx": float(fx),
+                    "fy": float(fy),
+                    "fz": float(fz),
+                    "cop_x": float(cop_to_m(cop_x)),
+                    "cop_y": float(cop_to_m(cop_y)),
+                    "moments": {"x": float(mx), "y": float(my), "z": float(mz)},
                     "group_id": frame_group_id,
                 }
 
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, Dict
+from collections import deque
+from typing import Deque, Optional, Tuple, Dict
 
+import numpy as np
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from ... import config
+from ...diagnostics import live_profiler
+from .force_series import ForceSeriesRing, decimate_minmax
 
 
 class ForcePlotWidget(QtWidgets.QWidget):
@@ -69,32 +73,23 @@ class ForcePlotWidget(QtWidgets.QWidget):
                 self._use_pg = False
                 self._pg = None
         # No header added to the layout to keep plot minimal
-        self._samples: list[tuple[int, float, float, float]] = []  # (t_ms, fx, fy, fz) single-device mode
-        self._samples_launch: list[tuple[int, float, float, float]] = []
-        self._samples_landing: list[tuple[int, float, float, float]] = []
-        self._max_points = 600  # ~10s at 60 Hz
+        # (t_ms, fx, fy, fz) history per series; both backends draw from these
+        self._window_ms = int(getattr(config, "PLOT_WINDOW_MS", 10_000))
+        capacity = int(getattr(config, "PLOT_BUFFER_CAPACITY", 16384))
+        self._single = ForceSeriesRing(capacity)
+        self._launch = ForceSeriesRing(capacity)
+        self._landing = ForceSeriesRing(capacity)
         self._auto_scale = True
         self._y_min = -10.0
         self._y_max = 10.0
-        # Pyqtgraph curves and buffers when using pg
+        # Pyqtgraph curves when using pg
         self._pg_curves: Dict[str, object] = {}
-        self._pg_x_single: list[int] = []
-        self._pg_fx: list[float] = []
-        self._pg_fy: list[float] = []
-        self._pg_fz: list[float] = []
-        self._pg_x_launch: list[int] = []
-        self._pg_lx: list[float] = []
-        self._pg_ly: list[float] = []
-        self._pg_lz: list[float] = []
-        self._pg_x_land: list[int] = []
-        self._pg_rx: list[float] = []
-        self._pg_ry: list[float] = []
-        self._pg_rz: list[float] = []
         # Time zero for relative axis formatting (ms)
         self._time0_ms: Optional[int] = None
 
         # Temperature buffer for 10-second rolling average
-        self._temp_buffer: list[tuple[float, float]] = [] # (time_sec, temp_f)
+        self._temp_buffer: Deque[tuple[float, float]] = deque()  # (time_sec, temp_f)
+        self._temp_sum = 0.0
         self._last_temp_update_time = 0.0
         
         if self._use_pg and self._pg is not None:
@@ -206,8 +201,9 @@ class ForcePlotWidget(QtWidgets.QWidget):
             except Exception:
                 pass
             def mkcurve(color: tuple[int, int, int], name: str):
+                # Data arrives pre-decimated to ~2 vertices per pixel (see _pg_refresh).
                 return self._plot_widget.plot(  # type: ignore[attr-defined]
-                    pen=pg.mkPen(color=color, width=2), name=name, clipToView=True, autoDownsample=True
+                    pen=pg.mkPen(color=color, width=2), name=name, clipToView=False, autoDownsample=False
                 )
             # Single
             self._pg_curves["fx"] = mkcurve((220, 80, 80), "Fx")
@@ -250,6 +246,16 @@ class ForcePlotWidget(QtWidgets.QWidget):
         self._autoscale_every_n: int = int(max(1, getattr(config, "PLOT_AUTOSCALE_DAMP_EVERY_N", 2)))
         self._autoscale_counter: int = 0
 
+        # Samples only mark the plot dirty; this timer repaints at most once per display
+        # refresh (capped by PLOT_MAX_FPS) and stops itself when no new data arrives.
+        self._repaint_pending = False
+        self._repaint_timer = QtCore.QTimer(self)
+        try:
+            self._repaint_timer.setTimerType(QtCore.Qt.PreciseTimer)
+        except Exception:
+            pass
+        self._repaint_timer.timeout.connect(self._on_repaint_tick)
+
         # Bottom-left overlay for current readings and Smooth toggle
         self._value_container = QtWidgets.QWidget(self)
         self._value_container.setObjectName("force_plot_value_container")
@@ -286,56 +292,107 @@ class ForcePlotWidget(QtWidgets.QWidget):
         )
         # Keep our line toggles in the top bar for both backends
 
-    def _pg_trim(self, xs: list[int], ys: list[float]) -> None:
-        if len(xs) > self._max_points:
-            del xs[:-self._max_points]
-            del ys[:-self._max_points]
-
-    # Trim helpers that keep X and all Y arrays in sync
-    def _pg_trim_single_all(self) -> None:
-        overflow = len(self._pg_x_single) - self._max_points
-        if overflow > 0:
-            del self._pg_x_single[:overflow]
-            del self._pg_fx[:overflow]
-            del self._pg_fy[:overflow]
-            del self._pg_fz[:overflow]
-
-    def _pg_trim_launch_all(self) -> None:
-        overflow = len(self._pg_x_launch) - self._max_points
-        if overflow > 0:
-            del self._pg_x_launch[:overflow]
-            del self._pg_lx[:overflow]
-            del self._pg_ly[:overflow]
-            del self._pg_lz[:overflow]
-
-    def _pg_trim_land_all(self) -> None:
-        overflow = len(self._pg_x_land) - self._max_points
-        if overflow > 0:
-            del self._pg_x_land[:overflow]
-            del self._pg_rx[:overflow]
-            del self._pg_ry[:overflow]
-            del self._pg_rz[:overflow]
+    # ---- series bookkeeping -------------------------------------------------
+
+    def _visible_series(self) -> list[tuple[str, ForceSeriesRing]]:
+        """(curve key prefix, ring) for the series currently on screen."""
+        if not self._dual_enabled:
+            return [("f", self._single)]
+        out: list[tuple[str, ForceSeriesRing]] = []
+        if self._legend_launch.isChecked():
+            out.append(("l", self._launch))
+        if self._legend_landing.isChecked():
+            out.append(("r", self._landing))
+        return out
+
+    def _view_end_ms(self) -> Optional[float]:
+        """Right edge of the time window: newest sample across the active series."""
+        rings = (self._launch, self._landing) if self._dual_enabled else (self._single,)
+        ends = [t for t in (r.latest_t() for r in rings) if t is not None]
+        return max(ends) if ends else None
+
+    def _window_peak_abs(self) -> float:
+        end = self._view_end_ms()
+        if end is None:
+            return 0.0
+        peak = 0.0
+        for _key, ring in self._visible_series():
+            _t, v = ring.since(end - self._window_ms)
+            if v.shape[0]:
+                peak = max(peak, float(np.abs(v).max()))
+        return peak
+
+    def _schedule_repaint(self) -> None:
+        self._repaint_pending = True
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start(self._repaint_interval_ms())
+
+    def _repaint_interval_ms(self) -> int:
+        hz = float(getattr(config, "PLOT_MAX_FPS", 60))
+        try:
+            screen = self.screen() or QtGui.QGuiApplication.primaryScreen()
+            refresh = float(screen.refreshRate()) if screen is not None else 0.0
+            if refresh > 1.0:
+                hz = min(hz, refresh)
+        except Exception:
+            pass
+        return int(max(1, round(1000.0 / max(1.0, hz))))
+
+    def _on_repaint_tick(self) -> None:
+        if not self._repaint_pending:
+            self._repaint_timer.stop()
+            return
+        self._repaint_pending = False
+        if self._use_pg:
+            if live_profiler.enabled:
+                t0 = live_profiler.now()
+                self._pg_refresh()
+                live_profiler.record_render("plot", t0)
+            else:
+                self._pg_refresh()
+        else:
+            self.update()
+
+    def _plot_width_px(self) -> int:
+        try:
+            if self._plot_widget is not None:
+                vb = self._plot_widget.getPlotItem().getViewBox()  # type: ignore[attr-defined]
+                return int(max(50, vb.width()))
+        except Exception:
+            pass
+        return int(max(50, self.width()))
+
+    def _pg_refresh(self) -> None:
+        """Push the decimated visible window of each on-screen series to its curves."""
+        if self._plot_widget is None:
+            return
+        end = self._view_end_ms()
+        if end is None:
+            return
+        start = end - self._window_ms
+        buckets = self._plot_width_px()
+        try:
+            for key, ring in self._visible_series():
+                t, v = ring.since(start)
+                xs, ys = decimate_minmax(t, v, start, end, buckets)
+                for i, axis in enumerate("xyz"):
+                    self._pg_curves[key + axis].setData(xs, ys[:, i])  # type: ignore[union-attr]
+            self._pg_set_view_last_ms(self._window_ms)
+            self._pg_update_y_range_min(10.0, 1.15)
+        except Exception:
+            pass
 
     def _pg_set_view_last_ms(self, window_ms: int = 10_000) -> None:
         # Clamp X range to show at most window_ms
         if self._plot_widget is None:
             return
-        max_x = None
-        if self._dual_enabled:
-            if self._pg_x_launch:
-                max_x = self._pg_x_launch[-1]
-            if self._pg_x_land:
-                mx = self._pg_x_land[-1]
-                max_x = mx if max_x is None else max(max_x, mx)
-        else:
-            if self._pg_x_single:
-                max_x = self._pg_x_single[-1]
+        max_x = self._view_end_ms()
         if max_x is None:
             return
         left = max(0, int(max_x) - int(window_ms))
         right = int(max_x)
         try:
-            self._plot_widget.setXRange(left, right)  # type: ignore[attr-defined]
+            self._plot_widget.setXRange(left, right, padding=0)  # type: ignore[attr-defined]
         except Exception:
             pass
 
@@ -343,29 +400,17 @@ class ForcePlotWidget(QtWidgets.QWidget):
         if self._plot_widget is None:
             return
         try:
-            peaks: list[float] = []
-            if not self._dual_enabled:
-                for arr in (self._pg_fx, self._pg_fy, self._pg_fz):
-                    if arr:
-                        peaks.append(max(abs(v) for v in arr))
-            else:
-                if self._legend_launch.isChecked():
-                    for arr in (self._pg_lx, self._pg_ly, self._pg_lz):
-                        if arr:
-                            peaks.append(max(abs(v) for v in arr))
-                if self._legend_landing.isChecked():
-                    for arr in (self._pg_rx, self._pg_ry, self._pg_rz):
-                        if arr:
-                            peaks.append(max(abs(v) for v in arr))
-            peak = max(peaks) if peaks else 0.0
-            target = max(min_abs, peak * headroom)
+            target = max(min_abs, self._window_peak_abs() * headroom)
             self._plot_widget.setYRange(-target, target)  # type: ignore[attr-defined]
         except Exception:
             pass
+
     def _on_legend_toggle_change(self, _v: int) -> None:
         # Painter backend uses these in draw; pg backend must apply visibility
         if self._use_pg:
             self._apply_pg_series_visibility()
+            # Hidden curves are not refreshed while hidden; bring them up to date.
+            self._schedule_repaint()
         self.update()
 
     def _apply_pg_series_visibility(self) -> None:
@@ -402,11 +447,14 @@ class ForcePlotWidget(QtWidgets.QWidget):
             if value_f is not None:
                 # Add sample
                 self._temp_buffer.append((now, float(value_f)))
+                self._temp_sum += float(value_f)
             
-            # Prune samples older than 10 seconds
+            # Prune samples older than 10 seconds (running sum: this runs for every live sample)
             cutoff = now - 10.0
             while self._temp_buffer and self._temp_buffer[0][0] < cutoff:
-                self._temp_buffer.pop(0)
+                self._temp_sum -= self._temp_buffer.popleft()[1]
+            if not self._temp_buffer:
+                self._temp_sum = 0.0
             
             # Update display at ~10Hz (every 0.1s)
             if now - self._last_temp_update_time >= 0.1:
@@ -416,8 +464,7 @@ class ForcePlotWidget(QtWidgets.QWidget):
                     self._temp_label.setText("Temp: -- °F")
                 else:
                     # Calculate average
-                    total = sum(t for _, t in self._temp_buffer)
-                    avg = total / len(self._temp_buffer)
+                    avg = self._temp_sum / len(self._temp_buffer)
                     self._temp_label.setText(f"Temp: {avg:.1f} °F")
                     
         except Exception:
@@ -438,33 +485,8 @@ class ForcePlotWidget(QtWidgets.QWidget):
         except Exception:
             pass
         try:
-            # Determine which data are currently visible (last _max_points)
-            def max_abs_from(samples: list[tuple[int, float, float, float]]) -> float:
-                if not samples:
-                    return 0.0
-                i0 = max(0, len(samples) - self._max_points)
-                peak = 0.0
-                for i in range(i0, len(samples)):
-                    _, fx, fy, fz = samples[i]
-                    # Consider all components; scale to the maximum absolute value
-                    if abs(fx) > peak:
-                        peak = abs(fx)
-                    if abs(fy) > peak:
-                        peak = abs(fy)
-                    if abs(fz) > peak:
-                        peak = abs(fz)
-                return peak
-
-            if self._dual_enabled:
-                # Respect legend toggles for visibility
-                peaks: list[float] = []
-                if self._legend_launch.isChecked():
-                    peaks.append(max_abs_from(self._samples_launch))
-                if self._legend_landing.isChecked():
-                    peaks.append(max_abs_from(self._samples_landing))
-                peak = max(peaks) if peaks else 0.0
-            else:
-                peak = max_abs_from(self._samples)
+            # Peak over all components of the on-screen window (respects legend toggles)
+            peak = self._window_peak_abs()
 
             # Add a comfortable headroom; enforce a minimum of ±10
             target = max(peak * 1.15, 10.0)
@@ -476,29 +498,19 @@ class ForcePlotWidget(QtWidgets.QWidget):
             pass
 
     def clear(self) -> None:
+        self._single.clear()
+        self._launch.clear()
+        self._landing.clear()
+        self._repaint_pending = False
+        self._repaint_timer.stop()
         if self._use_pg:
-            self._pg_x_single.clear()
-            self._pg_fx.clear()
-            self._pg_fy.clear()
-            self._pg_fz.clear()
             self._time0_ms = None
-            self._pg_x_launch.clear()
-            self._pg_lx.clear()
-            self._pg_ly.clear()
-            self._pg_lz.clear()
-            self._pg_x_land.clear()
-            self._pg_rx.clear()
-            self._pg_ry.clear()
-            self._pg_rz.clear()
             for k in ("fx", "fy", "fz", "lx", "ly", "lz", "rx", "ry", "rz"):
                 try:
                     self._pg_curves[k].clear()  # type: ignore[union-attr]
                 except Exception:
                     pass
         else:
-            self._samples.clear()
-            self._samples_launch.clear()
-            self._samples_landing.clear()
             # Reset scale
             self._y_min = -10.0
             self._y_max = 10.0
@@ -512,30 +524,27 @@ class ForcePlotWidget(QtWidgets.QWidget):
     def add_point(self, t_ms: int, fx: float, fy: float, fz: float) -> None:
         # Plot raw live data; overlay handles its own smoothing separately
         self._last_raw_single = (float(fx), float(fy), float(fz))
-        if self._use_pg:
-            if self._time0_ms is None:
-                self._time0_ms = int(t_ms)
-            self._pg_x_single.append(int(t_ms))
-            self._pg_fx.append(float(fx))
-            self._pg_fy.append(float(fy))
-            self._pg_fz.append(float(fz))
-            self._pg_trim_single_all()
-            try:
-                self._pg_curves["fx"].setData(self._pg_x_single, self._pg_fx)  # type: ignore[union-attr]
-                self._pg_curves["fy"].setData(self._pg_x_single, self._pg_fy)  # type: ignore[union-attr]
-                self._pg_curves["fz"].setData(self._pg_x_single, self._pg_fz)  # type: ignore[union-attr]
-                self._pg_set_view_last_ms(10_000)
-                self._pg_update_y_range_min(10.0, 1.15)
-            except Exception:
-                pass
-        else:
-            self._samples.append((t_ms, float(fx), float(fy), float(fz)))
+        if self._use_pg and self._time0_ms is None:
+            self._time0_ms = int(t_ms)
+        self._single.append(int(t_ms), float(fx), float(fy), float(fz))
+        if not self._use_pg:
             # Reset EMAs used previously for plotted series
             self._ema_fx = self._ema_fy = self._ema_fz = None
-            if len(self._samples) > self._max_points:
-                self._samples = self._samples[-self._max_points:]
-            self._recompute_autoscale()
-            self.update()
+        self._schedule_repaint()
+        self._update_overlay()
+
+    def add_points(self, t_ms: np.ndarray, fx: np.ndarray, fy: np.ndarray, fz: np.ndarray) -> None:
+        """`add_point` for a run of samples given as NumPy columns."""
+        n = int(len(t_ms))
+        if n <= 0:
+            return
+        self._last_raw_single = (float(fx[-1]), float(fy[-1]), float(fz[-1]))
+        if self._use_pg and self._time0_ms is None:
+            self._time0_ms = int(t_ms[0])
+        self._single.extend(np.trunc(np.asarray(t_ms, dtype=np.float64)), np.column_stack((fx, fy, fz)).astype(np.float64, copy=False))
+        if not self._use_pg:
+            self._ema_fx = self._ema_fy = self._ema_fz = None
+        self._schedule_repaint()
         self._update_overlay()
 
     # Dual-series API for mound mode
@@ -545,60 +554,27 @@ class ForcePlotWidget(QtWidgets.QWidget):
         self._legend_container.setVisible(self._dual_enabled)
         if self._use_pg:
             self._apply_pg_series_visibility()
+            self._schedule_repaint()
         else:
             self.update()
 
     def add_point_launch(self, t_ms: int, fx: float, fy: float, fz: float) -> None:
-        if self._use_pg:
-            if self._time0_ms is None:
-                self._time0_ms = int(t_ms)
-            self._pg_x_launch.append(int(t_ms))
-            self._pg_lx.append(float(fx))
-            self._pg_ly.append(float(fy))
-            self._pg_lz.append(float(fz))
-            self._pg_trim_launch_all()
-            try:
-                self._pg_curves["lx"].setData(self._pg_x_launch, self._pg_lx)  # type: ignore[union-attr]
-                self._pg_curves["ly"].setData(self._pg_x_launch, self._pg_ly)  # type: ignore[union-attr]
-                self._pg_curves["lz"].setData(self._pg_x_launch, self._pg_lz)  # type: ignore[union-attr]
-                self._pg_set_view_last_ms(10_000)
-                self._pg_update_y_range_min(10.0, 1.15)
-            except Exception:
-                pass
-        else:
-            # Plot raw in dual mode as well
-            self._samples_launch.append((t_ms, float(fx), float(fy), float(fz)))
+        if self._use_pg and self._time0_ms is None:
+            self._time0_ms = int(t_ms)
+        # Plot raw in dual mode as well
+        self._launch.append(int(t_ms), float(fx), float(fy), float(fz))
+        if not self._use_pg:
             self._ema_fx_launch = self._ema_fy_launch = self._ema_fz_launch = None
-            if len(self._samples_launch) > self._max_points:
-                self._samples_launch = self._samples_launch[-self._max_points:]
-            self._recompute_autoscale()
-            self.update()
+        self._schedule_repaint()
 
     def add_point_landing(self, t_ms: int, fx: float, fy: float, fz: float) -> None:
-        if self._use_pg:
-            if self._time0_ms is None:
-                self._time0_ms = int(t_ms)
-            self._pg_x_land.append(int(t_ms))
-            self._pg_rx.append(float(fx))
-            self._pg_ry.append(float(fy))
-            self._pg_rz.append(float(fz))
-            self._pg_trim_land_all()
-            try:
-                self._pg_curves["rx"].setData(self._pg_x_land, self._pg_rx)  # type: ignore[union-attr]
-                self._pg_curves["ry"].setData(self._pg_x_land, self._pg_ry)  # type: ignore[union-attr]
-                self._pg_curves["rz"].setData(self._pg_x_land, self._pg_rz)  # type: ignore[union-attr]
-                self._pg_set_view_last_ms(10_000)
-                self._pg_update_y_range_min(10.0, 1.15)
-            except Exception:
-                pass
-        else:
-            # Plot raw in dual mode as well
-            self._samples_landing.append((t_ms, float(fx), float(fy), float(fz)))
+        if self._use_pg and self._time0_ms is None:
+            self._time0_ms = int(t_ms)
+        # Plot raw in dual mode as well
+        self._landing.append(int(t_ms), float(fx), float(fy), float(fz))
+        if not self._use_pg:
             self._ema_fx_landing = self._ema_fy_landing = self._ema_fz_landing = None
-            if len(self._samples_landing) > self._max_points:
-                self._samples_landing = self._samples_landing[-self._max_points:]
-            self._recompute_autoscale()
-            self.update()
+        self._schedule_repaint()
 
     def set_autoscale_damping(self, enabled: bool, every_n: int) -> None:
         self._autoscale_damp_enabled = bool(enabled)
@@ -663,6 +639,9 @@ class ForcePlotWidget(QtWidgets.QWidget):
             except Exception:
                 pass
             return
+        prof = live_profiler.enabled
+        if prof:
+            t0 = live_profiler.now()
         p = QtGui.QPainter(self)
         p.setRenderHint(QtGui.QPainter.Antialiasing, True)
         w, h = self.width(), self.height()
@@ -709,15 +688,24 @@ class ForcePlotWidget(QtWidgets.QWidget):
                 except Exception:
                     pass
         # Determine drawing mode
-        draw_dual = self._dual_enabled and (self._samples_launch or self._samples_landing)
-        if not draw_dual and not self._samples:
+        t_end = self._view_end_ms()
+        if t_end is None:
             p.end()
             return
-
-        def to_xy(i: int, v: float) -> tuple[int, int]:
-            x = x0 + int(pw * (i / max(1, self._max_points - 1)))
-            y = y0 + int(ph * (1 - (v - self._y_min) / max(1e-6, (self._y_max - self._y_min))))
-            return x, y
+        t_start = t_end - self._window_ms
+        y_span = max(1e-6, (self._y_max - self._y_min))
+
+        def series_path(ring: ForceSeriesRing, comp: int) -> QtGui.QPainterPath:
+            # Decimated to ~2 vertices per pixel column, mapped to widget coordinates in NumPy.
+            t, v = ring.since(t_start)
+            xs, ys = decimate_minmax(t, v, t_start, t_end, pw)
+            px = x0 + pw * (xs - t_start) / float(max(1, self._window_ms))
+            py = y0 + ph * (1.0 - (ys[:, comp] - self._y_min) / y_span)
+            path = QtGui.QPainterPath()
+            if px.shape[0]:
+                pts = [QtCore.QPointF(float(a), float(b)) for a, b in zip(px.tolist(), py.tolist())]
+                path.addPolygon(QtGui.QPolygonF(pts))
+            return path
 
         # Base axis colors
         base_x = QtGui.QColor(220, 80, 80)
@@ -729,24 +717,10 @@ class ForcePlotWidget(QtWidgets.QWidget):
             pen.setWidth(2)
             return pen
 
-        if not draw_dual:
-            n = len(self._samples)
-            pen_x = make_pen(base_x)
-            pen_y = make_pen(base_y)
-            pen_z = make_pen(base_z)
-            for idx, (pen, comp) in enumerate(((pen_x, 1), (pen_y, 2), (pen_z, 3))):
+        if not self._dual_enabled:
+            for pen, comp in ((make_pen(base_x), 0), (make_pen(base_y), 1), (make_pen(base_z), 2)):
                 p.setPen(pen)
-                path = QtGui.QPainterPath()
-                i0 = max(0, n - self._max_points)
-                for i in range(i0, n):
-                    t_ms, fx, fy, fz = self._samples[i]
-                    v = fx if comp == 1 else fy if comp == 2 else fz
-                    x, y = to_xy(i - i0, v)
-                    if i == i0:
-                        path.moveTo(x, y)
-                    else:
-                        path.lineTo(x, y)
-                p.drawPath(path)
+                p.drawPath(series_path(self._single, comp))
         else:
             # Dual-series overlay: Launch (lighter colors) and Landing (base colors)
             # Lighter colors for launch
@@ -755,30 +729,19 @@ class ForcePlotWidget(QtWidgets.QWidget):
             launch_z = QtGui.QColor(160, 255, 160)
 
             series = []
-            if self._legend_launch.isChecked() and self._samples_launch:
-                series.append((self._samples_launch, make_pen(launch_x), 1))
-                series.append((self._samples_launch, make_pen(launch_y), 2))
-                series.append((self._samples_launch, make_pen(launch_z), 3))
-            if self._legend_landing.isChecked() and self._samples_landing:
-                series.append((self._samples_landing, make_pen(base_x), 1))
-                series.append((self._samples_landing, make_pen(base_y), 2))
-                series.append((self._samples_landing, make_pen(base_z), 3))
+            if self._legend_launch.isChecked() and len(self._launch):
+                series.append((self._launch, make_pen(launch_x), 0))
+                series.append((self._launch, make_pen(launch_y), 1))
+                series.append((self._launch, make_pen(launch_z), 2))
+            if self._legend_landing.isChecked() and len(self._landing):
+                series.append((self._landing, make_pen(base_x), 0))
+                series.append((self._landing, make_pen(base_y), 1))
+                series.append((self._landing, make_pen(base_z), 2))
 
             # Draw each series path
-            for samples, pen, comp in series:
-                n = len(samples)
+            for ring, pen, comp in series:
                 p.setPen(pen)
-                path = QtGui.QPainterPath()
-                i0 = max(0, n - self._max_points)
-                for i in range(i0, n):
-                    t_ms, fx, fy, fz = samples[i]
-                    v = fx if comp == 1 else fy if comp == 2 else fz
-                    x, y = to_xy(i - i0, v)
-                    if i == i0:
-                        path.moveTo(x, y)
-                    else:
-                        path.lineTo(x, y)
-                p.drawPath(path)
+                p.drawPath(series_path(ring, comp))
         # Draw temperature label inside the plot (top-right) for painter backend.
         try:
             p.save()
@@ -808,6 +771,8 @@ class ForcePlotWidget(QtWidgets.QWidget):
             pass
 
         p.end()
+        if prof:
+            live_profiler.record_render("plot", t0)
 
         # Position bottom-left overlay inside plot area
         try:
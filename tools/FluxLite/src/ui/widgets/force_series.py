@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class ForceSeriesRing:
+    """
+    Fixed-capacity (t_ms, fx, fy, fz) history for one plotted series.
+
+    Every sample is written twice (at `pos` and `pos + capacity`) so the newest `n`
+    samples are always one contiguous slice: reads are views, never concatenations.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = int(max(16, capacity))
+        self._t = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._v = np.zeros((2 * self.capacity, 3), dtype=np.float64)
+        self._written = 0
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    def clear(self) -> None:
+        self._written = 0
+
+    def append(self, t_ms: float, fx: float, fy: float, fz: float) -> None:
+        pos = self._written % self.capacity
+        self._t[pos] = t_ms
+        self._t[pos + self.capacity] = t_ms
+        row = self._v[pos]
+        row[0] = fx
+        row[1] = fy
+        row[2] = fz
+        self._v[pos + self.capacity] = row
+        self._written += 1
+
+    def extend(self, t_ms: np.ndarray, values: np.ndarray) -> None:
+        """Append (n,) times and (n, 3) values in slice copies; same result as n `append` calls."""
+        n = int(t_ms.shape[0])
+        if n <= 0:
+            return
+        if n > self.capacity:
+            t_ms = t_ms[n - self.capacity :]
+            values = values[n - self.capacity :]
+            self._written += n - self.capacity
+            n = self.capacity
+        pos = self._written % self.capacity
+        first = min(n, self.capacity - pos)
+        for base in (0, self.capacity):
+            self._t[base + pos : base + pos + first] = t_ms[:first]
+            self._v[base + pos : base + pos + first] = values[:first]
+            if first < n:
+                self._t[base : base + n - first] = t_ms[first:]
+                self._v[base : base + n - first] = values[first:]
+        self._written += n
+
+    def latest_t(self) -> Optional[float]:
+        if self._written == 0:
+            return None
+        return float(self._t[(self._written - 1) % self.capacity])
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All retained samples, oldest first: (t (n,), values (n, 3)). Views; do not mutate."""
+        n = len(self)
+        if n == 0:
+            return self._t[:0], self._v[:0]
+        # Newest sample's mirror sits at pos + capacity; the n before it are this lap's
+        # mirrors plus the previous lap's primaries.
+        end = (self._written - 1) % self.capacity + self.capacity + 1
+        return self._t[end - n : end], self._v[end - n : end]
+
+    def since(self, t0_ms: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Samples with t >= t0_ms, oldest first."""
+        t, v = self.arrays()
+        i0 = int(np.searchsorted(t, float(t0_ms), side="left"))
+        return t[i0:], v[i0:]
+
+
+def decimate_minmax(t: np.ndarray, v: np.ndarray, t0_ms: float, t1_ms: float, buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max-per-pixel decimation of `v` (n, k) sampled at `t` (n,) over [t0_ms, t1_ms].
+
+    The span is cut into `buckets` equal time columns; each non-empty column emits its
+    min and max (per series) at the column's first timestamp, so spikes survive and at
+    most 2 * buckets vertices reach the renderer. Samples before t0_ms fall into the first
+    column and samples from t1_ms on into the last. Inputs that already fit are returned
+    unchanged.
+    """
+    n = int(t.shape[0])
+    buckets = int(max(1, buckets))
+    if n <= 2 * buckets or t1_ms <= t0_ms:
+        return t, v
+    edges = np.linspace(float(t0_ms), float(t1_ms), buckets, endpoint=False)
+    starts = np.searchsorted(t, edges, side="left")
+    starts = np.unique(starts[starts < n])
+    if starts.shape[0] == 0:
+        starts = np.zeros(1, dtype=np.intp)
+    # Samples before t0_ms join the first column, so the 2 * buckets bound holds for any input.
+    starts[0] = 0
+    lo = np.minimum.reduceat(v, starts, axis=0)
+    hi = np.maximum.reduceat(v, starts, axis=0)
+    xs = np.repeat(t[starts], 2)
+    ys = np.empty((2 * starts.shape[0], v.shape[1]), dtype=v.dtype)
+    ys[0::2] = lo
+    ys[1::2] = hi
+    return xs, ys
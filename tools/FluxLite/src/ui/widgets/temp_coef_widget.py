@@ -172,6 +172,9 @@ class TempCoefWidget(QtWidgets.QWidget):
             pass
         self.tbl_leaderboard.setMinimumHeight(140)
         lb_layout.addWidget(self.tbl_leaderboard, 1)
+        self.lbl_surrogate = _lbl("Surrogate: —")
+        self.lbl_surrogate.setWordWrap(True)
+        lb_layout.addWidget(self.lbl_surrogate, 0)
         tuned_layout.addWidget(lb_box, 1)
         right.addWidget(tuned_box, 1)
 
@@ -306,6 +309,30 @@ class TempCoefWidget(QtWidgets.QWidget):
         except Exception:
             pass
 
+    def set_surrogate_stats(self, stats: dict | None) -> None:
+        """
+        stats format (SurrogateStats.as_dict):
+          { "considered": int, "pruned": int, "pruning_ratio": float, "predicted_runs": int,
+            "mean_rel_error": float|None, "audited": int, "audit_misses": int, ... }
+        """
+        try:
+            s = dict(stats or {})
+            considered = int(s.get("considered") or 0)
+            if considered <= 0:
+                self.lbl_surrogate.setText("Surrogate: —")
+                return
+            text = (
+                f"Surrogate: pruned {int(s.get('pruned') or 0)}/{considered} "
+                f"({100.0 * float(s.get('pruning_ratio') or 0.0):.0f}%)"
+            )
+            rel = s.get("mean_rel_error")
+            if rel is not None:
+                text += f"  pred err {100.0 * float(rel):.1f}% (n={int(s.get('predicted_runs') or 0)})"
+            text += f"  audits {int(s.get('audited') or 0)} ({int(s.get('audit_misses') or 0)} misses)"
+            self.lbl_surrogate.setText(text)
+        except Exception:
+            pass
+
     def set_tuning_leaderboard(self, rows: list[dict], *, select_first: bool = False) -> None:
         """
         rows format (expected):
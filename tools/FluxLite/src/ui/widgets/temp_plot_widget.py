@@ -6,10 +6,12 @@ import csv
 import io
 import json
 
+import numpy as np
 from PySide6 import QtCore, QtWidgets, QtGui
 
 from ... import config
 from ...app_services.discrete_temp_processing_service import DiscreteTempProcessingService
+from ...infra.columnar_csv import load_csv_columns, phase_mask
 from ..discrete_temp.coef_math import compute_baseline_anchor, estimate_coefs, estimate_slope, summarize, coef_line_points
 from ..discrete_temp.tuning import tuning_folder_for_test
 from ..discrete_temp.tuning_leaderboard import load_leaderboard_and_exploration
@@ -273,6 +275,7 @@ class TempPlotWidget(QtWidgets.QWidget):
             self._exploration_stats = dict(stats or {})
             try:
                 self._coef_widget.set_tuning_leaderboard(rows, select_first=True)
+                self._coef_widget.set_surrogate_stats(stats.get("surrogate"))
             except Exception:
                 pass
             # Seed the live leaderboard cache from ALL historical runs for this test folder,
@@ -656,35 +659,17 @@ class TempPlotWidget(QtWidgets.QWidget):
     # --- Internal helpers ---------------------------------------------------
 
     def _read_points(self, csv_path: str, phase_name: str, col_name: str) -> Tuple[List[float], List[float]]:
-        xs: List[float] = []
-        ys: List[float] = []
-        if not csv_path or not os.path.isfile(csv_path) or os.path.getsize(csv_path) <= 0:
-            return xs, ys
-        try:
-            with open(csv_path, "r", encoding="utf-8", newline="") as f:
-                header_line = f.readline()
-                if not header_line:
-                    return xs, ys
-                header_reader = csv.reader(io.StringIO(header_line))
-                headers = [h.strip() for h in next(header_reader, [])]
-                reader = csv.DictReader(f, fieldnames=headers, skipinitialspace=True)
-                for row in reader:
-                    if not row:
-                        continue
-                    ph = str(row.get("phase_name") or row.get("phase") or "").strip().lower()
-                    if ph != phase_name:
-                        continue
-                    try:
-                        temp_f = float(row.get("sum-t") or 0.0)
-                        y_val = float(row.get(col_name) or 0.0)
-                    except Exception:
-                        continue
-                    xs.append(temp_f)
-                    ys.append(y_val)
-        except Exception:
+        table = load_csv_columns(csv_path)
+        if table is None:
             return [], []
-        pts = sorted(zip(xs, ys), key=lambda p: p[0])
-        return [p[0] for p in pts], [p[1] for p in pts]
+        keep = phase_mask(table, phase_name, "phase_name", "phase")
+        temp_f, t_ok = table.number_or("sum-t")
+        y_val, y_ok = table.number_or(col_name)
+        keep &= t_ok & y_ok
+        temp_f = temp_f[keep]
+        y_val = y_val[keep]
+        order = np.argsort(temp_f, kind="stable")
+        return temp_f[order].tolist(), y_val[order].tolist()
 
     def _plot(self, csv_path: str, measurement_csv_path: str = "") -> None:
         assert self._plot_widget is not None and self._pg is not None
@@ -1207,6 +1192,11 @@ class TempPlotWidget(QtWidgets.QWidget):
             p = {}
         # Live leaderboard updates (one event per completed run)
         if str(p.get("event") or "") == "run_complete":
+            try:
+                if p.get("surrogate"):
+                    self._coef_widget.set_surrogate_stats(p.get("surrogate"))
+            except Exception:
+                pass
             try:
                 base_dir = os.path.dirname(self._csv_path) if self._csv_path else ""
                 run = dict(p.get("run") or {})
@@ -6,6 +6,7 @@ from PySide6 import QtCore, QtGui, QtWidgets
 
 from ... import config
 from ...app_services.geometry import GeometryService
+from ...diagnostics import live_profiler
 from ..state import ViewState
 from .grid_overlay import GridOverlay
 from ..dialogs.device_picker import DevicePickerDialog
@@ -327,6 +328,9 @@ class WorldCanvas(QtWidgets.QWidget):
     # Rendering is delegated to WorldRenderer (see src/ui/renderers/world_renderer.py)
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:  # noqa: N802
+        prof = live_profiler.enabled
+        if prof:
+            t0 = live_profiler.now()
         p = QtGui.QPainter(self)
         try:
             self._renderer.draw(p)
@@ -335,6 +339,8 @@ class WorldCanvas(QtWidgets.QWidget):
                 p.end()
             except Exception:
                 pass
+        if prof:
+            live_profiler.record_render("world", t0)
 
         # Resize overlay to plate bounds in single device mode
         try:
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Tests import the app as `src.*`, the same way `python -m src.main` runs it from tools/FluxLite.
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
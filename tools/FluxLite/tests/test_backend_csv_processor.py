@@ -0,0 +1,95 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.app_services import backend_csv_processor
+from src.infra import processed_cache
+from src.infra.processed_cache import ProcessedOutputCache
+
+ROWS = 20_000
+CLEAN_HEADER = "time,device_id,fz"
+
+
+def _padded_csv(path, rows=ROWS):
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        fh.write("\ufefftime , device_id   ,fz\n")
+        fh.writelines(f"{i}, 07.1 ,{i % 97}\n" for i in range(rows))
+    return str(path)
+
+
+def _stub_backend(monkeypatch, tmp_path):
+    """Replace the HTTP call with one that reads csvPath the way the backend would and checks it."""
+    cache = ProcessedOutputCache(str(tmp_path / "cache"), max_bytes=1 << 30, max_entries=1000)
+    monkeypatch.setattr(processed_cache, "_shared", cache)
+    monkeypatch.setattr(processed_cache.config, "PROCESSED_CACHE_ENABLED", True)
+    seen = []
+    lock = threading.Lock()
+
+    def fake_post(url, body, *, timeout_s):
+        with open(body["csvPath"], encoding="utf-8") as fh:
+            lines = fh.read().splitlines()
+        with lock:
+            seen.append((body["csvPath"], lines[0] if lines else "", len(lines) - 1))
+            n = len(seen)
+        out = os.path.join(body["outputDir"], f"backend-out-{n}.csv")
+        with open(out, "w", encoding="utf-8") as fh:
+            fh.write("time,fz\n1,9\n")
+        return {"outputPath": out}
+
+    monkeypatch.setattr(backend_csv_processor, "post_json", fake_post)
+    return seen
+
+
+def _process(src, out_dir, z, name):
+    return backend_csv_processor.process_csv_via_backend(
+        input_csv_path=src, device_id="07.1", output_folder=str(out_dir), output_filename=name,
+        use_temperature_correction=True, room_temp_f=76.0, mode="scalar",
+        temperature_coefficients={"x": 0.0, "y": 0.0, "z": z}, sanitize_header=True,
+    )
+
+
+def test_concurrent_candidates_on_one_input_all_send_the_complete_sanitized_csv(tmp_path, monkeypatch):
+    seen = _stub_backend(monkeypatch, tmp_path)
+    src = _padded_csv(tmp_path / "discrete.csv")
+    runs = tmp_path / "runs"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outs = list(pool.map(lambda i: _process(src, runs, 0.001 * i, f"cand-{i}.csv"), range(16)))
+
+    assert len(seen) == 16 and all(os.path.isfile(p) for p in outs)
+    assert {(header, rows) for _, header, rows in seen} == {(CLEAN_HEADER, ROWS)}
+    # One sanitized copy, shared by every request; no temp files left behind.
+    (sanitized,) = {path for path, _, _ in seen}
+    assert sorted(n for n in os.listdir(runs) if n.startswith("__sanitized__")) == [os.path.basename(sanitized)]
+    assert not [n for n in os.listdir(runs) if ".tmp." in n]
+    assert backend_csv_processor._sanitize_locks == {}
+
+
+def test_sanitized_copy_follows_the_input_version(tmp_path):
+    runs = tmp_path / "runs"
+    runs.mkdir()
+    (runs / "__sanitized__discrete.csv").write_text("left by an older release\n", encoding="utf-8")
+    src = _padded_csv(tmp_path / "discrete.csv", rows=3)
+    first = backend_csv_processor.sanitized_csv_for_backend(src, str(runs))
+    assert backend_csv_processor.sanitized_csv_for_backend(src, str(runs)) == first
+    assert os.listdir(runs) == [os.path.basename(first)]
+    with open(first, encoding="utf-8") as fh:
+        assert fh.read() == "time,device_id,fz\n0,07.1,0\n1,07.1,1\n2,07.1,2\n"
+
+    # A rewritten input gets a new copy; the old one is removed.
+    _padded_csv(tmp_path / "discrete.csv", rows=5)
+    second = backend_csv_processor.sanitized_csv_for_backend(src, str(runs))
+    assert second != first and os.listdir(runs) == [os.path.basename(second)]
+
+    # Another input with the same file name keeps its own copy next to it.
+    (tmp_path / "other").mkdir()
+    other = _padded_csv(tmp_path / "other" / "discrete.csv", rows=2)
+    third = backend_csv_processor.sanitized_csv_for_backend(other, str(runs))
+    assert sorted(os.listdir(runs)) == sorted([os.path.basename(second), os.path.basename(third)])
+
+
+def test_clean_input_is_sent_as_is(tmp_path):
+    src = tmp_path / "clean.csv"
+    src.write_text("time,device_id,fz\n1,07.1,2\n", encoding="utf-8")
+    assert backend_csv_processor.sanitized_csv_for_backend(str(src), str(tmp_path)) == str(src)
+    assert os.listdir(tmp_path) == ["clean.csv"]
@@ -0,0 +1,141 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from src import config
+from src.app_services.temperature_baseline_bias_service import TemperatureBaselineBiasService
+
+ROWS, COLS = 3, 4
+DB_TARGET, BW_TARGET = 206.3, 800.0
+
+
+def _reference_bias(analyses):
+    """The per-cell loop the service used before it was vectorized (fill missing cells with the stage average)."""
+    per_all, per_db, per_bw, measured = [], [], [], []
+    for stages in analyses:
+        pcts = {}
+        for stage, target in (("db", DB_TARGET), ("bw", BW_TARGET)):
+            out = {}
+            for cell in stages[stage]:
+                out[(int(cell["row"]), int(cell["col"]))] = (float(cell["mean_n"]) - target) / target
+            pcts[stage] = out
+        avg_db = sum(pcts["db"].values()) / float(len(pcts["db"]))
+        avg_bw = sum(pcts["bw"].values()) / float(len(pcts["bw"]))
+        b_db, b_bw, b_all = [], [], []
+        for rr in range(ROWS):
+            row_db, row_bw, row_all = [], [], []
+            for cc in range(COLS):
+                pct45 = float(pcts["db"].get((rr, cc), avg_db))
+                pctbw = float(pcts["bw"].get((rr, cc), avg_bw))
+                row_db.append(pct45)
+                row_bw.append(pctbw)
+                row_all.append(0.5 * pct45 + 0.5 * pctbw)
+            b_db.append(row_db)
+            b_bw.append(row_bw)
+            b_all.append(row_all)
+        per_db.append(b_db)
+        per_bw.append(b_bw)
+        per_all.append(b_all)
+        measured.append((len(pcts["db"]), len(pcts["bw"])))
+    n = float(len(per_all))
+    avg = lambda per: [[sum(b[rr][cc] for b in per) / n for cc in range(COLS)] for rr in range(ROWS)]
+    return {"bias_all": avg(per_all), "bias_db": avg(per_db), "bias_bw": avg(per_bw)}, measured
+
+
+def _synthetic_baselines(count, seed):
+    rng = random.Random(seed)
+    analyses = []
+    for b in range(count):
+        stages = {}
+        for stage, target in (("db", DB_TARGET), ("bw", BW_TARGET)):
+            cells = [
+                {"row": rr, "col": cc, "mean_n": target * (1.0 + rng.uniform(-0.08, 0.08))}
+                for rr in range(ROWS)
+                for cc in range(COLS)
+                if rng.random() > 0.3  # missing cells get the stage average
+            ] or [{"row": 0, "col": 0, "mean_n": target}]
+            if b == 0:
+                # Out-of-grid cells count toward the average only; a repeated cell keeps its last value.
+                cells.append({"row": ROWS + 1, "col": 0, "mean_n": target * 1.2})
+                cells.append(dict(cells[0], mean_n=target * 0.9))
+            stages[stage] = cells
+        analyses.append(stages)
+    return analyses
+
+
+class _Repo:
+    def __init__(self, tmp_path, count):
+        self.entries = []
+        for b in range(count):
+            path = tmp_path / f"temp-raw-07.00000051-2025030{b}-101500.csv"
+            path.write_text("time\n", encoding="utf-8")
+            self.entries.append({"csv_path": str(path), "meta": {"idx": b}, "temp_f": 72.0 + b})
+        self.saved = None
+
+    def list_temperature_room_baseline_tests(self, dev, *, min_temp_f, max_temp_f):
+        return list(self.entries)
+
+    def save_temperature_bias_cache(self, dev, payload):
+        self.saved = payload
+        return "bias.json"
+
+
+class _Processing:
+    def __init__(self, delays):
+        self.delays = delays
+
+    def ensure_temp_off_processed(self, *, folder, device_id, csv_path, room_temp_f, status_cb=None):
+        time.sleep(self.delays.get(csv_path, 0.0))
+        return csv_path.replace("temp-raw-", "temp-processed-")
+
+
+class _Analyzer:
+    def __init__(self, analyses):
+        self.analyses = analyses
+
+    def analyze_single_processed_csv(self, path, meta):
+        stages = self.analyses[meta["idx"]]
+        return {
+            "grid": {"rows": ROWS, "cols": COLS, "device_type": "07"},
+            "data": {"stages": {"db": {"cells": stages["db"], "target_n": DB_TARGET}, "bw": {"cells": stages["bw"], "target_n": BW_TARGET}}},
+        }
+
+
+def _compute(tmp_path, monkeypatch, analyses, *, workers, delays=None):
+    tmp_path.mkdir(exist_ok=True)
+    repo = _Repo(tmp_path, len(analyses))
+    delays = {e["csv_path"]: d for e, d in zip(repo.entries, delays or [])}
+    svc = TemperatureBaselineBiasService(repo=repo, analyzer=_Analyzer(analyses), processing=_Processing(delays))
+    monkeypatch.setattr(config, "TEMP_BIAS_WORKERS", workers)
+    res = svc.compute_and_store_bias_for_device(device_id="07.00000051")
+    assert res["ok"], res["errors"]
+    return res["payload"]
+
+
+@pytest.mark.parametrize("count", [1, 2, 5])
+def test_bias_maps_match_the_per_cell_loop(tmp_path, monkeypatch, count):
+    analyses = _synthetic_baselines(count, seed=count)
+    payload = _compute(tmp_path, monkeypatch, analyses, workers=4)
+    ref, measured = _reference_bias(analyses)
+    for key in ("bias_all", "bias_db", "bias_bw"):
+        # Baselines are summed in order, as the loop did, so the maps agree bit for bit.
+        np.testing.assert_array_equal(np.asarray(payload[key]), np.asarray(ref[key]))
+    assert payload["bias"] == payload["bias_all"]
+    assert [(b["db_cells_measured"], b["bw_cells_measured"]) for b in payload["baselines"]] == measured
+    db_counts = [m[0] for m in measured]
+    assert payload["measured_cells"]["db"] == pytest.approx(
+        {"mean": sum(db_counts) / len(db_counts), "min": min(db_counts), "max": max(db_counts)}
+    )
+
+
+def test_results_do_not_depend_on_pool_completion_order(tmp_path, monkeypatch):
+    analyses = _synthetic_baselines(5, seed=7)
+    serial = _compute(tmp_path / "serial", monkeypatch, analyses, workers=1)
+    # Later baselines finish first in the pool.
+    pooled = _compute(tmp_path / "pool", monkeypatch, analyses, workers=5, delays=[0.08, 0.06, 0.04, 0.02, 0.0])
+    for key in ("bias_all", "bias_db", "bias_bw", "measured_cells"):
+        assert pooled[key] == serial[key]
+    assert [b["csv"] for b in pooled["baselines"]] == [b["csv"] for b in serial["baselines"]]
+    assert [b["temp_f"] for b in pooled["baselines"]] == [72.0, 73.0, 74.0, 75.0, 76.0]
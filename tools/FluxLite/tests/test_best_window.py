@@ -0,0 +1,83 @@
+import math
+import random
+
+import numpy as np
+
+from src.app_services.analysis.temperature_analyzer import TemperatureAnalyzer, _best_windows_vectorized
+
+DESIRED_MS, TOLERANCE_MS = 1000, 150
+
+
+def _segment(rng, kind):
+    n = {"empty": 0, "one": 1, "short": rng.randrange(2, 40), "long": rng.randrange(600, 2000)}[kind]
+    t = rng.randrange(0, 10_000)
+    out = []
+    for i in range(n):
+        t += rng.choice((1, 1, 2, 3, 0))  # repeated timestamps and gaps, non-decreasing
+        if rng.random() < 0.5:
+            fz = float(i % 3)  # small integers: windows tie exactly on std and slope
+        else:
+            fz = 600.0 + 15.0 * math.sin(i / 40.0) + rng.gauss(0.0, 2.0)
+        out.append((t, fz, rng.uniform(-0.2, 0.2), rng.uniform(-0.3, 0.3)))
+    return out
+
+
+def _assert_same(got, want):
+    if want is None:
+        assert got is None
+        return
+    assert got is not None
+    assert (got["t_start"], got["t_end"]) == (want["t_start"], want["t_end"])
+    for k in ("std", "slope", "mean_fz", "mean_x", "mean_y"):
+        assert math.isclose(got[k], want[k], rel_tol=1e-7, abs_tol=1e-6), k
+
+
+def test_batched_windows_match_the_scan_reference_on_random_segments():
+    rng = random.Random(7)
+    analyzer = TemperatureAnalyzer()
+    for _ in range(12):
+        segments = [_segment(rng, rng.choice(("empty", "one", "short", "long", "long"))) for _ in range(8)]
+        batch = analyzer._select_best_windows_batch(segments, DESIRED_MS, TOLERANCE_MS)
+        for seg, got in zip(segments, batch):
+            want = analyzer._select_best_window_scan(seg, DESIRED_MS, TOLERANCE_MS)
+            _assert_same(got, want)
+            _assert_same(analyzer._select_best_window_optimized(seg, DESIRED_MS, TOLERANCE_MS), want)
+
+
+def test_constant_segment_ties_resolve_to_the_first_window():
+    analyzer = TemperatureAnalyzer()
+    seg = [(t, 1.0, 0.0, 0.0) for t in range(0, 3000, 5)]
+    want = analyzer._select_best_window_scan(seg, DESIRED_MS, TOLERANCE_MS)
+    got = analyzer._select_best_window_optimized(seg, DESIRED_MS, TOLERANCE_MS)
+    _assert_same(got, want)
+    assert got["t_start"] == 0.0 and got["t_end"] == 850.0  # first window reaching min duration
+
+
+def test_short_and_unsorted_segments():
+    analyzer = TemperatureAnalyzer()
+    # Shorter than the minimum duration, or a single sample: no window.
+    assert analyzer._select_best_window_optimized([(0, 1.0, 0.0, 0.0), (100, 2.0, 0.0, 0.0)], DESIRED_MS, TOLERANCE_MS) is None
+    assert analyzer._select_best_window_optimized([(0, 1.0, 0.0, 0.0)], DESIRED_MS, TOLERANCE_MS) is None
+    # Out-of-order timestamps fall back to the scan.
+    rng = random.Random(1)
+    seg = _segment(rng, "long")
+    seg[100], seg[300] = seg[300], seg[100]
+    sorted_seg = _segment(rng, "long")
+    got = analyzer._select_best_windows_batch([seg, sorted_seg], DESIRED_MS, TOLERANCE_MS)
+    _assert_same(got[0], analyzer._select_best_window_scan(seg, DESIRED_MS, TOLERANCE_MS))
+    _assert_same(got[1], analyzer._select_best_window_scan(sorted_seg, DESIRED_MS, TOLERANCE_MS))
+
+
+def test_vectorized_segments_are_independent():
+    rng = random.Random(3)
+    segs = [_segment(rng, "long") for _ in range(3)]
+    arr = np.array([s for seg in segs for s in seg], dtype=np.float64)
+    bounds, lo = [], 0
+    for seg in segs:
+        bounds.append((lo, lo + len(seg)))
+        lo += len(seg)
+    together = _best_windows_vectorized(arr[:, 0].astype(np.int64), arr[:, 1], arr[:, 2], arr[:, 3], bounds, 850, 1150)
+    for seg, got in zip(segs, together):
+        a = np.array(seg, dtype=np.float64)
+        (alone,) = _best_windows_vectorized(a[:, 0].astype(np.int64), a[:, 1], a[:, 2], a[:, 3], [(0, len(seg))], 850, 1150)
+        _assert_same(got, alone)
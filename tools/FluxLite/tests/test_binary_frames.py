@@ -0,0 +1,94 @@
+import struct
+
+import numpy as np
+import pytest
+
+from src.infra.binary_frames import (
+    CHANNELS,
+    BinaryBlock,
+    BinaryFrameError,
+    decode_frame,
+    encode_frame,
+)
+
+N = len(CHANNELS)
+
+
+def _block(did, n, n_channels=N, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(1_700_000_000_000, 1_700_000_000_000 + n, dtype=np.int64)
+    ch = rng.normal(size=(n, n_channels)).astype(np.float32)
+    return did, t, ch
+
+
+def test_round_trip_keeps_ids_times_and_channels_exactly():
+    # Id lengths 0..9 and a multi-byte id exercise the 8-byte padding.
+    blocks = [_block("d" * k, k * 3, seed=k) for k in range(10)]
+    blocks += [_block("07.ünï", 5, seed=10), _block("raw", 4, N + 8, seed=11), _block("empty", 0)]
+    buf = encode_frame({did: (t, ch) for did, t, ch in blocks})
+    out = decode_frame(buf)
+    assert [b.device_id for b in out] == [did for did, _, _ in blocks]
+    for b, (did, t, ch) in zip(out, blocks):
+        assert b.time_ms.dtype == np.int64 and b.channels.dtype == np.float32
+        assert np.array_equal(b.time_ms, t) and np.array_equal(b.channels, ch)
+        assert len(b) == len(t) and b.extra.shape == (len(t), ch.shape[1] - N)
+
+    # BinaryBlocks re-encode to the same bytes; memoryview/bytearray input decodes the same.
+    assert encode_frame(out) == buf
+    assert [b.device_id for b in decode_frame(memoryview(bytearray(buf)))] == [b.device_id for b in out]
+
+
+def test_to_frames_expands_to_the_dict_stream_shape():
+    did, t, ch = _block("07.00000051", 3, N + 2)
+    (b,) = decode_frame(encode_frame({did: (t, ch)}))
+    frames = b.to_frames()
+    assert len(frames) == 3
+    f = frames[1]
+    assert f["id"] == did and f["time"] == int(t[1])
+    assert f["fz"] == float(ch[1, CHANNELS.index("fz")])
+    assert f["cop"] == {"x": float(ch[1, 3]), "y": float(ch[1, 4])}
+    assert f["avgTemperatureF"] == float(ch[1, CHANNELS.index("temp_f")])
+    assert f["extra"] == [float(v) for v in ch[1, N:]]
+    assert np.array_equal(b.channel("mz"), ch[:, CHANNELS.index("mz")])
+    # Fewer than the named channels: nothing to expand.
+    (short,) = decode_frame(encode_frame({"x": _block("x", 2, 3)[1:]}))
+    assert short.to_frames() == []
+
+
+def test_encode_rejects_mismatched_shapes():
+    with pytest.raises(BinaryFrameError):
+        encode_frame({"a": ([1, 2, 3], np.zeros((2, N)))})
+    with pytest.raises(BinaryFrameError):
+        encode_frame([BinaryBlock("a", np.zeros(2, np.int64), np.zeros(2, np.float32))])
+
+
+def _header(magic=b"AXFB", version=1, n_blocks=1):
+    return struct.pack("<4sBBHQ", magic, version, 0, n_blocks, 0)
+
+
+@pytest.mark.parametrize(
+    "buf, match",
+    [
+        (b"", "shorter than header"),
+        (b"AXFB\x01", "shorter than header"),
+        (_header(magic=b"AXFC"), "bad magic"),
+        (_header(version=2), "unsupported version"),
+        (_header() + b"\x03\x00", "truncated block header"),
+        (_header() + struct.pack("<HHI", 40, N, 0) + b"abc", "truncated block id"),
+        (_header() + struct.pack("<HHI", 2, N, 0) + b"\xff\xfe" + b"\0" * 6, "not utf-8"),
+        (_header() + struct.pack("<HHI", 1, N, 4) + b"a" + b"\0" * 7 + b"\0" * 40, "truncated block 'a'"),
+    ],
+)
+def test_malformed_frames_raise_binary_frame_error(buf, match):
+    with pytest.raises(BinaryFrameError, match=match):
+        decode_frame(buf)
+
+
+def test_block_count_beyond_the_payload_is_rejected():
+    good = encode_frame({"a": _block("a", 2)[1:]})
+    with pytest.raises(BinaryFrameError, match="truncated block header"):
+        decode_frame(_header(n_blocks=2) + good[16:])
+    # Cutting a valid frame anywhere short of its end never decodes.
+    for cut in range(len(good)):
+        with pytest.raises(BinaryFrameError):
+            decode_frame(good[:cut])
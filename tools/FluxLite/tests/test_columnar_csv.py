@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from src.infra import columnar_csv, disk_lru
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    root = tmp_path / "cache"
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_ENABLED", True, raising=False)
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_DIR", str(root), raising=False)
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_MAX_MB", 64, raising=False)
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_MAX_ENTRIES", 1000, raising=False)
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_TRIM_EVERY_N", 0, raising=False)
+    monkeypatch.setattr(columnar_csv, "_trim_throttle", disk_lru.TrimThrottle(".npz"))
+    columnar_csv.clear_memo()
+    yield root
+    columnar_csv.clear_memo()
+
+
+def _write_csvs(tmp_path, n):
+    paths = []
+    for i in range(n):
+        p = tmp_path / f"run_{i:03d}.csv"
+        p.write_text("phase,sum-z\n" + "".join(f"45lb,{i + k * 0.5}\n" for k in range(20)))
+        paths.append(str(p))
+    return paths
+
+
+def _npz(root):
+    return [f for f in os.listdir(root) if f.endswith(".npz")]
+
+
+def test_writes_under_budget_walk_the_cache_once(cache, tmp_path, monkeypatch):
+    scans = []
+    real = disk_lru._trim
+    monkeypatch.setattr(disk_lru, "_trim", lambda *a, **kw: scans.append(a) or real(*a, **kw))
+    for p in _write_csvs(tmp_path, 40):
+        assert columnar_csv.load_csv_columns(p).n_rows == 20
+    assert len(_npz(cache)) == 40
+    assert len(scans) == 1  # the first write resyncs the estimate; the rest only add to it
+
+    # With a periodic resync, one walk per N writes.
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_TRIM_EVERY_N", 10, raising=False)
+    columnar_csv.clear_memo()
+    for p in _write_csvs(tmp_path, 40):
+        os.utime(p, ns=(1, 1))  # new mtime: every load is a cache write
+        columnar_csv.load_csv_columns(p)
+    assert len(scans) == 1 + 4
+
+
+def test_cache_stays_within_budget_and_keeps_the_recent_entries(cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_MAX_ENTRIES", 10, raising=False)
+    paths = _write_csvs(tmp_path, 50)
+    sizes = []
+    for i, p in enumerate(paths):
+        os.utime(p, ns=(i * 10**9, i * 10**9))
+        columnar_csv.load_csv_columns(p)
+        sizes.append(len(_npz(cache)))
+    assert max(sizes) <= 10
+    # Trims go down to 90% of the budget, so a full cache is not walked on every insert.
+    assert columnar_csv._trim_throttle.scans < len(paths) // 2
+
+    # The survivors are the most recently written entries; evict() trims to the exact budget.
+    columnar_csv.clear_memo()
+    kept = {columnar_csv._cache_path(os.path.abspath(p)) for p in paths[-len(_npz(cache)) :]}
+    assert {str(cache / f) for f in _npz(cache)} == kept
+    monkeypatch.setattr(columnar_csv.config, "CSV_CACHE_MAX_ENTRIES", 3, raising=False)
+    assert columnar_csv.evict() == len(kept) - 3 and len(_npz(cache)) == 3
+
+
+def test_throttle_resyncs_when_the_root_changes(tmp_path):
+    throttle = disk_lru.TrimThrottle(".npz")
+    a, b = tmp_path / "a", tmp_path / "b"
+    for root in (a, b):
+        root.mkdir()
+        (root / "x.npz").write_bytes(b"\0" * 300)
+        os.utime(root / "x.npz", (1, 1))
+    budget = {"max_bytes": 1000, "max_entries": 100}
+    assert throttle.after_write(str(a), 100, **budget) == 0 and throttle.scans == 1
+    assert throttle.after_write(str(a), 100, **budget) == 0 and throttle.scans == 1
+    throttle.after_write(str(b), 100, **budget)
+    assert throttle.scans == 2
+    # Passing the byte budget walks right away and trims the oldest entries to 90% of it.
+    (b / "y.npz").write_bytes(b"\0" * 800)
+    assert throttle.after_write(str(b), 800, **budget) == 1 and throttle.scans == 3
+    assert os.listdir(b) == ["y.npz"]
@@ -0,0 +1,50 @@
+import csv
+import math
+
+from src.infra.csv_downsample import downsample_csv
+
+
+def _write_capture(path, n=2000, blank=lambda i, col: False):
+    """1 kHz capture: sum-z is a constant 700 N plus a slow 2 Hz sway, sum-x a constant 5 N."""
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        w = csv.writer(fh)
+        w.writerow(["time", "device_id", "sum-x", "sum-z"])
+        for i in range(n):
+            x = "" if blank(i, "sum-x") else "5"
+            z = "" if blank(i, "sum-z") else f"{700.0 + 10.0 * math.sin(2 * math.pi * 2.0 * i / 1000.0):.6f}"
+            w.writerow([i, "07.00000051", x, z])
+
+
+def _read(path):
+    with open(path, newline="", encoding="utf-8") as fh:
+        return list(csv.DictReader(fh))
+
+
+def test_fir_ignores_scattered_blank_cells(tmp_path):
+    clean, holey = tmp_path / "clean.csv", tmp_path / "holey.csv"
+    _write_capture(clean)
+    _write_capture(holey, blank=lambda i, col: i % 7 == 3)
+    downsample_csv(str(clean), str(tmp_path / "clean_out.csv"), rate_hz=50.0, strategy="fir")
+    downsample_csv(str(holey), str(tmp_path / "holey_out.csv"), rate_hz=50.0, strategy="fir")
+
+    ref, out = _read(tmp_path / "clean_out.csv"), _read(tmp_path / "holey_out.csv")
+    assert len(out) == len(ref) == 100
+    for a, b in zip(ref, out):
+        assert a["time"] == b["time"]
+        assert b["sum-x"] != "" and abs(float(b["sum-x"]) - 5.0) < 1e-9
+        assert b["sum-z"] != "" and abs(float(b["sum-z"]) - float(a["sum-z"])) < 0.05
+
+
+def test_fir_falls_back_to_nearest_sample_in_a_mostly_blank_stretch(tmp_path):
+    src = tmp_path / "gap.csv"
+    # sum-x is blank everywhere except one sample at 1000 ms; sum-z is blank from 500 to 1500 ms.
+    _write_capture(src, blank=lambda i, col: (col == "sum-x" and i != 1000) or (col == "sum-z" and 500 <= i < 1500))
+    downsample_csv(str(src), str(tmp_path / "gap_out.csv"), rate_hz=50.0, strategy="fir")
+    rows = {int(r["time"]): r for r in _read(tmp_path / "gap_out.csv")}
+
+    # Only the window around the lone sample sees it; every other kept row stays blank.
+    assert float(rows[1000]["sum-x"]) == 5.0
+    assert rows[0]["sum-x"] == "" and rows[1500]["sum-x"] == ""
+    # Deep inside the gap nothing is in reach: blank rather than NaN-poisoned neighbours.
+    assert rows[1000]["sum-z"] == ""
+    assert all(rows[t]["sum-z"] != "" for t in (0, 400, 1600, 1980))
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.app_services.hardware import HardwareService
+from src.app_services import testing as testing_service
+from src.infra import binary_frames
+from src.io_client import IoClient
+from src.ui.fluxlite_page import FluxLitePage
+
+DEVICE = "07.00000051"
+SENSORS = ("Rear Right Outer", "Front Left Inner", "Sum")
+
+
+class _FakeSocket:
+    connected = True
+    sid = None
+
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, event, data=None):
+        self.emitted.append((event, data))
+
+    def requested_formats(self):
+        return [d["formats"] for e, d in self.emitted if e == "negotiateStreamFormat"]
+
+
+def _raw(t):
+    sensors = [{"name": nm, "x": 0.5 * k, "y": -0.25 * k, "z": 10.0 * k + t} for k, nm in enumerate(SENSORS)]
+    return {"deviceId": DEVICE, "time": t, "sensors": sensors, "cop": {"x": 0.1, "y": 0.2}, "moments": {"x": 1.0, "y": 2.0, "z": 3.0}}
+
+
+def _drain(hw, testing):
+    page = SimpleNamespace(controller=SimpleNamespace(testing=testing))
+    FluxLitePage._buffer_discrete_payloads(page, hw.frame_store.take_dirty())
+
+
+def test_discrete_session_moves_a_binary_stream_back_to_dicts_and_buffers_samples():
+    hw = HardwareService()
+    hw.client = IoClient("localhost", 1)
+    hw.client._sio = sock = _FakeSocket()
+    hw.client.status.connected = True
+    hw.client._on_stream_format_status({"format": binary_frames.FORMAT_NAME})
+    testing = testing_service.TestingService(hw)
+
+    testing.start_session("tester", DEVICE, "07", 800.0, None, is_discrete_temp=True)
+    assert sock.requested_formats() == [[binary_frames.FORMAT_DICT]]
+    session = testing.current_session
+
+    # Binary packets still in flight before the backend switches: no named sensors to buffer.
+    ch = np.ones((3, len(binary_frames.CHANNELS) + 6), dtype=np.float32)
+    hw._on_binary_blocks(binary_frames.decode_frame(binary_frames.encode_frame({DEVICE: ([1000, 1001, 1002], ch)})))
+    _drain(hw, testing)
+    assert session.discrete_buffer == []
+
+    hw.client._on_stream_format_status({"format": binary_frames.FORMAT_DICT})
+    hw._on_json_batch([_raw(t) for t in (1003, 1004, 1005)])
+    _drain(hw, testing)
+    assert [p["time"] for p in session.discrete_buffer] == [1003, 1004, 1005]
+    p = session.discrete_buffer[-1]
+    assert p["deviceId"] == DEVICE
+    assert [(s["name"], s["x"], s["y"], s["z"]) for s in p["sensors"]] == [
+        (s["name"], s["x"], s["y"], s["z"]) for s in _raw(1005)["sensors"]
+    ]
+
+    # Ending the session hands the stream back to the binary format.
+    testing.session_manager.end_session()
+    assert sock.requested_formats()[-1] == [binary_frames.FORMAT_NAME, binary_frames.FORMAT_DICT]
+
+
+def test_reconnect_during_a_discrete_session_asks_for_dicts():
+    hw = HardwareService()
+    hw.hold_dict_stream("discrete_temp", True)
+    hw.client = IoClient("localhost", 1)
+    hw.client._sio = sock = _FakeSocket()
+    hw._on_connect()
+    assert sock.requested_formats() == [[binary_frames.FORMAT_DICT]]
+
+    # Releasing an owner that never held anything does not renegotiate.
+    hw.hold_dict_stream("other", False)
+    assert len(sock.requested_formats()) == 1
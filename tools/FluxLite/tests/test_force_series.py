@@ -0,0 +1,92 @@
+import numpy as np
+
+from src.ui.widgets.force_series import ForceSeriesRing, decimate_minmax
+
+
+def test_extend_matches_appending_one_sample_at_a_time():
+    rng = np.random.default_rng(0)
+    one, bulk = ForceSeriesRing(16), ForceSeriesRing(16)
+    t0 = 0
+    for n in (3, 13, 1, 40, 7, 16, 0, 5):
+        t = np.arange(t0, t0 + n, dtype=np.float64)
+        v = rng.normal(size=(n, 3))
+        t0 += n
+        for i in range(n):
+            one.append(t[i], *v[i])
+        bulk.extend(t, v)
+        for a, b in zip(one.arrays(), bulk.arrays()):
+            assert np.array_equal(a, b)
+        assert bulk.latest_t() == one.latest_t()
+
+
+def _columns_reference(t, v, t0, t1, buckets):
+    """Per-column (first t, min, max) by brute force; column j is [t0 + j*w, t0 + (j+1)*w)."""
+    col = np.clip(np.floor((t - t0) / ((t1 - t0) / buckets)).astype(int), 0, buckets - 1)
+    xs, lo, hi = [], [], []
+    for j in np.unique(col):
+        m = col == j
+        xs.append(t[m][0])
+        lo.append(v[m].min(axis=0))
+        hi.append(v[m].max(axis=0))
+    return np.array(xs), np.array(lo), np.array(hi)
+
+
+def _spiky(n, t0, t1, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.sort(rng.uniform(t0, t1, size=n))
+    v = np.cumsum(rng.normal(size=(n, 3)), axis=0)
+    for i, k in ((n // 7, 0), (n // 3, 1), (n - 5, 2)):
+        v[i, k] += 500.0 if i % 2 else -500.0  # one-sample spikes a stride decimation would miss
+    return t, v
+
+
+def test_decimate_minmax_bounds_vertices_and_keeps_every_columns_extremes():
+    t0, t1, buckets = 1000.0, 6000.0, 200
+    t, v = _spiky(20_000, t0, t1)
+    xs, ys = decimate_minmax(t, v, t0, t1, buckets)
+    assert xs.shape[0] <= 2 * buckets and ys.shape == (xs.shape[0], 3)
+    ref_x, ref_lo, ref_hi = _columns_reference(t, v, t0, t1, buckets)
+    assert np.array_equal(xs[0::2], ref_x) and np.array_equal(xs[1::2], ref_x)
+    assert np.array_equal(ys[0::2], ref_lo) and np.array_equal(ys[1::2], ref_hi)
+    assert np.array_equal(ys.min(axis=0), v.min(axis=0)) and np.array_equal(ys.max(axis=0), v.max(axis=0))
+
+
+def test_decimate_minmax_passes_small_or_degenerate_inputs_through():
+    t, v = _spiky(400, 0.0, 100.0)
+    for args in ((0.0, 100.0, 200), (0.0, 100.0, 1000), (50.0, 50.0, 10), (60.0, 40.0, 10)):
+        xs, ys = decimate_minmax(t, v, *args)
+        assert xs is t and ys is v
+
+
+def test_decimate_minmax_folds_samples_outside_the_span_into_the_edge_columns():
+    t0, t1, buckets = 1000.0, 2000.0, 50
+    t, v = _spiky(5000, 500.0, 2500.0, seed=1)  # a quarter before t0, a quarter after t1
+    xs, ys = decimate_minmax(t, v, t0, t1, buckets)
+    assert xs.shape[0] <= 2 * buckets and xs[0] == t[0]
+    ref_x, ref_lo, ref_hi = _columns_reference(t, v, t0, t1, buckets)
+    assert np.array_equal(xs[0::2], ref_x)
+    assert np.array_equal(ys[0::2], ref_lo) and np.array_equal(ys[1::2], ref_hi)
+    # Everything before the span: a single column.
+    xs, ys = decimate_minmax(t, v, 3000.0, 4000.0, buckets)
+    assert xs.tolist() == [t[0], t[0]] and np.array_equal(ys, np.stack([v.min(axis=0), v.max(axis=0)]))
+
+
+def test_decimate_minmax_over_ring_reads():
+    ring = ForceSeriesRing(64)
+    t, v = ring.since(0.0)
+    xs, ys = decimate_minmax(t, v, 0.0, 100.0, 8)
+    assert xs.shape == (0,) and ys.shape == (0, 3)
+
+    # Several laps: the retained window wraps the backing arrays.
+    t_all, v_all = _spiky(1000, 0.0, 1000.0, seed=2)
+    ring.extend(t_all[:700], v_all[:700])
+    for i in range(700, 1000):
+        ring.append(t_all[i], *v_all[i])
+    t0 = float(t_all[950])
+    t, v = ring.since(t0)
+    assert np.array_equal(t, t_all[950:]) and np.array_equal(v, v_all[950:])
+    xs, ys = decimate_minmax(t, v, t0, 1000.0, 8)
+    assert xs.shape[0] <= 16
+    ref_x, ref_lo, ref_hi = _columns_reference(t, v, t0, 1000.0, 8)
+    assert np.array_equal(xs[0::2], ref_x)
+    assert np.array_equal(ys[0::2], ref_lo) and np.array_equal(ys[1::2], ref_hi)
@@ -0,0 +1,130 @@
+import pytest
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from src.infra import http_client
+
+URL = "http://backend.test:3001/api/get-groups"
+
+
+def _refused():
+    """What `requests` raises when nothing is listening: the request never left the client."""
+    reason = urllib3.exceptions.NewConnectionError(None, "Connection refused")
+    return requests.exceptions.ConnectionError(urllib3.exceptions.MaxRetryError(None, URL, reason))
+
+
+def _reset():
+    """Connection dropped after the request was sent; the server may have acted on it."""
+    return requests.exceptions.ConnectionError(urllib3.exceptions.ProtocolError("Connection aborted.", ConnectionResetError()))
+
+
+class _Transport(HTTPAdapter):
+    """Stub transport: plays back a script of status codes / exceptions, one per attempt."""
+
+    def __init__(self, *script):
+        super().__init__()
+        self.script = list(script)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append((request.method, kwargs.get("timeout")))
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        resp = requests.Response()
+        resp.status_code = step
+        resp._content = b"{}"
+        resp.request = request
+        resp.url = request.url
+        return resp
+
+
+def _client(*script, retries=2):
+    client = http_client.BackendHttpClient(retries=retries, backoff_s=0.0, connect_timeout_s=1.5)
+    transport = _Transport(*script)
+    client.session.mount("http://", transport)
+    return client, transport
+
+
+def _stats(client, key="GET /api/get-groups"):
+    ep = client.metrics_snapshot()["endpoints"][key]
+    return ep["requests"], ep["errors"], ep["retries"]
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_get_retries_gateway_statuses(status):
+    client, transport = _client(status, status, 200)
+    assert client.request("GET", URL).status_code == 200
+    assert len(transport.sent) == 3
+    assert _stats(client) == (3, 2, 2)
+
+
+@pytest.mark.parametrize("status", [200, 404, 429, 500])
+def test_get_does_not_retry_other_statuses(status):
+    client, transport = _client(status, 200)
+    assert client.request("GET", URL).status_code == status
+    assert len(transport.sent) == 1
+    assert _stats(client) == (1, 1 if status >= 500 else 0, 0)
+
+
+@pytest.mark.parametrize("exc", [requests.exceptions.ReadTimeout("read timed out"), _reset(), _refused(), requests.exceptions.ConnectTimeout("connect timed out")])
+def test_get_retries_transport_errors(exc):
+    client, transport = _client(exc, 200)
+    assert client.request("GET", URL).status_code == 200
+    assert len(transport.sent) == 2
+    assert _stats(client) == (2, 1, 1)
+
+
+def test_get_gives_back_the_last_response_when_retries_run_out():
+    client, transport = _client(503, 503, 503)
+    assert client.request("GET", URL).status_code == 503
+    assert len(transport.sent) == 3
+    assert _stats(client) == (3, 3, 2)
+
+
+def test_get_raises_the_last_error_when_retries_run_out():
+    client, transport = _client(requests.exceptions.ReadTimeout("1"), requests.exceptions.ReadTimeout("2"))
+    with pytest.raises(requests.exceptions.ReadTimeout, match="2"):
+        client.request("GET", URL, retries=1)
+    assert _stats(client) == (2, 2, 1)
+    assert client.metrics_snapshot()["endpoints"]["GET /api/get-groups"]["last_error"] == "2"
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_post_is_not_retried_on_gateway_statuses(status):
+    client, transport = _client(status, 200)
+    assert client.request("POST", URL, data="{}").status_code == status
+    assert len(transport.sent) == 1
+    assert _stats(client, "POST /api/get-groups") == (1, 1, 0)
+
+
+@pytest.mark.parametrize("exc", [requests.exceptions.ReadTimeout("read timed out"), _reset()])
+def test_post_is_not_retried_once_the_request_may_have_been_sent(exc):
+    client, transport = _client(exc, 200)
+    with pytest.raises(type(exc)):
+        client.request("POST", URL, data="{}")
+    assert len(transport.sent) == 1
+    assert _stats(client, "POST /api/get-groups") == (1, 1, 0)
+
+
+@pytest.mark.parametrize("exc", [_refused(), requests.exceptions.ConnectTimeout("connect timed out")])
+def test_post_is_retried_when_the_connection_was_never_made(exc):
+    client, transport = _client(exc, 200)
+    assert client.request("POST", URL, data="{}").status_code == 200
+    assert len(transport.sent) == 2
+    assert _stats(client, "POST /api/get-groups") == (2, 1, 1)
+
+
+def test_counters_accumulate_per_endpoint_and_reset():
+    client, transport = _client(503, 200, 200, 500)
+    client.request("GET", URL)
+    client.request("GET", URL)
+    client.request("POST", "http://backend.test:3001/api/device/process-csv", data="{}")
+    assert _stats(client) == (3, 1, 1)
+    assert _stats(client, "POST /api/device/process-csv") == (1, 1, 0)
+    assert client.metrics_snapshot()["endpoints"]["GET /api/get-groups"]["latency_count"] == 3
+    # (connect, read) timeouts: read timeout comes from the per-path table unless given.
+    assert [t for _, t in transport.sent] == [(1.5, 10.0), (1.5, 10.0), (1.5, 10.0), (1.5, 300.0)]
+    client.reset_metrics()
+    assert client.metrics_snapshot()["endpoints"] == {}
@@ -0,0 +1,110 @@
+import msgpack
+import numpy as np
+
+from src.infra import binary_frames
+from src.io_client import IoClient
+
+
+def _client():
+    got = []
+    client = IoClient("localhost", 1)
+    client.set_json_callback(got.append)
+    return client, got
+
+
+def _frame(t, fz):
+    return {"deviceId": "07.00000051", "time": t, "fz": fz}
+
+
+def test_back_to_back_frames_in_one_message_are_all_delivered():
+    client, got = _client()
+    client._on_simple_json_data(msgpack.packb(_frame(1, 1.0)) + msgpack.packb(_frame(2, 2.0)))
+    client._on_simple_json_data(memoryview(msgpack.packb(_frame(3, 3.0))))
+    assert got == [_frame(1, 1.0), _frame(2, 2.0), _frame(3, 3.0)]
+
+
+def test_truncated_message_is_rejected_without_corrupting_the_next_one():
+    client, got = _client()
+    good = msgpack.packb(_frame(1, 1.0))
+    for cut in range(1, len(good)):
+        client._on_simple_json_data(good[:cut])
+        client._on_simple_json_data(good)
+    # A message that ends mid-object is rejected whole, including the complete frame before it.
+    client._on_simple_json_data(msgpack.packb(_frame(2, 2.0)) + good[:5])
+    client._on_simple_json_data(good)
+    assert got == [_frame(1, 1.0)] * len(good)
+    assert "simpleJsonData" in client.status.last_error
+
+
+def test_garbage_messages_deliver_nothing():
+    client, got = _client()
+    for junk in (b"\xc1", b"\x01\x02\x03", b"\xff" * 16, b"\x81\xa2fz"):
+        client._on_simple_json_data(junk)
+    client._on_simple_json_data(msgpack.packb(_frame(4, 4.0)))
+    assert got == [_frame(4, 4.0)]
+
+
+class _FakeSocket:
+    """socketio.Client stand-in: records emits; `connect` ends the client loop after one pass."""
+
+    connected = False
+    sid = None
+
+    def __init__(self, client):
+        self.client = client
+        self.emitted = []
+
+    def emit(self, event, data=None):
+        self.emitted.append((event, data))
+
+    def connect(self, url, **_kw):
+        self.client._stop_flag.set()
+
+
+def _negotiating_client():
+    client, got = _client()
+    client._sio = _FakeSocket(client)
+    client.request_stream_format()
+    ((event, data),) = client._sio.emitted
+    assert event == "negotiateStreamFormat"
+    assert data["formats"] == [binary_frames.FORMAT_NAME, binary_frames.FORMAT_DICT]
+    assert data["channels"] == list(binary_frames.CHANNELS)
+    return client, got
+
+
+def test_stream_stays_on_dicts_when_the_backend_never_acknowledges():
+    client, got = _negotiating_client()
+    assert client.stream_format == binary_frames.FORMAT_DICT
+    client._on_simple_json_data(msgpack.packb(_frame(1, 1.0)))
+    assert got == [_frame(1, 1.0)]
+
+
+def test_unknown_or_malformed_acknowledgements_fall_back_to_dicts():
+    for payload in ({"format": "axf-f64-v9"}, {"format": None}, {}, None, "", ["axf-f32-v1"], {"format": "dict"}):
+        client, _ = _negotiating_client()
+        client._on_stream_format_status(payload)
+        assert client.stream_format == binary_frames.FORMAT_DICT
+    client._on_stream_format_status(binary_frames.FORMAT_NAME)
+    assert client.stream_format == binary_frames.FORMAT_NAME
+
+
+def test_acknowledged_binary_stream_decodes_and_reconnect_renegotiates():
+    client, got = _negotiating_client()
+    client._on_stream_format_status({"format": " axf-f32-v1 "})
+    assert client.stream_format == binary_frames.FORMAT_NAME
+
+    ch = np.arange(2 * len(binary_frames.CHANNELS), dtype=np.float32).reshape(2, -1)
+    client._on_binary_frame_data(binary_frames.encode_frame({"07.1": ([10, 11], ch)}))
+    assert [(f["id"], f["time"], f["fz"]) for f in got] == [("07.1", 10, 2.0), ("07.1", 11, 11.0)]
+
+    # A corrupt frame is dropped and reported; the next one still decodes.
+    client._on_binary_frame_data(b"AXFB\x07" + b"\0" * 11)
+    assert "unsupported version" in client.status.last_error
+    blocks = []
+    client.set_binary_blocks_callback(blocks.append)
+    client._on_binary_frame_data(binary_frames.encode_frame({"07.1": ([12], ch[:1])}))
+    assert len(got) == 2 and [b.device_id for b in blocks[0]] == ["07.1"]
+
+    # Every (re)connect starts back on the dict stream until the backend acknowledges again.
+    client._run_forever()
+    assert client.stream_format == binary_frames.FORMAT_DICT
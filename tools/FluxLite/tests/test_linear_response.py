@@ -0,0 +1,86 @@
+import math
+
+import pytest
+
+from src.app_services.temperature_linear_response import LinearResponse
+
+ROOM, GAIN = 76.0, 0.8
+COEFFS = {"x": 0.002, "y": -0.0015, "z": 0.003}
+HEADER = ["time", "device_id", "sum-x", "sum-y", "sum-z", "cop-x", "cop-y", "moments-z", "sum-t"]
+SUMS = {"x": 2, "y": 3, "z": 4}
+T_COL = 8
+
+
+def _off_rows():
+    rows = []
+    for i in range(40):
+        t = "" if i % 9 == 4 else f"{70.0 + 0.37 * i:.2f}"  # some rows carry no temperature
+        rows.append([
+            str(1_700_000_000_000 + 20 * i), " 07.00000051", f"{1.5 - 0.01 * i}", f"{-2.25 + 0.02 * i}",
+            f"{812.4 + 3.1 * i}", f"0.{i:02d}3456789012", f" -0.{i:02d}1", "1e-05", t,
+        ])
+    rows[7][SUMS["y"]] = "nan"
+    return rows
+
+
+def _write(path, header, rows):
+    path.write_text("\n".join(",".join(r) for r in [header] + rows) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _scaled(off, c, t, gain):
+    return off * (1.0 + gain * c * ((float(t) - ROOM) if t else 0.0))
+
+
+def test_candidate_rescales_only_the_sum_columns_and_copies_everything_else(tmp_path):
+    rows = _off_rows()
+    off = _write(tmp_path / "off.csv", HEADER, rows)
+    dest = LinearResponse(off, room_temp_f=ROOM, gain=GAIN).write_candidate_csv(COEFFS, str(tmp_path / "out" / "cand.csv"))
+
+    expected = []
+    for r in rows:
+        out = list(r)
+        for axis, idx in SUMS.items():
+            v = float(r[idx])
+            if v == v:
+                out[idx] = f"{_scaled(v, COEFFS[axis], r[T_COL], GAIN):.6f}"
+        expected.append(out)
+    with open(dest, "rb") as fh:
+        assert fh.read() == ("\n".join(",".join(r) for r in [HEADER] + expected) + "\n").encode("utf-8")
+    # Rows without a temperature keep the OFF sums (value-wise); a non-numeric cell is left alone.
+    assert float(expected[4][SUMS["z"]]) == pytest.approx(float(rows[4][SUMS["z"]]), abs=1e-6)
+    assert expected[7][SUMS["y"]] == "nan"
+
+
+def test_compare_with_backend_recovers_the_gain_of_a_scaled_output(tmp_path):
+    rows = _off_rows()
+    off = _write(tmp_path / "off.csv", HEADER, rows)
+    model = LinearResponse(off, room_temp_f=ROOM, gain=GAIN)
+
+    for true_gain in (GAIN, 1.1):
+        backend = [list(r) for r in rows]
+        for r in backend:
+            for axis, idx in SUMS.items():
+                r[idx] = repr(_scaled(float(r[idx]), COEFFS[axis], r[T_COL], true_gain))
+        path = _write(tmp_path / f"backend-{true_gain}.csv", HEADER, backend + [backend[-1]])
+        report = model.compare_with_backend(COEFFS, path)
+        assert (report["rows"], report["row_mismatch"]) == (len(rows), 1)
+        for axis in SUMS:
+            assert report[axis]["fitted_gain"] == pytest.approx(true_gain, rel=1e-9)
+            if true_gain == GAIN:
+                assert report[axis]["rel_rms_error"] < 1e-12 and report[axis]["max_abs_error"] < 1e-9
+            else:
+                assert report[axis]["rel_rms_error"] > 1e-6
+
+
+def test_temp_f_fills_rows_without_a_temperature(tmp_path):
+    rows = _off_rows()
+    off = _write(tmp_path / "off.csv", HEADER, rows)
+    model = LinearResponse(off, room_temp_f=ROOM, temp_f=80.0, gain=GAIN)
+    assert model.sensitivity[4] == pytest.approx(4.0)
+    assert model.sensitivity[0] == pytest.approx(70.0 - ROOM)
+    assert math.isnan(model.sums(COEFFS)["y"][7])
+
+    no_temp = _write(tmp_path / "no-temp.csv", HEADER[:-1], [r[:-1] for r in rows])
+    with pytest.raises(ValueError):
+        LinearResponse(no_temp, room_temp_f=ROOM, gain=GAIN)
@@ -0,0 +1,99 @@
+import numpy as np
+
+from src.app_services.live_frame_store import COL, DeviceFrameRing, LiveFrameStore, merge_batches
+from src.infra.binary_frames import BinaryBlock
+
+
+def _frame(did, t, fz, **extra):
+    return dict({"id": did, "time": t, "fx": 0.0, "fy": 0.0, "fz": fz, "cop": {"x": 0.1, "y": -0.2}}, **extra)
+
+
+def _row(t):
+    row = np.zeros(len(COL))
+    row[COL["time_ms"]] = t
+    row[COL["fz"]] = 10.0 * t
+    return row
+
+
+def test_ring_wraps_and_keeps_the_newest_samples_in_order():
+    ring = DeviceFrameRing(16)
+    for t in range(1, 41):
+        ring.append(_row(t))
+    assert len(ring) == 16 and ring.total_written == 40
+    assert ring.last(16)[:, COL["time_ms"]].tolist() == list(range(25, 41))
+    assert ring.last(5)[:, COL["time_ms"]].tolist() == [36, 37, 38, 39, 40]
+
+    # A block larger than the ring keeps only its tail; one that straddles the end wraps.
+    ring.append_block(np.stack([_row(t) for t in range(100, 130)]))
+    assert ring.last(16)[:, COL["time_ms"]].tolist() == list(range(114, 130))
+    ring.append_block(np.stack([_row(t) for t in range(130, 140)]))
+    assert ring.last(16)[:, COL["time_ms"]].tolist() == list(range(124, 140))
+    assert ring.latest()[COL["time_ms"]] == 139
+
+
+def test_take_new_returns_each_sample_once_and_counts_overwrites():
+    ring = DeviceFrameRing(16)
+    for t in range(1, 6):
+        ring.append(_row(t))
+    rows, sensors, extra, dropped = ring.take_new()
+    assert rows[:, COL["time_ms"]].tolist() == [1, 2, 3, 4, 5] and dropped == 0
+    assert sensors is None and extra is None
+    assert ring.take_new()[0].shape[0] == 0
+
+    for t in range(6, 30):  # 24 new samples into a 16-slot ring
+        ring.append(_row(t))
+    rows, _, _, dropped = ring.take_new()
+    assert rows[:, COL["time_ms"]].tolist() == list(range(14, 30)) and dropped == 8
+
+    # Copies: later writes do not change what was taken.
+    ring.append(_row(30))
+    assert rows[-1, COL["time_ms"]] == 29
+
+
+def test_window_selects_by_time_across_the_wrap():
+    store = LiveFrameStore(capacity=16)
+    for t in range(0, 40):
+        store.ingest(_frame("a", 1000 + 10 * t, 1.0))
+    w = store.window("a", 1250, 1300)
+    assert w[:, COL["time_ms"]].tolist() == [1250, 1260, 1270, 1280, 1290, 1300]
+    assert store.window("a", 0, 1200).shape[0] == 0  # already overwritten
+    assert store.window("missing", 0, 1e9).shape == (0, len(COL))
+    # Handed-out windows are copies.
+    w[:] = 0
+    assert store.last("a", 1)[0, COL["time_ms"]] == 1390
+
+
+def test_take_dirty_batches_keep_packet_grouping_when_timestamps_differ():
+    store = LiveFrameStore(capacity=64)
+    # Upper and lower landing plates of one packet are 1 ms apart.
+    for k in range(3):
+        store.ingest({"devices": [_frame("upper", 100 + k, 5.0 + k), _frame("lower", 101 + k, 50.0 + k)]})
+    store.ingest(_frame("launch", 200, 1.0))
+    samples = merge_batches(store.take_dirty())
+    packets = [[samples.device_ids[d] for d in samples.device[a:b]] for a, b in samples.packets()]
+    assert sorted(map(sorted, packets[:3])) == [["lower", "upper"]] * 3
+    assert packets[3] == ["launch"]
+    assert store.take_dirty() == {}
+
+
+def test_binary_blocks_of_one_frame_share_seq_per_sample_index():
+    store = LiveFrameStore(capacity=64)
+    ch = np.zeros((4, 11), dtype=np.float32)
+    ch[:, 9] = [1.5, 2.5, 3.5, 4.5]  # first extra channel
+    blocks = [BinaryBlock("a", np.arange(10, 14, dtype=np.int64), ch), BinaryBlock("b", np.arange(11, 15, dtype=np.int64), ch)]
+    store.ingest_blocks(blocks)
+    store.ingest_blocks(blocks[:1])
+    batches = store.take_dirty()
+    assert batches["a"].extra.dtype == np.float64 and batches["a"].extra[:, 0].tolist() == [1.5, 2.5, 3.5, 4.5] * 2
+    samples = merge_batches(batches)
+    assert [b - a for a, b in samples.packets()] == [2, 2, 2, 2, 1, 1, 1, 1]
+    assert store.packets_taken == 2
+
+
+def test_raw_sensor_values_are_kept_at_full_precision():
+    store = LiveFrameStore(capacity=16)
+    sensors = [{"name": "Sum", "x": 0.1, "y": 0.2, "z": 812.123456789}, {"name": "A", "x": 1e-7, "y": 3.3, "z": 123456.789012}]
+    store.ingest({"deviceId": "07.1", "time": 5, "sensors": sensors})
+    (fr,) = store.take_dirty()["07.1"].frames()
+    assert fr["sensors"] == [dict(s) for s in sensors]
+    assert fr["fz"] == 812.123456789
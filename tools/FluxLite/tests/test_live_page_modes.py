@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from src.app_services.live_frame_store import LiveFrameStore
+from src.ui.fluxlite_page import FluxLitePage
+
+
+class _Plot:
+    def __init__(self):
+        self.dual = []
+
+    def set_dual_series_enabled(self, enabled):
+        self.dual.append(bool(enabled))
+
+
+class _Page:
+    """Just the live-drain methods of FluxLitePage, with the views and per-sample consumers stubbed."""
+
+    _process_live_batches = FluxLitePage._process_live_batches
+    _process_mound_samples = FluxLitePage._process_mound_samples
+    _set_dual_series_enabled = FluxLitePage._set_dual_series_enabled
+    _buffer_discrete_payloads = FluxLitePage._buffer_discrete_payloads
+    _log_live_error = FluxLitePage._log_live_error
+
+    def __init__(self):
+        self.controller = SimpleNamespace(testing=SimpleNamespace(current_session=None))
+        self.state = SimpleNamespace(display_mode="single", selected_device_id="a")
+        self.sensor_plot_left, self.sensor_plot_right = _Plot(), _Plot()
+        self.mound_packets = 0
+        self.selected = []
+
+    def _process_mound_packet(self, packet, moments_data):
+        self.mound_packets += 1
+
+    def _process_selected_device(self, batch):
+        self.selected.append(batch.device_id)
+
+    def _set_moments(self, moments_data):
+        pass
+
+
+def _drain(page, store, t):
+    store.ingest({"devices": [{"id": "a", "time": t, "fz": 1.0}, {"id": "b", "time": t, "fz": 2.0}]})
+    page._process_live_batches(store.take_dirty())
+
+
+def test_switching_from_mound_back_to_single_restores_the_single_series():
+    page, store = _Page(), LiveFrameStore(capacity=16)
+    page.state.display_mode = "mound"
+    _drain(page, store, 1)
+    assert page.mound_packets == 1
+    assert page.sensor_plot_left.dual[-1] is True and page.sensor_plot_right.dual[-1] is True
+
+    page.state.display_mode = "single"
+    _drain(page, store, 2)
+    assert page.selected == ["a"]
+    assert page.sensor_plot_left.dual[-1] is False and page.sensor_plot_right.dual[-1] is False
@@ -0,0 +1,45 @@
+import random
+
+import numpy as np
+
+from src.diagnostics import live_profiler
+from src.diagnostics.live_profiler import N_BUCKETS, RollingHistogram, bucket_index, bucket_indexes
+
+S = 1_000_000_000
+
+
+def test_vectorized_bucket_indexes_match_the_scalar_version():
+    rng = random.Random(3)
+    values = [0, 1, 15, 16, 17, 31, 32, 33, 1000, 2**40, 2**41 - 1, 2**41, 2**42, 2**53, 2**62]
+    values += [rng.randrange(0, 2 ** rng.randrange(1, 50)) for _ in range(20000)]
+    assert bucket_indexes(np.array(values, dtype=np.int64)).tolist() == [bucket_index(v) for v in values]
+
+
+def test_buffered_records_land_in_their_time_slices():
+    h = RollingHistogram(window_s=6.0, slices=6)
+    t0 = 5 * S
+    ts = [t0 + k * 7_000_000 for k in range(3000)]  # 21 s at 7 ms, several folds along the way
+    for k, t in enumerate(ts):
+        h.record(k % 5000, t)
+    end = ts[-1]
+    # Slices start at t0 and are 1 s long; the window keeps the current one and the five before.
+    oldest = t0 + ((end - t0) // S - 5) * S
+    kept = [k % 5000 for k, t in enumerate(ts) if t >= oldest]
+    counts, total_sum, vmax = h.merged(end)
+    assert sum(counts) == len(kept) and total_sum == sum(kept) and vmax == max(kept)
+    assert counts == np.bincount(bucket_indexes(np.array(kept)), minlength=N_BUCKETS).tolist()
+    assert h.total == len(ts)
+    # Nothing left in the window once it has fully passed.
+    assert h.snapshot(end + 7 * S)["count"] == 0
+
+
+def test_handles_survive_reset_and_empty_metrics_are_hidden():
+    h = live_profiler.histogram("test.stage")
+    t = h.record_since(live_profiler.now() - 1000)
+    assert t > 0 and live_profiler.snapshot()["metrics"]["test.stage"]["count"] == 1
+    live_profiler.reset()
+    assert "test.stage" not in live_profiler.snapshot()["metrics"]
+    h.record_since(live_profiler.now())
+    assert live_profiler.histogram("test.stage") is h
+    assert live_profiler.snapshot()["metrics"]["test.stage"]["count"] == 1
+    live_profiler.reset()
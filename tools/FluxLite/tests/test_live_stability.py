@@ -0,0 +1,99 @@
+import math
+import random
+from dataclasses import replace
+
+from src.app_services.live_measurement_engine import LiveMeasurementConfig, LiveMeasurementEngine
+
+
+def _trace(seconds, seed):
+    """1 kHz (t_ms, visible, cop_x, cop_y, fz): arm + hold, drift, next cell, wobble, lift-off; with impulse spikes."""
+    rng = random.Random(seed)
+    segments = (
+        (400, False, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+        (1800, True, 0.0, 0.0, 600.0, 3.0, 1.5, 0.0),
+        (800, True, 0.0, 0.0, 600.0, 4.0, 2.0, 60.0),
+        (1800, True, 0.0, 120.0, 450.0, 2.0, 1.0, 0.0),
+        (700, True, 0.0, 120.0, 450.0, 25.0, 30.0, 0.0),
+    )
+    out, t = [], 0
+    while t < seconds * 1000:
+        for dur, visible, cx, cy, fz, fz_sd, cop_sd, drift in segments:
+            for k in range(dur):
+                f = fz + drift * (k / 1000.0) + rng.gauss(0.0, fz_sd)
+                if visible and rng.random() < 0.004:
+                    f += rng.choice((-1.0, 1.0)) * 150.0
+                out.append((t, visible, cx + rng.gauss(0.0, cop_sd), cy + rng.gauss(0.0, cop_sd), f))
+                t += 1
+    return out
+
+
+def _run(engine, trace):
+    done, log = set(), []
+    for t_ms, visible, x, y, fz in trace:
+        ev = engine.process_sample(
+            t_ms=t_ms, cop_x_mm=x, cop_y_mm=y, fz_n=fz, is_visible=visible, device_type="07",
+            rows=5, cols=3, rotation_quadrants=0, is_cell_already_done=lambda r, c: (r, c) in done,
+        )
+        if ev is not None:
+            done.add((ev.row, ev.col))
+        log.append((engine.phase, engine.status(), engine.progress_01, ev))
+    return log
+
+
+def test_incremental_engine_matches_the_sum_reference_sample_for_sample():
+    for seed, window_ms, kernel in ((1, 500, 7), (2, 300, 5)):
+        base = replace(LiveMeasurementConfig(), stability_duration_ms=window_ms, median_filter_size=kernel)
+        trace = _trace(5.5, seed)
+        ref = _run(LiveMeasurementEngine(replace(base, incremental_stability=False)), trace)
+        inc = _run(LiveMeasurementEngine(replace(base, incremental_stability=True)), trace)
+        assert any(entry[3] is not None for entry in ref)  # the trace does reach captures
+        assert inc == ref
+
+
+def _engine_with_window(fz_values, kernel=1):
+    eng = LiveMeasurementEngine(replace(LiveMeasurementConfig(), median_filter_size=kernel))
+    for i, fz in enumerate(fz_values):
+        eng._append_window(i, 0.0, 0.0, fz)
+    return eng
+
+
+def test_verdicts_match_the_reference_at_the_threshold_despite_summation_differences():
+    """
+    Documented deviation: the tracker's mean is exactly rounded, the reference's (sum()/n) is
+    not, so the reported numbers can differ in the last ulps. Windows built with their Fz range
+    a few ulps either side of the threshold still get the reference's verdict.
+    """
+    rng = random.Random(5)
+    pct = LiveMeasurementConfig().stability_fz_range_pct
+    deviating = 0
+    for _ in range(300):
+        n = rng.randrange(20, 400)
+        mean_guess = rng.uniform(400.0, 1000.0)
+        vals = [mean_guess + rng.uniform(-0.01, 0.01) * mean_guess for _ in range(n)]
+        lo = min(vals) - 1.0
+        for _ in range(4):  # settle range == threshold computed the reference's way
+            vals[0] = lo
+            vals[1] = lo + (sum(vals) / n) * pct
+        vals[1] = vals[1] + rng.randint(-3, 3) * math.ulp(vals[1])
+        eng = _engine_with_window(vals)
+
+        ref = eng._check_stability_full()
+        inc = eng._check_stability()
+        assert inc[0] == ref[0]
+
+        _, _, mean_inc = eng._stability.fz_stats()
+        mean_ref = sum(vals) / n
+        # Left-to-right summation error bound: about n ulps of the mean.
+        assert abs(mean_inc - mean_ref) <= n * math.ulp(mean_ref)
+        deviating += mean_inc != mean_ref
+    # The case the fallback exists for does occur.
+    assert deviating > 0
+
+
+def test_reported_values_away_from_the_threshold_come_from_the_tracker():
+    eng = _engine_with_window([600.0 + (i % 5) for i in range(200)], kernel=7)
+    ref = eng._check_stability_full()
+    inc = eng._check_stability()
+    assert inc[0] is ref[0] is True
+    assert math.isclose(inc[1], ref[1]) and math.isclose(inc[2], ref[2])
+    assert inc[4] == ref[4] == "stable"
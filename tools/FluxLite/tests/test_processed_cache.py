@@ -0,0 +1,173 @@
+import os
+import subprocess
+import threading
+import time
+
+from src.infra import processed_cache
+from src.infra.processed_cache import ProcessedOutputCache
+
+
+def _csv(path, body):
+    path.write_text("time,fz\n" + body, encoding="utf-8")
+    return str(path)
+
+
+def _key(cache, path, **overrides):
+    params = dict(
+        input_csv_path=path, device_id="07.1", use_temperature_correction=True, mode="scalar",
+        coefficients={"x": 0.1, "y": 0.2, "z": 0.3}, room_temp_f=76.0,
+    )
+    params.update(overrides)
+    return cache.key(**params)
+
+
+def _age(path, seconds):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - int(seconds * 1e9)))
+
+
+def test_keys_follow_inputs_parameters_and_backend_version(tmp_path):
+    src = _csv(tmp_path / "in.csv", "1,2\n")
+    a = ProcessedOutputCache(str(tmp_path / "c"), max_bytes=1 << 20, max_entries=10, backend_version="abc")
+    b = ProcessedOutputCache(str(tmp_path / "c"), max_bytes=1 << 20, max_entries=10, backend_version="def")
+    assert _key(a, src) == _key(a, src)
+    assert _key(a, src) != _key(b, src)
+    assert _key(a, src) != _key(a, src, room_temp_f=77.0)
+    assert _key(a, src) != _key(a, _csv(tmp_path / "other.csv", "1,3\n"))
+
+
+def test_hits_touch_entries_and_trim_drops_the_least_recently_used(tmp_path):
+    cache = ProcessedOutputCache(str(tmp_path / "c"), max_bytes=1 << 20, max_entries=3)
+    keys = []
+    for i in range(3):
+        src = _csv(tmp_path / f"in{i}.csv", f"{i},0\n")
+        key = _key(cache, src)
+        assert cache.put(key, _csv(tmp_path / f"out{i}.csv", f"{i},{i}\n")) is not None
+        _age(cache.entry_path(key), 100 - i)
+        keys.append(key)
+
+    assert cache.get(keys[0]) is not None  # touched: now the most recent
+    src = _csv(tmp_path / "in3.csv", "3,0\n")
+    key3 = _key(cache, src)
+    cache.put(key3, _csv(tmp_path / "out3.csv", "3,3\n"))
+    assert cache.stats.evictions == 1
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(k) is not None for k in (keys[0], keys[2], key3))
+
+    dest = tmp_path / "copy.csv"
+    assert cache.materialize(key3, str(dest)) and dest.read_text(encoding="utf-8") == "time,fz\n3,3\n"
+
+    # Byte budget: only the newest entry fits.
+    cache.max_bytes = os.path.getsize(cache.entry_path(key3))
+    assert cache.evict() == 2
+
+
+def test_backend_version_prefers_the_override_then_the_checkout_head(tmp_path, monkeypatch):
+    checkout = tmp_path / "backend"
+    checkout.mkdir()
+    monkeypatch.setattr(processed_cache.config, "PROCESSED_CACHE_BACKEND_VERSION", "", raising=False)
+    monkeypatch.setattr(processed_cache.config, "PROCESSED_CACHE_BACKEND_DIR", str(checkout), raising=False)
+    processed_cache.backend_version.cache_clear()
+    try:
+        assert processed_cache.backend_version() == ""  # not a checkout
+
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@t", "-c", "commit.gpgsign=false"]
+        subprocess.run(["git", "init", "-q"], cwd=checkout, check=True)
+        (checkout / "model.txt").write_text("v1", encoding="utf-8")
+        subprocess.run(["git", "add", "model.txt"], cwd=checkout, check=True)
+        subprocess.run([*git, "commit", "-qm", "v1"], cwd=checkout, check=True)
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=checkout, capture_output=True, text=True).stdout.strip()
+        processed_cache.backend_version.cache_clear()
+        assert processed_cache.backend_version() == head
+
+        (checkout / "model.txt").write_text("v2", encoding="utf-8")
+        processed_cache.backend_version.cache_clear()
+        assert processed_cache.backend_version() == f"{head}-dirty"
+
+        monkeypatch.setattr(processed_cache.config, "PROCESSED_CACHE_BACKEND_VERSION", "nn-2024.1")
+        processed_cache.backend_version.cache_clear()
+        assert processed_cache.backend_version() == "nn-2024.1"
+    finally:
+        processed_cache.backend_version.cache_clear()
+
+
+def test_correction_off_runs_share_a_key_whatever_the_mode(tmp_path):
+    src = _csv(tmp_path / "in.csv", "1,2\n")
+    cache = ProcessedOutputCache(str(tmp_path / "c"), max_bytes=1 << 20, max_entries=10)
+    off = dict(use_temperature_correction=False, coefficients=None)
+    assert _key(cache, src, mode="scalar", **off) == _key(cache, src, mode="legacy", **off) == _key(cache, src, mode="", **off)
+    assert _key(cache, src, mode="scalar") != _key(cache, src, mode="legacy")
+
+
+def test_key_locks_serialize_one_key_and_are_dropped_when_released(tmp_path):
+    cache = ProcessedOutputCache(str(tmp_path / "c"), max_bytes=1 << 20, max_entries=10)
+    inside, overlap = [], []
+
+    def worker(key):
+        with cache.key_lock(key):
+            inside.append(key)
+            if inside.count(key) > 1:
+                overlap.append(key)
+            time.sleep(0.005)
+            inside.remove(key)
+
+    threads = [threading.Thread(target=worker, args=(f"k{i % 3}",)) for i in range(24)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert overlap == []
+    assert cache._key_locks == {}
+
+    for i in range(500):
+        with cache.key_lock(f"once-{i}"):
+            pass
+    assert cache._key_locks == {}
+
+
+def test_gain_analysis_and_app_off_runs_share_entries(tmp_path, monkeypatch):
+    from analysis.gain_analysis import backend_runner
+    from src.app_services import backend_csv_processor
+
+    cache = ProcessedOutputCache(str(tmp_path / "c"), max_bytes=1 << 20, max_entries=10)
+    monkeypatch.setattr(processed_cache, "_shared", cache)
+    monkeypatch.setattr(processed_cache.config, "PROCESSED_CACHE_ENABLED", True)
+    raw = tmp_path / "discrete.csv"
+    raw.write_text("\ufefftime, device_id  ,fz\n1, 07.1 ,2\n2,07.1,3\n", encoding="utf-8")
+    sent = []
+
+    class _Resp:
+        status_code = 200
+
+        def __init__(self, body):
+            out = os.path.join(body["outputDir"], "backend-out.csv")
+            with open(out, "w", encoding="utf-8") as fh:
+                fh.write("time,fz\n1,9\n")
+            self._data = {"outputPath": out}
+
+        def json(self):
+            return self._data
+
+    def fake_post(url, body, *, timeout_s):
+        sent.append(dict(body))
+        return _Resp(body)
+
+    monkeypatch.setattr(backend_runner, "_post", fake_post)
+    cfg = backend_runner.BackendConfig(host="localhost", port=1, room_temperature_f=76.0)
+    gain_out = backend_runner.process_csv_with_cache(cfg, str(raw), "07.1", str(tmp_path / "gain"), None)
+    assert [b["mode"] for b in sent] == ["legacy"]
+    with open(sent[0]["csvPath"], "rb") as fh:
+        assert fh.read() == b"time,device_id,fz\n1,07.1,2\n2,07.1,3\n"
+
+    def no_backend(**_kw):
+        raise AssertionError("expected a processed-cache hit")
+
+    monkeypatch.setattr(backend_csv_processor, "_post_process_csv", no_backend)
+    for mode in ("scalar", "legacy"):
+        out = backend_csv_processor.process_csv_via_backend(
+            input_csv_path=str(raw), device_id="07.1", output_folder=str(tmp_path / f"app-{mode}"),
+            output_filename="off.csv", use_temperature_correction=False, room_temp_f=76.0, mode=mode,
+            sanitize_header=True,
+        )
+        with open(out, encoding="utf-8") as a, open(gain_out, encoding="utf-8") as b:
+            assert a.read() == b.read()
@@ -0,0 +1,91 @@
+import json
+import random
+
+from src.app_services.temperature_coef_rollup.aggregation import aggregate_mean_signed_for_coef_key, top3_rows_for_plate_type
+from src.app_services.temperature_coef_rollup.store import RollupStore
+
+
+def _run(rng, i):
+    row = {
+        "coef_key": rng.choice(["x=0.001,y=0.002", "x=0.002,y=0.002", "x=0.003,y=0.001", "x=0.004,y=0.000"]),
+        "device_id": rng.choice(["06.01", "06.02", "06.03", "07.01"]),
+        "raw_csv": f"test_{rng.randrange(6)}.csv",
+        "temp_f": rng.choice([55.0, 72.0, 85.0, None]),
+        "selected": {"all": {"mean_abs": rng.uniform(0.5, 5.0), "mean_signed": rng.uniform(-3.0, 3.0), "std_signed": rng.uniform(0.0, 1.0)}},
+        "seq": i,
+    }
+    if rng.random() < 0.2:
+        row["post_correction"] = {"post_key": "scalar"}
+    if rng.random() < 0.03:
+        row["raw_csv"] = ""  # no complete key: never merged with anything
+    return row
+
+
+def _full_recompute(history):
+    """The single-file rollup rule: a repeated (coef_key, device_id, raw_csv) overwrites in place."""
+    runs, pos = [], {}
+    for r in history:
+        key = (r["coef_key"], r["device_id"], r["raw_csv"])
+        if all(key) and key in pos:
+            runs[pos[key]] = r
+            continue
+        if all(key):
+            pos[key] = len(runs)
+        runs.append(r)
+    return runs
+
+
+def _check(store, history, exclude):
+    runs = _full_recompute(history)
+    assert store.runs() == runs
+    kept = [r for r in runs if r["raw_csv"] not in exclude]
+    for sort_by in ("mean_abs", "signed"):
+        assert store.top3(sort_by=sort_by, exclude_raw_csvs=exclude) == top3_rows_for_plate_type(runs=kept, sort_by=sort_by)
+    for ck in {r["coef_key"] for r in runs}:
+        assert store.mean_signed(ck) == aggregate_mean_signed_for_coef_key(runs=runs, coef_key=ck)
+
+
+def test_replay_matches_full_recompute_over_random_histories(tmp_path):
+    for seed in range(4):
+        rng = random.Random(seed)
+        path = tmp_path / f"type{seed:02d}.jsonl"
+        store = RollupStore(str(path), "06")
+        history = []
+        exclude = frozenset()
+        for step in range(60):
+            batch = [_run(rng, len(history) + k) for k in range(rng.randrange(1, 12))]
+            store.upsert(batch)
+            history.extend(batch)
+            roll = rng.random()
+            if roll < 0.1:
+                store = RollupStore(str(path), "06")  # a fresh process replays the log from disk
+            elif roll < 0.15:
+                store.compact()
+            if rng.random() < 0.2:
+                exclude = frozenset(rng.sample([f"test_{i}.csv" for i in range(6)], rng.randrange(3)))
+            _check(store, history, exclude)
+        # Superseded lines piled up past the threshold, so the log compacted itself along the way.
+        assert sum(1 for _ in open(path, encoding="utf-8")) < len(history)
+
+
+def test_store_picks_up_rows_appended_by_another_writer(tmp_path):
+    rng = random.Random(7)
+    path = str(tmp_path / "type06.jsonl")
+    reader, writer = RollupStore(path, "06"), RollupStore(path, "06")
+    history = [_run(rng, i) for i in range(40)]
+    writer.upsert(history[:20])
+    _check(reader, history[:20], frozenset())
+    writer.upsert(history[20:])
+    writer.compact()  # replaced file: the reader reloads rather than tail-reading
+    _check(reader, history, frozenset())
+
+
+def test_legacy_json_rollup_is_imported_once(tmp_path):
+    rng = random.Random(3)
+    runs = _full_recompute([_run(rng, i) for i in range(30)])
+    legacy = tmp_path / "type06.json"
+    legacy.write_text(json.dumps({"version": 1, "plate_type": "06", "runs": runs}), encoding="utf-8")
+    store = RollupStore(str(tmp_path / "type06.jsonl"), "06", legacy_json_path=str(legacy))
+    assert store.runs() == runs
+    assert not legacy.exists() and (tmp_path / "type06.json.migrated").exists()
+    assert store.as_payload()["runs"] == runs
@@ -0,0 +1,165 @@
+import json
+import os
+
+import pytest
+
+from src.core import sync_logic
+from src.core.sync_logic import SyncManifest, _append_tail, _entry_for, sync_all_data
+
+
+@pytest.fixture
+def roots(tmp_path, monkeypatch):
+    """Local repo root and OneDrive root under tmp_path, with the manifest kept beside them."""
+    local, remote = tmp_path / "repo", tmp_path / "onedrive"
+    for base in (local, remote):
+        (base / "temp_testing").mkdir(parents=True)
+    monkeypatch.setattr(sync_logic, "_repo_root", lambda: str(local))
+    monkeypatch.setattr(sync_logic, "_manifest_path", lambda: str(tmp_path / "sync_manifest.json"))
+    monkeypatch.setattr(sync_logic.config, "DATA_SYNC_MANIFEST_ENABLED", True, raising=False)
+    monkeypatch.setattr(sync_logic.config, "DATA_SYNC_WORKERS", 1, raising=False)
+    return local / "temp_testing", remote / "temp_testing"
+
+
+def _rows(start, stop):
+    return "".join(f"{t},07.1,{t * 2}\r\n" for t in range(start, stop))
+
+
+def _seed(path, body):
+    path.write_bytes(("time,device_id,fz\r\n" + body).encode("utf-8"))
+
+
+def _count_pairs(monkeypatch):
+    calls = []
+    real = sync_logic._sync_pair
+
+    def counting(kind, local_path, remote_path, prev):
+        calls.append(os.path.basename(local_path))
+        return real(kind, local_path, remote_path, prev)
+
+    monkeypatch.setattr(sync_logic, "_sync_pair", counting)
+    return calls
+
+
+def test_unchanged_pairs_are_skipped_without_being_opened(roots, tmp_path, monkeypatch):
+    local, remote = roots
+    _seed(local / "a.csv", _rows(0, 10))
+    _seed(remote / "b.csv", _rows(0, 5))
+    (remote / "b.json").write_text(json.dumps({"k": 1}), encoding="utf-8")
+
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"copied": 3}
+    assert (remote / "a.csv").read_bytes() == (local / "a.csv").read_bytes()
+    assert (local / "b.json").exists()
+
+    calls = _count_pairs(monkeypatch)
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"unchanged": 3}
+    assert calls == []
+
+    # The manifest is per OneDrive root: another root starts from scratch.
+    other = tmp_path / "other"
+    (other / "temp_testing").mkdir(parents=True)
+    assert sync_all_data(str(other)) == {"copied": 3}
+    doc = json.loads((tmp_path / "sync_manifest.json").read_text(encoding="utf-8"))
+    assert len(doc["roots"]) == 2
+
+
+def test_one_sided_growth_appends_only_the_new_rows(roots, tmp_path):
+    local, remote = roots
+    _seed(local / "a.csv", _rows(0, 10))
+    sync_all_data(str(tmp_path / "onedrive"))
+
+    with open(local / "a.csv", "ab") as fh:
+        fh.write(_rows(10, 15).encode("utf-8"))
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"appended": 1}
+    assert (remote / "a.csv").read_bytes() == (local / "a.csv").read_bytes()
+    assert not (remote / "a.csv.bak").exists()  # appended in place, not merged
+
+    # Now the remote side grows.
+    with open(remote / "a.csv", "ab") as fh:
+        fh.write(_rows(15, 18).encode("utf-8"))
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"appended": 1}
+    assert (local / "a.csv").read_bytes() == (remote / "a.csv").read_bytes()
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"unchanged": 1}
+
+
+def test_both_sides_changed_or_rewritten_takes_a_merge(roots, tmp_path):
+    local, remote = roots
+    _seed(local / "a.csv", _rows(0, 10))
+    sync_all_data(str(tmp_path / "onedrive"))
+
+    with open(local / "a.csv", "ab") as fh:
+        fh.write(_rows(10, 12).encode("utf-8"))
+    with open(remote / "a.csv", "ab") as fh:
+        fh.write(_rows(20, 22).encode("utf-8"))
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"merged": 1}
+    merged = (local / "a.csv").read_bytes()
+    assert merged == (remote / "a.csv").read_bytes()
+    assert merged == ("time,device_id,fz\r\n" + _rows(0, 12) + _rows(20, 22)).encode("utf-8")
+
+    # A rewritten (not appended) prefix is not mistaken for growth.
+    _seed(local / "a.csv", _rows(100, 120))
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"merged": 1}
+    assert (local / "a.csv").read_bytes() == (remote / "a.csv").read_bytes()
+
+
+def test_mtime_drift_with_identical_bytes_only_refreshes_the_entry(roots, tmp_path, monkeypatch):
+    local, remote = roots
+    _seed(local / "a.csv", _rows(0, 10))
+    sync_all_data(str(tmp_path / "onedrive"))
+    before = (remote / "a.csv").read_bytes()
+
+    st = os.stat(remote / "a.csv")
+    os.utime(remote / "a.csv", ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"unchanged": 1}
+    assert (remote / "a.csv").read_bytes() == before
+
+    calls = _count_pairs(monkeypatch)
+    assert sync_all_data(str(tmp_path / "onedrive")) == {"unchanged": 1}
+    assert calls == []
+
+
+def test_full_sync_ignores_the_manifest(roots, tmp_path, monkeypatch):
+    local, remote = roots
+    _seed(local / "a.csv", _rows(0, 10))
+    sync_all_data(str(tmp_path / "onedrive"))
+
+    calls = _count_pairs(monkeypatch)
+    assert sync_all_data(str(tmp_path / "onedrive"), full=True) == {"unchanged": 1}
+    assert calls == ["a.csv"]
+
+
+def test_append_tail_refuses_unless_exactly_one_side_extends_the_synced_content(tmp_path):
+    src, dst = tmp_path / "src.csv", tmp_path / "dst.csv"
+    _seed(src, _rows(0, 10))
+    _seed(dst, _rows(0, 10))
+    prev = _entry_for(str(src), str(dst))
+
+    assert _append_tail(str(src), str(dst), prev) is False  # nothing new
+
+    with open(src, "ab") as fh:
+        fh.write(_rows(10, 12).encode("utf-8"))
+    with open(dst, "ab") as fh:
+        fh.write(b"99,07.1,0\r\n")
+    assert _append_tail(str(src), str(dst), prev) is False  # destination moved on too
+
+    _seed(dst, _rows(0, 10))
+    _seed(src, _rows(1, 11) + _rows(11, 13))  # same length prefix, different bytes
+    assert _append_tail(str(src), str(dst), prev) is False
+
+    # Last synced row was cut mid-line: the tail cannot simply be appended.
+    _seed(dst, _rows(0, 10)[:-1])
+    cut = _entry_for(str(dst), str(dst))
+    _seed(src, _rows(0, 12))
+    assert _append_tail(str(src), str(dst), cut) is False
+
+
+def test_manifest_survives_a_reload_and_ignores_other_versions(tmp_path):
+    path = str(tmp_path / "m.json")
+    m = SyncManifest(path, str(tmp_path / "od"))
+    m.put("temp_testing/a.csv", {"size": 1})
+    m.save()
+    assert SyncManifest(path, str(tmp_path / "od")).get("temp_testing/a.csv") == {"size": 1}
+    assert SyncManifest(path, str(tmp_path / "elsewhere")).get("temp_testing/a.csv") is None
+
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"version": 99, "roots": {}}, fh)
+    assert SyncManifest(path, str(tmp_path / "od")).files == {}
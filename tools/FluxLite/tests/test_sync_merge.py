@@ -0,0 +1,94 @@
+import csv
+import shutil
+
+from src.core.sync_logic import _merge_csv_in_memory, _merge_csv_streaming, _merge_csv_two_way
+
+
+def _write(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        w = csv.writer(fh)
+        for r in rows:
+            w.writerow(r)
+
+
+def _both_ways(tmp_path, local_rows, remote_rows):
+    """Merge the same inputs with the streaming and the in-memory merge; return (streaming, in-memory) bytes."""
+    out = {}
+    for name in ("stream", "memory"):
+        d = tmp_path / name
+        d.mkdir()
+        _write(d / "local.csv", local_rows)
+        _write(d / "remote.csv", remote_rows)
+        if name == "stream":
+            assert _merge_csv_streaming(str(d / "local.csv"), str(d / "remote.csv")) is True
+        else:
+            _merge_csv_in_memory(str(d / "local.csv"), str(d / "remote.csv"))
+        local, remote = (d / "local.csv").read_bytes(), (d / "remote.csv").read_bytes()
+        assert local == remote
+        assert not (d / "local.csv.tmp").exists() and not (d / "remote.csv.tmp").exists()
+        out[name] = local
+    return out["stream"], out["memory"]
+
+
+def test_streaming_matches_in_memory_on_overlapping_logs(tmp_path):
+    header = ["time", "device_id", "fz"]
+    local = [header] + [[t, "07.1", f"{t * 0.5:.1f}"] for t in range(0, 60, 2)]
+    # Remote overlaps the local tail, repeats some rows verbatim and disagrees on others at equal times.
+    remote = [header] + [[t, "07.1", f"{t * 0.5:.1f}" if t % 4 else "-1"] for t in range(40, 100, 2)]
+    remote.append([98, "07.1", "49.0"])  # duplicate of its own last row
+    stream, memory = _both_ways(tmp_path, local, remote)
+    assert stream == memory
+    assert stream.count(b"\r\n40,07.1,20.0\r\n") == 1
+
+
+def test_streaming_matches_in_memory_on_ragged_rows_and_differing_columns(tmp_path):
+    local = [
+        ["time", "device_id", "fz"],
+        ["0", "a", "1"],
+        ["1", "a"],  # short row
+        ["2", "a", "3", "extra"],  # long row: the extra cell is dropped
+        [],
+        ["3", "a", "4"],
+    ]
+    remote = [
+        ["fz", "time", "cop_x"],  # different order plus a column local does not have
+        ["1", "0", ""],
+        ["9", "1.5", "0.25"],
+        ["4", "3", "0.5"],
+    ]
+    stream, memory = _both_ways(tmp_path, local, remote)
+    assert stream == memory
+    assert stream.splitlines()[0] == b"time,device_id,fz,cop_x"
+
+
+def test_unordered_or_untimed_files_fall_back_to_the_in_memory_merge(tmp_path):
+    cases = {
+        "unordered": ([["time", "v"], ["2", "a"], ["1", "b"]], [["time", "v"], ["3", "c"]]),
+        "untimed": ([["key", "v"], ["x", "1"]], [["key", "v"], ["y", "2"]]),
+        "bad_time": ([["time", "v"], ["0", "a"], ["n/a", "b"]], [["time", "v"], ["1", "c"]]),
+    }
+    for name, (local_rows, remote_rows) in cases.items():
+        d = tmp_path / name
+        d.mkdir()
+        _write(d / "local.csv", local_rows)
+        _write(d / "remote.csv", remote_rows)
+        before = (d / "local.csv").read_bytes(), (d / "remote.csv").read_bytes()
+        assert _merge_csv_streaming(str(d / "local.csv"), str(d / "remote.csv")) is False
+        # Nothing was written or left behind.
+        assert ((d / "local.csv").read_bytes(), (d / "remote.csv").read_bytes()) == before
+        assert sorted(p.name for p in d.iterdir()) == ["local.csv", "remote.csv"]
+
+        ref = tmp_path / f"{name}_ref"
+        shutil.copytree(d, ref)
+        _merge_csv_two_way(str(d / "local.csv"), str(d / "remote.csv"))
+        _merge_csv_in_memory(str(ref / "local.csv"), str(ref / "remote.csv"))
+        assert (d / "local.csv").read_bytes() == (ref / "local.csv").read_bytes()
+        assert (d / "remote.csv").read_bytes() == (ref / "remote.csv").read_bytes()
+
+
+def test_streaming_declines_a_missing_or_empty_side(tmp_path):
+    _write(tmp_path / "local.csv", [["time", "v"], ["0", "a"]])
+    (tmp_path / "empty.csv").write_bytes(b"")
+    assert _merge_csv_streaming(str(tmp_path / "local.csv"), str(tmp_path / "missing.csv")) is False
+    assert _merge_csv_streaming(str(tmp_path / "local.csv"), str(tmp_path / "empty.csv")) is False
+    assert (tmp_path / "empty.csv").read_bytes() == b""
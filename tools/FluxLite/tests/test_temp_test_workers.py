@@ -0,0 +1,83 @@
+import pytest
+
+from src.ui.controllers.temp_test_workers import PlateTypeAutoSearchWorker
+
+ROOT = 0.00437  # mean_signed crosses zero here (between grid points 0.0043 and 0.0044)
+
+
+class StubService:
+    """Rollup/aggregate stand-in with a monotonic mean_signed(coef) response."""
+
+    def __init__(self):
+        self.batches = []
+        self.singles = []
+        self.aggregated = []
+
+    def run_temperature_coef_sets_across_plate_type(self, *, plate_type, coef_sets, mode):
+        self.batches.append([cs["x"] for cs in coef_sets])
+        return {"ok": True}
+
+    def run_temperature_coefs_across_plate_type(self, *, plate_type, coefs, mode):
+        self.singles.append(coefs["x"])
+        return {"ok": True}
+
+    def aggregate_temperature_coefs_for_plate_type(self, plate_type, *, coefs, mode):
+        c = coefs["x"]
+        self.aggregated.append(c)
+        return {"mean_signed": (c - ROOT) * 1000.0, "coverage": "3/3"}
+
+
+def _search(service, k, cache, low_c=0.0, high_c=0.01):
+    worker = PlateTypeAutoSearchWorker(service, "07", "scalar", "unified")
+    worker.parallel_k = k
+    explored = set()
+    seen = []
+    worker._ksection(
+        low_c,
+        high_c,
+        (low_c - ROOT) * 1000.0,
+        (high_c - ROOT) * 1000.0,
+        step=0.0001,
+        cache=cache,
+        explored=explored,
+        maybe_best=lambda c, ms, agg: seen.append((c, ms)),
+    )
+    return explored, seen
+
+
+@pytest.mark.parametrize("k", [1, 2, 4, 8])
+def test_bracket_converges_to_the_adjacent_grid_points_around_the_root(k):
+    service = StubService()
+    explored, seen = _search(service, k, cache={})
+    assert 0.0043 in explored and 0.0044 in explored
+    below = max(c for c, ms in seen if ms < 0)
+    above = min(c for c, ms in seen if ms > 0)
+    assert (below, above) == pytest.approx((0.0043, 0.0044))
+    best = min(seen, key=lambda s: abs(s[1]))
+    assert best[0] == pytest.approx(0.0044)
+
+    # Each round is one batch of up to K points; wider batches need fewer rounds.
+    rounds = len(service.batches) + len(service.singles)
+    assert all(len(b) <= k for b in service.batches)
+    assert sorted(service.aggregated) == sorted(explored)
+    if k == 1:
+        assert not service.batches and rounds >= 7  # plain bisection over 100 grid steps
+    else:
+        assert rounds < 7
+
+
+def test_cached_candidates_are_not_re_run():
+    service = StubService()
+    cache: dict = {}
+    explored, _ = _search(service, 4, cache)
+    assert set(cache) == {f"{c:.6f}" for c in explored}
+    first = (list(service.batches), list(service.singles), list(service.aggregated))
+
+    # Same bracket again: every interior point comes from the cache.
+    again, seen = _search(service, 4, cache)
+    assert again == explored and seen
+    assert (service.batches, service.singles, service.aggregated) == first
+
+    # A bracket already at grid width does no work at all.
+    _, seen = _search(service, 4, cache, 0.0043, 0.0044)
+    assert seen == [] and (service.batches, service.singles, service.aggregated) == first
@@ -0,0 +1,72 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from src.app_services import backend_csv_processor
+from src.app_services.repositories import temperature_test_repository as repo_mod
+from src.app_services.temperature_coef_rollup_service import TemperatureCoefRollupService
+from src.app_services.temperature_processing_service import TemperatureProcessingService
+from src.infra import processed_cache
+from src.infra.processed_cache import ProcessedOutputCache
+
+DEVICE = "07.00000051"
+BASE = f"{DEVICE}-20250301-101500.csv"
+ROWS = 20_000
+
+
+def test_parallel_coef_sets_send_one_complete_sanitized_trimmed_csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(repo_mod, "data_dir", lambda name: str(tmp_path / name))
+    monkeypatch.setattr(processed_cache, "_shared", ProcessedOutputCache(str(tmp_path / "cache"), max_bytes=1 << 30, max_entries=100))
+    monkeypatch.setattr(processed_cache.config, "PROCESSED_CACHE_ENABLED", True)
+    folder = tmp_path / DEVICE
+    folder.mkdir()
+    raw = folder / f"temp-raw-{BASE}"
+    raw.write_text("time,sum-t\n1,70.0\n", encoding="utf-8")
+    # The 50 Hz trimmed CSV keeps the raw export's padded headers; the OFF baseline already exists.
+    with open(folder / f"temp-trimmed-{BASE}", "w", encoding="utf-8") as fh:
+        fh.write("time ,device_id   ,sum-z\n")
+        fh.writelines(f"{i}, {DEVICE} ,{i % 97}\n" for i in range(ROWS))
+    (folder / f"temp-processed-{BASE}").write_text("time,sum-z\n1,1\n", encoding="utf-8")
+
+    seen = []
+    lock = threading.Lock()
+
+    def fake_post(url, body, *, timeout_s):
+        with open(body["csvPath"], encoding="utf-8") as fh:
+            lines = fh.read().splitlines()
+        with lock:
+            seen.append((body["csvPath"], lines[0], len(lines) - 1))
+            n = len(seen)
+        out = os.path.join(body["outputDir"], f"backend-out-{n}.csv")
+        with open(out, "w", encoding="utf-8") as fh:
+            fh.write("time,sum-z\n1,2\n")
+        return {"outputPath": out}
+
+    monkeypatch.setattr(backend_csv_processor, "post_json", fake_post)
+    repo = repo_mod.TemperatureTestRepository()
+    processing = TemperatureProcessingService(repo=repo, hardware=object())
+    svc = TemperatureCoefRollupService(repo=repo, analyzer=None, processing=processing, bias=None)
+
+    # Baseline stage, once per test: leaves the sanitized trimmed CSV ready for the fan-out.
+    assert svc._ensure_test_baseline(SimpleNamespace(raw_csv=str(raw), device_id=DEVICE), "scalar") == ""
+    (sanitized,) = [n for n in os.listdir(folder) if n.startswith("__sanitized__")]
+    built = os.stat(folder / sanitized).st_mtime_ns
+
+    statuses = []
+
+    def coef_set(z):
+        processing.run_temperature_processing(
+            folder=str(folder), device_id=DEVICE, csv_path=str(raw), slopes={"x": 0.0, "y": 0.0, "z": z},
+            room_temp_f=76.0, mode="scalar", status_cb=lambda p: statuses.append(p.get("status")),
+        )
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(coef_set, (0.001, 0.002, 0.003, 0.004, 0.005, 0.006)))
+
+    assert statuses.count("completed") == 6 and "error" not in statuses
+    assert {(os.path.basename(p), header, rows) for p, header, rows in seen} == {(sanitized, "time,device_id,sum-z", ROWS)}
+    assert len(seen) == 6
+    # Reused, never rewritten during the fan-out.
+    assert os.stat(folder / sanitized).st_mtime_ns == built
+    assert [n for n in os.listdir(folder) if n.startswith("__sanitized__")] == [sanitized]
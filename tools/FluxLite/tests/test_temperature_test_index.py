@@ -0,0 +1,142 @@
+import json
+import os
+
+import pytest
+
+from src import config, meta_store
+from src.app_services.repositories import temperature_test_index as index_mod
+from src.app_services.repositories import temperature_test_repository as repo_mod
+
+BASE = "07.00000051-20250301-101500.csv"
+OUTPUTS = (
+    f"temp-processed-{BASE}",
+    f"temp-0.1_0.2_0.3-{BASE}",
+    f"temp-scalar-0.05_0_0-{BASE}",
+    # Found by the crawl's substring match but not by an exact "-<base>" suffix lookup.
+    f"temp-processed-retry_{BASE}",
+    f"temp-0.4_0_0-{BASE}.bak.csv",
+    "temp-0.1_0.2_0.3-07.00000099-20250301-101500.csv",
+)
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(text)
+
+
+def _age(path, seconds=600):
+    """Push a file's mtime into the past (its ctime still moves to now)."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    root = tmp_path / "temp_testing"
+    for did, temps in (("07.00000051", (55.5, 72.0)), ("06.00000012", (80.0,))):
+        for k, temp in enumerate(temps):
+            base = f"{did}-20250301-10{k}500.csv"
+            _write(str(root / did / f"temp-raw-{base}"), "time,sum-t\n1,70.0\n2,71.0\n")
+            _write(str(root / did / f"temp-raw-{base[:-4]}.meta.json"), json.dumps({"room_temp_f": temp, "stage_events": []}))
+    for name in OUTPUTS:
+        _write(str(root / "07.00000051" / name), "time\n")
+    _write(str(root / "07.00000051" / "temp-trimmed-x.csv"), "time\n")
+    os.makedirs(str(root / "07.00000051" / "notes"))
+
+    monkeypatch.setattr(meta_store, "_DB_PATH", str(tmp_path / "meta.db"))
+    monkeypatch.setattr(repo_mod, "data_dir", lambda name: str(tmp_path / name))
+    monkeypatch.setattr(index_mod, "_shared", None)
+    # Files in the fixture were all written just now; trust them straight away.
+    monkeypatch.setattr(index_mod, "_RACY_NS", 0)
+    return root
+
+
+def _snapshot(repo):
+    out = {"devices": repo.list_temperature_devices(), "tests": {}, "details": {}, "baselines": {}}
+    for did in out["devices"]:
+        tests = repo.list_temperature_tests(did)
+        out["tests"][did] = tests
+        out["baselines"][did] = repo.list_temperature_room_baseline_tests(did, min_temp_f=60.0, max_temp_f=90.0)
+        for csv_path in tests:
+            out["details"][csv_path] = repo.get_temperature_test_details(csv_path)
+    return out
+
+
+def _crawl(repo, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(config, "TEMP_TEST_INDEX_ENABLED", False)
+        assert index_mod.shared_index() is None
+        return _snapshot(repo)
+
+
+def test_indexed_answers_match_the_directory_crawl(tree, monkeypatch):
+    repo = repo_mod.TemperatureTestRepository()
+    crawled = _crawl(repo, monkeypatch)
+
+    assert _snapshot(repo) == crawled
+    # Warm (in-memory) and cold (SQLite only) index answers agree as well.
+    assert _snapshot(repo) == crawled
+    monkeypatch.setattr(index_mod, "_shared", None)
+    assert _snapshot(repo) == crawled
+
+    assert crawled["devices"] == ["06.00000012", "07.00000051"]
+    assert len(crawled["baselines"]["07.00000051"]) == 1
+
+
+def test_output_names_use_the_crawls_substring_match(tree):
+    folder = str(tree / "07.00000051")
+    names = index_mod.TemperatureTestIndex().output_names(folder, BASE)
+    assert sorted(names) == sorted(n for n in OUTPUTS if BASE in n)
+    assert f"temp-processed-retry_{BASE}" in names and f"temp-0.4_0_0-{BASE}.bak.csv" in names
+    assert "temp-0.1_0.2_0.3-07.00000099-20250301-101500.csv" not in names
+
+
+def test_meta_rows_are_reused_until_the_file_changes(tree, monkeypatch):
+    repo = repo_mod.TemperatureTestRepository()
+    meta_path = str(tree / "07.00000051" / f"temp-raw-{BASE[:-4]}.meta.json")
+    _age(meta_path)
+    reads = []
+    real_read = index_mod.TemperatureTestIndex._read_meta
+
+    def counting_read(self, path, **kw):
+        reads.append(path)
+        return real_read(self, path, **kw)
+
+    monkeypatch.setattr(index_mod.TemperatureTestIndex, "_read_meta", counting_read)
+    assert repo.load_meta_for_csv(str(tree / "07.00000051" / f"temp-raw-{BASE}"))["room_temp_f"] == 72.0
+    assert reads == [meta_path]
+
+    # Warm process and a cold one (fresh index, rows from SQLite) both reuse the row.
+    repo.load_meta_for_csv(str(tree / "07.00000051" / f"temp-raw-{BASE}"))
+    monkeypatch.setattr(index_mod, "_shared", None)
+    repo.load_meta_for_csv(str(tree / "07.00000051" / f"temp-raw-{BASE}"))
+    assert reads == [meta_path]
+
+
+def test_rewrite_with_restored_mtime_and_same_size_is_not_served_stale(tree):
+    repo = repo_mod.TemperatureTestRepository()
+    csv_path = str(tree / "07.00000051" / f"temp-raw-{BASE}")
+    meta_path = str(tree / "07.00000051" / f"temp-raw-{BASE[:-4]}.meta.json")
+    _age(meta_path)
+    before = os.stat(meta_path)
+    assert repo.load_meta_for_csv(csv_path)["room_temp_f"] == 72.0
+
+    # A sync tool rewrites the file in place and puts the original mtime back.
+    _write(meta_path, json.dumps({"room_temp_f": 61.0, "stage_events": []}))
+    os.utime(meta_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    after = os.stat(meta_path)
+    assert (after.st_mtime_ns, after.st_size) == (before.st_mtime_ns, before.st_size)
+
+    assert repo.load_meta_for_csv(csv_path)["room_temp_f"] == 61.0
+    baselines = repo.list_temperature_room_baseline_tests("07.00000051", min_temp_f=60.0, max_temp_f=65.0)
+    assert [b["temp_f"] for b in baselines] == [61.0]
+
+
+def test_new_and_removed_tests_show_up_in_the_listing(tree):
+    repo = repo_mod.TemperatureTestRepository()
+    device_dir = tree / "06.00000012"
+    assert [os.path.basename(p) for p in repo.list_temperature_tests("06.00000012")] == ["temp-raw-06.00000012-20250301-100500.csv"]
+    _write(str(device_dir / "temp-raw-06.00000012-20250302-090000.csv"), "time\n")
+    os.remove(str(device_dir / "temp-raw-06.00000012-20250301-100500.csv"))
+    assert [os.path.basename(p) for p in repo.list_temperature_tests("06.00000012")] == ["temp-raw-06.00000012-20250302-090000.csv"]
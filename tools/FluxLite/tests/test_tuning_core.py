@@ -0,0 +1,207 @@
+import os
+import random
+import threading
+import time
+
+import pytest
+
+from src.ui.discrete_temp import tuning_core
+from src.ui.discrete_temp.tuning_core import (
+    CandidateRun,
+    CoordinateWalk,
+    TuningCancelled,
+    compute_baseline_targets_from_off,
+    evaluate_candidates_batch,
+)
+from src.ui.discrete_temp.tuning_local_refine import run_local_refine_tuning
+
+TEMPS = (70.0, 72.0, 74.0, 76.0, 78.0, 80.0, 82.0)
+
+
+def _write_output(path, coeffs):
+    """Processed-output stand-in: Sum-z drifts with temperature unless cz cancels it; cx/cy add an offset."""
+    cx, cy, cz = (float(coeffs.get(a, 0.0)) for a in ("x", "y", "z"))
+    offset = 1e5 * ((cx - 0.002) ** 2 + (cy - 0.001) ** 2)
+    lines = ["phase,sum-t,sum-x,sum-y,sum-z"]
+    for phase in ("45lb", "bodyweight"):
+        for t in TEMPS:
+            z = 100.0 + (t - 76.0) * (0.5 - 100.0 * cz) + offset
+            lines.append(f"{phase},{t},0,0,{z!r}")
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(lines) + "\n")
+    return path
+
+
+class StubBackend:
+    def __init__(self, *, delay_s=0.0, fail_on=None):
+        self.delay_s = delay_s
+        self.fail_on = fail_on
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(0)
+
+    def __call__(self, *, output_folder, output_filename, coeffs, **_kw):
+        with self._lock:
+            self.calls.append(output_filename)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            delay = self._rng.uniform(0.0, self.delay_s)
+        try:
+            time.sleep(delay)
+            if self.fail_on is not None and output_filename == self.fail_on:
+                raise RuntimeError(f"backend failed for {output_filename}")
+            return _write_output(os.path.join(output_folder, output_filename), coeffs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    monkeypatch.setattr(tuning_core.config, "CSV_CACHE_ENABLED", False, raising=False)
+    monkeypatch.setattr(tuning_core.config, "TEMP_LINEAR_RESPONSE_MODE", "off", raising=False)
+    off = _write_output(str(tmp_path / "off.csv"), {"x": 0.002, "y": 0.001})  # temperature correction off: cz = 0
+    return tmp_path, off
+
+
+def _install(monkeypatch, backend):
+    monkeypatch.setattr(tuning_core, "run_backend_candidate", backend)
+    return backend
+
+
+def _runs(n):
+    return [CandidateRun(coeffs={"x": 0.0, "y": 0.0, "z": 0.0005 * i}, output_filename=f"run_{i:03d}.csv") for i in range(n)]
+
+
+def _evaluate(tmp_path, off, runs, **kw):
+    return evaluate_candidates_batch(
+        runs,
+        input_csv_path=off,
+        device_id="07.1",
+        output_folder=str(tmp_path / "runs"),
+        targets=compute_baseline_targets_from_off(off),
+        baseline_low_f=74.0,
+        baseline_high_f=78.0,
+        axes=("z",),
+        weights=(0.0, 0.0, 1.0),
+        **kw,
+    )
+
+
+def test_batched_evaluation_matches_sequential(env, monkeypatch):
+    tmp_path, off = env
+    os.makedirs(tmp_path / "runs")
+    seq_backend = _install(monkeypatch, StubBackend())
+    seq = list(_evaluate(tmp_path, off, _runs(12), max_in_flight=1))
+    assert [r.output_filename for r in seq] == [f"run_{i:03d}.csv" for i in range(12)]
+
+    par_backend = _install(monkeypatch, StubBackend(delay_s=0.02))
+    par = list(_evaluate(tmp_path, off, _runs(12), max_in_flight=4))
+    assert {r.output_filename: r.score.total for r in par} == {r.output_filename: r.score.total for r in seq}
+    assert sorted(par_backend.calls) == sorted(seq_backend.calls)
+    assert 1 < par_backend.max_in_flight <= 4
+    # The surface has its minimum at cz = 0.005 (run 10).
+    assert min(seq, key=lambda r: r.score.total).output_filename == "run_010.csv"
+
+
+def test_backend_error_cancels_the_rest_and_is_reraised(env, monkeypatch):
+    tmp_path, off = env
+    os.makedirs(tmp_path / "runs")
+    backend = _install(monkeypatch, StubBackend(fail_on="run_002.csv"))
+    got = []
+    with pytest.raises(RuntimeError, match="run_002"):
+        for run in _evaluate(tmp_path, off, _runs(20), max_in_flight=2):
+            got.append(run.output_filename)
+    assert "run_002.csv" not in got
+    assert len(backend.calls) < 20  # queued runs are never submitted
+
+
+def test_cancel_callback_stops_between_completions(env, monkeypatch):
+    tmp_path, off = env
+    os.makedirs(tmp_path / "runs")
+    for limit in (1, 3):
+        backend = _install(monkeypatch, StubBackend())
+        got = []
+        with pytest.raises(TuningCancelled):
+            for run in _evaluate(tmp_path, off, _runs(20), max_in_flight=limit, cancel_cb=lambda: len(got) >= 2):
+                got.append(run.output_filename)
+        assert len(got) == 2
+        assert len(backend.calls) <= 2 + limit
+
+
+def _sequential_walk(values, scores, worse_limit, best):
+    """Reference stop-after-N-worse walk, one value at a time."""
+    visited, best_value, streak = [], None, 0
+    for v in values:
+        s = scores[v]
+        visited.append(v)
+        if s < best:
+            best, best_value, streak = s, v, 0
+        else:
+            streak += 1
+            if streak >= worse_limit:
+                break
+    return visited, best, best_value
+
+
+def test_coordinate_walk_lookahead_visits_exactly_what_the_sequential_walk_visits():
+    rng = random.Random(11)
+    for _ in range(300):
+        n = rng.randrange(0, 25)
+        values = [round(0.0001 * i, 7) for i in range(1, n + 1)]
+        scores = {v: rng.choice((1.0, 2.0, 3.0, rng.random() * 4.0)) for v in values}
+        worse_limit = rng.randrange(1, 5)
+        start = rng.choice((float("inf"), 2.0))
+        want = _sequential_walk(values, scores, worse_limit, start)
+
+        walk = CoordinateWalk(iter(values), worse_limit=worse_limit, best=start)
+        visited = []
+        while True:
+            wave = walk.lookahead()
+            if not wave:
+                break
+            # Every value of a wave is dispatched together; scores are fed back in order.
+            for v in wave:
+                if walk.done:
+                    break
+                visited.append(v)
+                walk.feed(scores[v])
+        assert (visited, walk.best, walk.best_value) == want
+
+
+def _refine(tmp_path, off, add_runs, max_in_flight):
+    folder = tmp_path / f"refine_{max_in_flight}_{add_runs}"
+    os.makedirs(folder / "tuning")
+    with open(off, "rb") as src, open(folder / "tuning" / "baseline__nn_off.csv", "wb") as dst:
+        dst.write(src.read())
+    return run_local_refine_tuning(
+        input_csv_path=off,
+        device_id="07.1",
+        test_folder=str(folder),
+        add_runs=add_runs,
+        refine_step=0.001,
+        stop_after_worse=2,
+        score_axes=("x", "y", "z"),
+        score_weights=(1.0, 1.0, 1.0),
+        max_in_flight=max_in_flight,
+    )
+
+
+def test_local_refine_spends_exactly_its_budget_and_matches_sequential(env, monkeypatch):
+    tmp_path, off = env
+    monkeypatch.setattr(tuning_core.config, "TUNING_SURROGATE_ENABLED", False, raising=False)
+    results = {}
+    for limit in (1, 4):
+        backend = _install(monkeypatch, StubBackend(delay_s=0.01 if limit > 1 else 0.0))
+        res = _refine(tmp_path, off, 9, limit)
+        assert len(backend.calls) == 9 and res["completed_runs"] == 9
+        assert not res["cancelled"]
+        results[limit] = (res["best_coeffs"], res["best_score_total"], sorted(c.split("__", 1)[1] for c in backend.calls))
+    assert results[1] == results[4]
+
+    # A larger budget reaches the optimum of the synthetic surface.
+    _install(monkeypatch, StubBackend())
+    res = _refine(tmp_path, off, 40, 4)
+    assert res["best_coeffs"] == {"x": 0.002, "y": 0.001, "z": 0.005}
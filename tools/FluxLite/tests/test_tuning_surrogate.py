@@ -0,0 +1,118 @@
+import math
+import random
+
+import pytest
+
+from src.ui.discrete_temp.tuning_surrogate import (
+    QuadraticSurrogate,
+    SurrogateStats,
+    load_surrogate_stats,
+    make_surrogate,
+    save_surrogate_stats,
+)
+
+OPT = (0.002, 0.001, 0.004)
+
+
+def _score(k):
+    """Synthetic quadratic score surface (coefficients ~1e-3), minimum 1.0 at OPT."""
+    dx, dy, dz = ((a - b) * 1000.0 for a, b in zip(k, OPT))
+    return 1.0 + dx * dx + 2.0 * dy * dy + 0.5 * dz * dz + 0.3 * dx * dz
+
+
+def _grid(n, seed=0):
+    rng = random.Random(seed)
+    return [tuple(round(rng.uniform(0.0, 0.008), 7) for _ in range(3)) for _ in range(n)]
+
+
+def _surrogate(**kw):
+    kw.setdefault("min_points", 20)
+    kw.setdefault("margin", 0.25)
+    kw.setdefault("z_score", 2.0)
+    kw.setdefault("audit_every", 0)
+    return QuadraticSurrogate(**kw)
+
+
+def test_no_prediction_or_pruning_below_min_points():
+    sur = _surrogate(min_points=20)
+    cache = {k: _score(k) for k in _grid(19)}
+    assert sur.fit(cache) is False and not sur.ready
+    far = (0.008, 0.008, 0.0)
+    assert sur.screen(far, best_score=1.0) == (False, None)
+    assert sur.stats.considered == 1 and sur.stats.pruned == 0
+
+    # min_points never drops below what a 10-term quadratic needs.
+    assert QuadraticSurrogate(min_points=3, margin=0.25, z_score=2.0, audit_every=0).min_points == 12
+
+
+def test_fit_recovers_the_quadratic_and_prunes_only_clearly_worse_candidates():
+    sur = _surrogate()
+    cache = {k: _score(k) for k in _grid(30)}
+    assert sur.fit(cache) is True
+    for k in _grid(50, seed=1):
+        mean, lower = sur.predict(k)
+        assert math.isclose(mean, _score(k), rel_tol=1e-6, abs_tol=1e-6)
+        assert lower <= mean
+
+    best = min(cache.values())
+    near, far = (0.0021, 0.001, 0.004), (0.008, 0.008, 0.0)
+    assert sur.screen(near, best) == (False, pytest.approx(_score(near)))
+    prune, predicted = sur.screen(far, best)
+    assert prune is True and predicted == pytest.approx(_score(far))
+    # No finite best yet: nothing is pruned.
+    assert sur.screen(far, float("inf"))[0] is False
+
+    # Same cache size: no refit; a noisy surface widens the interval instead of pruning.
+    assert sur.fit(cache) is True
+    rng = random.Random(2)
+    noisy = {k: _score(k) * rng.uniform(0.2, 5.0) for k in _grid(40, seed=3)}
+    wide = _surrogate()
+    assert wide.fit(noisy)
+    assert wide.predict(far)[1] < sur.predict(far)[1]
+
+
+def test_every_nth_would_be_pruned_candidate_is_audited():
+    sur = _surrogate(audit_every=3)
+    sur.fit({k: _score(k) for k in _grid(30)})
+    far = [(0.008, 0.008, round(0.0001 * i, 7)) for i in range(9)]
+    decisions = [sur.screen(k, best_score=1.0) for k in far]
+    assert [prune for prune, _ in decisions] == [True, True, False] * 3
+    assert (sur.stats.considered, sur.stats.pruned, sur.stats.audited) == (9, 6, 3)
+
+    audited = [k for k, (prune, _) in zip(far, decisions) if not prune]
+    # One audited run comes in within the margin (the rule would have skipped it wrongly).
+    sur.observe(audited[0], decisions[2][1], actual=1.1)
+    sur.observe(audited[1], decisions[5][1], actual=_score(audited[1]))
+    sur.observe(audited[2], None, actual=50.0)
+    assert sur.stats.audit_misses == 1
+    assert sur.stats.predicted_runs == 2
+
+
+def test_stats_ratios_and_persistence(tmp_path):
+    sur = _surrogate()
+    sur.fit({k: _score(k) for k in _grid(30)})
+    cands = _grid(20, seed=4)
+    best = sorted(_score(k) for k in cands)[10] / (1.0 + sur.margin)  # about half clearly worse
+    for k in cands:
+        prune, predicted = sur.screen(k, best_score=best)
+        if not prune:
+            sur.observe(k, predicted, actual=_score(k) * 1.1)
+    stats = sur.stats.as_dict()
+    assert stats["pruning_ratio"] == pytest.approx(sur.stats.pruned / 20)
+    assert 0.0 < stats["pruning_ratio"] < 1.0
+    assert stats["mean_rel_error"] == pytest.approx(0.1 / 1.1, rel=1e-4)
+    assert stats["mean_abs_error"] == pytest.approx(sur.stats.abs_err_sum / sur.stats.predicted_runs)
+    assert SurrogateStats().as_dict()["mean_abs_error"] is None
+
+    save_surrogate_stats(str(tmp_path), sur.stats)
+    save_surrogate_stats(str(tmp_path), sur.stats)  # accumulates across sessions
+    again = load_surrogate_stats(str(tmp_path))
+    assert again["considered"] == 2 * sur.stats.considered
+    assert again["pruning_ratio"] == pytest.approx(stats["pruning_ratio"])
+
+
+def test_disabled_by_config(monkeypatch):
+    from src.ui.discrete_temp import tuning_surrogate
+
+    monkeypatch.setattr(tuning_surrogate.config, "TUNING_SURROGATE_ENABLED", False, raising=False)
+    assert make_surrogate() is None